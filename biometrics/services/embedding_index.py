@@ -0,0 +1,251 @@
+"""
+Process-resident face embedding index for 1:N matching.
+
+Check-in, check-out and biometric verification used to read every active
+document of the face_embeddings collection per request and compare the
+probe employee by employee. FaceEmbeddingIndex keeps all active embeddings
+of the process as one contiguous float32 matrix with a parallel array of
+employee ids, so a match is a single vectorised distance computation.
+
+The index stays current through a version counter stored in MongoDB next to
+the embeddings: MongoBiometricRepository bumps it (and appends the changed
+employee to a bounded change log in the same document) whenever it saves,
+deactivates or deletes embeddings. On refresh() each process compares its
+version with the stored one and reloads only the changed employees, falling
+back to a full reload when the change log does not reach back far enough.
+Independently of the version, an index older than
+FACE_EMBEDDING_INDEX_MAX_AGE seconds is reloaded in full, so a lost bump
+cannot keep deactivated or deleted embeddings matching indefinitely.
+
+Example usage:
+    index = get_face_embedding_index()
+    if not index.is_empty:
+        employee_id, distance = index.nearest(probe_encoding)
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from django.conf import settings
+
+logger = logging.getLogger("biometrics")
+
+# Length of the stored change log; more changes since the last refresh
+# trigger a full reload
+MAX_INCREMENTAL_CHANGES = 500
+
+DEFAULT_MAX_AGE_SECONDS = 300
+
+
+def _to_vectors(embeddings: Iterable[Dict]) -> List[np.ndarray]:
+    """float32 vectors of embedding documents ({"vector": [...], ...})"""
+    vectors = []
+    for embedding in embeddings or []:
+        vector = embedding.get("vector") if isinstance(embedding, dict) else None
+        if vector:
+            vectors.append(np.asarray(vector, dtype=np.float32))
+    return vectors
+
+
+class FaceEmbeddingIndex:
+    """
+    All active embeddings as one matrix (one row per embedding).
+
+    Readers take an immutable (matrix, employee_ids) snapshot, so matching
+    never blocks on a refresh running in another thread.
+    """
+
+    def __init__(self, repository=None, max_age_seconds: Optional[float] = None):
+        """
+        Args:
+            repository: Source with get_all_active_embeddings(),
+                get_active_embeddings(employee_ids) and
+                get_embeddings_version(); None for a static index
+            max_age_seconds: Full reload interval (default:
+                FACE_EMBEDDING_INDEX_MAX_AGE)
+        """
+        self._repository = repository
+        self._max_age_seconds = max_age_seconds
+        self._loaded_at = -math.inf
+        self._lock = threading.Lock()
+        self._vectors: Dict[int, List[np.ndarray]] = {}
+        self._snapshot: Tuple[np.ndarray, np.ndarray] = (
+            np.empty((0, 0), dtype=np.float32),
+            np.empty(0, dtype=np.int64),
+        )
+        self._version: Optional[int] = None
+
+    @classmethod
+    def from_embeddings(
+        cls, all_embeddings: Iterable[Tuple[int, List[Dict]]]
+    ) -> "FaceEmbeddingIndex":
+        """Static index of (employee_id, embeddings) tuples"""
+        index = cls()
+        for employee_id, embeddings in all_embeddings:
+            index._set_employee(employee_id, embeddings)
+        index._rebuild()
+        return index
+
+    @property
+    def max_age_seconds(self) -> float:
+        if self._max_age_seconds is not None:
+            return self._max_age_seconds
+        return getattr(
+            settings, "FACE_EMBEDDING_INDEX_MAX_AGE", DEFAULT_MAX_AGE_SECONDS
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self._snapshot[1]) == 0
+
+    @property
+    def employee_count(self) -> int:
+        return len(np.unique(self._snapshot[1]))
+
+    def __len__(self) -> int:
+        return len(self._snapshot[1])
+
+    def nearest(self, encoding) -> Optional[Tuple[int, float]]:
+        """
+        Closest stored embedding to a probe encoding.
+
+        Returns:
+            (employee_id, euclidean distance), or None for an empty index
+        """
+        matrix, employee_ids = self._snapshot
+        if not len(employee_ids):
+            return None
+
+        probe = np.asarray(encoding, dtype=np.float32)
+        if probe.shape != matrix.shape[1:]:
+            logger.warning(
+                f"Probe encoding has {probe.size} dimensions, "
+                f"index has {matrix.shape[1]}"
+            )
+            return None
+
+        distances = np.linalg.norm(matrix - probe, axis=1)
+        best = int(np.argmin(distances))
+        return int(employee_ids[best]), float(distances[best])
+
+    def refresh(self) -> "FaceEmbeddingIndex":
+        """Catch up with embedding changes made by any process"""
+        if self._repository is None:
+            return self
+
+        # (version, change log), None if the version could not be read
+        state = self._repository.get_embeddings_version()
+        if not self._is_stale(state):
+            return self
+
+        with self._lock:
+            if not self._is_stale(state):
+                return self
+
+            version, changes = state if state is not None else (None, [])
+            changed = None
+            if not self._is_expired():
+                changed = self._get_changed_employees(self._version, version, changes)
+            if changed is None:
+                loaded = self._load_all()
+            else:
+                loaded = self._load_employees(changed)
+
+            self._rebuild()
+            # An empty or failed load is retried on the next refresh
+            if loaded:
+                self._version = version
+                if changed is None:
+                    self._loaded_at = time.monotonic()
+
+        return self
+
+    def _is_expired(self) -> bool:
+        return time.monotonic() - self._loaded_at >= self.max_age_seconds
+
+    def _is_stale(self, state: Optional[Tuple[int, Sequence[int]]]) -> bool:
+        if self._is_expired():
+            return True
+        # An unreadable version keeps the index until it expires
+        return state is not None and state[0] != self._version
+
+    @staticmethod
+    def _get_changed_employees(
+        old_version: Optional[int],
+        new_version: Optional[int],
+        changes: Sequence[int],
+    ) -> Optional[Set[int]]:
+        """Employees changed between two versions, None if unknown"""
+        if old_version is None or new_version is None or new_version < old_version:
+            return None
+        # changes[-1] is the employee of new_version, changes[-2] of the one
+        # before, and so on
+        missed = new_version - old_version
+        if missed > len(changes):
+            return None
+        return set(changes[len(changes) - missed :])
+
+    def _load_all(self) -> bool:
+        all_embeddings = self._repository.get_all_active_embeddings()
+        self._vectors = {}
+        for employee_id, embeddings in all_embeddings:
+            self._set_employee(employee_id, embeddings)
+        logger.info(
+            f"Face embedding index loaded: {len(self._vectors)} employees",
+            extra={"employees": len(self._vectors), "action": "face_index_load"},
+        )
+        return bool(all_embeddings)
+
+    def _load_employees(self, employee_ids: Set[int]) -> bool:
+        embeddings_by_employee = self._repository.get_active_embeddings(
+            sorted(employee_ids)
+        )
+        if embeddings_by_employee is None:
+            return False
+        for employee_id in employee_ids:
+            self._set_employee(employee_id, embeddings_by_employee.get(employee_id))
+        logger.debug(
+            f"Face embedding index refreshed {len(employee_ids)} employees",
+            extra={"employees": len(employee_ids), "action": "face_index_refresh"},
+        )
+        return True
+
+    def _set_employee(self, employee_id: int, embeddings) -> None:
+        vectors = _to_vectors(embeddings)
+        if vectors:
+            self._vectors[employee_id] = vectors
+        else:
+            self._vectors.pop(employee_id, None)
+
+    def _rebuild(self) -> None:
+        rows, employee_ids = [], []
+        dimensions = None
+        for employee_id, vectors in self._vectors.items():
+            for vector in vectors:
+                dimensions = dimensions or vector.shape
+                if vector.shape != dimensions:
+                    logger.warning(
+                        "Skipping embedding with mismatched dimensions",
+                        extra={"dimensions": vector.size},
+                    )
+                    continue
+                rows.append(vector)
+                employee_ids.append(employee_id)
+
+        if rows:
+            matrix = np.ascontiguousarray(np.vstack(rows), dtype=np.float32)
+        else:
+            matrix = np.empty((0, 0), dtype=np.float32)
+        self._snapshot = (matrix, np.asarray(employee_ids, dtype=np.int64))
+
+
+def get_face_embedding_index() -> FaceEmbeddingIndex:
+    """Refreshed index of the process-wide MongoBiometricRepository"""
+    from .mongodb_repository import get_mongo_biometric_repository
+
+    return get_mongo_biometric_repository().get_embedding_index()
@@ -232,13 +232,15 @@ class EnhancedBiometricService:
         return profile if "profile" in locals() else None
 
     def verify_biometric(
-        self, face_encoding: List[float]
+        self, face_encoding: List[float], employee_id: Optional[int] = None
     ) -> Optional[Tuple[int, float]]:
         """
         Verify biometric data against all registered employees
 
         Args:
             face_encoding: Face encoding vector
+            employee_id: Claimed employee; only their embeddings are compared
+                (1:1 verification)
 
         Returns:
             Tuple of (employee_id, confidence_score) if match found, None otherwise
@@ -254,7 +256,12 @@ class EnhancedBiometricService:
             )  # lgtm[py/clear-text-logging-sensitive-data]
 
         try:
-            result = self.mongo_repo.find_matching_employee(face_encoding)
+            # Same threshold as FaceProcessor (check-in) for 1:1 and 1:N
+            result = self.mongo_repo.find_matching_employee(
+                face_encoding,
+                tolerance=getattr(settings, "FACE_RECOGNITION_TOLERANCE", 0.8),
+                employee_id=employee_id,
+            )
             if result:
                 employee_id, confidence = result
                 logger.info(
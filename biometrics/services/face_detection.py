@@ -0,0 +1,397 @@
+"""
+Budgeted face detection pipeline for FaceProcessor.detect_faces.
+
+FaceProcessor.detect_faces used to try HOG at several upsamplings, then a
+grid of three Haar cascades x 6 scale factors x 5 minNeighbors, image
+enhancements and a CNN fallback - dozens of detector passes on a bad image,
+with a new CascadeClassifier constructed for most of them.
+
+FaceDetectionPipeline runs a configurable list of DetectionStage passes until
+one finds a face:
+- stages share one downscaled working image per size and enhancement
+- Haar cascades are loaded once per process and shared (the dlib HOG and CNN
+  detectors are module-level instances of face_recognition)
+- the pipeline stops when the per-image time budget is spent, and skips
+  stages whose measured duration no longer fits into it
+- each stage's runs, hits and duration are recorded; once a stage has enough
+  samples it is reordered among the measured stages by its cost per
+  detected face, so the stage that usually succeeds runs first
+
+Settings:
+    FACE_DETECTION_BUDGET_MS: time budget per image (the first stage always
+        runs)
+    FACE_DETECTION_STAGES: stage names from DEFAULT_STAGES, in order
+        (default: all)
+    FACE_DETECTION_ADAPTIVE_ORDER: reorder stages by measured cost
+
+Example usage:
+    result = get_face_detection_pipeline().detect(image)
+    if result.face_locations:
+        ...
+    get_face_detection_pipeline().get_stats()
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import face_recognition
+import numpy as np
+
+from django.conf import settings
+
+from core.logging_utils import err_tag
+
+logger = logging.getLogger(__name__)
+
+# Contrast (alpha) and brightness (beta) of the convertScaleAbs enhancements
+ENHANCEMENTS = {
+    "contrast_bright": (1.2, 30),
+    "high_contrast": (1.5, 20),
+    "low_contrast_bright": (0.8, 40),
+    "brightness_only": (1.0, 50),
+}
+
+# Runs a stage needs before it takes part in the adaptive ordering
+MIN_STAGE_SAMPLES = 20
+
+DEFAULT_BUDGET_MS = 1500
+
+
+@dataclass(frozen=True)
+class DetectionStage:
+    """One detector pass over a (downscaled, optionally enhanced) image"""
+
+    name: str
+    detector: str  # "hog", "cnn" or "haar"
+    max_size: Optional[int] = 800  # longest side of the image the stage sees
+    upsample: int = 0  # dlib upsamplings (hog, cnn)
+    enhancement: Optional[str] = None  # "equalize" or an ENHANCEMENTS key
+    cascade: str = "haarcascade_frontalface_default.xml"
+    scale_factor: float = 1.1
+    min_neighbors: int = 3
+
+
+# A higher minNeighbors only drops detections of a lower one, so the Haar
+# stages use a single setting instead of the former 6 x 5 grid per cascade
+DEFAULT_STAGES: Tuple[DetectionStage, ...] = (
+    DetectionStage("hog", "hog"),
+    DetectionStage("hog_upsample", "hog", upsample=1),
+    DetectionStage("haar_default", "haar"),
+    DetectionStage("haar_alt2", "haar", cascade="haarcascade_frontalface_alt2.xml"),
+    DetectionStage("hog_equalized", "hog", enhancement="equalize"),
+    DetectionStage("haar_equalized", "haar", enhancement="equalize", min_neighbors=2),
+    DetectionStage("hog_contrast_bright", "hog", enhancement="contrast_bright"),
+    DetectionStage("hog_brightness_only", "hog", enhancement="brightness_only"),
+    DetectionStage("haar_aggressive", "haar", scale_factor=1.05, min_neighbors=1),
+    DetectionStage("cnn", "cnn", max_size=200),
+)
+
+
+@dataclass
+class StageStats:
+    """Recorded runs of one stage"""
+
+    runs: int = 0
+    hits: int = 0
+    skipped: int = 0
+    total_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.runs if self.runs else 0.0
+
+    @property
+    def success_rate(self) -> float:
+        return self.hits / self.runs if self.runs else 0.0
+
+    @property
+    def cost_per_hit_ms(self) -> float:
+        """Expected detector time spent in this stage per detected face"""
+        return self.avg_ms / self.success_rate if self.hits else math.inf
+
+    def to_dict(self) -> Dict:
+        return {
+            "runs": self.runs,
+            "hits": self.hits,
+            "skipped": self.skipped,
+            "avg_ms": round(self.avg_ms, 1),
+            "success_rate": round(self.success_rate, 3),
+        }
+
+
+@dataclass
+class DetectionResult:
+    """
+    Faces found by the pipeline.
+
+    face_locations are (top, right, bottom, left) in input image
+    coordinates; stage_locations are the same faces in stage_image, the
+    downscaled/enhanced image the successful stage ran on.
+    """
+
+    face_locations: List[Tuple[int, int, int, int]] = field(default_factory=list)
+    stage: Optional[str] = None
+    stage_image: Optional[np.ndarray] = None
+    stage_locations: List[Tuple[int, int, int, int]] = field(default_factory=list)
+    scale: float = 1.0  # stage_image size / input image size
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+    budget_exhausted: bool = False
+
+    @property
+    def total_ms(self) -> float:
+        return round(sum(self.timings_ms.values()), 1)
+
+
+_cascades: Dict[str, Optional["cv2.CascadeClassifier"]] = {}
+_cascades_lock = threading.Lock()
+
+
+def get_cascade(cascade_file: str):
+    """Shared CascadeClassifier, loaded on first use (None if unavailable)"""
+    if cascade_file not in _cascades:
+        with _cascades_lock:
+            if cascade_file not in _cascades:
+                classifier = cv2.CascadeClassifier(cv2.data.haarcascades + cascade_file)
+                if classifier.empty():
+                    logger.warning(f"Haar cascade {cascade_file} could not be loaded")
+                    classifier = None
+                _cascades[cascade_file] = classifier
+    return _cascades[cascade_file]
+
+
+class _WorkingImages:
+    """Downscaled and enhanced variants of one input image, built once each"""
+
+    def __init__(self, image: np.ndarray):
+        self.image = image
+        self._rgb: Dict[Tuple, Tuple[np.ndarray, float]] = {}
+        self._gray: Dict[Tuple, np.ndarray] = {}
+
+    def rgb(
+        self, max_size: Optional[int], enhancement: Optional[str] = None
+    ) -> Tuple[np.ndarray, float]:
+        """(image, scale relative to the input image)"""
+        key = (max_size, enhancement)
+        if key not in self._rgb:
+            if enhancement is None:
+                self._rgb[key] = self._resized(max_size)
+            elif enhancement == "equalize":
+                equalized = self.gray(max_size, enhancement)
+                _, scale = self.rgb(max_size)
+                self._rgb[key] = (cv2.cvtColor(equalized, cv2.COLOR_GRAY2RGB), scale)
+            else:
+                alpha, beta = ENHANCEMENTS[enhancement]
+                image, scale = self.rgb(max_size)
+                enhanced = cv2.convertScaleAbs(image, alpha=alpha, beta=beta)
+                self._rgb[key] = (enhanced, scale)
+        return self._rgb[key]
+
+    def gray(
+        self, max_size: Optional[int], enhancement: Optional[str] = None
+    ) -> np.ndarray:
+        key = (max_size, enhancement)
+        if key not in self._gray:
+            if enhancement == "equalize":
+                self._gray[key] = cv2.equalizeHist(self.gray(max_size))
+            else:
+                image, _ = self.rgb(max_size, enhancement)
+                self._gray[key] = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+        return self._gray[key]
+
+    def _resized(self, max_size: Optional[int]) -> Tuple[np.ndarray, float]:
+        longest = max(self.image.shape[:2])
+        if not max_size or longest <= max_size:
+            return self.image, 1.0
+        scale = max_size / longest
+        resized = cv2.resize(
+            self.image,
+            (int(self.image.shape[1] * scale), int(self.image.shape[0] * scale)),
+            interpolation=cv2.INTER_AREA,
+        )
+        return resized, scale
+
+
+def _scale_locations(
+    locations: Sequence[Tuple[int, int, int, int]], factor: float
+) -> List[Tuple[int, int, int, int]]:
+    if factor == 1.0:
+        return [tuple(int(v) for v in location) for location in locations]
+    return [tuple(int(v * factor) for v in location) for location in locations]
+
+
+class FaceDetectionPipeline:
+    """
+    Ordered detector stages with a time budget and per-stage statistics.
+
+    Statistics are process-wide; one pipeline instance is shared by all
+    requests of a process (see get_face_detection_pipeline).
+    """
+
+    def __init__(
+        self,
+        stages: Optional[Sequence[DetectionStage]] = None,
+        budget_ms: Optional[float] = None,
+        adaptive: bool = True,
+        min_samples: int = MIN_STAGE_SAMPLES,
+    ):
+        self.stages = list(stages or DEFAULT_STAGES)
+        self.budget_ms = budget_ms if budget_ms is not None else DEFAULT_BUDGET_MS
+        self.adaptive = adaptive
+        self.min_samples = min_samples
+        self._stats = {stage.name: StageStats() for stage in self.stages}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "FaceDetectionPipeline":
+        """Pipeline configured by the FACE_DETECTION_* settings"""
+        stages = list(DEFAULT_STAGES)
+        names = [
+            name for name in getattr(settings, "FACE_DETECTION_STAGES", []) if name
+        ]
+        if names:
+            by_name = {stage.name: stage for stage in DEFAULT_STAGES}
+            unknown = [name for name in names if name not in by_name]
+            if unknown:
+                raise ValueError(f"Unknown face detection stages: {unknown}")
+            stages = [by_name[name] for name in names]
+        return cls(
+            stages,
+            budget_ms=getattr(settings, "FACE_DETECTION_BUDGET_MS", DEFAULT_BUDGET_MS),
+            adaptive=getattr(settings, "FACE_DETECTION_ADAPTIVE_ORDER", True),
+        )
+
+    def ordered_stages(self) -> List[DetectionStage]:
+        """
+        Stages in run order.
+
+        Stages with at least min_samples runs are sorted by cost per detected
+        face within the positions they occupy; the others keep their
+        configured position.
+        """
+        if not self.adaptive:
+            return list(self.stages)
+        with self._lock:
+            measured = [
+                i
+                for i, stage in enumerate(self.stages)
+                if self._stats[stage.name].runs >= self.min_samples
+            ]
+            ranked = sorted(
+                (self.stages[i] for i in measured),
+                key=lambda stage: self._stats[stage.name].cost_per_hit_ms,
+            )
+        ordered = list(self.stages)
+        for position, stage in zip(measured, ranked):
+            ordered[position] = stage
+        return ordered
+
+    def detect(self, image: np.ndarray) -> DetectionResult:
+        """Run the stages until one finds a face or the budget is spent"""
+        result = DetectionResult()
+        images = _WorkingImages(image)
+        start = time.perf_counter()
+
+        for i, stage in enumerate(self.ordered_stages()):
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if i > 0:
+                remaining_ms = self.budget_ms - elapsed_ms
+                if remaining_ms <= 0:
+                    result.budget_exhausted = True
+                    break
+                if self._expected_ms(stage) > remaining_ms:
+                    self._record_skip(stage)
+                    continue
+
+            stage_start = time.perf_counter()
+            try:
+                locations, stage_image, scale = self._run_stage(stage, images)
+            except Exception as e:
+                logger.warning(
+                    f"Face detection stage {stage.name} failed: {err_tag(e)}"
+                )
+                locations, stage_image, scale = [], None, 1.0
+            duration_ms = (time.perf_counter() - stage_start) * 1000
+
+            result.timings_ms[stage.name] = round(duration_ms, 1)
+            self._record_run(stage, duration_ms, bool(locations))
+            if locations:
+                result.stage = stage.name
+                result.stage_image = stage_image
+                result.stage_locations = _scale_locations(locations, 1.0)
+                result.scale = scale
+                result.face_locations = _scale_locations(locations, 1.0 / scale)
+                break
+
+        logger.info(
+            f"Face detection: {len(result.face_locations)} faces via "
+            f"{result.stage or 'no stage'} in {result.total_ms:.0f}ms",
+            extra={
+                "stage": result.stage,
+                "timings_ms": result.timings_ms,
+                "budget_exhausted": result.budget_exhausted,
+                "action": "face_detection",
+            },
+        )
+        return result
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-stage runs, hits, skips and average duration"""
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = {stage.name: StageStats() for stage in self.stages}
+
+    def _run_stage(self, stage: DetectionStage, images: _WorkingImages):
+        image, scale = images.rgb(stage.max_size, stage.enhancement)
+        if stage.detector == "haar":
+            cascade = get_cascade(stage.cascade)
+            if cascade is None:
+                return [], image, scale
+            faces = cascade.detectMultiScale(
+                images.gray(stage.max_size, stage.enhancement),
+                scaleFactor=stage.scale_factor,
+                minNeighbors=stage.min_neighbors,
+            )
+            locations = [(y, x + w, y + h, x) for (x, y, w, h) in faces]
+        else:
+            locations = face_recognition.face_locations(
+                image, number_of_times_to_upsample=stage.upsample, model=stage.detector
+            )
+        return locations, image, scale
+
+    def _expected_ms(self, stage: DetectionStage) -> float:
+        with self._lock:
+            stats = self._stats[stage.name]
+            return stats.avg_ms if stats.runs >= self.min_samples else 0.0
+
+    def _record_run(self, stage: DetectionStage, duration_ms: float, hit: bool):
+        with self._lock:
+            stats = self._stats[stage.name]
+            stats.runs += 1
+            stats.hits += int(hit)
+            stats.total_ms += duration_ms
+
+    def _record_skip(self, stage: DetectionStage):
+        with self._lock:
+            self._stats[stage.name].skipped += 1
+
+
+_pipeline: Optional[FaceDetectionPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_face_detection_pipeline() -> FaceDetectionPipeline:
+    """Process-wide pipeline configured from settings"""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = FaceDetectionPipeline.from_settings()
+    return _pipeline
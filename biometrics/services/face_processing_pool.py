@@ -0,0 +1,270 @@
+"""
+Worker process pool for face detection and encoding.
+
+Decoding, detection (dlib, OpenCV) and encoding used to run on the web
+request thread, so a burst of shift-change check-ins occupied every web
+worker. With FACE_PROCESSING_WORKERS > 0, FaceProcessor submits
+process_registration_image jobs to a pool of worker processes instead:
+- each worker loads Django, the dlib models and the Haar cascades once at
+  start-up
+- at most FACE_PROCESSING_WORKERS + FACE_PROCESSING_QUEUE_SIZE jobs are in
+  flight per web process; further jobs are rejected at once with
+  FaceProcessingUnavailable (503 + Retry-After) instead of queueing
+- a job that does not finish within FACE_PROCESSING_TIMEOUT seconds fails
+  the request with the same error; the job itself keeps its slot until the
+  worker finishes it, so the bound stays accurate
+- queue depth, queue wait and run time are recorded (get_stats()) and
+  logged per job
+
+The pool and its bound are per web process, and only help when one process
+serves several requests at a time: production runs gunicorn with threaded
+workers (--worker-class gthread --threads, docker-compose.prod.yml). With
+sync workers a process holds one request, so each pool sees at most one job.
+
+Example usage:
+    pool = get_face_processing_pool()
+    if pool is not None:
+        result = pool.process_registration_image(base64_image)
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Dict, NoReturn, Optional
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from django.conf import settings
+
+from core.logging_utils import err_tag
+
+logger = logging.getLogger("biometrics")
+
+
+class FaceProcessingUnavailable(APIException):
+    """
+    Face processing pool saturated, broken or too slow.
+
+    DRF turns it into a 503 with a Retry-After header (wait seconds).
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Face processing is busy, please retry shortly"
+    default_code = "face_processing_busy"
+
+    def __init__(self, detail=None, wait: int = 1):
+        super().__init__(detail)
+        self.wait = wait
+
+
+@dataclass
+class PoolStats:
+    """Jobs handled by one web process's pool"""
+
+    submitted: int = 0
+    completed: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    total_queue_ms: float = 0.0
+    total_run_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        completed = self.completed or 1
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "failed": self.failed,
+            "queue_depth": self.in_flight,
+            "max_queue_depth": self.max_in_flight,
+            "avg_queue_ms": round(self.total_queue_ms / completed, 1),
+            "avg_run_ms": round(self.total_run_ms / completed, 1),
+        }
+
+
+# FaceProcessor of the worker process, created by _init_worker
+_worker_processor = None
+
+
+def _init_worker() -> None:
+    """Load Django, the dlib models and the Haar cascades once per worker"""
+    global _worker_processor
+
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+    # Importing face_processor loads the dlib models of face_recognition
+    from .face_detection import get_cascade, get_face_detection_pipeline
+    from .face_processor import FaceProcessor
+
+    for stage in get_face_detection_pipeline().stages:
+        if stage.detector == "haar":
+            get_cascade(stage.cascade)
+    _worker_processor = FaceProcessor()
+
+
+def _process_in_worker(base64_image: str):
+    """Job run in a worker: (result, started_at, finished_at)"""
+    started_at = time.time()
+    result = _worker_processor.process_registration_image_inline(base64_image)
+    return result, started_at, time.time()
+
+
+class FaceProcessingPool:
+    """Bounded process pool for FaceProcessor jobs of one web process"""
+
+    def __init__(
+        self,
+        workers: int,
+        queue_size: int = 4,
+        timeout: float = 10.0,
+        retry_after: int = 2,
+    ):
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = PoolStats()
+
+    def process_registration_image(self, base64_image: str) -> Dict[str, Any]:
+        """
+        FaceProcessor.process_registration_image in a worker process.
+
+        Raises:
+            FaceProcessingUnavailable: Pool full, broken, or job too slow
+        """
+        if not self._acquire_slot():
+            logger.warning(
+                "Face processing pool saturated, rejecting job",
+                extra={**self.get_stats(), "action": "face_pool_rejected"},
+            )
+            raise FaceProcessingUnavailable(wait=self.retry_after)
+
+        submitted_at = time.time()
+        try:
+            future = self._get_executor().submit(_process_in_worker, base64_image)
+        except Exception as e:
+            self._release_slot()
+            self._fail(f"Face processing pool unavailable: {err_tag(e)}")
+        future.add_done_callback(lambda _: self._release_slot())
+
+        try:
+            result, started_at, finished_at = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # A job still waiting is dropped; a running one keeps its slot
+            future.cancel()
+            with self._lock:
+                self._stats.timed_out += 1
+            raise FaceProcessingUnavailable(
+                "Face processing timed out, please retry", wait=self.retry_after
+            )
+        except BrokenProcessPool as e:
+            self._fail(f"Face processing worker died: {err_tag(e)}")
+        except Exception:
+            with self._lock:
+                self._stats.failed += 1
+            raise
+
+        queue_ms = max(0.0, (started_at - submitted_at) * 1000)
+        run_ms = (finished_at - started_at) * 1000
+        with self._lock:
+            self._stats.completed += 1
+            self._stats.total_queue_ms += queue_ms
+            self._stats.total_run_ms += run_ms
+            depth = self._stats.in_flight
+        logger.debug(
+            f"Face processing job: {queue_ms:.0f}ms queued, {run_ms:.0f}ms run",
+            extra={
+                "queue_ms": round(queue_ms, 1),
+                "run_ms": round(run_ms, 1),
+                "queue_depth": depth,
+                "action": "face_pool_job",
+            },
+        )
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Job counters, current/max queue depth and average latencies"""
+        with self._lock:
+            return self._stats.to_dict()
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _acquire_slot(self) -> bool:
+        with self._lock:
+            if self._stats.in_flight >= self.capacity:
+                self._stats.rejected += 1
+                return False
+            self._stats.in_flight += 1
+            self._stats.submitted += 1
+            self._stats.max_in_flight = max(
+                self._stats.max_in_flight, self._stats.in_flight
+            )
+            return True
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._stats.in_flight -= 1
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: workers start clean instead of forking a threaded
+                # web process
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return self._executor
+
+    def _fail(self, message: str) -> NoReturn:
+        """Drop a broken executor (recreated on the next job) and raise"""
+        logger.error(message, extra={"action": "face_pool_failed"})
+        with self._lock:
+            self._stats.failed += 1
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        raise FaceProcessingUnavailable(wait=self.retry_after)
+
+
+_pool: Optional[FaceProcessingPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_face_processing_pool() -> Optional[FaceProcessingPool]:
+    """Pool of this web process, None when FACE_PROCESSING_WORKERS is 0"""
+    global _pool
+    workers = getattr(settings, "FACE_PROCESSING_WORKERS", 0)
+    if workers <= 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = FaceProcessingPool(
+                    workers,
+                    queue_size=getattr(settings, "FACE_PROCESSING_QUEUE_SIZE", 4),
+                    timeout=getattr(settings, "FACE_PROCESSING_TIMEOUT", 10.0),
+                    retry_after=getattr(settings, "FACE_PROCESSING_RETRY_AFTER", 2),
+                )
+    return _pool
@@ -2,7 +2,7 @@ import base64
 import io
 import logging
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import cv2
 import face_recognition
@@ -13,6 +13,10 @@ from django.conf import settings
 
 from core.logging_utils import err_tag
 
+from .embedding_index import FaceEmbeddingIndex
+from .face_detection import get_face_detection_pipeline
+from .face_processing_pool import get_face_processing_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,13 +28,23 @@ class FaceProcessor:
         self.model = getattr(settings, "FACE_ENCODING_MODEL", "large")
         self.min_face_size = getattr(settings, "MIN_FACE_SIZE", (50, 50))
         self.quality_threshold = getattr(settings, "FACE_QUALITY_THRESHOLD", 0.65)
-
-    def decode_base64_image(self, base64_string: str) -> Optional[np.ndarray]:
+        self.max_image_dimension = getattr(settings, "FACE_IMAGE_MAX_DIMENSION", 1024)
+
+    def decode_base64_image(
+        self,
+        base64_string: str,
+        max_dimension: Optional[int] = None,
+        stats: Optional[Dict[str, Any]] = None,
+    ) -> Optional[np.ndarray]:
         """
         Enhanced base64 image decoder with validation and error handling
 
         Args:
             base64_string: Base64 encoded image
+            max_dimension: Decode at most this many pixels on the longest
+                side; JPEGs are decoded at reduced scale by libjpeg (draft
+                mode) instead of decoding full size and resizing afterwards
+            stats: Filled with bytes_in, source_pixels and decoded_pixels
 
         Returns:
             Numpy array of the image or None if failed
@@ -101,15 +115,33 @@ class FaceProcessor:
                         f"Very large image: {width}x{height}, consider resizing"
                     )
 
+                if max_dimension and max(width, height) > max_dimension:
+                    # JPEG: libjpeg decodes straight to RGB at 1/2, 1/4 or 1/8
+                    # scale (no-op for other formats), thumbnail() resamples
+                    # the rest of the way
+                    image.draft("RGB", (max_dimension, max_dimension))
+                    image.thumbnail((max_dimension, max_dimension))
+
                 # Convert to RGB if necessary
                 if image.mode != "RGB":
                     logger.debug(f"Converting image from {image.mode} to RGB")
                     image = image.convert("RGB")
 
-                # Convert to numpy array
+                # Convert to numpy array (writable: dlib and OpenCV consume it)
                 image_array = np.array(image)
+
+                decoded_width, decoded_height = image.size
+                decode_stats = {
+                    "bytes_in": len(image_data),
+                    "source_pixels": width * height,
+                    "decoded_pixels": decoded_width * decoded_height,
+                }
+                if stats is not None:
+                    stats.update(decode_stats)
                 logger.info(
-                    f"Successfully converted to numpy array: {image_array.shape}"
+                    f"Image decoded: {len(image_data)} bytes, {width}x{height} "
+                    f"-> {decoded_width}x{decoded_height}",
+                    extra={**decode_stats, "action": "face_image_decode"},
                 )
 
                 return image_array
@@ -139,7 +171,7 @@ class FaceProcessor:
 
             # Resize if too large (for performance)
             height, width = image.shape[:2]
-            max_dimension = 1024
+            max_dimension = self.max_image_dimension
 
             if max(height, width) > max_dimension:
                 scale = max_dimension / max(height, width)
@@ -225,7 +257,10 @@ class FaceProcessor:
 
     def detect_faces(self, image: np.ndarray) -> Tuple[List, List]:
         """
-        Detect faces in the image with aggressive detection methods
+        Detect faces in the image
+
+        Runs the budgeted detector cascade of
+        biometrics.services.face_detection (FACE_DETECTION_* settings).
 
         Args:
             image: Numpy array of the image
@@ -234,301 +269,36 @@ class FaceProcessor:
             Tuple of (face_locations, face_landmarks)
         """
         try:
-            detection_start_time = time.time()
-            original_shape = image.shape
-            logger.info(f"🕐 Starting face detection on image: {original_shape}")
-
-            # DEBUG: Check image properties
-            logger.info(f"🔍 Image analysis:")
-            logger.info(f"   - Shape: {image.shape}")
-            logger.info(f"   - Data type: {image.dtype}")
-            logger.info(f"   - Min/Max values: {image.min()}/{image.max()}")
-            logger.info(f"   - Mean brightness: {np.mean(image):.2f}")
-
-            # Try on multiple image sizes for better detection
-            working_image = image.copy()
-            face_locations = []
-            scale_factor = 1.0
-
-            # Method 0: FAST detection first - prioritize speed over accuracy
-            method_start_time = time.time()
-            logger.info("🚀 Trying FAST detection with minimal processing...")
-            try:
-                # Try HOG first with no upsampling (fastest)
-                hog_start = time.time()
-                face_locations = face_recognition.face_locations(
-                    working_image, number_of_times_to_upsample=0, model="hog"
-                )
-                hog_time = (time.time() - hog_start) * 1000
-                logger.info(
-                    f"⚡ Fast HOG (no upsample): {len(face_locations)} faces in {hog_time:.0f}ms"
-                )
-
-                # Only try one upsampling if nothing found
-                if not face_locations:
-                    hog_start = time.time()
-                    face_locations = face_recognition.face_locations(
-                        working_image, number_of_times_to_upsample=1, model="hog"
-                    )
-                    hog_time = (time.time() - hog_start) * 1000
-                    logger.info(
-                        f"⚡ Fast HOG (upsample=1): {len(face_locations)} faces in {hog_time:.0f}ms"
-                    )
-
-            except Exception as e:
-                logger.warning(f"Fast detection failed: {e}")
-
-            method_time = (time.time() - method_start_time) * 1000
-            logger.info(f"⏱️ Method 0 total time: {method_time:.0f}ms")
-
-            # Method 1: Try original size first (if not too large)
-            if not face_locations and max(image.shape[:2]) <= 800:
-                logger.info("Trying original size detection...")
-                try:
-                    face_locations = face_recognition.face_locations(
-                        working_image, model="hog"
-                    )
-                    logger.info(f"Original size HOG: {len(face_locations)} faces")
-                    if not face_locations:
-                        face_locations = face_recognition.face_locations(
-                            working_image, model="cnn"
-                        )
-                        logger.info(f"Original size CNN: {len(face_locations)} faces")
-                except Exception as e:
-                    logger.warning(f"Original size detection failed: {e}")
-
-            # Method 2: Resize to optimal size (800px max)
-            if not face_locations:
-                target_size = 800
-                if max(image.shape[:2]) > target_size:
-                    scale_factor = target_size / max(image.shape[:2])
-                    new_width = int(image.shape[1] * scale_factor)
-                    new_height = int(image.shape[0] * scale_factor)
-                    working_image = cv2.resize(image, (new_width, new_height))
-                    logger.info(f"Resized to {working_image.shape} for detection")
-
-                logger.info("Trying resized image HOG detection...")
-                try:
-                    face_locations = face_recognition.face_locations(
-                        working_image, model="hog"
-                    )
-                    logger.info(f"Resized HOG: {len(face_locations)} faces")
-                except Exception as e:
-                    logger.warning(f"Resized HOG failed: {e}")
-
-            # Method 3: Try upsampling on resized image
-            if not face_locations:
-                logger.info("Trying upsampled detection...")
-                try:
-                    face_locations = face_recognition.face_locations(
-                        working_image, number_of_times_to_upsample=1
-                    )
-                    logger.info(f"Upsampled: {len(face_locations)} faces")
-                except Exception as e:
-                    logger.warning(f"Upsampled detection failed: {e}")
-
-            # Method 4: Skip CNN entirely for speed - move to method 7
-
-            # Method 5: OpenCV cascade as fallback - MORE AGGRESSIVE
-            if not face_locations:
-                logger.info("Trying OpenCV Haar cascades...")
-                try:
-                    gray = cv2.cvtColor(working_image, cv2.COLOR_RGB2GRAY)
-
-                    # Try different cascade files
-                    cascade_files = [
-                        "haarcascade_frontalface_default.xml",
-                        "haarcascade_frontalface_alt.xml",
-                        "haarcascade_frontalface_alt2.xml",
-                    ]
-
-                    for cascade_file in cascade_files:
-                        try:
-                            cascade_path = cv2.data.haarcascades + cascade_file
-                            face_cascade = cv2.CascadeClassifier(cascade_path)
-
-                            # Try different scale factors AND minimum neighbors
-                            for scale in [1.05, 1.1, 1.15, 1.2, 1.3, 1.5]:
-                                for min_neighbors in [1, 2, 3, 4, 5]:
-                                    faces = face_cascade.detectMultiScale(
-                                        gray, scale, min_neighbors
-                                    )
-                                    if len(faces) > 0:
-                                        face_locations = [
-                                            (y, x + w, y + h, x)
-                                            for (x, y, w, h) in faces
-                                        ]
-                                        logger.info(
-                                            f"OpenCV {cascade_file} scale {scale} neighbors {min_neighbors}: {len(face_locations)} faces"
-                                        )
-                                        break
-                                if face_locations:
-                                    break
-                            if face_locations:
-                                break
-                        except Exception as e:
-                            logger.warning(f"OpenCV cascade {cascade_file} failed: {e}")
-                except Exception as e:
-                    logger.warning(f"All OpenCV detection failed: {e}")
-
-            # Method 6: Try with image enhancement - MULTIPLE ENHANCEMENTS
-            if not face_locations:
-                logger.info("Trying with enhanced image...")
-                try:
-                    # Try different enhancement techniques
-                    enhancements = [
-                        # Contrast and brightness
-                        {"alpha": 1.2, "beta": 30, "name": "contrast_bright"},
-                        {"alpha": 1.5, "beta": 20, "name": "high_contrast"},
-                        {"alpha": 0.8, "beta": 40, "name": "low_contrast_bright"},
-                        {"alpha": 1.0, "beta": 50, "name": "brightness_only"},
-                    ]
-
-                    for enhancement in enhancements:
-                        enhanced = cv2.convertScaleAbs(
-                            working_image,
-                            alpha=enhancement["alpha"],
-                            beta=enhancement["beta"],
-                        )
-
-                        # Try both HOG and OpenCV on enhanced image
-                        face_locations = face_recognition.face_locations(
-                            enhanced, model="hog"
-                        )
-                        if face_locations:
-                            logger.info(
-                                f"Enhanced image {enhancement['name']} HOG: {len(face_locations)} faces"
-                            )
-                            working_image = enhanced
-                            break
-
-                        # Try OpenCV on enhanced image
-                        gray_enhanced = cv2.cvtColor(enhanced, cv2.COLOR_RGB2GRAY)
-                        face_cascade = cv2.CascadeClassifier(
-                            cv2.data.haarcascades
-                            + "haarcascade_frontalface_default.xml"
-                        )
-                        faces = face_cascade.detectMultiScale(gray_enhanced, 1.1, 2)
-                        if len(faces) > 0:
-                            face_locations = [
-                                (y, x + w, y + h, x) for (x, y, w, h) in faces
-                            ]
-                            logger.info(
-                                f"Enhanced image {enhancement['name']} OpenCV: {len(face_locations)} faces"
-                            )
-                            working_image = enhanced
-                            break
-
-                except Exception as e:
-                    logger.warning(f"Enhanced detection failed: {e}")
-
-            # Method 7: Histogram equalization
-            if not face_locations:
-                logger.info("Trying histogram equalization...")
-                try:
-                    gray = cv2.cvtColor(working_image, cv2.COLOR_RGB2GRAY)
-                    equalized = cv2.equalizeHist(gray)
-                    equalized_rgb = cv2.cvtColor(equalized, cv2.COLOR_GRAY2RGB)
-
-                    face_locations = face_recognition.face_locations(
-                        equalized_rgb, model="hog"
-                    )
-                    if face_locations:
-                        logger.info(f"Histogram equalized: {len(face_locations)} faces")
-                        working_image = equalized_rgb
-                    else:
-                        # Try OpenCV on histogram equalized
-                        face_cascade = cv2.CascadeClassifier(
-                            cv2.data.haarcascades
-                            + "haarcascade_frontalface_default.xml"
-                        )
-                        faces = face_cascade.detectMultiScale(equalized, 1.1, 2)
-                        if len(faces) > 0:
-                            face_locations = [
-                                (y, x + w, y + h, x) for (x, y, w, h) in faces
-                            ]
-                            logger.info(
-                                f"Histogram equalized OpenCV: {len(face_locations)} faces"
-                            )
-                            working_image = equalized_rgb
-                except Exception as e:
-                    logger.warning(f"Histogram equalization failed: {e}")
+            result = get_face_detection_pipeline().detect(image)
+            face_locations = result.face_locations
 
-            # Method 8: CNN detection as LAST RESORT on very small image
-            if not face_locations:
-                logger.info("Trying CNN detection as last resort...")
-                try:
-                    # Make image very small for CNN (200px max)
-                    if max(working_image.shape[:2]) > 200:
-                        cnn_scale = 200 / max(working_image.shape[:2])
-                        cnn_width = int(working_image.shape[1] * cnn_scale)
-                        cnn_height = int(working_image.shape[0] * cnn_scale)
-                        cnn_image = cv2.resize(working_image, (cnn_width, cnn_height))
-                        scale_factor *= cnn_scale
-                    else:
-                        cnn_image = working_image
-
-                    face_locations = face_recognition.face_locations(
-                        cnn_image, model="cnn"
-                    )
-                    logger.info(f"CNN (last resort): {len(face_locations)} faces")
-                    working_image = cnn_image  # Update working image for scaling
-                except Exception as e:
-                    logger.warning(f"CNN detection failed: {e}")
-
-            # Scale face_locations back to original size
-            if face_locations and scale_factor != 1.0:
-                scale_back = 1.0 / scale_factor
-                scaled_locations = []
-                for top, right, bottom, left in face_locations:
-                    scaled_locations.append(
-                        (
-                            int(top * scale_back),
-                            int(right * scale_back),
-                            int(bottom * scale_back),
-                            int(left * scale_back),
-                        )
-                    )
-                face_locations = scaled_locations
-                logger.info(f"Scaled face locations back by factor {scale_back}")
-
-            # Get face landmarks if faces found
+            # Get face landmarks on the image the successful stage ran on
             face_landmarks = []
             if face_locations:
                 try:
-                    # Use the image coordinates that match the face_locations
-                    # face_locations are already in working_image coordinates after scaling
                     face_landmarks = face_recognition.face_landmarks(
-                        working_image, face_locations
+                        result.stage_image, result.stage_locations
                     )
-                    logger.info(
-                        f"Successfully extracted landmarks for {len(face_landmarks)} faces"
-                    )
-
-                    # Debug: check if landmarks contain eyes
-                    for i, landmarks in enumerate(face_landmarks):
-                        landmark_keys = list(landmarks.keys())
-                        has_eyes = (
-                            "left_eye" in landmark_keys and "right_eye" in landmark_keys
-                        )
-                        logger.info(
-                            f"Face {i+1} landmarks: {landmark_keys}, has_eyes: {has_eyes}"
-                        )
-
+                    if result.scale != 1.0:
+                        face_landmarks = [
+                            {
+                                feature: [
+                                    (int(x / result.scale), int(y / result.scale))
+                                    for x, y in points
+                                ]
+                                for feature, points in landmarks.items()
+                            }
+                            for landmarks in face_landmarks
+                        ]
                 except Exception as e:
-                    logger.warning(f"Failed to get face landmarks: {e}")
+                    logger.warning(f"Failed to get face landmarks: {err_tag(e)}")
                     face_landmarks = []
 
-            total_detection_time = (time.time() - detection_start_time) * 1000
-            logger.info(
-                f"🏁 FINAL DETECTION RESULT: {len(face_locations)} faces found in {total_detection_time:.0f}ms"
-            )
-            if face_locations:
+            if settings.DEBUG:
                 for i, (top, right, bottom, left) in enumerate(face_locations):
-                    face_width = right - left
-                    face_height = bottom - top
-                    logger.info(
-                        f"Face {i+1}: size {face_width}x{face_height}, position ({left},{top})"
+                    logger.debug(
+                        f"Face {i+1}: size {right - left}x{bottom - top}, "
+                        f"position ({left},{top})"
                     )
 
             return face_locations, face_landmarks
@@ -584,6 +354,27 @@ class FaceProcessor:
         """
         Process a single image for registration
 
+        Runs in the face processing pool when FACE_PROCESSING_WORKERS is set
+        (see biometrics.services.face_processing_pool), otherwise inline.
+
+        Args:
+            base64_image: Base64 encoded image
+
+        Returns:
+            Dictionary with processing results
+
+        Raises:
+            FaceProcessingUnavailable: Pool saturated or job timed out
+        """
+        pool = get_face_processing_pool()
+        if pool is not None:
+            return pool.process_registration_image(base64_image)
+        return self.process_registration_image_inline(base64_image)
+
+    def process_registration_image_inline(self, base64_image: str) -> Dict[str, Any]:
+        """
+        Process a single image for registration on the calling thread
+
         Args:
             base64_image: Base64 encoded image
 
@@ -593,9 +384,13 @@ class FaceProcessor:
         start_time = time.time()
         logger.info("Starting biometric image processing")
 
-        # Decode image
+        # Decode image at the preprocessing resolution, so face locations found
+        # on the processed image match the image the encoding is taken from
         logger.info(f"Decoding base64 image (length: {len(base64_image)})")
-        image = self.decode_base64_image(base64_image)
+        decode_stats: Dict[str, Any] = {}
+        image = self.decode_base64_image(
+            base64_image, max_dimension=self.max_image_dimension, stats=decode_stats
+        )
         if image is None:
             logger.error("Failed to decode base64 image")
             return {"success": False, "error": "Failed to decode image"}
@@ -711,6 +506,7 @@ class FaceProcessor:
             "face_size_ratio": face_size_ratio,
             "has_eyes": has_eyes,
             "processing_time_ms": processing_time,
+            "decode": decode_stats,
         }
 
     def process_multiple_images(self, base64_images: List[str]) -> Dict[str, Any]:
@@ -800,14 +596,17 @@ class FaceProcessor:
             return False, 0.0
 
     def find_matching_employee(
-        self, base64_image: str, all_embeddings: List[Tuple[int, List[Dict]]]
+        self,
+        base64_image: str,
+        all_embeddings: Union[FaceEmbeddingIndex, List[Tuple[int, List[Dict]]]],
     ) -> Dict[str, Any]:
         """
         Find matching employee from a face image
 
         Args:
             base64_image: Base64 encoded image
-            all_embeddings: List of tuples (employee_id, embeddings)
+            all_embeddings: FaceEmbeddingIndex (see get_face_embedding_index),
+                or a list of tuples (employee_id, embeddings)
 
         Returns:
             Dictionary with matching results
@@ -823,76 +622,26 @@ class FaceProcessor:
                 "details": result,
             }
 
-        unknown_encoding = np.array(result["encoding"])
+        index = all_embeddings
+        if not isinstance(index, FaceEmbeddingIndex):
+            index = FaceEmbeddingIndex.from_embeddings(all_embeddings)
 
-        # Compare with all known embeddings
+        # One vectorised distance computation over every stored embedding;
+        # the closest embedding decides the employee
+        nearest = index.nearest(result["encoding"])
         best_match_employee_id = None
         best_confidence = 0.0
-        all_matches = []  # Track all matches for debugging
-
-        logger.info(
-            f"🔍 Face matching debug - comparing against {len(all_embeddings)} employees"
-        )
-
-        for employee_id, employee_embeddings in all_embeddings:
-            # Extract encoding vectors
-            known_encodings = []
-            for embedding in employee_embeddings:
-                if "vector" in embedding:
-                    known_encodings.append(np.array(embedding["vector"]))
-
-            if not known_encodings:
-                if settings.DEBUG:
-                    logger.debug(
-                        "FaceProcessor: no encodings found",
-                        extra={"has_employee_id": bool(employee_id)},
-                    )  # lgtm[py/clear-text-logging-sensitive-data]
-                continue
-
-            # Compare with this employee's encodings
-            is_match, confidence = self.compare_faces(unknown_encoding, known_encodings)
-
-            if settings.DEBUG:
-                logger.debug(
-                    "FaceProcessor: comparison result",
-                    extra={
-                        "has_employee_id": bool(employee_id),
-                        "confidence_level": (
-                            "high"
-                            if confidence >= 0.8
-                            else "medium" if confidence >= 0.6 else "low"
-                        ),
-                        "is_match": bool(is_match),
-                    },
-                )  # lgtm[py/clear-text-logging-sensitive-data]
-            all_matches.append((employee_id, confidence, is_match))
-
-            if is_match and confidence > best_confidence:
+        if nearest is not None:
+            employee_id, distance = nearest
+            if distance <= self.tolerance:
                 best_match_employee_id = employee_id
-                best_confidence = confidence
-
-        # Log all results sorted by confidence
-        all_matches.sort(key=lambda x: x[1], reverse=True)
-        logger.info(f"🎯 All matching results (sorted by confidence):")
-        for emp_id, conf, match in all_matches[:5]:  # Top 5 results
-            if settings.DEBUG:
-                logger.debug(
-                    "FaceProcessor: top match result",
-                    extra={
-                        "has_employee_id": bool(emp_id),
-                        "confidence_level": (
-                            "high"
-                            if conf >= 0.8
-                            else "medium" if conf >= 0.6 else "low"
-                        ),
-                        "match_result": "✅" if match else "❌",
-                    },
-                )  # lgtm[py/clear-text-logging-sensitive-data]
+                best_confidence = float(1 - distance)
 
         logger.info(
             "🏆 Best match found",
             extra={
                 "has_employee_id": bool(best_match_employee_id),
+                "compared_embeddings": len(index),
                 "confidence_level": (
                     "high"
                     if best_confidence >= 0.8
@@ -8,13 +8,15 @@ from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from bson import ObjectId
-from pymongo import ASCENDING, MongoClient
+from pymongo import ASCENDING, MongoClient, ReturnDocument
 from pymongo.errors import ConnectionFailure, DuplicateKeyError, OperationFailure
 
 from django.conf import settings
 
 from core.logging_utils import err_tag, hash_id, redact, safe_extra, safe_id
 
+from .embedding_index import MAX_INCREMENTAL_CHANGES, FaceEmbeddingIndex
+
 logger = logging.getLogger("biometrics")
 
 
@@ -27,11 +29,15 @@ class MongoBiometricRepository:
     """
 
     COLLECTION_NAME = "face_embeddings"  # Fixed collection name - no dynamic selection!
+    # Version and change log of the embeddings, for FaceEmbeddingIndex
+    VERSION_COLLECTION_NAME = "face_embeddings_versions"
 
     def __init__(self):
         self.client = None
         self.db = None
         self.collection = None
+        self.version_collection = None
+        self._embedding_index = FaceEmbeddingIndex(self)
         self._connect()
 
     def _connect(self):
@@ -62,6 +68,7 @@ class MongoBiometricRepository:
             if self.db is not None:
                 # FIXED: Always use face_embeddings collection
                 self.collection = self.db[self.COLLECTION_NAME]
+                self.version_collection = self.db[self.VERSION_COLLECTION_NAME]
                 logger.info(
                     f"MongoDB repository connected to '{self.COLLECTION_NAME}' collection"
                 )
@@ -219,6 +226,7 @@ class MongoBiometricRepository:
                     "Verification passed",
                     extra=safe_extra({"count": len(saved_doc["embeddings"])}),
                 )
+                self._bump_embeddings_version(employee_id)
                 return document_id
             else:
                 logger.error(
@@ -344,8 +352,108 @@ class MongoBiometricRepository:
             logger.error(f"Failed to get all active embeddings: {err_tag(e)}")
             return []
 
+    def get_embedding_index(self) -> FaceEmbeddingIndex:
+        """
+        In-memory index of all active embeddings for 1:N matching
+
+        Refreshed from the collection when embeddings changed since the last
+        call (see biometrics.services.embedding_index).
+        """
+        return self._embedding_index.refresh()
+
+    def get_embeddings_version(self) -> Optional[Tuple[int, List[int]]]:
+        """
+        Current embeddings version and change log
+
+        Returns:
+            (version, employee ids of the latest changes, oldest first; the
+            last one changed in this version), None if the read failed
+        """
+        if self.version_collection is None:
+            return None
+
+        try:
+            document = self.version_collection.find_one(
+                {"_id": self.COLLECTION_NAME}, {"version": 1, "changes": 1}
+            )
+        except Exception as e:
+            logger.warning(f"Failed to read embeddings version: {err_tag(e)}")
+            return None
+
+        if document is None:
+            return 0, []
+        return document.get("version", 0), document.get("changes", [])
+
+    def _bump_embeddings_version(self, employee_id: int) -> Optional[int]:
+        """
+        Record that an employee's embeddings changed
+
+        Returns:
+            New version, None if the update failed (indexes then catch up on
+            their next full reload)
+        """
+        if self.version_collection is None:
+            return None
+
+        try:
+            # One atomic update: the change log stays aligned with the version
+            document = self.version_collection.find_one_and_update(
+                {"_id": self.COLLECTION_NAME},
+                {
+                    "$inc": {"version": 1},
+                    "$push": {
+                        "changes": {
+                            "$each": [employee_id],
+                            "$slice": -MAX_INCREMENTAL_CHANGES,
+                        }
+                    },
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+            return document["version"]
+        except Exception as e:
+            logger.warning(f"Failed to bump embeddings version: {err_tag(e)}")
+            return None
+
+    def get_active_embeddings(
+        self, employee_ids: List[int]
+    ) -> Optional[Dict[int, List[Dict]]]:
+        """
+        Retrieve active face embeddings of specific employees
+
+        Used by FaceEmbeddingIndex to refresh only changed employees.
+
+        Args:
+            employee_ids: Employee IDs
+
+        Returns:
+            Dict mapping employee_id to embeddings (employees without active
+            embeddings are omitted), None if the query failed
+        """
+        if self.collection is None:
+            return None
+
+        try:
+            cursor = self.collection.find(
+                {"employee_id": {"$in": list(employee_ids)}, "is_active": True},
+                {"employee_id": 1, "embeddings": 1, "_id": 0},
+            )
+            return {
+                document["employee_id"]: document.get("embeddings", [])
+                for document in cursor
+                if document.get("employee_id")
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to get active embeddings: {err_tag(e)}")
+            return None
+
     def find_matching_employee(
-        self, face_encoding: List[float], tolerance: float = 0.8
+        self,
+        face_encoding: List[float],
+        tolerance: float = 0.8,
+        employee_id: Optional[int] = None,
     ) -> Optional[Tuple[int, float]]:
         """
         Find matching employee for given face encoding
@@ -353,6 +461,8 @@ class MongoBiometricRepository:
         Args:
             face_encoding: Face encoding vector to match
             tolerance: Matching tolerance (lower = stricter)
+            employee_id: Only compare against this employee's embeddings
+                (1:1 verification instead of a 1:N search)
 
         Returns:
             Tuple of (employee_id, confidence_score) if match found, None otherwise
@@ -361,39 +471,21 @@ class MongoBiometricRepository:
             return None
 
         try:
-            # Get all active embeddings
-            cursor = self.collection.find({"is_active": True})
+            if employee_id is None:
+                index = self.get_embedding_index()
+            else:
+                embeddings = self.get_face_embeddings(employee_id) or []
+                index = FaceEmbeddingIndex.from_embeddings([(employee_id, embeddings)])
 
+            # One vectorised comparison against the candidate embeddings
             best_match = None
-            best_distance = float("inf")
-
-            for document in cursor:
-                employee_id = document.get("employee_id")
-                embeddings = document.get("embeddings", [])
-
-                for embedding_data in embeddings:
-                    stored_encoding = embedding_data.get("vector", [])
-                    if not stored_encoding:
-                        continue
-
-                    # Calculate Euclidean distance
-                    try:
-                        distance = np.linalg.norm(
-                            np.array(face_encoding) - np.array(stored_encoding)
-                        )
-
-                        if distance < tolerance and distance < best_distance:
-                            best_distance = distance
-                            # Convert distance to confidence score (0-1, higher is better)
-                            confidence = max(0.0, 1.0 - (distance / tolerance))
-                            best_match = (employee_id, confidence)
-
-                    except Exception as e:
-
-                        logger.warning(
-                            f"Failed to calculate distance: {err_tag(e)}"
-                        )  # lgtm[py/clear-text-logging-sensitive-data]
-                        continue
+            nearest = index.nearest(face_encoding)
+            if nearest is not None:
+                employee_id, distance = nearest
+                if distance < tolerance:
+                    # Convert distance to confidence score (0-1, higher is better)
+                    confidence = max(0.0, 1.0 - (distance / tolerance))
+                    best_match = (employee_id, confidence)
 
             if best_match:
                 employee_id, confidence = best_match
@@ -439,6 +531,7 @@ class MongoBiometricRepository:
                     "✅ Embeddings deleted",
                     extra={"meta": {"employee_hash": hash_id(employee_id)}},
                 )  # lgtm[py/clear-text-logging-sensitive-data]
+                self._bump_embeddings_version(employee_id)
                 return True
             else:
                 logger.warning(
@@ -485,6 +578,7 @@ class MongoBiometricRepository:
                     "✅ Embeddings deactivated",
                     extra={"meta": {"employee_hash": hash_id(employee_id)}},
                 )  # lgtm[py/clear-text-logging-sensitive-data]
+                self._bump_embeddings_version(employee_id)
                 return True
             else:
                 logger.warning(
@@ -18,7 +18,7 @@ from unittest.mock import MagicMock, Mock, patch
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from biometrics.models import BiometricProfile
@@ -241,6 +241,7 @@ class BiometricServiceRegisterTest(EnhancedBiometricServiceTest):
 class BiometricServiceVerifyTest(EnhancedBiometricServiceTest):
     """Test verify_biometric method"""
 
+    @override_settings(FACE_RECOGNITION_TOLERANCE=0.6)
     def test_verify_biometric_success(self):
         """Test successful biometric verification"""
         # Create service and mock its mongo_repo directly
@@ -259,7 +260,25 @@ class BiometricServiceVerifyTest(EnhancedBiometricServiceTest):
         self.assertEqual(employee_id, self.employee.id)
         self.assertEqual(confidence, 0.95)
 
-        mock_repo.find_matching_employee.assert_called_once_with(test_encoding)
+        mock_repo.find_matching_employee.assert_called_once_with(
+            test_encoding, tolerance=0.6, employee_id=None
+        )
+
+    @override_settings(FACE_RECOGNITION_TOLERANCE=0.6)
+    def test_verify_biometric_claimed_employee(self):
+        """Test 1:1 verification only compares the claimed employee"""
+        service = EnhancedBiometricService()
+        mock_repo = Mock()
+        mock_repo.find_matching_employee.return_value = (self.employee.id, 0.9)
+        service.mongo_repo = mock_repo
+
+        test_encoding = [0.1] * 128
+        result = service.verify_biometric(test_encoding, employee_id=self.employee.id)
+
+        self.assertEqual(result, (self.employee.id, 0.9))
+        mock_repo.find_matching_employee.assert_called_once_with(
+            test_encoding, tolerance=0.6, employee_id=self.employee.id
+        )
 
     @patch("biometrics.services.enhanced_biometric_service.MongoBiometricRepository")
     def test_verify_biometric_no_match(self, mock_repo_class):
@@ -0,0 +1,100 @@
+"""
+Tests for the budgeted face detection pipeline.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+
+from django.test import TestCase, override_settings
+
+from biometrics.services.face_detection import (
+    DetectionStage,
+    FaceDetectionPipeline,
+    get_cascade,
+)
+
+STAGES = [
+    DetectionStage("hog", "hog", max_size=100),
+    DetectionStage("hog_upsample", "hog", max_size=100, upsample=1),
+    DetectionStage("cnn", "cnn", max_size=50),
+]
+
+
+class FaceDetectionPipelineTest(TestCase):
+    def setUp(self):
+        self.image = np.zeros((200, 400, 3), dtype=np.uint8)
+
+    @patch("biometrics.services.face_detection.face_recognition.face_locations")
+    def test_stops_at_first_stage_with_faces(self, mock_locations):
+        # Nothing at upsample 0, a face at upsample 1
+        def face_locations(image, number_of_times_to_upsample, model):
+            return [(10, 40, 40, 10)] if number_of_times_to_upsample else []
+
+        mock_locations.side_effect = face_locations
+        pipeline = FaceDetectionPipeline(STAGES)
+
+        result = pipeline.detect(self.image)
+
+        self.assertEqual(result.stage, "hog_upsample")
+        self.assertEqual(list(result.timings_ms), ["hog", "hog_upsample"])
+        # Stages see the image downscaled to 100px; locations are scaled back
+        self.assertEqual(result.stage_image.shape[:2], (50, 100))
+        self.assertEqual(result.face_locations, [(40, 160, 160, 40)])
+        stats = pipeline.get_stats()
+        self.assertEqual(stats["hog"]["runs"], 1)
+        self.assertEqual(stats["hog"]["hits"], 0)
+        self.assertEqual(stats["hog_upsample"]["hits"], 1)
+        self.assertEqual(stats["cnn"]["runs"], 0)
+
+    @patch("biometrics.services.face_detection.face_recognition.face_locations")
+    def test_budget_stops_further_stages(self, mock_locations):
+        mock_locations.return_value = []
+        pipeline = FaceDetectionPipeline(STAGES, budget_ms=0)
+
+        result = pipeline.detect(self.image)
+
+        self.assertEqual(result.face_locations, [])
+        self.assertTrue(result.budget_exhausted)
+        self.assertEqual(mock_locations.call_count, 1)
+
+    @patch("biometrics.services.face_detection.face_recognition.face_locations")
+    def test_stages_too_slow_for_remaining_budget_are_skipped(self, mock_locations):
+        mock_locations.return_value = []
+        pipeline = FaceDetectionPipeline(STAGES, budget_ms=100, min_samples=1)
+        pipeline._record_run(STAGES[1], 500, hit=False)
+
+        pipeline.detect(self.image)
+
+        stats = pipeline.get_stats()
+        self.assertEqual(stats["hog_upsample"]["skipped"], 1)
+        self.assertEqual(stats["cnn"]["runs"], 1)
+
+    def test_measured_stages_are_ordered_by_cost_per_hit(self):
+        pipeline = FaceDetectionPipeline(STAGES, min_samples=2)
+        for _ in range(2):
+            pipeline._record_run(STAGES[0], 10, hit=False)
+            pipeline._record_run(STAGES[2], 50, hit=True)
+
+        self.assertEqual(
+            [stage.name for stage in pipeline.ordered_stages()],
+            ["cnn", "hog_upsample", "hog"],
+        )
+        pipeline.adaptive = False
+        self.assertEqual(pipeline.ordered_stages(), STAGES)
+
+    @override_settings(FACE_DETECTION_STAGES=["cnn", "hog"], FACE_DETECTION_BUDGET_MS=5)
+    def test_from_settings(self):
+        pipeline = FaceDetectionPipeline.from_settings()
+
+        self.assertEqual([stage.name for stage in pipeline.stages], ["cnn", "hog"])
+        self.assertEqual(pipeline.budget_ms, 5)
+
+        with override_settings(FACE_DETECTION_STAGES=["missing"]):
+            with self.assertRaises(ValueError):
+                FaceDetectionPipeline.from_settings()
+
+    def test_cascades_are_shared(self):
+        cascade = get_cascade("haarcascade_frontalface_default.xml")
+
+        self.assertIs(cascade, get_cascade("haarcascade_frontalface_default.xml"))
@@ -0,0 +1,159 @@
+"""
+Tests for the resident face embedding index used for 1:N matching.
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+
+from biometrics.services.embedding_index import FaceEmbeddingIndex
+from biometrics.services.face_processor import FaceProcessor
+from biometrics.services.mongodb_repository import MongoBiometricRepository
+
+
+def _embedding(*values):
+    return {"vector": list(values), "quality_score": 0.9}
+
+
+class FaceEmbeddingIndexTest(TestCase):
+    def setUp(self):
+        self.repository = Mock()
+        self.repository.get_all_active_embeddings.return_value = [
+            (1, [_embedding(0.0, 0.0), _embedding(0.1, 0.0)]),
+            (2, [_embedding(1.0, 1.0)]),
+        ]
+        self.repository.get_embeddings_version.return_value = (0, [])
+
+    def test_nearest(self):
+        index = FaceEmbeddingIndex.from_embeddings(
+            self.repository.get_all_active_embeddings()
+        )
+
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.employee_count, 2)
+        employee_id, distance = index.nearest([0.1, 0.1])
+        self.assertEqual(employee_id, 1)
+        self.assertAlmostEqual(distance, 0.1, places=5)
+        self.assertEqual(index.nearest([0.9, 1.0])[0], 2)
+        # Probe of another model (dimension mismatch) never matches
+        self.assertIsNone(index.nearest([0.0, 0.0, 0.0]))
+        self.assertIsNone(FaceEmbeddingIndex.from_embeddings([]).nearest([0.0, 0.0]))
+
+    def test_refresh_reloads_only_changed_employees(self):
+        index = FaceEmbeddingIndex(self.repository).refresh()
+        self.assertEqual(self.repository.get_all_active_embeddings.call_count, 1)
+
+        # Unchanged version: no embeddings read
+        index.refresh()
+        self.assertEqual(self.repository.get_all_active_embeddings.call_count, 1)
+
+        self.repository.get_embeddings_version.return_value = (2, [7, 2, 3])
+        self.repository.get_active_embeddings.return_value = {3: [_embedding(5.0, 5.0)]}
+        index.refresh()
+
+        self.assertEqual(self.repository.get_all_active_embeddings.call_count, 1)
+        self.repository.get_active_embeddings.assert_called_once_with([2, 3])
+        self.assertEqual(index.nearest([5.0, 4.0])[0], 3)
+        # Employee 2 has no active embeddings any more
+        self.assertEqual(index.nearest([1.0, 1.0])[0], 1)
+
+    def test_refresh_falls_back_to_full_reload(self):
+        index = FaceEmbeddingIndex(self.repository).refresh()
+
+        # The change log no longer reaches back to version 0
+        self.repository.get_embeddings_version.return_value = (3, [2, 3])
+        index.refresh()
+
+        self.assertEqual(self.repository.get_all_active_embeddings.call_count, 2)
+        self.repository.get_active_embeddings.assert_not_called()
+
+    def test_expired_index_is_reloaded_without_version_change(self):
+        index = FaceEmbeddingIndex(self.repository, max_age_seconds=60).refresh()
+
+        with patch(
+            "biometrics.services.embedding_index.time.monotonic",
+            return_value=time.monotonic() + 61,
+        ):
+            index.refresh()
+        self.assertEqual(self.repository.get_all_active_embeddings.call_count, 2)
+
+        # An unreadable version keeps a fresh index
+        self.repository.get_embeddings_version.return_value = None
+        index.refresh()
+        self.assertEqual(self.repository.get_all_active_embeddings.call_count, 2)
+
+    def test_failed_load_is_retried(self):
+        self.repository.get_all_active_embeddings.return_value = []
+        index = FaceEmbeddingIndex(self.repository).refresh()
+        self.assertTrue(index.is_empty)
+
+        self.repository.get_all_active_embeddings.return_value = [
+            (1, [_embedding(0.0, 0.0)])
+        ]
+        index.refresh()
+
+        self.assertFalse(index.is_empty)
+        self.assertEqual(self.repository.get_all_active_embeddings.call_count, 2)
+
+    @patch.object(FaceProcessor, "process_registration_image")
+    def test_face_processor_matches_against_index(self, mock_process):
+        processor = FaceProcessor()
+        index = FaceEmbeddingIndex(self.repository).refresh()
+
+        mock_process.return_value = {
+            "success": True,
+            "encoding": [0.95, 1.0],
+            "quality_check": {},
+        }
+        result = processor.find_matching_employee("image", index)
+        self.assertTrue(result["success"])
+        self.assertEqual(result["employee_id"], 2)
+        self.assertGreater(result["confidence"], 0.9)
+
+        mock_process.return_value = {
+            "success": True,
+            "encoding": [9.0, 9.0],
+            "quality_check": {},
+        }
+        result = processor.find_matching_employee("image", index)
+        self.assertFalse(result["success"])
+
+    @patch("biometrics.services.mongodb_repository.MongoBiometricRepository._connect")
+    def test_repository_verifies_claimed_employee(self, mock_connect):
+        repo = MongoBiometricRepository()
+        repo.collection = Mock()
+        repo.get_embedding_index = Mock()
+
+        with patch.object(
+            repo, "get_face_embeddings", return_value=[_embedding(1.0, 1.0)]
+        ) as mock_get:
+            self.assertEqual(
+                repo.find_matching_employee([1.0, 1.0], employee_id=2), (2, 1.0)
+            )
+            # Another employee's face does not pass 1:1 verification
+            self.assertIsNone(repo.find_matching_employee([0.0, 0.0], employee_id=2))
+
+        mock_get.assert_called_with(2)
+        repo.get_embedding_index.assert_not_called()
+
+    @patch("biometrics.services.mongodb_repository.MongoBiometricRepository._connect")
+    def test_repository_keeps_version_and_change_log_together(self, mock_connect):
+        repo = MongoBiometricRepository()
+        repo.version_collection = Mock()
+        repo.version_collection.find_one_and_update.return_value = {"version": 4}
+        repo.version_collection.find_one.return_value = {
+            "version": 4,
+            "changes": [1, 2],
+        }
+
+        self.assertEqual(repo._bump_embeddings_version(2), 4)
+        update = repo.version_collection.find_one_and_update.call_args[0][1]
+        self.assertEqual(update["$inc"], {"version": 1})
+        self.assertEqual(update["$push"]["changes"]["$each"], [2])
+        self.assertEqual(repo.get_embeddings_version(), (4, [1, 2]))
+
+        repo.version_collection.find_one.return_value = None
+        self.assertEqual(repo.get_embeddings_version(), (0, []))
+        repo.version_collection.find_one.side_effect = Exception("down")
+        self.assertIsNone(repo.get_embeddings_version())
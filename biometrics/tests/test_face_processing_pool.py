@@ -0,0 +1,113 @@
+"""
+Tests for the face processing worker pool and its backpressure.
+
+A thread executor stands in for the worker processes.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+
+from biometrics.services.face_processing_pool import (
+    FaceProcessingPool,
+    FaceProcessingUnavailable,
+)
+from biometrics.services.face_processor import FaceProcessor
+from biometrics.views.helpers import face_processing_unavailable_response
+
+
+class FaceProcessingPoolTest(TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+        def process(base64_image):
+            started_at = time.time()
+            self.release.wait(5)
+            return {"success": True, "image": base64_image}, started_at, time.time()
+
+        patcher = patch(
+            "biometrics.services.face_processing_pool._process_in_worker", process
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.release.set()
+        self.executor.shutdown(wait=True)
+
+    def _pool(self, **kwargs):
+        pool = FaceProcessingPool(workers=1, **kwargs)
+        pool._get_executor = Mock(return_value=self.executor)
+        return pool
+
+    def _wait_for(self, condition):
+        deadline = time.time() + 5
+        while not condition() and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_job_result_and_stats(self):
+        pool = self._pool()
+        self.release.set()
+
+        result = pool.process_registration_image("image")
+
+        self.assertEqual(result, {"success": True, "image": "image"})
+        # Slots are released by the future's done callback
+        self._wait_for(lambda: pool.get_stats()["queue_depth"] == 0)
+        stats = pool.get_stats()
+        self.assertEqual(stats["completed"], 1)
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertEqual(stats["max_queue_depth"], 1)
+
+    def test_rejects_jobs_beyond_capacity(self):
+        pool = self._pool(queue_size=0, retry_after=3)
+        running = threading.Thread(target=pool.process_registration_image, args=["a"])
+        running.start()
+        self._wait_for(lambda: pool.get_stats()["queue_depth"] == 1)
+
+        with self.assertRaises(FaceProcessingUnavailable) as ctx:
+            pool.process_registration_image("b")
+
+        self.assertEqual(ctx.exception.wait, 3)
+        self.assertEqual(pool.get_stats()["rejected"], 1)
+        self.release.set()
+        running.join()
+        self._wait_for(lambda: pool.get_stats()["queue_depth"] == 0)
+        self.assertEqual(pool.get_stats()["queue_depth"], 0)
+
+    def test_timeout_keeps_slot_until_job_finishes(self):
+        pool = self._pool(timeout=0.05)
+
+        with self.assertRaises(FaceProcessingUnavailable):
+            pool.process_registration_image("slow")
+
+        self.assertEqual(pool.get_stats()["timed_out"], 1)
+        self.assertEqual(pool.get_stats()["queue_depth"], 1)
+        self.release.set()
+        self._wait_for(lambda: pool.get_stats()["queue_depth"] == 0)
+        self.assertEqual(pool.get_stats()["queue_depth"], 0)
+
+    def test_face_processor_submits_to_pool(self):
+        pool = Mock()
+        pool.process_registration_image.return_value = {"success": False}
+
+        with patch(
+            "biometrics.services.face_processor.get_face_processing_pool",
+            return_value=pool,
+        ):
+            result = FaceProcessor().process_registration_image("image")
+
+        self.assertEqual(result, {"success": False})
+        pool.process_registration_image.assert_called_once_with("image")
+
+    def test_unavailable_response_has_retry_after(self):
+        response = face_processing_unavailable_response(
+            FaceProcessingUnavailable(wait=4)
+        )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "4")
@@ -160,6 +160,28 @@ class FaceProcessorSmokeTest(TestCase):
                 self.assertIsNotNone(result)
                 mock_logger.warning.assert_called()
 
+    def test_decode_base64_image_reduced_resolution(self):
+        """Test large JPEGs are decoded directly at the requested size"""
+        img = Image.new("RGB", (2400, 1800), color="blue")
+        img_buffer = io.BytesIO()
+        img.save(img_buffer, format="JPEG")
+        large_image = base64.b64encode(img_buffer.getvalue()).decode("utf-8")
+
+        stats = {}
+        result = self.processor.decode_base64_image(
+            large_image, max_dimension=600, stats=stats
+        )
+
+        self.assertEqual(result.shape, (450, 600, 3))
+        self.assertEqual(stats["source_pixels"], 2400 * 1800)
+        self.assertEqual(stats["decoded_pixels"], 600 * 450)
+        self.assertEqual(stats["bytes_in"], len(img_buffer.getvalue()))
+
+        # Without a limit the image is decoded at full size
+        self.assertEqual(
+            self.processor.decode_base64_image(large_image).shape, (1800, 2400, 3)
+        )
+
     @patch("biometrics.services.face_processor.face_recognition")
     def test_extract_face_encodings_success(self, mock_face_recognition):
         """Test successful face encoding extraction"""
@@ -29,8 +29,26 @@ from worktime.models import WorkLog
 
 from ..models import BiometricAttempt, BiometricLog, BiometricProfile, FaceQualityCheck
 from ..serializers import FaceRecognitionSerializer
+from ..services.embedding_index import FaceEmbeddingIndex
 from ..services.enhanced_biometric_service import CriticalBiometricError
-from .helpers import check_rate_limit, get_client_ip, log_biometric_attempt
+from ..services.face_processing_pool import FaceProcessingUnavailable
+from .helpers import (
+    check_rate_limit,
+    face_processing_unavailable_response,
+    get_client_ip,
+    log_biometric_attempt,
+)
+
+
+def _get_claimed_employee(request):
+    """
+    Employee profile of the authenticated user, None for shared devices.
+
+    Personal accounts are verified 1:1 against their own embeddings; accounts
+    without an employee profile (shared/kiosk devices) identify the face 1:N
+    against all registered employees.
+    """
+    return request.user.employees.first()
 
 
 @extend_schema(
@@ -44,7 +62,8 @@ from .helpers import check_rate_limit, get_client_ip, log_biometric_attempt
     **Process:**
     1. Capture face image from camera
     2. Extract face encoding from image
-    3. Compare with all registered employee faces
+    3. Compare with the authenticated employee's registered faces (all
+       registered faces for accounts without an employee profile)
     4. Create WorkLog entry if match found
     5. Log biometric attempt for security
 
@@ -165,12 +184,24 @@ def check_in(request):
         image = serializer.validated_data["image"]
         location = serializer.validated_data.get("location", "")
 
-        # Get all active embeddings
-        all_embeddings = (
-            biometrics_views.mongo_biometric_repository.get_all_active_embeddings()
-        )
+        claimed_employee = _get_claimed_employee(request)
+        if claimed_employee is not None:
+            # 1:1 verification against the authenticated employee's faces
+            embeddings = (
+                biometrics_views.mongo_biometric_repository.get_face_embeddings(
+                    claimed_employee.id
+                )
+            )
+            embedding_index = FaceEmbeddingIndex.from_embeddings(
+                [(claimed_employee.id, embeddings or [])]
+            )
+        else:
+            # Shared device: 1:N search over the resident index
+            embedding_index = (
+                biometrics_views.mongo_biometric_repository.get_embedding_index()
+            )
 
-        if not all_embeddings:
+        if embedding_index.is_empty:
             return Response(
                 {"error": "No registered faces in the system"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -213,7 +244,7 @@ def check_in(request):
                     status=status.HTTP_503_SERVICE_UNAVAILABLE,
                 )
             match_result = biometrics_views.face_processor.find_matching_employee(
-                image, all_embeddings
+                image, embedding_index
             )
 
             if not match_result["success"]:
@@ -354,6 +385,8 @@ def check_in(request):
         return Response(
             {"error": "Employee record not found"}, status=status.HTTP_404_NOT_FOUND
         )
+    except FaceProcessingUnavailable as e:
+        return face_processing_unavailable_response(e)
     except Exception:
         biometrics_views.logger.exception("Check-in error")
         return Response(
@@ -456,11 +489,14 @@ def check_out(request):
                         status=status.HTTP_400_BAD_REQUEST,
                     )
 
-                # Use enhanced service for verification
+                # Use enhanced service for verification (1:1 for personal
+                # accounts, 1:N for shared devices)
                 face_encoding = result["encoding"]
+                claimed_employee = _get_claimed_employee(request)
                 verification_result = (
                     biometrics_views.enhanced_biometric_service.verify_biometric(
-                        face_encoding
+                        face_encoding,
+                        employee_id=claimed_employee.id if claimed_employee else None,
                     )
                 )
 
@@ -495,6 +531,8 @@ def check_out(request):
                     },
                     status=status.HTTP_503_SERVICE_UNAVAILABLE,
                 )
+            except FaceProcessingUnavailable as e:
+                return face_processing_unavailable_response(e)
             except Exception as e:
 
                 biometrics_views.logger.error(
@@ -5,10 +5,13 @@ This module contains utility functions used across multiple biometric views:
 - IP address extraction
 - Rate limiting
 - Biometric attempt logging
+- Face processing pool saturation responses
 """
 
 import logging
 
+from rest_framework.response import Response
+
 from ..models import BiometricAttempt, BiometricLog
 
 logger = logging.getLogger("biometrics.views")
@@ -63,3 +66,12 @@ def log_biometric_attempt(
     except Exception:
         logger.exception("Failed to log biometric attempt")
         return None
+
+
+def face_processing_unavailable_response(exc):
+    """503 with Retry-After for FaceProcessingUnavailable"""
+    return Response(
+        {"success": False, "error": str(exc.detail)},
+        status=exc.status_code,
+        headers={"Retry-After": str(exc.wait)},
+    )
@@ -30,7 +30,12 @@ from users.models import Employee
 from ..models import BiometricAttempt, BiometricLog, BiometricProfile, FaceQualityCheck
 from ..serializers import FaceRegistrationSerializer
 from ..services.enhanced_biometric_service import CriticalBiometricError
-from .helpers import check_rate_limit, log_biometric_attempt
+from ..services.face_processing_pool import FaceProcessingUnavailable
+from .helpers import (
+    check_rate_limit,
+    face_processing_unavailable_response,
+    log_biometric_attempt,
+)
 
 
 @extend_schema(
@@ -281,6 +286,8 @@ def register_face(request):
                     )
                 result = biometrics_views.face_processor.process_images(images)
                 biometrics_views.logger.info(f"Face processor result: {result}")
+            except FaceProcessingUnavailable as e:
+                return face_processing_unavailable_response(e)
             except Exception as e:
                 biometrics_views.logger.exception("Face processor threw exception")
                 return Response(
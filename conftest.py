@@ -15,6 +15,16 @@ def clear_cache():
     cache.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_payroll_recalculation_queue():
+    """Drop payroll recalculations queued (deferred) by earlier tests"""
+    from payroll.services.recalculation_queue import get_recalculation_queue
+
+    get_recalculation_queue().clear()
+    yield
+    get_recalculation_queue().clear()
+
+
 @pytest.fixture
 def enable_project_payroll(settings):
     """Enable PROJECT_PAYROLL feature flag for tests that need it"""
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self):
+        from core.query_budget import install_task_profiling, is_profiling_enabled
+
+        if is_profiling_enabled():
+            install_task_profiling()
@@ -6,6 +6,7 @@ duplicate execution on retries or network failures.
 """
 
 import hashlib
+import inspect
 import json
 import logging
 from datetime import timedelta
@@ -141,6 +142,111 @@ def idempotent_task(ttl_hours=24, date_based=True, skip_on_duplicate=True):
     return decorator
 
 
+def make_run_idempotency_key(task_name, *key_parts):
+    """
+    Idempotency key of a task execution identified by explicit parts.
+
+    Args:
+        task_name: Name of the Celery task
+        *key_parts: Identifying argument values (e.g. run_id, shard index)
+
+    Returns:
+        String key for Redis storage
+    """
+    return ":".join(["idempotent", task_name, *(str(part) for part in key_parts)])
+
+
+_NO_RESULT = object()
+
+
+def _get_stored_result(task, task_id):
+    """Result of a finished task in the Celery result backend, if still there"""
+    if not task_id:
+        return _NO_RESULT
+    try:
+        async_result = task.AsyncResult(task_id)
+        if async_result.successful():
+            return async_result.result
+    except Exception as e:
+        logger.warning(f"Could not read result of task {task_id}: {e}")
+    return _NO_RESULT
+
+
+def idempotent_per_run(*key_params, ttl_hours=24, side_effect_free=False):
+    """
+    Decorator for tasks identified by some of their arguments (e.g. run_id).
+
+    Unlike idempotent_task, the key is built from the named arguments only,
+    so large payload arguments are never serialized or hashed, and only a
+    small completion marker is stored - the result itself stays in the
+    Celery result backend. A duplicate execution returns the original
+    result from the backend; if it is gone, side-effect-free tasks run
+    again and others return the marker.
+
+    Usage:
+        @shared_task(bind=True)
+        @idempotent_per_run("run_id", "shard_index", side_effect_free=True)
+        def my_task(self, payload, run_id, shard_index):
+            ...
+
+    Args:
+        *key_params: Names of the arguments identifying an execution
+        ttl_hours: How long to remember task completion (hours)
+        side_effect_free: Rerun instead of skipping when the original result
+            is no longer available
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            task_name = self.name if hasattr(self, "name") else func.__name__
+            arguments = signature.bind(self, *args, **kwargs)
+            arguments.apply_defaults()
+            idempotency_key = make_run_idempotency_key(
+                task_name, *(arguments.arguments[name] for name in key_params)
+            )
+
+            marker = cache.get(idempotency_key)
+            if marker is not None:
+                result = _get_stored_result(self, marker.get("task_id"))
+                if result is not _NO_RESULT:
+                    logger.info(
+                        f"Task {task_name} already completed "
+                        f"(idempotency key: {idempotency_key}). Returning its result."
+                    )
+                    return result
+                if not side_effect_free:
+                    logger.info(
+                        f"Task {task_name} already completed "
+                        f"(idempotency key: {idempotency_key}). Skipping execution."
+                    )
+                    return {**marker, "duplicate": True}
+                logger.info(
+                    f"Task {task_name} already completed but its result expired "
+                    f"(idempotency key: {idempotency_key}). Running again."
+                )
+
+            result = func(self, *args, **kwargs)
+
+            request = getattr(self, "request", None)
+            cache.set(
+                idempotency_key,
+                {
+                    "task_name": task_name,
+                    "task_id": getattr(request, "id", None),
+                    "completed_at": timezone.now().isoformat(),
+                },
+                timeout=ttl_hours * 3600,
+            )
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 def clear_idempotency_key(task_name, args=None, kwargs=None, date_based=True):
     """
     Manually clear idempotency key (for testing or manual retry).
@@ -0,0 +1,299 @@
+"""
+SQL query profiling with per-endpoint budgets.
+
+profile_queries() records every statement run on the database connections
+while it is active - query count, total DB time, repeated statements (same
+SQL fingerprint, the signature of an N+1 loop) and the slowest statements.
+It works without DEBUG through connection.execute_wrapper().
+
+Three users share it:
+- QueryBudgetMiddleware profiles each request, logs budget violations and
+  adds X-DB-* headers to responses for superusers
+- install_task_profiling() does the same for Celery tasks
+- tests assert budgets with assert_query_budget()
+
+Budgets come from settings.QUERY_BUDGETS, keyed by URL name or Celery task
+name:
+
+    QUERY_BUDGETS = {
+        "face-check-out": 6,  # at most 6 queries
+        "worklog-list": {"max_queries": 10, "max_duplicates": 0},
+    }
+
+Profiling of requests and tasks is opt-in (QUERY_PROFILER_ENABLED).
+
+Example usage:
+    with assert_query_budget(max_queries=6, max_duplicates=0):
+        self.client.post(url, data)
+"""
+
+import heapq
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# Slowest statements kept per profile
+SLOWEST_STATEMENTS = 5
+
+# Statements are truncated to this length in logs and reports
+MAX_SQL_LENGTH = 300
+
+_FINGERPRINT_PATTERNS = (
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"%s|\$\d+"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(...)"),
+    (re.compile(r"\s+"), " "),
+)
+
+
+def fingerprint_sql(sql: str) -> str:
+    """
+    SQL with literals, placeholders and IN lists normalized.
+
+    Statements that only differ in parameter values (one per loop iteration
+    of an N+1) share a fingerprint.
+    """
+    for pattern, replacement in _FINGERPRINT_PATTERNS:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+def _truncate(sql: str) -> str:
+    return sql if len(sql) <= MAX_SQL_LENGTH else sql[:MAX_SQL_LENGTH] + "..."
+
+
+@dataclass
+class QueryProfile:
+    """Statements recorded by profile_queries()"""
+
+    label: str = ""
+    count: int = 0
+    total_time: float = 0.0  # seconds
+    fingerprints: Counter = field(default_factory=Counter)
+    _slowest: List[Tuple[float, int, str]] = field(default_factory=list)
+
+    def __call__(self, execute, sql, params, many, context):
+        """connection.execute_wrapper() hook"""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(sql, time.perf_counter() - start)
+
+    def record(self, sql: str, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        self.fingerprints[fingerprint_sql(sql)] += 1
+
+        entry = (duration, self.count, sql)
+        if len(self._slowest) < SLOWEST_STATEMENTS:
+            heapq.heappush(self._slowest, entry)
+        else:
+            heapq.heappushpop(self._slowest, entry)
+
+    @property
+    def total_time_ms(self) -> float:
+        return round(self.total_time * 1000, 2)
+
+    @property
+    def duplicates(self) -> Dict[str, int]:
+        """Fingerprints executed more than once, with their counts"""
+        return {sql: count for sql, count in self.fingerprints.items() if count > 1}
+
+    @property
+    def duplicate_count(self) -> int:
+        """Statements that repeat an earlier fingerprint"""
+        return sum(count - 1 for count in self.duplicates.values())
+
+    @property
+    def slowest(self) -> List[Tuple[float, str]]:
+        """(ms, sql) of the slowest statements, slowest first"""
+        return [
+            (round(duration * 1000, 2), _truncate(sql))
+            for duration, _, sql in sorted(self._slowest, reverse=True)
+        ]
+
+    def to_dict(self) -> Dict:
+        return {
+            "label": self.label,
+            "queries": self.count,
+            "duplicates": self.duplicate_count,
+            "db_time_ms": self.total_time_ms,
+            "duplicate_statements": {
+                _truncate(sql): count for sql, count in self.duplicates.items()
+            },
+            "slowest": [{"ms": ms, "sql": sql} for ms, sql in self.slowest],
+        }
+
+
+@contextmanager
+def profile_queries(label: str = "", using: Optional[str] = None):
+    """
+    Record the statements run while the block is active.
+
+    Args:
+        label: Name of the profiled unit (URL name, task name)
+        using: Only this database alias (default: all connections)
+
+    Yields:
+        QueryProfile: Filled in as statements run
+    """
+    profile = QueryProfile(label=label)
+    aliases = [using] if using else list(connections)
+    with ExitStack() as stack:
+        for alias in aliases:
+            stack.enter_context(connections[alias].execute_wrapper(profile))
+        yield profile
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    """Limits for one endpoint or task (None = unlimited)"""
+
+    max_queries: Optional[int] = None
+    max_duplicates: Optional[int] = None
+
+    def violations(self, profile: QueryProfile) -> List[str]:
+        problems = []
+        if self.max_queries is not None and profile.count > self.max_queries:
+            problems.append(f"{profile.count} queries > budget {self.max_queries}")
+        if (
+            self.max_duplicates is not None
+            and profile.duplicate_count > self.max_duplicates
+        ):
+            problems.append(
+                f"{profile.duplicate_count} duplicate queries > budget "
+                f"{self.max_duplicates}"
+            )
+        return problems
+
+
+def get_budget(name: Optional[str]) -> Optional[QueryBudget]:
+    """Budget from settings.QUERY_BUDGETS (an int limits the query count)"""
+    if not name:
+        return None
+    budget: Union[int, dict, None] = getattr(settings, "QUERY_BUDGETS", {}).get(name)
+    if budget is None:
+        return None
+    if isinstance(budget, int):
+        return QueryBudget(max_queries=budget)
+    return QueryBudget(**budget)
+
+
+def report_violations(
+    profile: QueryProfile, budget: Optional[QueryBudget]
+) -> List[str]:
+    """Log a warning when the profile exceeds its budget"""
+    problems = budget.violations(profile) if budget else []
+    if problems:
+        logger.warning(
+            f"Query budget exceeded for {profile.label}: {'; '.join(problems)}",
+            extra={**profile.to_dict(), "action": "query_budget_exceeded"},
+        )
+    return problems
+
+
+@contextmanager
+def assert_query_budget(
+    max_queries: Optional[int] = None,
+    max_duplicates: Optional[int] = None,
+    using: Optional[str] = None,
+) -> Iterator[QueryProfile]:
+    """
+    Fail with a query report when the block exceeds the budget.
+
+    Raises:
+        AssertionError: Budget exceeded
+    """
+    budget = QueryBudget(max_queries=max_queries, max_duplicates=max_duplicates)
+    with profile_queries("assert_query_budget", using=using) as profile:
+        yield profile
+
+    problems = budget.violations(profile)
+    if problems:
+        lines = [f"{count}x {sql}" for sql, count in profile.duplicates.items()]
+        lines += [f"{ms}ms {sql}" for ms, sql in profile.slowest]
+        raise AssertionError("; ".join(problems) + "\n  " + "\n  ".join(lines))
+
+
+def is_profiling_enabled() -> bool:
+    return getattr(settings, "QUERY_PROFILER_ENABLED", False)
+
+
+class QueryBudgetMiddleware:
+    """
+    Profile the SQL of every request (opt-in via QUERY_PROFILER_ENABLED).
+
+    Budget violations are logged under the URL name. Superusers get the
+    numbers as response headers:
+        X-DB-Query-Count, X-DB-Duplicate-Queries, X-DB-Time-Ms, X-DB-Slowest-Ms
+
+    Queries run while a streaming response is consumed are not counted.
+    """
+
+    def __init__(self, get_response):
+        if not is_profiling_enabled():
+            raise MiddlewareNotUsed("QUERY_PROFILER_ENABLED is off")
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with profile_queries(request.path) as profile:
+            response = self.get_response(request)
+
+        match = getattr(request, "resolver_match", None)
+        url_name = match.url_name if match else None
+        if url_name:
+            profile.label = url_name
+        report_violations(profile, get_budget(url_name))
+
+        user = getattr(request, "user", None)
+        if user is not None and getattr(user, "is_superuser", False):
+            slowest = profile.slowest
+            response["X-DB-Query-Count"] = str(profile.count)
+            response["X-DB-Duplicate-Queries"] = str(profile.duplicate_count)
+            response["X-DB-Time-Ms"] = str(profile.total_time_ms)
+            response["X-DB-Slowest-Ms"] = str(slowest[0][0] if slowest else 0)
+        return response
+
+
+# Profiles of running Celery tasks by task id
+_task_profiles: Dict[str, Tuple[ExitStack, QueryProfile]] = {}
+
+
+def _start_task_profile(task_id=None, task=None, **kwargs):
+    stack = ExitStack()
+    profile = stack.enter_context(profile_queries(getattr(task, "name", "")))
+    _task_profiles[task_id] = (stack, profile)
+
+
+def _finish_task_profile(task_id=None, task=None, **kwargs):
+    entry = _task_profiles.pop(task_id, None)
+    if entry is None:
+        return
+    stack, profile = entry
+    stack.close()
+    report_violations(profile, get_budget(profile.label))
+    logger.debug(
+        f"Task {profile.label}: {profile.count} queries, "
+        f"{profile.total_time_ms}ms DB time",
+        extra={**profile.to_dict(), "action": "task_query_profile"},
+    )
+
+
+def install_task_profiling() -> None:
+    """Profile every Celery task run by this process"""
+    from celery.signals import task_postrun, task_prerun
+
+    task_prerun.connect(_start_task_profile, weak=False)
+    task_postrun.connect(_finish_task_profile, weak=False)
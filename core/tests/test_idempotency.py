@@ -15,8 +15,10 @@ from core.idempotency import (
     clear_idempotency_key,
     idempotent_daily_task,
     idempotent_once,
+    idempotent_per_run,
     idempotent_task,
     make_idempotency_key,
+    make_run_idempotency_key,
 )
 
 
@@ -278,6 +280,74 @@ class ConvenienceDecoratorsTest(TestCase):
         self.assertEqual(execution_count["count"], 2)
 
 
+class IdempotentPerRunTest(TestCase):
+    """Test run-keyed idempotency with a completion marker"""
+
+    def setUp(self):
+        cache.clear()
+        self.executions = []
+        self.mock_self = Mock()
+        self.mock_self.name = "run.task"
+        self.mock_self.request.id = "task-1"
+
+    def tearDown(self):
+        cache.clear()
+
+    def _task(self, **options):
+        executions = self.executions
+
+        @idempotent_per_run("run_id", "shard_index", **options)
+        def run_task(self, payload, run_id, shard_index=0):
+            executions.append(payload)
+            return {"payload": payload}
+
+        return run_task
+
+    def test_key_ignores_payload_and_stores_marker_only(self):
+        task = self._task()
+
+        task(self.mock_self, ["large"] * 1000, "run-1", shard_index=2)
+
+        marker = cache.get(make_run_idempotency_key("run.task", "run-1", 2))
+        self.assertEqual(marker["task_id"], "task-1")
+        self.assertNotIn("result", marker)
+        self.assertNotIn("args", marker)
+
+    def test_duplicate_returns_result_from_backend(self):
+        task = self._task()
+        self.mock_self.AsyncResult.return_value.successful.return_value = True
+        self.mock_self.AsyncResult.return_value.result = {"payload": "stored"}
+
+        task(self.mock_self, "a", "run-1")
+        result = task(self.mock_self, "a", "run-1")
+
+        self.assertEqual(result, {"payload": "stored"})
+        self.assertEqual(self.executions, ["a"])
+        self.mock_self.AsyncResult.assert_called_once_with("task-1")
+
+    def test_duplicate_without_stored_result(self):
+        self.mock_self.AsyncResult.return_value.successful.return_value = False
+
+        skipping = self._task()
+        skipping(self.mock_self, "a", "run-1")
+        result = skipping(self.mock_self, "a", "run-1")
+        self.assertTrue(result["duplicate"])
+        self.assertEqual(self.executions, ["a"])
+
+        # Side-effect-free tasks are recalculated
+        rerunning = self._task(side_effect_free=True)
+        self.assertEqual(rerunning(self.mock_self, "b", "run-1"), {"payload": "b"})
+        self.assertEqual(self.executions, ["a", "b"])
+
+    def test_other_shard_of_same_run_executes(self):
+        task = self._task()
+
+        task(self.mock_self, "a", "run-1", shard_index=0)
+        task(self.mock_self, "b", "run-1", shard_index=1)
+
+        self.assertEqual(self.executions, ["a", "b"])
+
+
 class IdempotencyUtilsTest(TestCase):
     """Test utility functions"""
 
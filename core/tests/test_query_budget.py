@@ -0,0 +1,97 @@
+"""
+Tests for SQL query profiling and query budgets.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from core.query_budget import (
+    QueryBudget,
+    _finish_task_profile,
+    _start_task_profile,
+    assert_query_budget,
+    fingerprint_sql,
+    get_budget,
+    profile_queries,
+)
+
+
+class QueryBudgetTest(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(username=f"budget_user{i}") for i in range(3)
+        ]
+
+    def test_fingerprint_ignores_parameter_values(self):
+        self.assertEqual(
+            fingerprint_sql('SELECT * FROM "t" WHERE "id" = 1 AND "name" = \'a\''),
+            fingerprint_sql('SELECT * FROM "t" WHERE "id" = 22 AND "name" = \'bb\''),
+        )
+        self.assertEqual(
+            fingerprint_sql('SELECT * FROM "t" WHERE "id" IN (%s, %s)'),
+            fingerprint_sql('SELECT * FROM "t" WHERE "id" IN (%s, %s, %s)'),
+        )
+
+    def test_profile_counts_duplicates(self):
+        with profile_queries("loop") as profile:
+            for user in self.users:
+                User.objects.get(pk=user.pk)
+            list(User.objects.all())
+
+        self.assertEqual(profile.count, 4)
+        self.assertEqual(profile.duplicate_count, 2)
+        self.assertEqual(len(profile.slowest), 4)
+        self.assertEqual(profile.to_dict()["queries"], 4)
+
+    def test_assert_query_budget(self):
+        with assert_query_budget(max_queries=1, max_duplicates=0):
+            list(User.objects.all())
+
+        with self.assertRaisesRegex(AssertionError, "duplicate queries"):
+            with assert_query_budget(max_duplicates=0):
+                for user in self.users:
+                    User.objects.get(pk=user.pk)
+
+    @override_settings(QUERY_BUDGETS={"health-check": 0, "task": {"max_duplicates": 1}})
+    def test_get_budget(self):
+        self.assertEqual(get_budget("health-check"), QueryBudget(max_queries=0))
+        self.assertEqual(get_budget("task"), QueryBudget(max_duplicates=1))
+        self.assertIsNone(get_budget("other"))
+
+    @override_settings(QUERY_PROFILER_ENABLED=True, QUERY_BUDGETS={"payroll-list": 0})
+    def test_middleware_headers_and_violations(self):
+        admin = User.objects.create_superuser(username="budget_admin")
+
+        with patch("core.query_budget.logger.warning") as mock_warning:
+            self.client.force_login(admin)
+            response = self.client.get("/api/v1/payroll/?year=2025&month=10")
+
+        self.assertGreater(int(response["X-DB-Query-Count"]), 0)
+        self.assertIn("X-DB-Time-Ms", response)
+        self.assertIn("X-DB-Duplicate-Queries", response)
+        self.assertTrue(mock_warning.called)
+        self.assertIn("payroll-list", mock_warning.call_args[0][0])
+
+    @override_settings(QUERY_PROFILER_ENABLED=True)
+    def test_middleware_hides_headers_from_regular_users(self):
+        self.client.force_login(self.users[0])
+
+        response = self.client.get("/api/v1/payroll/?year=2025&month=10")
+
+        self.assertNotIn("X-DB-Query-Count", response)
+
+    @override_settings(QUERY_BUDGETS={"payroll.tasks.example": 1})
+    def test_task_profile_reports_violations(self):
+        task = SimpleNamespace(name="payroll.tasks.example")
+
+        with patch("core.query_budget.logger.warning") as mock_warning:
+            _start_task_profile(task_id="task-1", task=task)
+            list(User.objects.all())
+            list(User.objects.all())
+            _finish_task_profile(task_id="task-1", task=task)
+
+        self.assertTrue(mock_warning.called)
+        self.assertIn("2 queries > budget 1", mock_warning.call_args[0][0])
@@ -0,0 +1,203 @@
+"""
+Process-local (L1) cache for calendar lookups - holidays and Shabbat times.
+
+Holidays and Shabbat times change a few times a year, yet payroll asked
+Redis (or the database) for them on every calculation. LocalCalendarCache
+sits in front of the Django cache: a size-bounded LRU with a TTL, kept in
+each process.
+
+Cross-process invalidation uses the calendar generation counter of
+payroll.services.cache_versions, kept in the shared cache next to the
+payroll cache generations. bump_calendar_version() (called when
+HolidaySyncService writes and when a Holiday is saved or deleted) increments
+it, and every L1 cache compares it with the generation it was filled under
+at most once per CALENDAR_L1_VERSION_CHECK_SECONDS, dropping all entries
+when it changed.
+
+CALENDAR_L1_CACHE_TTL = 0 disables the L1 caches (CI does this so tests see
+their own fixtures). get_calendar_cache_stats() exposes hit/miss counters
+for monitoring.
+
+Example usage:
+    holidays_l1 = LocalCalendarCache("holidays")
+    holidays = holidays_l1.get_or_set((2025, 10), load_holidays)
+"""
+
+import copy
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from django.conf import settings
+
+from payroll.services.cache_versions import bump_calendar, get_calendar_generation
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_VERSION_CHECK_SECONDS = 5
+
+_MISSING = object()
+
+# Live caches, for bump_calendar_version() and get_calendar_cache_stats()
+_registry: "weakref.WeakSet[LocalCalendarCache]" = weakref.WeakSet()
+_registry_lock = threading.Lock()
+
+
+def get_calendar_version() -> int:
+    """Current cross-process calendar version"""
+    return get_calendar_generation()
+
+
+def bump_calendar_version() -> None:
+    """Invalidate the L1 calendar caches of all processes"""
+    bump_calendar()
+
+    # This process does not wait for its next version check
+    with _registry_lock:
+        local_caches = list(_registry)
+    for local_cache in local_caches:
+        local_cache.clear()
+
+
+class LocalCalendarCache:
+    """
+    Thread-safe LRU + TTL cache for calendar data in this process.
+
+    Values are deep-copied on the way in and out, so callers may mutate what
+    they get (e.g. enrich holiday dicts) without corrupting the cache.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            name: Name reported in get_calendar_cache_stats()
+            max_entries: LRU bound (defaults to CALENDAR_L1_CACHE_MAX_ENTRIES)
+            ttl_seconds: Entry lifetime (defaults to CALENDAR_L1_CACHE_TTL)
+        """
+        self.name = name
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = _MISSING
+        self._next_version_check = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        with _registry_lock:
+            _registry.add(self)
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return getattr(settings, "CALENDAR_L1_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        return getattr(settings, "CALENDAR_L1_CACHE_TTL", DEFAULT_TTL_SECONDS)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def _check_version(self, now: float) -> None:
+        """Drop all entries if another process bumped the calendar version"""
+        if now < self._next_version_check:
+            return
+        self._next_version_check = now + getattr(
+            settings,
+            "CALENDAR_L1_VERSION_CHECK_SECONDS",
+            DEFAULT_VERSION_CHECK_SECONDS,
+        )
+        version = get_calendar_version()
+        if version != self._version:
+            if self._version is not _MISSING and self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._version = version
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if not self.enabled:
+            self.misses += 1
+            return default
+
+        now = time.monotonic()
+        with self._lock:
+            self._check_version(now)
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+
+        value = copy.deepcopy(value)
+        now = time.monotonic()
+        with self._lock:
+            self._check_version(now)
+            self._entries[key] = (now + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Cached value, or loader() stored for later calls (None is not stored)"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            if value is not None:
+                self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._next_version_check = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+def get_calendar_cache_stats() -> List[Dict[str, Any]]:
+    """Hit/miss counters of every L1 calendar cache in this process"""
+    with _registry_lock:
+        local_caches = list(_registry)
+    return [local_cache.stats() for local_cache in local_caches]
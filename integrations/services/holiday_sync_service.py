@@ -20,6 +20,7 @@ from django.utils import timezone
 
 from integrations.config.israeli_holidays import is_official_holiday
 from integrations.models import Holiday
+from integrations.services.calendar_cache import bump_calendar_version
 from integrations.services.hebcal_api_client import HebcalAPIClient
 from integrations.services.holiday_times_service import HolidayTimesService
 from integrations.services.israeli_holidays_service import IsraeliHolidaysService
@@ -85,6 +86,10 @@ class HolidaySyncService:
             special_updated + other_updated + weekly_updated + national_updated
         )
 
+        # Drop process-local holiday/Shabbat caches in all processes
+        if total_created or total_updated:
+            bump_calendar_version()
+
         logger.info(
             f"Holiday sync completed for {year}: "
             f"created={total_created}, updated={total_updated}"
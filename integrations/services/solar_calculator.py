@@ -0,0 +1,238 @@
+"""
+Offline sunset calculator based on the NOAA solar position algorithm.
+
+Computes sunrise/sunset for any latitude, longitude and date locally, so
+Shabbat times never depend on the sunrise-sunset.org API. The algorithm
+follows the NOAA Solar Calculator spreadsheet and agrees with the API to
+within about a minute at Israeli latitudes.
+
+Example usage:
+    sunset = calculate_sunset(date(2025, 7, 4), 31.7683, 35.2137)
+
+    # Optional precomputed table for repeated lookups
+    table = SunsetTable.build(2024, 2030, 31.7683, 35.2137)
+    sunset = table.get_sunset(date(2025, 7, 4))
+"""
+
+import logging
+import math
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+
+import pytz
+
+logger = logging.getLogger(__name__)
+
+# Sun's apparent radius plus atmospheric refraction at the horizon
+SUNSET_ZENITH_DEGREES = 90.833
+
+# Julian day of 2000-01-01 12:00 UTC (J2000.0 epoch)
+J2000_JULIAN_DAY = 2451545.0
+UNIX_EPOCH_JULIAN_DAY = 2440587.5
+
+
+class SolarCalculationError(ValueError):
+    """Raised when the sun does not rise or set on the given day (polar regions)"""
+
+    pass
+
+
+def _julian_day(day: date, minutes_utc: float = 0.0) -> float:
+    """Julian day for a UTC date plus minutes since midnight"""
+    days_since_epoch = (day - date(1970, 1, 1)).days
+    return UNIX_EPOCH_JULIAN_DAY + days_since_epoch + minutes_utc / 1440.0
+
+
+def _solar_parameters(julian_day: float):
+    """
+    Get solar declination (degrees) and equation of time (minutes).
+
+    Args:
+        julian_day: Julian day of the moment
+
+    Returns:
+        Tuple[float, float]: Declination and equation of time
+    """
+    t = (julian_day - J2000_JULIAN_DAY) / 36525.0  # Julian centuries
+
+    mean_longitude = (280.46646 + t * (36000.76983 + t * 0.0003032)) % 360
+    mean_anomaly = 357.52911 + t * (35999.05029 - 0.0001537 * t)
+    eccentricity = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+
+    anomaly_rad = math.radians(mean_anomaly)
+    equation_of_center = (
+        math.sin(anomaly_rad) * (1.914602 - t * (0.004817 + 0.000014 * t))
+        + math.sin(2 * anomaly_rad) * (0.019993 - 0.000101 * t)
+        + math.sin(3 * anomaly_rad) * 0.000289
+    )
+
+    omega = math.radians(125.04 - 1934.136 * t)
+    apparent_longitude = (
+        mean_longitude + equation_of_center - 0.00569 - 0.00478 * math.sin(omega)
+    )
+
+    mean_obliquity = (
+        23 + (26 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) / 60) / 60
+    )
+    obliquity = math.radians(mean_obliquity + 0.00256 * math.cos(omega))
+
+    declination = math.degrees(
+        math.asin(math.sin(obliquity) * math.sin(math.radians(apparent_longitude)))
+    )
+
+    y = math.tan(obliquity / 2) ** 2
+    longitude_rad = math.radians(mean_longitude)
+    equation_of_time = 4 * math.degrees(
+        y * math.sin(2 * longitude_rad)
+        - 2 * eccentricity * math.sin(anomaly_rad)
+        + 4 * eccentricity * y * math.sin(anomaly_rad) * math.cos(2 * longitude_rad)
+        - 0.5 * y * y * math.sin(4 * longitude_rad)
+        - 1.25 * eccentricity * eccentricity * math.sin(2 * anomaly_rad)
+    )
+
+    return declination, equation_of_time
+
+
+def _event_minutes_utc(day: date, lat: float, lng: float, is_sunset: bool) -> float:
+    """Minutes after UTC midnight of sunrise or sunset"""
+    # First pass at solar noon, second pass at the estimated event time
+    minutes = 720.0 - 4 * lng
+    for _ in range(2):
+        declination, equation_of_time = _solar_parameters(_julian_day(day, minutes))
+
+        lat_rad = math.radians(lat)
+        decl_rad = math.radians(declination)
+        cos_hour_angle = math.cos(math.radians(SUNSET_ZENITH_DEGREES)) / (
+            math.cos(lat_rad) * math.cos(decl_rad)
+        ) - math.tan(lat_rad) * math.tan(decl_rad)
+        if not -1.0 <= cos_hour_angle <= 1.0:
+            raise SolarCalculationError(
+                f"No sunrise/sunset on {day} at lat={lat}, lng={lng}"
+            )
+
+        hour_angle = math.degrees(math.acos(cos_hour_angle))
+        solar_noon = 720.0 - 4 * lng - equation_of_time
+        minutes = solar_noon + (4 * hour_angle if is_sunset else -4 * hour_angle)
+
+    return minutes
+
+
+def _to_datetime(day: date, minutes_utc: float) -> datetime:
+    """Convert minutes after UTC midnight to an aware UTC datetime"""
+    moment = datetime(day.year, day.month, day.day) + timedelta(
+        seconds=round(minutes_utc * 60)
+    )
+    return pytz.UTC.localize(moment)
+
+
+def calculate_sunset(day: date, lat: float, lng: float) -> datetime:
+    """
+    Calculate sunset for a date and location.
+
+    Args:
+        day: Local calendar date at the location
+        lat: Latitude in degrees (north positive)
+        lng: Longitude in degrees (east positive)
+
+    Returns:
+        datetime: Sunset as an aware UTC datetime
+
+    Raises:
+        SolarCalculationError: If the sun does not set on that day
+    """
+    return _to_datetime(day, _event_minutes_utc(day, lat, lng, is_sunset=True))
+
+
+def calculate_sunrise(day: date, lat: float, lng: float) -> datetime:
+    """
+    Calculate sunrise for a date and location.
+
+    Args:
+        day: Local calendar date at the location
+        lat: Latitude in degrees (north positive)
+        lng: Longitude in degrees (east positive)
+
+    Returns:
+        datetime: Sunrise as an aware UTC datetime
+
+    Raises:
+        SolarCalculationError: If the sun does not rise on that day
+    """
+    return _to_datetime(day, _event_minutes_utc(day, lat, lng, is_sunset=False))
+
+
+class SunsetTable:
+    """
+    Precomputed sunsets for one location over a range of years.
+
+    Lookups outside the table are calculated on demand, so the table is a
+    pure speed-up and never changes results.
+    """
+
+    def __init__(self, lat: float, lng: float, sunsets: Dict[date, datetime]):
+        """
+        Initialize the table.
+
+        Args:
+            lat: Latitude of the location
+            lng: Longitude of the location
+            sunsets: Sunset (aware UTC datetime) keyed by date
+        """
+        self.lat = lat
+        self.lng = lng
+        self._sunsets = sunsets
+
+    @classmethod
+    def build(cls, start_year: int, end_year: int, lat: float, lng: float):
+        """
+        Precompute sunsets for every day of the given years (inclusive).
+
+        Args:
+            start_year: First year of the table
+            end_year: Last year of the table
+            lat: Latitude of the location
+            lng: Longitude of the location
+
+        Returns:
+            SunsetTable: Table for the location
+        """
+        sunsets = {}
+        current = date(start_year, 1, 1)
+        last_day = date(end_year, 12, 31)
+        while current <= last_day:
+            try:
+                sunsets[current] = calculate_sunset(current, lat, lng)
+            except SolarCalculationError:
+                pass  # Polar day/night - lookups raise on demand
+            current += timedelta(days=1)
+
+        logger.debug(
+            f"Built sunset table for {start_year}-{end_year} ({len(sunsets)} days)",
+            extra={"lat": lat, "lng": lng, "days": len(sunsets)},
+        )
+        return cls(lat, lng, sunsets)
+
+    def covers(self, lat: float, lng: float) -> bool:
+        """Check whether the table was built for the given location"""
+        return self.lat == lat and self.lng == lng
+
+    def get_sunset(self, day: date) -> datetime:
+        """
+        Get sunset for a date, calculating it if the date is not in the table.
+
+        Args:
+            day: Calendar date
+
+        Returns:
+            datetime: Sunset as an aware UTC datetime
+        """
+        sunset: Optional[datetime] = self._sunsets.get(day)
+        if sunset is None:
+            sunset = calculate_sunset(day, self.lat, self.lng)
+        return sunset
+
+    def __len__(self) -> int:
+        return len(self._sunsets)
+
+    def __repr__(self):
+        return f"SunsetTable(lat={self.lat}, lng={self.lng}, days={len(self._sunsets)})"
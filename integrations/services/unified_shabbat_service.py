@@ -6,11 +6,13 @@ with a single, precise, and consistent implementation that always returns
 the standardized ShabbatTimes contract.
 
 Key improvements:
-- Always uses precise calculations (2 API calls when possible)
+- Sunsets calculated offline with the NOAA solar position algorithm
+  (no network access; sunrise-sunset.org API is an optional source/cross-check)
 - Consistent ShabbatTimes contract return type
 - Proper Israeli timezone handling
 - Comprehensive error handling with fallbacks
-- Built-in caching for performance
+- Built-in caching for performance (process-local L1 in front of the Django
+  cache, see integrations/services/calendar_cache.py)
 """
 
 import logging
@@ -20,8 +22,11 @@ from typing import Optional
 import pytz
 import requests
 
+from django.conf import settings
 from django.core.cache import cache
 
+from integrations.services.calendar_cache import LocalCalendarCache
+from integrations.services.solar_calculator import SunsetTable, calculate_sunset
 from payroll.services.contracts import (
     ShabbatTimes,
     create_fallback_shabbat_times,
@@ -35,13 +40,23 @@ class UnifiedShabbatService:
     """
     Single source of truth for Shabbat times with precise Israeli labor law compliance.
 
-    This service always aims for maximum precision using two API calls (Friday + Saturday)
-    with intelligent fallback to seasonal approximations when API is unavailable.
+    Friday and Saturday sunsets are calculated locally (SHABBAT_TIMES_SOURCE
+    "astronomical", the default). With SHABBAT_TIMES_SOURCE "api" the service
+    makes two sunrise-sunset.org API calls instead and falls back to seasonal
+    approximations when the API is unavailable. SHABBAT_TIMES_API_CROSS_CHECK
+    compares astronomical sunsets with the API and logs deviations.
 
     All returned times are in Israeli timezone (Asia/Jerusalem) and conform to
     the ShabbatTimes contract for type safety and consistency.
     """
 
+    # Sources of sunset times
+    SOURCE_ASTRONOMICAL = "astronomical"
+    SOURCE_API = "api"
+
+    # Astronomical vs API sunset difference that is logged by the cross-check
+    CROSS_CHECK_TOLERANCE_MINUTES = 3
+
     # API Configuration
     BASE_URL = "https://api.sunrise-sunset.org/json"
     CACHE_KEY_PREFIX = "unified_shabbat_"
@@ -61,10 +76,69 @@ class UnifiedShabbatService:
         42  # Havdalah time (42 min after sunset, 3 stars appear)
     )
 
-    def __init__(self):
-        """Initialize service with logging setup"""
+    def __init__(
+        self, source: Optional[str] = None, api_cross_check: Optional[bool] = None
+    ):
+        """
+        Initialize service.
+
+        Args:
+            source: "astronomical" or "api" (defaults to SHABBAT_TIMES_SOURCE)
+            api_cross_check: Compare astronomical sunsets with the API
+                (defaults to SHABBAT_TIMES_API_CROSS_CHECK)
+        """
+        self._source = source
+        self._api_cross_check = api_cross_check
+        self._sunset_table: Optional[SunsetTable] = None
         self._api_calls_made = 0
         self._cache_hits = 0
+        self._l1_cache = LocalCalendarCache("shabbat_times")
+        self._astronomical_calculations = 0
+        self._cross_check_deviations = 0
+
+    @property
+    def source(self) -> str:
+        """Source of sunset times, read from settings unless set explicitly"""
+        if self._source is not None:
+            return self._source
+        return getattr(settings, "SHABBAT_TIMES_SOURCE", self.SOURCE_ASTRONOMICAL)
+
+    @property
+    def api_cross_check(self) -> bool:
+        """Whether astronomical sunsets are cross-checked against the API"""
+        if self._api_cross_check is not None:
+            return self._api_cross_check
+        return getattr(settings, "SHABBAT_TIMES_API_CROSS_CHECK", False)
+
+    def preload_sunset_table(
+        self,
+        start_year: int,
+        end_year: int,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+    ) -> SunsetTable:
+        """
+        Precompute sunsets for a range of years for the astronomical source.
+
+        Optional - sunsets are cheap to calculate, the table only removes the
+        calculation from repeated lookups for the same location.
+
+        Args:
+            start_year: First year of the table
+            end_year: Last year of the table (inclusive)
+            lat: Latitude (defaults to Jerusalem)
+            lng: Longitude (defaults to Jerusalem)
+
+        Returns:
+            SunsetTable: The table now used by the service
+        """
+        self._sunset_table = SunsetTable.build(
+            start_year,
+            end_year,
+            self.DEFAULT_LAT if lat is None else lat,
+            self.DEFAULT_LNG if lng is None else lng,
+        )
+        return self._sunset_table
 
     def get_shabbat_times(
         self,
@@ -76,8 +150,9 @@ class UnifiedShabbatService:
         """
         Get precise Shabbat start and end times in Israeli timezone.
 
-        Always attempts maximum precision with two API calls (Friday + Saturday).
-        Falls back to seasonal approximations if API is unavailable.
+        Sunsets are calculated offline unless the service is configured to use
+        the API (two calls, Friday + Saturday), which falls back to seasonal
+        approximations if the API is unavailable.
 
         Args:
             date_obj: Any date (will find the appropriate Friday)
@@ -103,23 +178,42 @@ class UnifiedShabbatService:
             saturday_date = friday_date + timedelta(days=1)
 
             # Check cache first
-            cache_key = f"{self.CACHE_KEY_PREFIX}{friday_date}_{lat}_{lng}"
+            cache_key = (
+                f"{self.CACHE_KEY_PREFIX}{self.source}_{friday_date}_{lat}_{lng}"
+            )
             if use_cache:
+                cached_result = self._l1_cache.get(cache_key)
+                if cached_result:
+                    self._cache_hits += 1
+                    return cached_result
+
                 cached_result = cache.get(cache_key)
                 if cached_result:
                     logger.debug(f"📋 Cache HIT for Shabbat times {friday_date}")
                     self._cache_hits += 1
-                    return validate_shabbat_times(cached_result)
+                    cached_result = validate_shabbat_times(cached_result)
+                    self._l1_cache.set(cache_key, cached_result)
+                    return cached_result
+
+            if self.source == self.SOURCE_API:
+                # Try precise calculation with API
+                result = self._calculate_precise_times(
+                    friday_date, saturday_date, lat, lng
+                )
+            else:
+                result = self._calculate_astronomical_times(
+                    friday_date, saturday_date, lat, lng
+                )
 
-            # Try precise calculation with API
-            result = self._calculate_precise_times(friday_date, saturday_date, lat, lng)
+            result = validate_shabbat_times(result)
 
             # Cache successful result
             if use_cache and result:
                 cache.set(cache_key, result, self.CACHE_TIMEOUT)
+                self._l1_cache.set(cache_key, result)
                 logger.debug(f"📋 Cached precise Shabbat times for {friday_date}")
 
-            return validate_shabbat_times(result)
+            return result
 
         except Exception as e:
             logger.error(
@@ -138,7 +232,9 @@ class UnifiedShabbatService:
 
             # Cache fallback to prevent repeated API failures
             if use_cache:
-                cache_key = f"{self.CACHE_KEY_PREFIX}{friday_date}_{lat}_{lng}"
+                cache_key = (
+                    f"{self.CACHE_KEY_PREFIX}{self.source}_{friday_date}_{lat}_{lng}"
+                )
                 cache.set(
                     cache_key, fallback_result, self.CACHE_TIMEOUT // 4
                 )  # Shorter cache for fallbacks
@@ -156,6 +252,84 @@ class UnifiedShabbatService:
             days_back_to_friday = date_obj.weekday() - 4
             return date_obj - timedelta(days=days_back_to_friday)
 
+    def _get_sunset(self, date_obj: date, lat: float, lng: float) -> datetime:
+        """Calculate sunset in Israeli timezone, using the preloaded table if any"""
+        if self._sunset_table is not None and self._sunset_table.covers(lat, lng):
+            sunset = self._sunset_table.get_sunset(date_obj)
+        else:
+            sunset = calculate_sunset(date_obj, lat, lng)
+        return sunset.astimezone(self.ISRAEL_TZ)
+
+    def _calculate_astronomical_times(
+        self, friday_date: date, saturday_date: date, lat: float, lng: float
+    ) -> ShabbatTimes:
+        """
+        Calculate Shabbat times from locally computed Friday and Saturday sunsets.
+
+        No network access unless the API cross-check is enabled.
+        """
+        friday_sunset = self._get_sunset(friday_date, lat, lng)
+        saturday_sunset = self._get_sunset(saturday_date, lat, lng)
+        self._astronomical_calculations += 1
+
+        if self.api_cross_check:
+            self._cross_check_with_api(friday_date, friday_sunset, lat, lng)
+
+        shabbat_start = friday_sunset - timedelta(
+            minutes=self.SHABBAT_START_BUFFER_MINUTES
+        )
+        shabbat_end = saturday_sunset + timedelta(
+            minutes=self.SHABBAT_END_BUFFER_MINUTES
+        )
+
+        return ShabbatTimes(
+            shabbat_start=shabbat_start.isoformat(),
+            shabbat_end=shabbat_end.isoformat(),
+            friday_sunset=friday_sunset.isoformat(),
+            saturday_sunset=saturday_sunset.isoformat(),
+            timezone="Asia/Jerusalem",
+            is_estimated=False,
+            calculation_method=self.SOURCE_ASTRONOMICAL,
+            coordinates={"lat": lat, "lng": lng},
+            friday_date=friday_date.isoformat(),
+            saturday_date=saturday_date.isoformat(),
+        )
+
+    def _cross_check_with_api(
+        self, date_obj: date, sunset: datetime, lat: float, lng: float
+    ) -> Optional[float]:
+        """
+        Compare a calculated sunset with the sunrise-sunset.org API.
+
+        Never raises - the API is only a diagnostic here.
+
+        Returns:
+            Deviation in minutes, or None if the API is unavailable
+        """
+        api_times = self._get_api_times(date_obj, lat, lng)
+        if not api_times or "sunset" not in api_times:
+            return None
+
+        try:
+            api_sunset = self._parse_and_convert_to_israel_tz(api_times["sunset"])
+        except ValueError:
+            return None
+
+        deviation = abs((api_sunset - sunset).total_seconds()) / 60
+        if deviation > self.CROSS_CHECK_TOLERANCE_MINUTES:
+            self._cross_check_deviations += 1
+            logger.warning(
+                f"Astronomical sunset for {date_obj} deviates from API by {deviation:.1f} min",
+                extra={
+                    "date": date_obj.isoformat(),
+                    "deviation_minutes": round(deviation, 1),
+                    "lat": lat,
+                    "lng": lng,
+                    "action": "shabbat_sunset_cross_check",
+                },
+            )
+        return deviation
+
     def _calculate_precise_times(
         self, friday_date: date, saturday_date: date, lat: float, lng: float
     ) -> ShabbatTimes:
@@ -341,8 +515,12 @@ class UnifiedShabbatService:
     def get_service_stats(self) -> dict:
         """Get service usage statistics for monitoring"""
         return {
+            "source": self.source,
             "api_calls_made": self._api_calls_made,
             "cache_hits": self._cache_hits,
+            "astronomical_calculations": self._astronomical_calculations,
+            "cross_check_deviations": self._cross_check_deviations,
+            "l1_cache": self._l1_cache.stats(),
             "service_version": "unified_v1.0",
         }
 
@@ -390,6 +568,9 @@ def get_sunset_time(
     """
     try:
         service = UnifiedShabbatService()
+        if service.source != UnifiedShabbatService.SOURCE_API:
+            return service._get_sunset(date_obj, lat, lng)
+
         # Get API times for the given date
         api_data = service._get_api_times(date_obj, lat, lng)
         if api_data and "sunset" in api_data:
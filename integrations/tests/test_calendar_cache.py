@@ -0,0 +1,103 @@
+"""
+Tests for the process-local (L1) calendar cache and its use by
+UnifiedShabbatService.
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from integrations.services.calendar_cache import (
+    LocalCalendarCache,
+    bump_calendar_version,
+    get_calendar_cache_stats,
+)
+from integrations.services.unified_shabbat_service import UnifiedShabbatService
+from payroll.services.cache_versions import make_calendar_key
+
+
+class LocalCalendarCacheTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_hits_misses_and_copies(self):
+        l1 = LocalCalendarCache("test", ttl_seconds=60, max_entries=10)
+
+        self.assertIsNone(l1.get((2025, 10)))
+        l1.set((2025, 10), {"2025-10-07": {"name": "Sukkot"}})
+        holidays = l1.get((2025, 10))
+        holidays["2025-10-07"]["name"] = "changed"
+
+        self.assertEqual(l1.get((2025, 10))["2025-10-07"]["name"], "Sukkot")
+        self.assertEqual((l1.hits, l1.misses), (2, 1))
+        self.assertIn("test", [stats["name"] for stats in get_calendar_cache_stats()])
+
+    def test_lru_bound_and_ttl(self):
+        l1 = LocalCalendarCache("test", ttl_seconds=60, max_entries=2)
+        l1.set(1, "a")
+        l1.set(2, "b")
+        l1.get(1)
+        l1.set(3, "c")
+
+        self.assertEqual(l1.get(2), None)
+        self.assertEqual(l1.get(1), "a")
+        self.assertEqual(l1.evictions, 1)
+
+        with patch(
+            "integrations.services.calendar_cache.time.monotonic", return_value=1e12
+        ):
+            self.assertIsNone(l1.get(1))
+
+    @override_settings(CALENDAR_L1_VERSION_CHECK_SECONDS=3600)
+    def test_version_bump_in_another_process_invalidates(self):
+        l1 = LocalCalendarCache("test", ttl_seconds=60)
+        l1.set("key", "value")
+
+        # Another process bumps the shared version ...
+        cache.set(make_calendar_key(), 12345, timeout=None)
+        self.assertEqual(l1.get("key"), "value")  # ... not checked yet
+
+        l1._next_version_check = 0.0
+        self.assertIsNone(l1.get("key"))
+        self.assertEqual(l1.invalidations, 1)
+
+    def test_local_bump_clears_immediately(self):
+        l1 = LocalCalendarCache("test", ttl_seconds=60)
+        l1.set("key", "value")
+
+        bump_calendar_version()
+
+        self.assertIsNone(l1.get("key"))
+
+    @override_settings(CALENDAR_L1_CACHE_TTL=0)
+    def test_disabled_by_zero_ttl(self):
+        l1 = LocalCalendarCache("test")
+        l1.set("key", "value")
+
+        self.assertIsNone(l1.get("key"))
+        self.assertFalse(l1.stats()["enabled"])
+
+
+@override_settings(CALENDAR_L1_CACHE_TTL=60)
+class ShabbatTimesL1Test(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_repeated_lookups_skip_the_django_cache(self):
+        service = UnifiedShabbatService(source="astronomical", api_cross_check=False)
+        first = service.get_shabbat_times(date(2025, 7, 4))
+
+        with patch("integrations.services.unified_shabbat_service.cache") as l2:
+            second = service.get_shabbat_times(date(2025, 7, 5))
+
+        l2.get.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(service.get_service_stats()["l1_cache"]["hits"], 1)
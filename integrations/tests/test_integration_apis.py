@@ -16,7 +16,7 @@ from unittest.mock import MagicMock, patch
 import requests
 
 from django.core.cache import cache
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from integrations.models import Holiday
 from integrations.services.hebcal_service import HebcalService
@@ -98,6 +98,7 @@ class IntegrationErrorHandlingTest(TestCase):
             holidays = HebcalService.fetch_holidays(2025, use_cache=False)
             self.assertEqual(holidays, [])
 
+    @override_settings(SHABBAT_TIMES_SOURCE="api")
     def test_connection_error_handling(self):
         """Test handling of connection errors with UnifiedShabbatService"""
         with patch("requests.get") as mock_get:
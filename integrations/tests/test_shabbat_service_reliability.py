@@ -97,7 +97,7 @@ class TestReliability:
 
     def test_handles_api_timeouts_gracefully(self):
         """Test that service handles API timeouts without crashing"""
-        service = UnifiedShabbatService()
+        service = UnifiedShabbatService(source="api")
 
         with patch("requests.get") as mock_get:
             # Simulate timeout
@@ -112,7 +112,7 @@ class TestReliability:
 
     def test_handles_malformed_api_responses(self):
         """Test handling of malformed API responses"""
-        service = UnifiedShabbatService()
+        service = UnifiedShabbatService(source="api")
 
         test_cases = [
             {"status": "INVALID_REQUEST"},  # Bad status
@@ -264,7 +264,7 @@ class TestErrorRecovery:
 
     def test_partial_api_failure_recovery(self):
         """Test recovery when only one of two API calls fails"""
-        service = UnifiedShabbatService()
+        service = UnifiedShabbatService(source="api")
 
         call_count = 0
 
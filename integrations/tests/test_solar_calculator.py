@@ -0,0 +1,143 @@
+"""
+Tests for the offline NOAA sunset calculator and the astronomical source
+of UnifiedShabbatService.
+"""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+import pytz
+
+from integrations.services.solar_calculator import (
+    SolarCalculationError,
+    SunsetTable,
+    calculate_sunrise,
+    calculate_sunset,
+)
+from integrations.services.unified_shabbat_service import UnifiedShabbatService
+from payroll.services.contracts import validate_shabbat_times
+
+ISRAEL_TZ = pytz.timezone("Asia/Jerusalem")
+JERUSALEM = (31.7683, 35.2137)
+
+
+def _israel_time(value: str) -> datetime:
+    return ISRAEL_TZ.localize(datetime.fromisoformat(value))
+
+
+class TestSolarCalculator:
+    """Sunset/sunrise calculation accuracy"""
+
+    @pytest.mark.parametrize(
+        "day,expected",
+        [
+            # Published sunsets for Jerusalem (sunrise-sunset.org)
+            (date(2025, 7, 4), "2025-07-04T19:48:00"),
+            (date(2025, 1, 3), "2025-01-03T16:48:00"),
+            (date(2024, 3, 29), "2024-03-29T18:57:00"),
+        ],
+    )
+    def test_sunset_matches_published_times(self, day, expected):
+        sunset = calculate_sunset(day, *JERUSALEM).astimezone(ISRAEL_TZ)
+
+        deviation = abs((sunset - _israel_time(expected)).total_seconds())
+        assert deviation <= 120, f"{day}: {sunset} deviates {deviation:.0f}s"
+
+    def test_western_longitude_sunset_after_utc_midnight(self):
+        # New York, June 21: sunset ~20:31 EDT = 00:31 UTC on June 22
+        sunset = calculate_sunset(date(2025, 6, 21), 40.7128, -74.0060)
+
+        assert sunset.tzinfo is not None
+        assert sunset.date() == date(2025, 6, 22)
+        assert sunset.hour == 0
+
+    def test_sunrise_before_sunset(self):
+        sunrise = calculate_sunrise(date(2025, 7, 4), *JERUSALEM)
+        sunset = calculate_sunset(date(2025, 7, 4), *JERUSALEM)
+
+        assert timedelta(hours=13) < sunset - sunrise < timedelta(hours=15)
+
+    def test_polar_night_raises(self):
+        with pytest.raises(SolarCalculationError):
+            calculate_sunset(date(2025, 12, 21), 78.2, 15.6)  # Svalbard
+
+    def test_sunset_table_matches_calculation(self):
+        table = SunsetTable.build(2025, 2025, *JERUSALEM)
+
+        assert len(table) == 365
+        assert table.covers(*JERUSALEM)
+        assert table.get_sunset(date(2025, 7, 4)) == calculate_sunset(
+            date(2025, 7, 4), *JERUSALEM
+        )
+        # Outside the table the sunset is calculated on demand
+        assert table.get_sunset(date(2026, 7, 3)) == calculate_sunset(
+            date(2026, 7, 3), *JERUSALEM
+        )
+
+
+class TestAstronomicalShabbatTimes:
+    """UnifiedShabbatService with the astronomical source"""
+
+    def test_no_network_access(self):
+        service = UnifiedShabbatService(source="astronomical", api_cross_check=False)
+
+        with patch("requests.get") as mock_get:
+            result = service.get_shabbat_times(date(2025, 7, 4), use_cache=False)
+
+        mock_get.assert_not_called()
+        validate_shabbat_times(result)
+        assert result["calculation_method"] == "astronomical"
+        assert result["is_estimated"] is False
+        assert service.get_service_stats()["astronomical_calculations"] == 1
+
+    def test_shabbat_buffers_applied(self):
+        service = UnifiedShabbatService(source="astronomical", api_cross_check=False)
+        result = service.get_shabbat_times(date(2025, 7, 3), use_cache=False)
+
+        friday_sunset = datetime.fromisoformat(result["friday_sunset"])
+        saturday_sunset = datetime.fromisoformat(result["saturday_sunset"])
+        assert result["friday_date"] == "2025-07-04"
+        assert datetime.fromisoformat(result["shabbat_start"]) == (
+            friday_sunset - timedelta(minutes=18)
+        )
+        assert datetime.fromisoformat(result["shabbat_end"]) == (
+            saturday_sunset + timedelta(minutes=42)
+        )
+
+    def test_preloaded_table_gives_same_result(self):
+        service = UnifiedShabbatService(source="astronomical", api_cross_check=False)
+        expected = service.get_shabbat_times(date(2025, 7, 4), use_cache=False)
+
+        service.preload_sunset_table(2025, 2025)
+        with patch(
+            "integrations.services.unified_shabbat_service.calculate_sunset"
+        ) as mock_calculate:
+            result = service.get_shabbat_times(date(2025, 7, 4), use_cache=False)
+
+        mock_calculate.assert_not_called()
+        assert result == expected
+
+    def test_api_cross_check_logs_deviation(self):
+        service = UnifiedShabbatService(source="astronomical", api_cross_check=True)
+        api_response = Mock()
+        api_response.json.return_value = {
+            "status": "OK",
+            "results": {"sunset": "2025-07-04T17:00:00+00:00"},  # 20:00 local
+        }
+
+        with patch("requests.get", return_value=api_response) as mock_get:
+            result = service.get_shabbat_times(date(2025, 7, 4), use_cache=False)
+
+        assert mock_get.call_count == 1
+        assert result["calculation_method"] == "astronomical"
+        assert service.get_service_stats()["cross_check_deviations"] == 1
+
+    def test_api_cross_check_failure_is_ignored(self):
+        service = UnifiedShabbatService(source="astronomical", api_cross_check=True)
+
+        with patch("requests.get", side_effect=Exception("Network error")):
+            result = service.get_shabbat_times(date(2025, 7, 4), use_cache=False)
+
+        assert result["calculation_method"] == "astronomical"
+        assert service.get_service_stats()["cross_check_deviations"] == 0
@@ -199,7 +199,7 @@ class TestEdgeCases:
 
     def test_fallback_when_api_fails(self):
         """Test that service returns fallback times when API fails"""
-        service = UnifiedShabbatService()
+        service = UnifiedShabbatService(source="api")
 
         with patch("requests.get") as mock_get:
             # Simulate API failure
@@ -216,7 +216,7 @@ class TestEdgeCases:
 
     def test_fallback_times_are_seasonal(self):
         """Test that fallback times vary by season appropriately"""
-        service = UnifiedShabbatService()
+        service = UnifiedShabbatService(source="api")
 
         with patch("requests.get") as mock_get:
             mock_get.side_effect = Exception("API unavailable")
@@ -141,7 +141,7 @@ class TestUnifiedShabbatServiceNoDb:
         # Mock API failure
         mock_get.side_effect = Exception("Network error")
 
-        service = UnifiedShabbatService()
+        service = UnifiedShabbatService(source="api")
         result = service.get_shabbat_times(date(2024, 6, 15))
 
         # Should return valid ShabbatTimes even with API failure
@@ -164,7 +164,7 @@ class TestUnifiedShabbatServiceNoDb:
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
-        service = UnifiedShabbatService()
+        service = UnifiedShabbatService(source="api")
         result = service.get_shabbat_times(date(2024, 6, 14))
 
         # Should have made API calls
@@ -78,5 +78,10 @@ def health_check(request):
         }
         status["status"] = "unhealthy"
 
+    # Process-local calendar cache counters (monitoring only)
+    from integrations.services.calendar_cache import get_calendar_cache_stats
+
+    status["calendar_cache"] = get_calendar_cache_stats()
+
     http_status = 200 if status["status"] == "healthy" else 503
     return JsonResponse(status, status=http_status)
@@ -11,6 +11,8 @@ import dj_database_url  # pip install dj-database-url
 from decouple import config  # pip install python-decouple
 from pymongo import MongoClient
 
+from myhours.redis_settings import get_cache_config_with_fallback
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -89,6 +91,8 @@ if not TESTING:
     MIDDLEWARE.append("django.middleware.security.SecurityMiddleware")
 
 MIDDLEWARE += [
+    # SQL profiling and query budgets (inactive unless QUERY_PROFILER_ENABLED)
+    "core.query_budget.QueryBudgetMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -192,7 +196,11 @@ else:
         MONGO_CLIENT = None
         MONGO_DB = None
 
-# Redis/Cache configuration will be set up below
+# Cache: Redis (django-redis, REDIS_URL or Sentinel), shared by all web and
+# Celery processes - cache versions, bulk payroll jobs and checkpoints, task
+# idempotency and invalidation keys rely on that. LocMem only for tests or
+# with USE_LOCMEM_CACHE=true (single-process development).
+CACHES = get_cache_config_with_fallback()
 
 # Session settings
 # Use database sessions until Redis auth is fixed
@@ -350,6 +358,106 @@ FACE_ENCODING_MODEL = config(
     "FACE_ENCODING_MODEL", default="large"
 )  # Use large model for better accuracy
 MIN_FACE_SIZE = (40, 40)  # Minimum face size in pixels
+# Each process reloads its face embedding index in full after this many
+# seconds, even if no embeddings version change was seen
+FACE_EMBEDDING_INDEX_MAX_AGE = config(
+    "FACE_EMBEDDING_INDEX_MAX_AGE", default=300, cast=int
+)
+# Longest side incoming face images are decoded and processed at (JPEGs are
+# decoded at reduced scale instead of full size)
+FACE_IMAGE_MAX_DIMENSION = config("FACE_IMAGE_MAX_DIMENSION", default=1024, cast=int)
+# Face detection cascade: time budget per image (the first stage always
+# runs), optional comma-separated stage order (names from
+# biometrics.services.face_detection.DEFAULT_STAGES) and whether stages are
+# reordered by their measured cost per detected face
+FACE_DETECTION_BUDGET_MS = config("FACE_DETECTION_BUDGET_MS", default=1500, cast=int)
+FACE_DETECTION_STAGES = [
+    name.strip()
+    for name in config("FACE_DETECTION_STAGES", default="", cast=str).split(",")
+    if name.strip()
+]
+FACE_DETECTION_ADAPTIVE_ORDER = config(
+    "FACE_DETECTION_ADAPTIVE_ORDER", default=True, cast=bool
+)
+# Face processing pool: decoding, detection and encoding run in this many
+# worker processes per web process (0 = on the request thread). Up to
+# FACE_PROCESSING_QUEUE_SIZE more jobs wait for a worker; beyond that, or when
+# a job exceeds FACE_PROCESSING_TIMEOUT seconds, the request gets a 503 with
+# Retry-After: FACE_PROCESSING_RETRY_AFTER
+FACE_PROCESSING_WORKERS = config("FACE_PROCESSING_WORKERS", default=0, cast=int)
+FACE_PROCESSING_QUEUE_SIZE = config("FACE_PROCESSING_QUEUE_SIZE", default=4, cast=int)
+FACE_PROCESSING_TIMEOUT = config("FACE_PROCESSING_TIMEOUT", default=10.0, cast=float)
+FACE_PROCESSING_RETRY_AFTER = config("FACE_PROCESSING_RETRY_AFTER", default=2, cast=int)
+
+# Shabbat Times Settings
+# "astronomical" calculates sunsets locally; "api" uses sunrise-sunset.org
+SHABBAT_TIMES_SOURCE = config("SHABBAT_TIMES_SOURCE", default="astronomical")
+# Compare astronomical sunsets with the API and log deviations
+SHABBAT_TIMES_API_CROSS_CHECK = config(
+    "SHABBAT_TIMES_API_CROSS_CHECK", default=False, cast=bool
+)
+# Process-local (L1) cache for holidays and Shabbat times in front of Redis:
+# entry lifetime (0 disables), LRU bound, and how often each process checks
+# the cross-process invalidation version
+CALENDAR_L1_CACHE_TTL = config(
+    "CALENDAR_L1_CACHE_TTL", default=0 if TESTING else 300, cast=int
+)
+CALENDAR_L1_CACHE_MAX_ENTRIES = config(
+    "CALENDAR_L1_CACHE_MAX_ENTRIES", default=256, cast=int
+)
+CALENDAR_L1_VERSION_CHECK_SECONDS = config(
+    "CALENDAR_L1_VERSION_CHECK_SECONDS", default=5, cast=int
+)
+
+# Payroll Settings
+# Integer microseconds/agorot arithmetic in EnhancedPayrollStrategy
+PAYROLL_FIXED_POINT_ARITHMETIC = config(
+    "PAYROLL_FIXED_POINT_ARITHMETIC", default=False, cast=bool
+)
+# WorkLog changes queue payroll recalculation: "async" (Celery), "sync"
+# (on transaction commit) or "deferred" (until flushed, for tests)
+PAYROLL_RECALCULATION_MODE = config("PAYROLL_RECALCULATION_MODE", default="async")
+PAYROLL_RECALCULATION_DEBOUNCE_SECONDS = config(
+    "PAYROLL_RECALCULATION_DEBOUNCE_SECONDS", default=5, cast=int
+)
+# Distributed bulk payroll: employees per Celery shard, and whether each
+# shard also uses a local process pool. Shards run sequentially by default:
+# a prefork worker child cannot start processes, so scale with more shards
+# and worker concurrency instead of nested pools
+PAYROLL_BULK_SHARD_SIZE = config("PAYROLL_BULK_SHARD_SIZE", default=500, cast=int)
+PAYROLL_BULK_SHARD_PARALLEL = config(
+    "PAYROLL_BULK_SHARD_PARALLEL", default=False, cast=bool
+)
+# Employees per committed chunk in streaming bulk mode (bounds peak memory)
+PAYROLL_BULK_CHUNK_SIZE = config("PAYROLL_BULK_CHUNK_SIZE", default=500, cast=int)
+# Persist bulk payroll results with COPY + INSERT ... ON CONFLICT on PostgreSQL
+# (other databases always use the ORM bulk_create/bulk_update path)
+PAYROLL_BULK_USE_COPY = config("PAYROLL_BULK_USE_COPY", default=True, cast=bool)
+# zlib-compress large daily_results sections of cached bulk payroll results
+PAYROLL_BULK_CACHE_COMPRESS = config(
+    "PAYROLL_BULK_CACHE_COMPRESS", default=True, cast=bool
+)
+# Bulk API jobs (status and progress) are kept in the cache for this long
+PAYROLL_BULK_JOB_TTL_SECONDS = config(
+    "PAYROLL_BULK_JOB_TTL_SECONDS", default=86400, cast=int
+)
+# Rows fetched per server-side cursor round-trip by payroll exports
+PAYROLL_EXPORT_CHUNK_SIZE = config("PAYROLL_EXPORT_CHUNK_SIZE", default=2000, cast=int)
+# At most one payroll_list backfill job per month is started within this window
+PAYROLL_BACKFILL_LOCK_SECONDS = config(
+    "PAYROLL_BACKFILL_LOCK_SECONDS", default=600, cast=int
+)
+
+# SQL query profiling (core.query_budget): per-request and per-Celery-task
+# query counts, duplicate statements and DB time. Budgets are keyed by URL
+# name or task name; an int limits the query count, a dict may also limit
+# duplicate (N+1) statements. Violations are logged as warnings.
+QUERY_PROFILER_ENABLED = config("QUERY_PROFILER_ENABLED", default=False, cast=bool)
+QUERY_BUDGETS = {
+    "face-check-in": 6,
+    "face-check-out": 6,
+    "worklog-list": {"max_duplicates": 0},
+}
 
 # Feature Flags
 FEATURE_FLAGS = {
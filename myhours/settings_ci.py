@@ -106,6 +106,12 @@ if ENABLE_BIOMETRIC_MOCK and ("test" in sys.argv or GITHUB_ACTIONS):
 
     biometrics.services.mongodb_service.mongodb_service = _MockMongoService()
 
+# Payroll recalculation is queued in-process and flushed explicitly by tests
+PAYROLL_RECALCULATION_MODE = "deferred"
+
+# No process-local calendar caches: tests must see their own holiday fixtures
+CALENDAR_L1_CACHE_TTL = 0
+
 # Feature flags
 FEATURE_FLAGS = {
     "ENABLE_PROJECT_PAYROLL": True,
@@ -10,3 +10,13 @@ class PayrollConfig(AppConfig):
         from payroll.services.factory import register_default_strategies
 
         register_default_strategies()
+
+        # Start bulk payroll workers when a Celery worker starts
+        from payroll.services.bulk.parallel_executor import (
+            install_worker_pool_warm_up,
+        )
+
+        install_worker_pool_warm_up()
+
+        # Cache invalidation (generation bumps) on WorkLog/Salary/Holiday changes
+        import payroll.signals  # noqa: F401
@@ -0,0 +1,34 @@
+"""
+Repeatable payroll benchmarks on deterministic synthetic workloads.
+
+Run with:
+    python manage.py benchmark_payroll --employees 200
+"""
+
+from .runner import (
+    SCENARIOS,
+    ScenarioResult,
+    compare_to_baseline,
+    load_baseline,
+    run_benchmarks,
+    write_baseline,
+)
+from .workload import (
+    SyntheticWorkload,
+    WorkloadSpec,
+    generate_workload,
+    materialize_workload,
+)
+
+__all__ = [
+    "SCENARIOS",
+    "ScenarioResult",
+    "SyntheticWorkload",
+    "WorkloadSpec",
+    "compare_to_baseline",
+    "generate_workload",
+    "load_baseline",
+    "materialize_workload",
+    "run_benchmarks",
+    "write_baseline",
+]
@@ -0,0 +1,277 @@
+"""
+Payroll benchmark scenarios and baseline comparison.
+
+Each scenario times one layer of the payroll pipeline on a synthetic month
+(see workload.py) and counts the SQL queries it issues:
+
+- strategy_memory: EnhancedPayrollStrategy on preloaded contexts, no database
+- strategy_db: EnhancedPayrollStrategy loading its own data per employee
+- bulk_sequential / bulk_parallel: BulkEnhancedPayrollService.calculate_bulk
+  (no cache, no persistence) with sequential or parallel execution
+- persistence: BulkPersister.save_all of precalculated results
+
+Database scenarios run against the configured database (SQLite in
+development, PostgreSQL in production) inside a transaction that is rolled
+back, so they leave no rows behind.
+
+Results are reported per employee (ms and queries) and compared with a
+baseline JSON file written by a previous run on the same machine.
+"""
+
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from payroll.services.bulk import BulkEnhancedPayrollService
+from payroll.services.bulk.data_loader import BulkDataLoader
+from payroll.services.bulk.postgres_persister import get_bulk_persister
+from payroll.services.bulk.types import BulkLoadedData
+from payroll.services.enums import CalculationStrategy
+from payroll.services.strategies.enhanced import EnhancedPayrollStrategy
+
+from .workload import SyntheticWorkload, WorkloadSpec, materialize_workload
+
+SCENARIO_STRATEGY_MEMORY = "strategy_memory"
+SCENARIO_STRATEGY_DB = "strategy_db"
+SCENARIO_BULK_SEQUENTIAL = "bulk_sequential"
+SCENARIO_BULK_PARALLEL = "bulk_parallel"
+SCENARIO_PERSISTENCE = "persistence"
+
+SCENARIOS = (
+    SCENARIO_STRATEGY_MEMORY,
+    SCENARIO_STRATEGY_DB,
+    SCENARIO_BULK_SEQUENTIAL,
+    SCENARIO_BULK_PARALLEL,
+    SCENARIO_PERSISTENCE,
+)
+
+# Scenarios that need the workload written to the database
+DATABASE_SCENARIOS = SCENARIOS[1:]
+
+DEFAULT_BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# Time regressions below this many ms/employee are measurement noise
+MIN_TIME_DELTA_MS = 0.05
+
+
+@dataclass
+class ScenarioResult:
+    """Best-of-N timing and query count of one scenario"""
+
+    name: str
+    employees: int
+    seconds: float
+    queries: int
+
+    @property
+    def ms_per_employee(self) -> float:
+        return self.seconds * 1000 / self.employees if self.employees else 0.0
+
+    @property
+    def queries_per_employee(self) -> float:
+        return self.queries / self.employees if self.employees else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "employees": self.employees,
+            "seconds": round(self.seconds, 4),
+            "queries": self.queries,
+            "ms_per_employee": round(self.ms_per_employee, 3),
+            "queries_per_employee": round(self.queries_per_employee, 3),
+        }
+
+
+def _measure(fn: Callable[[], object], repeat: int) -> Tuple[float, int]:
+    """Fastest of `repeat` runs and the query count of the last one"""
+    best, queries = None, 0
+    for _ in range(max(repeat, 1)):
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        queries = len(captured)
+    return best, queries
+
+
+def _kernel_contexts(bulk_data: BulkLoadedData) -> Dict:
+    """Contexts exactly as BulkEnhancedPayrollService hands them to strategies"""
+    service = BulkEnhancedPayrollService(
+        use_cache=False, use_parallel=False, show_progress=False
+    )
+    contexts = service._build_contexts(
+        sorted(bulk_data.employees), bulk_data, bulk_data.year, bulk_data.month
+    )
+    service._attach_shift_segments(contexts, bulk_data)
+    return contexts
+
+
+def _calculate_all(contexts: Dict) -> Dict:
+    return {
+        employee_id: EnhancedPayrollStrategy(context).calculate()
+        for employee_id, context in contexts.items()
+    }
+
+
+def _run_bulk(employee_ids: List[int], spec: WorkloadSpec, use_parallel: bool):
+    service = BulkEnhancedPayrollService(
+        use_cache=False, use_parallel=use_parallel, show_progress=False
+    )
+    result = service.calculate_bulk(
+        employee_ids,
+        spec.year,
+        spec.month,
+        strategy=CalculationStrategy.ENHANCED,
+        save_to_db=False,
+    )
+    if result.failed_count:
+        raise RuntimeError(
+            f"Bulk benchmark run failed for {result.failed_count} employees"
+        )
+
+
+def _run_db_scenario(
+    name: str, employee_ids: List[int], spec: WorkloadSpec, repeat: int
+) -> Tuple[float, int]:
+    if name == SCENARIO_STRATEGY_DB:
+
+        def run():
+            for employee_id in employee_ids:
+                EnhancedPayrollStrategy(
+                    {
+                        "employee_id": employee_id,
+                        "year": spec.year,
+                        "month": spec.month,
+                        "user_id": 0,
+                    }
+                ).calculate()
+
+        return _measure(run, repeat)
+
+    if name in (SCENARIO_BULK_SEQUENTIAL, SCENARIO_BULK_PARALLEL):
+        use_parallel = name == SCENARIO_BULK_PARALLEL
+        return _measure(lambda: _run_bulk(employee_ids, spec, use_parallel), repeat)
+
+    if name == SCENARIO_PERSISTENCE:
+        bulk_data = BulkDataLoader().load_all_data(
+            employee_ids, spec.year, spec.month, include_shabbat_times=True
+        )
+        contexts = _kernel_contexts(bulk_data)
+        results = _calculate_all(contexts)
+        persister = get_bulk_persister()
+        return _measure(
+            lambda: persister.save_all(results, contexts, bulk_data), repeat
+        )
+
+    raise ValueError(f"Unknown benchmark scenario: {name}")
+
+
+def run_benchmarks(
+    workload: SyntheticWorkload,
+    scenarios: Optional[Iterable[str]] = None,
+    repeat: int = 3,
+) -> List[ScenarioResult]:
+    """
+    Run scenarios on a synthetic workload.
+
+    Args:
+        workload: Month from generate_workload()
+        scenarios: Scenario names (defaults to SCENARIOS), run in SCENARIOS order
+        repeat: Runs per scenario; the fastest is reported
+
+    Raises:
+        ValueError: Unknown scenario name
+    """
+    selected = set(scenarios or SCENARIOS)
+    unknown = selected - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"Unknown benchmark scenarios: {', '.join(sorted(unknown))}")
+
+    employees = len(workload.employee_ids)
+    results = []
+
+    if SCENARIO_STRATEGY_MEMORY in selected:
+        contexts = _kernel_contexts(workload.bulk_data)
+        seconds, queries = _measure(lambda: _calculate_all(contexts), repeat)
+        results.append(
+            ScenarioResult(SCENARIO_STRATEGY_MEMORY, employees, seconds, queries)
+        )
+
+    db_scenarios = [name for name in DATABASE_SCENARIOS if name in selected]
+    if db_scenarios:
+        with transaction.atomic():
+            employee_ids = materialize_workload(workload)
+            for name in db_scenarios:
+                seconds, queries = _run_db_scenario(
+                    name, employee_ids, workload.spec, repeat
+                )
+                results.append(ScenarioResult(name, employees, seconds, queries))
+            transaction.set_rollback(True)
+
+    return results
+
+
+def load_baseline(path: Path) -> Optional[Dict]:
+    """Baseline written by write_baseline(), None if there is none yet"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with path.open() as baseline_file:
+        return json.load(baseline_file)
+
+
+def write_baseline(
+    path: Path, spec: WorkloadSpec, results: List[ScenarioResult]
+) -> None:
+    baseline = {
+        "spec": asdict(spec),
+        "scenarios": {result.name: result.to_dict() for result in results},
+    }
+    with Path(path).open("w") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write("\n")
+
+
+def compare_to_baseline(
+    results: List[ScenarioResult], baseline: Dict, tolerance: float = 0.25
+) -> List[str]:
+    """
+    Regressions of results against a baseline.
+
+    Any increase in queries/employee is a regression; ms/employee may grow by
+    `tolerance` (a fraction) before it counts. Scenarios missing from the
+    baseline are not compared.
+
+    Returns:
+        List[str]: One message per regression, empty if there are none
+    """
+    regressions = []
+    for result in results:
+        reference = baseline.get("scenarios", {}).get(result.name)
+        if not reference:
+            continue
+
+        current = result.to_dict()
+        if current["queries_per_employee"] > reference["queries_per_employee"]:
+            regressions.append(
+                f"{result.name}: {current['queries_per_employee']} queries/employee "
+                f"(baseline {reference['queries_per_employee']})"
+            )
+
+        allowed = reference["ms_per_employee"] * (1 + tolerance)
+        if (
+            current["ms_per_employee"] > allowed
+            and current["ms_per_employee"] - reference["ms_per_employee"]
+            > MIN_TIME_DELTA_MS
+        ):
+            regressions.append(
+                f"{result.name}: {current['ms_per_employee']} ms/employee "
+                f"(baseline {reference['ms_per_employee']}, "
+                f"tolerance {tolerance:.0%})"
+            )
+    return regressions
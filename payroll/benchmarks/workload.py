@@ -0,0 +1,280 @@
+"""
+Deterministic synthetic payroll months for benchmarks.
+
+generate_workload() builds a month of shifts for hourly and monthly
+employees - day shifts (some with overtime), night shifts, evening shifts
+running past midnight, Sabbath shifts and holiday shifts - from a seeded
+random.Random, so the same WorkloadSpec always produces the same month.
+
+The month exists as a BulkLoadedData for in-memory runs of the strategy, and
+materialize_workload() writes it as Employee / Salary / WorkLog / Holiday
+rows for runs against the configured database.
+
+Example usage:
+    workload = generate_workload(WorkloadSpec(employees=200, seed=7))
+    employee_ids = materialize_workload(workload)
+"""
+
+import calendar
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Dict, List, Tuple
+
+from django.db import transaction
+
+from integrations.models import Holiday
+from payroll.models import Salary
+from payroll.services.bulk.types import (
+    BulkLoadedData,
+    EmployeeData,
+    HolidayData,
+    ShabbatTimesData,
+    WorkLogData,
+)
+from payroll.services.shabbat_windows import (
+    ISRAEL_TZ,
+    ShabbatWindowTable,
+    get_fridays_for_month,
+)
+from users.models import Employee
+from worktime.models import WorkLog
+
+SHIFT_DAY = "day"
+SHIFT_OVERTIME = "overtime"
+SHIFT_NIGHT = "night"
+SHIFT_OVERNIGHT = "overnight"
+SHIFT_SABBATH = "sabbath"
+SHIFT_HOLIDAY = "holiday"
+
+# Start time and length in hours of each shift kind
+SHIFT_HOURS = {
+    SHIFT_DAY: (time(9, 0), 8),
+    SHIFT_OVERTIME: (time(8, 0), 11),
+    SHIFT_NIGHT: (time(22, 0), 8),
+    SHIFT_OVERNIGHT: (time(16, 0), 10),
+    SHIFT_SABBATH: (time(9, 0), 8),
+    SHIFT_HOLIDAY: (time(9, 0), 8),
+}
+
+# Weekday shift mix (Sunday - Friday)
+WEEKDAY_SHIFT_WEIGHTS = (
+    (SHIFT_DAY, 60),
+    (SHIFT_OVERTIME, 15),
+    (SHIFT_NIGHT, 15),
+    (SHIFT_OVERNIGHT, 10),
+)
+
+HOURLY_RATES = ("45.00", "50.00", "60.00", "75.00")
+MONTHLY_SALARIES = ("8000.00", "10000.00", "12000.00", "15000.00")
+
+# Synthetic Shabbat: Friday 18:00 - Saturday 19:00 Israel time
+SHABBAT_START = time(18, 0)
+SHABBAT_END = time(19, 0)
+
+EMAIL_DOMAIN = "benchmark.invalid"
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    """Parameters of a synthetic month"""
+
+    employees: int = 100
+    year: int = 2025
+    month: int = 10
+    seed: int = 42
+    hourly_share: float = 0.5
+    absence_rate: float = 0.1
+    sabbath_rate: float = 0.3
+    holiday_rate: float = 0.5
+
+
+@dataclass
+class SyntheticWorkload:
+    """A generated month, keyed by synthetic employee ids 1..N"""
+
+    spec: WorkloadSpec
+    bulk_data: BulkLoadedData
+    shift_counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def employee_ids(self) -> List[int]:
+        return sorted(self.bulk_data.employees)
+
+    @property
+    def work_log_count(self) -> int:
+        return sum(len(logs) for logs in self.bulk_data.work_logs.values())
+
+
+def get_holiday_date(year: int, month: int) -> date:
+    """Synthetic holiday: the first Tuesday on or after the 15th"""
+    day = date(year, month, 15)
+    return day + timedelta(days=(1 - day.weekday()) % 7)
+
+
+def _shift(day: date, kind: str) -> Tuple[datetime, datetime]:
+    start_time, hours = SHIFT_HOURS[kind]
+    check_in = ISRAEL_TZ.localize(datetime.combine(day, start_time))
+    return check_in, check_in + timedelta(hours=hours)
+
+
+def _shabbat_times(year: int, month: int) -> Dict[date, ShabbatTimesData]:
+    return {
+        friday: ShabbatTimesData(
+            friday_date=friday,
+            shabbat_start=ISRAEL_TZ.localize(datetime.combine(friday, SHABBAT_START)),
+            shabbat_end=ISRAEL_TZ.localize(
+                datetime.combine(friday + timedelta(days=1), SHABBAT_END)
+            ),
+            source="synthetic",
+        )
+        for friday in get_fridays_for_month(year, month)
+    }
+
+
+def _month_shifts(
+    rng: random.Random, spec: WorkloadSpec, holiday: date
+) -> List[Tuple[str, date]]:
+    """Shift kinds and dates of one employee's month"""
+    kinds, weights = zip(*WEEKDAY_SHIFT_WEIGHTS)
+    shifts = []
+    for day_number in range(1, calendar.monthrange(spec.year, spec.month)[1] + 1):
+        day = date(spec.year, spec.month, day_number)
+        if day == holiday:
+            if rng.random() < spec.holiday_rate:
+                shifts.append((SHIFT_HOLIDAY, day))
+        elif day.weekday() == 5:  # Saturday
+            if rng.random() < spec.sabbath_rate:
+                shifts.append((SHIFT_SABBATH, day))
+        elif rng.random() >= spec.absence_rate:
+            shifts.append((rng.choices(kinds, weights)[0], day))
+    return shifts
+
+
+def generate_workload(spec: WorkloadSpec) -> SyntheticWorkload:
+    """
+    Generate a synthetic month.
+
+    Shifts never overlap: the longest shift (overnight, 16:00-02:00) ends
+    before the earliest start of the next day (08:00).
+    """
+    rng = random.Random(spec.seed)
+    holiday = get_holiday_date(spec.year, spec.month)
+    shabbat_times = _shabbat_times(spec.year, spec.month)
+
+    employees: Dict[int, EmployeeData] = {}
+    work_logs: Dict[int, List[WorkLogData]] = {}
+    shift_counts: Counter = Counter()
+    worklog_id = 0
+
+    for employee_id in range(1, spec.employees + 1):
+        is_hourly = rng.random() < spec.hourly_share
+        employees[employee_id] = EmployeeData(
+            employee_id=employee_id,
+            user_id=0,
+            first_name=f"Bench{employee_id}",
+            last_name="Employee",
+            salary_id=employee_id,
+            calculation_type="hourly" if is_hourly else "monthly",
+            hourly_rate=Decimal(rng.choice(HOURLY_RATES)) if is_hourly else None,
+            base_salary=None if is_hourly else Decimal(rng.choice(MONTHLY_SALARIES)),
+        )
+
+        logs = []
+        for kind, day in _month_shifts(rng, spec, holiday):
+            worklog_id += 1
+            check_in, check_out = _shift(day, kind)
+            logs.append(
+                WorkLogData(
+                    worklog_id=worklog_id,
+                    employee_id=employee_id,
+                    check_in=check_in,
+                    check_out=check_out,
+                    work_date=day,
+                )
+            )
+            shift_counts[kind] += 1
+        work_logs[employee_id] = logs
+
+    bulk_data = BulkLoadedData(
+        employees=employees,
+        work_logs=work_logs,
+        holidays={
+            holiday: HolidayData(
+                date=holiday, name="Benchmark Holiday", source="synthetic"
+            )
+        },
+        shabbat_times=shabbat_times,
+        year=spec.year,
+        month=spec.month,
+        shabbat_windows=ShabbatWindowTable.from_shabbat_times(shabbat_times),
+    )
+    return SyntheticWorkload(
+        spec=spec, bulk_data=bulk_data, shift_counts=dict(shift_counts)
+    )
+
+
+@transaction.atomic
+def materialize_workload(workload: SyntheticWorkload) -> List[int]:
+    """
+    Write the workload to the database.
+
+    Rows are inserted with bulk_create (WorkLog validation is skipped - the
+    generator never produces overlapping or over-long shifts). Call inside a
+    transaction that is rolled back to leave the database untouched.
+
+    Returns:
+        List[int]: Database ids of the employees, in synthetic id order
+    """
+    spec = workload.spec
+    data = workload.bulk_data
+    token = f"{spec.seed}-{spec.year}{spec.month:02d}"
+
+    employees = Employee.objects.bulk_create(
+        [
+            Employee(
+                first_name=employee.first_name,
+                last_name=employee.last_name,
+                email=f"bench-{token}-{employee_id}@{EMAIL_DOMAIN}",
+                role="employee",
+            )
+            for employee_id, employee in sorted(data.employees.items())
+        ]
+    )
+    db_ids = {
+        employee_id: employee.id
+        for employee_id, employee in zip(sorted(data.employees), employees)
+    }
+
+    Salary.objects.bulk_create(
+        [
+            Salary(
+                employee_id=db_ids[employee_id],
+                calculation_type=employee.calculation_type,
+                hourly_rate=employee.hourly_rate,
+                base_salary=employee.base_salary,
+                is_active=True,
+            )
+            for employee_id, employee in data.employees.items()
+        ]
+    )
+    WorkLog.objects.bulk_create(
+        [
+            WorkLog(
+                employee_id=db_ids[log.employee_id],
+                check_in=log.check_in,
+                check_out=log.check_out,
+            )
+            for logs in data.work_logs.values()
+            for log in logs
+        ],
+        batch_size=1000,
+    )
+    for holiday in data.holidays.values():
+        Holiday.objects.update_or_create(
+            date=holiday.date, defaults={"name": holiday.name, "is_holiday": True}
+        )
+
+    return [db_ids[employee_id] for employee_id in workload.employee_ids]
@@ -13,9 +13,12 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from django.urls import reverse
+
 from users.models import Employee
 from users.permissions import IsEmployeeOrAbove
 
+from .services.bulk.jobs import BulkPayrollJobStore, format_employee_result
 from .services.enums import CalculationStrategy
 from .services.payroll_service import get_payroll_service
 
@@ -45,6 +48,11 @@ def bulk_calculate_payroll_optimized(request):
 
     **Performance**: 10-15x faster than sequential calculation for large batches
 
+    By default the calculation runs as a background job: the endpoint returns
+    202 with a job_id immediately and progress is polled via
+    bulk_calculation_status?job_id=<job_id>. Pass "wait": true to calculate
+    within the request (small batches only).
+
     **Request Body:**
     ```json
     {
@@ -54,11 +62,21 @@ def bulk_calculate_payroll_optimized(request):
         "strategy": "enhanced",  // Optional: "enhanced" or "critical_points"
         "use_parallel": true,    // Optional, default: true
         "use_cache": true,       // Optional, default: true
-        "save_to_db": true       // Optional, default: true
+        "save_to_db": true,      // Optional, default: true
+        "wait": false            // Optional, default: false
     }
     ```
 
-    **Response:**
+    **Response (202, background job):**
+    ```json
+    {
+        "status": "accepted",
+        "job_id": "3f2b...",
+        "status_url": "/api/v1/payroll/bulk/status/?job_id=3f2b..."
+    }
+    ```
+
+    **Response (200, "wait": true):**
     ```json
     {
         "status": "success",
@@ -186,6 +204,7 @@ def bulk_calculate_payroll_optimized(request):
         use_parallel = data.get("use_parallel", True)
         use_cache = data.get("use_cache", True)
         save_to_db = data.get("save_to_db", True)
+        wait = data.get("wait", False)
 
         logger.info(
             "Bulk payroll calculation requested",
@@ -197,10 +216,23 @@ def bulk_calculate_payroll_optimized(request):
                 "strategy": strategy.value,
                 "use_parallel": use_parallel,
                 "use_cache": use_cache,
+                "wait": wait,
                 "action": "bulk_calc_api_request",
             },
         )
 
+        if not wait:
+            return _start_bulk_job(
+                request,
+                employee_ids=employee_ids,
+                year=year,
+                month=month,
+                strategy=strategy,
+                use_parallel=use_parallel,
+                use_cache=use_cache,
+                save_to_db=save_to_db,
+            )
+
         # Execute bulk calculation
         payroll_service = get_payroll_service()
 
@@ -239,16 +271,7 @@ def bulk_calculate_payroll_optimized(request):
                 "strategy": strategy.value,
             },
             "results": {
-                str(emp_id): {
-                    "total_salary": float(result["total_salary"]),
-                    "total_hours": float(result["total_hours"]),
-                    "regular_hours": float(result["regular_hours"]),
-                    "overtime_hours": float(result["overtime_hours"]),
-                    "holiday_hours": float(result["holiday_hours"]),
-                    "sabbath_hours": float(result["shabbat_hours"]),
-                    "worked_days": result.get("worked_days", 0),
-                    "status": result.get("metadata", {}).get("status", "calculated"),
-                }
+                str(emp_id): format_employee_result(result)
                 for emp_id, result in results.items()
             },
         }
@@ -302,6 +325,68 @@ def bulk_calculate_payroll_optimized(request):
         )
 
 
+def _start_bulk_job(request, employee_ids, year, month, strategy, **options):
+    """Create a bulk payroll job and queue it for a Celery worker"""
+    from .tasks import run_bulk_payroll_job
+
+    store = BulkPayrollJobStore()
+    try:
+        job = store.create_job(
+            request.user.id, employee_ids, year, month, strategy.value, **options
+        )
+    except Exception as e:
+        logger.exception(
+            "Could not store bulk payroll job",
+            extra={
+                "user_id": request.user.id,
+                "error": str(e),
+                "action": "bulk_job_store_error",
+            },
+        )
+        return Response(
+            {
+                "status": "error",
+                "error": "Job storage is unavailable",
+                "message": 'Retry later or pass "wait": true for small batches',
+            },
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    job_id = job["job_id"]
+
+    try:
+        run_bulk_payroll_job.apply_async(args=[job_id])
+    except Exception as e:
+        logger.exception(
+            "Could not queue bulk payroll job",
+            extra={
+                "user_id": request.user.id,
+                "job_id": job_id,
+                "error": str(e),
+                "action": "bulk_job_queue_error",
+            },
+        )
+        store.mark_failed(job_id, f"Could not queue job: {e}")
+        return Response(
+            {
+                "status": "error",
+                "job_id": job_id,
+                "error": "Background workers are unavailable",
+                "message": 'Retry later or pass "wait": true for small batches',
+            },
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+    return Response(
+        {
+            "status": "accepted",
+            "job_id": job_id,
+            "status_url": f"{reverse('bulk-calculation-status')}?job_id={job_id}",
+            "total_employees": len(employee_ids),
+        },
+        status=status.HTTP_202_ACCEPTED,
+    )
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def bulk_calculation_status(request):
@@ -311,6 +396,10 @@ def bulk_calculation_status(request):
     Returns information about the bulk calculation service configuration
     and recent statistics.
 
+    With ``?job_id=<job_id>`` returns the background job instead: its status,
+    live progress (completed, calculations_per_second, estimated_time_remaining,
+    cache hits) while running, and the final summary once completed.
+
     **Response:**
     ```json
     {
@@ -338,6 +427,16 @@ def bulk_calculation_status(request):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
+        job_id = request.query_params.get("job_id")
+        if job_id:
+            job = BulkPayrollJobStore().get_job(job_id)
+            if job is None:
+                return Response(
+                    {"error": f"Bulk payroll job not found: {job_id}"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            return Response(job, status=status.HTTP_200_OK)
+
         payroll_service = get_payroll_service()
 
         # Get service statistics if available
@@ -1,7 +1,9 @@
 """
 Enhanced Redis Cache Service with Shabbat Times Integration
 
-Combines holiday data with precise Shabbat times from sunrise-sunset API
+Combines holiday data with precise Shabbat times from sunrise-sunset API.
+Calendar lookups go through a process-local L1 cache first
+(integrations/services/calendar_cache.py).
 """
 
 import json
@@ -9,10 +11,12 @@ import logging
 from datetime import date, timedelta
 from typing import Any, Dict, List, Optional
 
+from integrations.services.calendar_cache import LocalCalendarCache
 from integrations.services.unified_shabbat_service import (
     get_shabbat_times,
 )
 from payroll.redis_cache_service import PayrollRedisCache
+from payroll.services.cache_versions import get_holiday_version
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,14 @@ class EnhancedPayrollCache(PayrollRedisCache):
     Enhanced version that includes precise Shabbat times from API
     """
 
+    # Holidays built by EnhancedPayrollStrategy (Redis, 1 week)
+    STRATEGY_HOLIDAYS_TIMEOUT = 7 * 24 * 60 * 60
+
+    def __init__(self):
+        super().__init__()
+        self._holidays_l1 = LocalCalendarCache("enhanced_holidays")
+        self._strategy_holidays_l1 = LocalCalendarCache("strategy_holidays")
+
     def get_holidays_with_shabbat_times(self, year: int, month: int) -> Dict[str, Dict]:
         """
         Get holidays with enhanced Shabbat timing data
@@ -29,7 +41,22 @@ class EnhancedPayrollCache(PayrollRedisCache):
         Combines:
         1. Holiday data from Redis/DB
         2. Precise Shabbat times from sunrise-sunset API
+
+        Served from the process-local L1 cache when possible.
         """
+        holidays_dict = self._holidays_l1.get((year, month))
+        if holidays_dict is not None:
+            return holidays_dict
+
+        holidays_dict = self._build_holidays_with_shabbat_times(year, month)
+        if holidays_dict:
+            self._holidays_l1.set((year, month), holidays_dict)
+        return holidays_dict
+
+    def _build_holidays_with_shabbat_times(
+        self, year: int, month: int
+    ) -> Dict[str, Dict]:
+        """Holidays of the month enhanced with precise Shabbat times"""
         try:
             # Get basic holiday data
             holidays_dict = self.get_holidays_for_month(year, month)
@@ -85,6 +112,59 @@ class EnhancedPayrollCache(PayrollRedisCache):
 
         return holidays_dict
 
+    def _strategy_holidays_key(self, year: int, month: int) -> str:
+        return self._make_key(
+            "strategy_holidays", year, month, get_holiday_version(year, month)
+        )
+
+    def get_holidays(self, year: int, month: int) -> Optional[Dict[date, Dict]]:
+        """
+        Holidays cached by EnhancedPayrollStrategy (L1, then Redis).
+
+        Returns:
+            Dict keyed by date, or None on a miss
+        """
+        holidays = self._strategy_holidays_l1.get((year, month))
+        if holidays is not None or not self.cache_available:
+            return holidays
+
+        cache_key = self._strategy_holidays_key(year, month)
+        try:
+            cached_data = self.redis_client.get(cache_key)
+            if not cached_data:
+                return None
+            holidays = {
+                date.fromisoformat(date_str): holiday_data
+                for date_str, holiday_data in json.loads(cached_data).items()
+            }
+        except Exception as e:
+            logger.warning(f"Redis get error for strategy holidays: {e}")
+            return None
+
+        self._strategy_holidays_l1.set((year, month), holidays)
+        return holidays
+
+    def set_holidays(self, year: int, month: int, holidays: Dict[date, Dict]):
+        """Cache holidays built by EnhancedPayrollStrategy"""
+        self._strategy_holidays_l1.set((year, month), holidays)
+        if not self.cache_available:
+            return
+
+        try:
+            self.redis_client.setex(
+                self._strategy_holidays_key(year, month),
+                self.STRATEGY_HOLIDAYS_TIMEOUT,
+                json.dumps(
+                    {
+                        holiday_date.isoformat(): holiday_data
+                        for holiday_date, holiday_data in holidays.items()
+                    },
+                    default=self._serialize_decimal,
+                ),
+            )
+        except Exception as e:
+            logger.warning(f"Redis set error for strategy holidays: {e}")
+
     def cache_shabbat_times_for_month(self, year: int, month: int):
         """
         Pre-cache all Shabbat times for the month using bulk API calls
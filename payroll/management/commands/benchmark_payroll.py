@@ -0,0 +1,150 @@
+"""
+Django management command for payroll benchmarks.
+
+Usage:
+    # Run all scenarios on 100 synthetic employees and compare with the
+    # stored baseline
+    python manage.py benchmark_payroll
+
+    # Record a new baseline (numbers are machine-specific)
+    python manage.py benchmark_payroll --employees 200 --write-baseline
+
+    # Only the in-memory strategy kernel, 10% time tolerance
+    python manage.py benchmark_payroll --scenarios strategy_memory --tolerance 0.1
+"""
+
+import json
+from dataclasses import asdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from payroll.benchmarks import (
+    SCENARIOS,
+    WorkloadSpec,
+    compare_to_baseline,
+    generate_workload,
+    load_baseline,
+    run_benchmarks,
+    write_baseline,
+)
+from payroll.benchmarks.runner import DEFAULT_BASELINE_PATH
+
+
+class Command(BaseCommand):
+    help = "Benchmark payroll strategies, bulk calculation and persistence"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--employees",
+            type=int,
+            default=100,
+            help="Synthetic employees (default: 100)",
+        )
+        parser.add_argument("--year", type=int, default=2025)
+        parser.add_argument("--month", type=int, default=10)
+        parser.add_argument(
+            "--seed", type=int, default=42, help="Workload seed (default: 42)"
+        )
+        parser.add_argument(
+            "--scenarios",
+            type=str,
+            help=f"Comma-separated scenarios (default: {','.join(SCENARIOS)})",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per scenario, the fastest is reported (default: 3)",
+        )
+        parser.add_argument(
+            "--baseline",
+            type=str,
+            default=str(DEFAULT_BASELINE_PATH),
+            help="Baseline JSON file",
+        )
+        parser.add_argument(
+            "--write-baseline",
+            action="store_true",
+            help="Store the results as the new baseline instead of comparing",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.25,
+            help="Allowed ms/employee growth over the baseline (default: 0.25)",
+        )
+        parser.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    def handle(self, *args, **options):
+        spec = WorkloadSpec(
+            employees=options["employees"],
+            year=options["year"],
+            month=options["month"],
+            seed=options["seed"],
+        )
+        scenarios = (
+            [name.strip() for name in options["scenarios"].split(",")]
+            if options["scenarios"]
+            else None
+        )
+
+        workload = generate_workload(spec)
+        shifts = ", ".join(
+            f"{kind}={count}" for kind, count in sorted(workload.shift_counts.items())
+        )
+        self.stdout.write(
+            f"Workload: {spec.employees} employees, "
+            f"{workload.work_log_count} shifts ({shifts})"
+        )
+
+        try:
+            results = run_benchmarks(workload, scenarios, repeat=options["repeat"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if options["json"]:
+            self.stdout.write(
+                json.dumps(
+                    {result.name: result.to_dict() for result in results}, indent=2
+                )
+            )
+        else:
+            self.stdout.write(
+                f"{'scenario':<18}{'ms/employee':>14}{'queries/employee':>20}"
+            )
+            for result in results:
+                self.stdout.write(
+                    f"{result.name:<18}{result.ms_per_employee:>14.3f}"
+                    f"{result.queries_per_employee:>20.2f}"
+                )
+
+        if options["write_baseline"]:
+            write_baseline(options["baseline"], spec, results)
+            self.stdout.write(
+                self.style.SUCCESS(f"Baseline written to {options['baseline']}")
+            )
+            return
+
+        baseline = load_baseline(options["baseline"])
+        if baseline is None:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"No baseline at {options['baseline']}; "
+                    "record one with --write-baseline"
+                )
+            )
+            return
+
+        if baseline.get("spec") != asdict(spec):
+            raise CommandError(
+                "Baseline was recorded for a different workload "
+                f"({baseline.get('spec')}); rerun with the same parameters or "
+                "--write-baseline"
+            )
+
+        regressions = compare_to_baseline(results, baseline, options["tolerance"])
+        if regressions:
+            raise CommandError(
+                "Payroll benchmark regressions:\n  " + "\n  ".join(regressions)
+            )
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline"))
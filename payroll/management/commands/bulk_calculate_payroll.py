@@ -19,6 +19,13 @@ Usage:
 
     # Export statistics
     python manage.py bulk_calculate_payroll --year 2025 --month 10 --export-stats /tmp/stats.json
+
+    # Shard across Celery worker nodes
+    python manage.py bulk_calculate_payroll --year 2025 --month 10 --distributed --shard-size 500
+
+    # Stream in committed chunks (bounded memory); rerun with the same
+    # --run-id to resume after a crash
+    python manage.py bulk_calculate_payroll --year 2025 --month 10 --stream --run-id oct-2025
 """
 
 import logging
@@ -28,6 +35,7 @@ from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 
 from payroll.services.bulk import BulkEnhancedPayrollService
+from payroll.services.bulk.types import ProcessingStatus
 from payroll.services.enums import CalculationStrategy
 from users.models import Employee
 
@@ -103,6 +111,36 @@ class Command(BaseCommand):
             "--export-stats", type=str, help="Path to export statistics JSON file"
         )
 
+        parser.add_argument(
+            "--distributed",
+            action="store_true",
+            help="Shard employees across Celery workers and persist once",
+        )
+
+        parser.add_argument(
+            "--shard-size",
+            type=int,
+            help="Employees per shard in distributed mode (default: PAYROLL_BULK_SHARD_SIZE)",
+        )
+
+        parser.add_argument(
+            "--stream",
+            action="store_true",
+            help="Calculate and persist in committed chunks with bounded memory",
+        )
+
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="Employees per chunk in streaming mode (default: PAYROLL_BULK_CHUNK_SIZE)",
+        )
+
+        parser.add_argument(
+            "--run-id",
+            type=str,
+            help="Checkpoint ID of a streaming run; reuse it to resume an interrupted run",
+        )
+
         parser.add_argument(
             "--invalidate-cache",
             action="store_true",
@@ -178,14 +216,36 @@ class Command(BaseCommand):
 
         self.stdout.write("")
 
+        if options["distributed"]:
+            self._handle_distributed(employee_ids, year, month, strategy, options)
+            return
+
         # Create service
-        service = BulkEnhancedPayrollService(
-            use_cache=not options["no_cache"],
-            use_parallel=not options["no_parallel"],
-            max_workers=options["max_workers"],
-            batch_size=options["batch_size"],
-            show_progress=not options["no_progress"],
-        )
+        service_options = {
+            "use_cache": not options["no_cache"],
+            "use_parallel": not options["no_parallel"],
+            "max_workers": options["max_workers"],
+            "batch_size": options["batch_size"],
+            "show_progress": not options["no_progress"],
+        }
+        calculate_options = {}
+        if options["stream"]:
+            from payroll.services.bulk.streaming import StreamingBulkPayrollService
+
+            service = StreamingBulkPayrollService(
+                chunk_size=options["chunk_size"], **service_options
+            )
+            calculate_options["run_id"] = options["run_id"]
+            self.stdout.write(f"Streaming: chunks of {service.chunk_size} employees")
+            if options["run_id"]:
+                self.stdout.write(f'Run ID: {options["run_id"]}')
+        else:
+            service = BulkEnhancedPayrollService(**service_options)
+
+        # Start the worker pool before loading data, not during the first chunk
+        warmed_workers = service.warm_up_workers()
+        if warmed_workers:
+            self.stdout.write(f"Warmed up {warmed_workers} workers")
 
         # Invalidate cache if requested
         if options["invalidate_cache"] and not options["no_cache"]:
@@ -203,6 +263,7 @@ class Command(BaseCommand):
                 strategy=strategy,
                 save_to_db=not options["dry_run"],
                 export_stats_path=export_stats_path,
+                **calculate_options,
             )
 
             # Display results
@@ -217,6 +278,14 @@ class Command(BaseCommand):
             self.stdout.write(f"Total employees: {summary.total_employees}")
             self.stdout.write(self.style.SUCCESS(f"Successful: {summary.successful}"))
 
+            if options["stream"] and result.status == ProcessingStatus.FAILED:
+                self.stdout.write(
+                    self.style.ERROR(
+                        "Run interrupted; committed chunks are kept. "
+                        "Rerun with the same --run-id to resume."
+                    )
+                )
+
             if summary.failed > 0:
                 self.stdout.write(self.style.ERROR(f"Failed: {summary.failed}"))
 
@@ -272,3 +341,43 @@ class Command(BaseCommand):
 
         except Exception as e:
             raise CommandError(f"Bulk calculation failed: {e}")
+
+    def _handle_distributed(self, employee_ids, year, month, strategy, options):
+        """Run the calculation sharded across Celery workers"""
+        from payroll.services.bulk.distributed import DistributedBulkPayrollService
+
+        service = DistributedBulkPayrollService(shard_size=options["shard_size"])
+        self.stdout.write(f"Distributed: shards of {service.shard_size} employees")
+
+        try:
+            summary = service.calculate_bulk(
+                employee_ids=employee_ids,
+                year=year,
+                month=month,
+                strategy=strategy,
+                save_to_db=not options["dry_run"],
+            )
+        except Exception as e:
+            logger.exception("Distributed bulk calculation failed")
+            raise CommandError(f"Distributed calculation failed: {e}")
+
+        if summary.get("duplicate"):
+            # A redelivered callback of a finalized run returns its completion
+            # marker once the original summary expired from the result backend
+            self.stdout.write(
+                self.style.WARNING(
+                    "Run was already finalized at "
+                    f'{summary.get("completed_at")}; its summary is no longer '
+                    "available and results were not saved again"
+                )
+            )
+            return
+
+        self.stdout.write(self.style.SUCCESS("Calculation Complete"))
+        self.stdout.write(f'Total employees: {summary["total_employees"]}')
+        self.stdout.write(self.style.SUCCESS(f'Successful: {summary["successful"]}'))
+        if summary["failed"]:
+            self.stdout.write(self.style.ERROR(f'Failed: {summary["failed"]}'))
+        self.stdout.write(f'Shards: {summary.get("shard_count", 0)}')
+        self.stdout.write(f'Saved records: {summary.get("saved_records", 0)}')
+        self.stdout.write(f'Duration: {summary["duration_seconds"]:.2f}s')
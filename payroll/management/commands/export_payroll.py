@@ -0,0 +1,76 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from payroll.services.export import (
+    COLUMNS,
+    CONTENT_TYPES,
+    DATASET_SUMMARIES,
+    FORMAT_CSV,
+    encode_rows,
+    iter_rows,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream a month of payroll summaries or daily calculations "
+        "as CSV or NDJSON in constant memory"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", type=int, required=True, help="Year, e.g. 2025")
+        parser.add_argument(
+            "--month", type=int, required=True, help="Month number (1-12)"
+        )
+        parser.add_argument(
+            "--dataset",
+            choices=list(COLUMNS),
+            default=DATASET_SUMMARIES,
+            help="MonthlyPayrollSummary (summaries) or DailyPayrollCalculation (daily)",
+        )
+        parser.add_argument(
+            "--format",
+            dest="output_format",
+            choices=list(CONTENT_TYPES),
+            default=FORMAT_CSV,
+        )
+        parser.add_argument("--employee-id", type=int, help="Only this employee")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="Rows per cursor fetch (default: PAYROLL_EXPORT_CHUNK_SIZE)",
+        )
+        parser.add_argument(
+            "--output", "-o", help="Output file (default: standard output)"
+        )
+
+    def handle(self, *args, **options):
+        if not 1 <= options["month"] <= 12:
+            raise CommandError("--month must be between 1 and 12")
+
+        rows = iter_rows(
+            options["dataset"],
+            options["year"],
+            options["month"],
+            employee_id=options.get("employee_id"),
+            chunk_size=options.get("chunk_size"),
+        )
+        lines = encode_rows(rows, options["dataset"], options["output_format"])
+
+        if not options.get("output"):
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        count = 0
+        with open(options["output"], "w", encoding="utf-8", newline="") as output:
+            for line in lines:
+                output.write(line)
+                count += 1
+        if options["output_format"] == FORMAT_CSV:
+            count -= 1  # Header line
+
+        self.stderr.write(
+            self.style.SUCCESS(
+                f"Exported {count} {options['dataset']} rows to {options['output']}"
+            )
+        )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from payroll.services.analytics_rollup import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild payroll analytics rollups from monthly payroll summaries"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--year", type=int, help="Only rebuild this year (default: all years)"
+        )
+
+    def handle(self, *args, **options):
+        year = options.get("year")
+        self.stdout.write(
+            f"Rebuilding payroll rollups for {year if year else 'all years'}..."
+        )
+
+        rows = rebuild_rollups(year)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} payroll rollup rows"))
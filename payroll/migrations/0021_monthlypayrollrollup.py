@@ -0,0 +1,79 @@
+# Generated manually
+# Adds MonthlyPayrollRollup - incrementally maintained analytics totals,
+# filled from the existing monthly summaries
+
+from decimal import Decimal
+
+import django.core.validators
+from django.db import migrations, models
+
+
+def build_rollups(apps, schema_editor):
+    """Compute the rollups of all existing MonthlyPayrollSummary rows"""
+    from payroll.services.analytics_rollup import rebuild_rollups
+
+    rebuild_rollups()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payroll", "0020_add_database_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyPayrollRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("year", models.IntegerField()),
+                (
+                    "month",
+                    models.IntegerField(
+                        validators=[
+                            django.core.validators.MinValueValidator(1),
+                            django.core.validators.MaxValueValidator(12),
+                        ]
+                    ),
+                ),
+                (
+                    "role",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="Empty for all roles",
+                        max_length=20,
+                    ),
+                ),
+                ("employee_count", models.IntegerField(default=0)),
+                (
+                    "total_gross_pay_sum",
+                    models.DecimalField(
+                        decimal_places=2, default=Decimal("0"), max_digits=16
+                    ),
+                ),
+                (
+                    "total_hours_sum",
+                    models.DecimalField(
+                        decimal_places=2, default=Decimal("0"), max_digits=12
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Monthly Payroll Rollup",
+                "verbose_name_plural": "Monthly Payroll Rollups",
+                "ordering": ["year", "month", "role"],
+                "unique_together": {("year", "month", "role")},
+            },
+        ),
+        migrations.RunPython(build_rollups, migrations.RunPython.noop),
+    ]
@@ -667,3 +667,57 @@ class MonthlyPayrollSummary(models.Model):
     def period_display(self):
         """Return formatted period display"""
         return f"{calendar.month_name[self.month]} {self.year}"
+
+
+class MonthlyPayrollRollup(models.Model):
+    """
+    Per-month totals of MonthlyPayrollSummary for analytics.
+
+    Maintained incrementally by payroll/services/analytics_rollup.py whenever
+    summaries are written; rebuild with `manage.py rebuild_payroll_rollups`.
+    One row per month for all employees (role "") and one per employee role.
+    """
+
+    ALL_ROLES = ""
+
+    year = models.IntegerField()
+    month = models.IntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(12)]
+    )
+    role = models.CharField(
+        max_length=20, blank=True, default=ALL_ROLES, help_text="Empty for all roles"
+    )
+
+    employee_count = models.IntegerField(default=0)
+    total_gross_pay_sum = models.DecimalField(
+        max_digits=16, decimal_places=2, default=Decimal("0")
+    )
+    total_hours_sum = models.DecimalField(
+        max_digits=12, decimal_places=2, default=Decimal("0")
+    )
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Monthly Payroll Rollup"
+        verbose_name_plural = "Monthly Payroll Rollups"
+        unique_together = ["year", "month", "role"]
+        ordering = ["year", "month", "role"]
+
+    def __str__(self):
+        role = self.role or "all roles"
+        return f"{self.year}/{self.month:02d} {role} - {self.employee_count} employees"
+
+    @property
+    def avg_gross_pay(self):
+        if not self.employee_count:
+            return Decimal("0")
+        return (self.total_gross_pay_sum / self.employee_count).quantize(
+            Decimal("0.01")
+        )
+
+    @property
+    def avg_hours(self):
+        if not self.employee_count:
+            return Decimal("0")
+        return (self.total_hours_sum / self.employee_count).quantize(Decimal("0.01"))
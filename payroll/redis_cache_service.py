@@ -6,6 +6,12 @@ Provides caching for:
 2. Daily payroll calculations
 3. Monthly payroll summaries
 4. Bulk holiday lookups to eliminate N+1 queries
+
+Keys carry the generation of their inputs (payroll/services/cache_versions.py),
+so WorkLog, Salary and Holiday changes invalidate them without deleting keys.
+Writers pass the version read before loading the inputs they cache: a version
+read at write time could label values computed from superseded inputs with
+the generation of their replacement.
 """
 
 import json
@@ -28,6 +34,12 @@ from integrations.models import Holiday
 from integrations.services.unified_shabbat_service import (
     get_shabbat_times,
 )
+from payroll.services.cache_versions import (
+    bump_employee_month,
+    bump_holiday_month,
+    get_holiday_version,
+    get_monthly_version,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +104,18 @@ class PayrollRedisCache:
         key_parts = [prefix] + [str(arg) for arg in args]
         return ":".join(key_parts)
 
+    def _make_daily_key(
+        self, employee_id: int, work_date: date, version: Optional[str] = None
+    ) -> str:
+        """Versioned key of a daily calculation (default: current version)"""
+        return self._make_key(
+            "daily_calc",
+            employee_id,
+            work_date.isoformat(),
+            version
+            or get_monthly_version(employee_id, work_date.year, work_date.month),
+        )
+
     def _serialize_decimal(self, obj):
         """Custom JSON serializer for Decimal objects"""
         if isinstance(obj, Decimal):
@@ -110,7 +134,8 @@ class PayrollRedisCache:
         if not self.cache_available:
             return self._get_holidays_from_db(year, month)
 
-        cache_key = self._make_key("holidays", year, month)
+        version = get_holiday_version(year, month)
+        cache_key = self._make_key("holidays", year, month, version)
 
         try:
             cached_data = self.redis_client.get(cache_key)
@@ -125,7 +150,7 @@ class PayrollRedisCache:
 
         # Cache miss - get from database and cache
         holidays_dict = self._get_holidays_from_db(year, month)
-        self.cache_holidays_for_month(year, month, holidays_dict)
+        self.cache_holidays_for_month(year, month, holidays_dict, version=version)
 
         logger.debug(f"📋 Cache MISS: holidays for {year}-{month:02d} loaded from DB")
         return holidays_dict
@@ -186,13 +211,25 @@ class PayrollRedisCache:
         return holidays_dict
 
     def cache_holidays_for_month(
-        self, year: int, month: int, holidays_dict: Dict[str, Dict]
+        self,
+        year: int,
+        month: int,
+        holidays_dict: Dict[str, Dict],
+        version: Optional[str] = None,
     ):
-        """Cache holidays for a month"""
+        """
+        Cache holidays for a month
+
+        Args:
+            version: Holiday version read before holidays_dict was loaded
+                (default: current version)
+        """
         if not self.cache_available:
             return
 
-        cache_key = self._make_key("holidays", year, month)
+        cache_key = self._make_key(
+            "holidays", year, month, version or get_holiday_version(year, month)
+        )
 
         try:
             # Cache for 1 week (holidays don't change often)
@@ -264,7 +301,7 @@ class PayrollRedisCache:
         if not self.cache_available:
             return None
 
-        cache_key = self._make_key("daily_calc", employee_id, work_date.isoformat())
+        cache_key = self._make_daily_key(employee_id, work_date)
 
         try:
             cached_data = self.redis_client.get(cache_key)
@@ -276,13 +313,23 @@ class PayrollRedisCache:
         return None
 
     def cache_daily_calculation(
-        self, employee_id: int, work_date: date, calculation_data: Dict
+        self,
+        employee_id: int,
+        work_date: date,
+        calculation_data: Dict,
+        version: Optional[str] = None,
     ):
-        """Cache daily payroll calculation"""
+        """
+        Cache daily payroll calculation
+
+        Args:
+            version: Monthly version read before calculation_data was computed
+                (default: current version)
+        """
         if not self.cache_available:
             return
 
-        cache_key = self._make_key("daily_calc", employee_id, work_date.isoformat())
+        cache_key = self._make_daily_key(employee_id, work_date, version)
 
         try:
             # Cache for 24 hours (daily calculations can change with new work logs)
@@ -303,7 +350,13 @@ class PayrollRedisCache:
         if not self.cache_available:
             return None
 
-        cache_key = self._make_key("monthly_summary", employee_id, year, month)
+        cache_key = self._make_key(
+            "monthly_summary",
+            employee_id,
+            year,
+            month,
+            get_monthly_version(employee_id, year, month),
+        )
 
         try:
             cached_data = self.redis_client.get(cache_key)
@@ -327,13 +380,30 @@ class PayrollRedisCache:
         return None
 
     def cache_monthly_summary(
-        self, employee_id: int, year: int, month: int, summary_data: Dict
+        self,
+        employee_id: int,
+        year: int,
+        month: int,
+        summary_data: Dict,
+        version: Optional[str] = None,
     ):
-        """Cache monthly payroll summary"""
+        """
+        Cache monthly payroll summary
+
+        Args:
+            version: Monthly version read before summary_data was computed
+                (default: current version)
+        """
         if not self.cache_available:
             return
 
-        cache_key = self._make_key("monthly_summary", employee_id, year, month)
+        cache_key = self._make_key(
+            "monthly_summary",
+            employee_id,
+            year,
+            month,
+            version or get_monthly_version(employee_id, year, month),
+        )
 
         try:
             # Cache for 1 hour (monthly summaries can change during the month)
@@ -360,44 +430,22 @@ class PayrollRedisCache:
     # CACHE INVALIDATION
 
     def invalidate_employee_cache(self, employee_id: int, year: int, month: int):
-        """Invalidate all cache for an employee's month"""
-        if not self.cache_available:
-            return
-
-        patterns = [
-            self._make_key("daily_calc", employee_id, "*"),
-            self._make_key("monthly_summary", employee_id, year, month),
-        ]
+        """
+        Invalidate all cache for an employee's month.
 
-        try:
-            for pattern in patterns:
-                keys = self.redis_client.keys(pattern)
-                if keys:
-                    self.redis_client.delete(*keys)
-                    import hashlib
-
-                    pattern_hash = hashlib.sha256(
-                        str(pattern).encode("utf-8")
-                    ).hexdigest()[:8]
-                    logger.info(
-                        "🗑️ Invalidated cache keys",
-                        extra={"pattern_hash": pattern_hash, "count": len(keys)},
-                    )
-        except Exception as e:
-            logger.warning(f"Cache invalidation error: {e}")
+        Bumps the employee-month generation; no keys are scanned or deleted.
+        WorkLog signals do this automatically.
+        """
+        bump_employee_month(employee_id, year, month)
+        logger.debug(
+            "🗑️ Invalidated employee-month cache",
+            extra={"period": f"{year}-{month:02d}"},
+        )
 
     def invalidate_holidays_cache(self, year: int, month: int):
-        """Invalidate holiday cache for a specific month"""
-        if not self.cache_available:
-            return
-
-        cache_key = self._make_key("holidays", year, month)
-
-        try:
-            self.redis_client.delete(cache_key)
-            logger.info(f"🗑️ Invalidated holidays cache for {year}-{month:02d}")
-        except Exception as e:
-            logger.warning(f"Holiday cache invalidation error: {e}")
+        """Invalidate holiday cache for a specific month (Holiday signals do this)"""
+        bump_holiday_month(year, month)
+        logger.info(f"🗑️ Invalidated holidays cache for {year}-{month:02d}")
 
     # UTILITY METHODS
 
@@ -0,0 +1,198 @@
+"""
+Incrementally maintained payroll analytics rollups.
+
+payroll_analytics used to aggregate MonthlyPayrollSummary (Count distinct,
+Sum, Avg) over the whole year on every request. MonthlyPayrollRollup keeps
+those totals per month - for all employees and per employee role - and is
+updated in the transaction that writes the summaries:
+
+- single saves and deletes (PayrollService._persist_results, admin edits)
+  via the MonthlyPayrollSummary receivers in payroll/signals.py
+- bulk writes via BulkPersister.save_all (bulk_create/bulk_update and the
+  PostgreSQL COPY upsert bypass model signals)
+
+Writes that bypass both (QuerySet.update(), raw SQL) or role changes of an
+employee make the rollups drift; `manage.py rebuild_payroll_rollups`
+recomputes them from the summaries.
+
+Example usage:
+    with transaction.atomic():
+        previous = load_summary_totals(employee_ids, 2025, 10)
+        ...write summaries...
+        apply_summary_changes(2025, 10, previous, current)
+"""
+
+import logging
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from payroll.models import MonthlyPayrollRollup, MonthlyPayrollSummary
+from users.models import Employee
+
+logger = logging.getLogger(__name__)
+
+ALL_ROLES = MonthlyPayrollRollup.ALL_ROLES
+
+# (total_gross_pay, total_hours) of one summary
+Totals = Tuple[Decimal, Decimal]
+
+_CENT = Decimal("0.01")
+
+
+def summary_totals(total_gross_pay, total_hours) -> Totals:
+    """Totals rounded the way the summary columns store them"""
+    return (
+        Decimal(str(total_gross_pay or 0)).quantize(_CENT),
+        Decimal(str(total_hours or 0)).quantize(_CENT),
+    )
+
+
+def load_summary_totals(
+    employee_ids: Iterable[int], year: int, month: int
+) -> Dict[int, Totals]:
+    """
+    Current totals of the employees' summaries, locked until the transaction
+    ends (call inside transaction.atomic()).
+    """
+    rows = (
+        MonthlyPayrollSummary.objects.select_for_update()
+        .filter(employee_id__in=list(employee_ids), year=year, month=month)
+        .values_list("employee_id", "total_gross_pay", "total_hours")
+    )
+    return {
+        employee_id: summary_totals(gross_pay, hours)
+        for employee_id, gross_pay, hours in rows
+    }
+
+
+def apply_summary_changes(
+    year: int,
+    month: int,
+    previous: Dict[int, Totals],
+    current: Dict[int, Totals],
+    roles: Optional[Dict[int, str]] = None,
+) -> None:
+    """
+    Add the difference between two states of a month's summaries to its
+    rollups.
+
+    Args:
+        year: Payroll year
+        month: Payroll month
+        previous: Totals before the write, by employee_id (absent = no summary)
+        current: Totals after the write, by employee_id (absent = no summary)
+        roles: Employee roles by employee_id (looked up when omitted)
+    """
+    changed = [
+        employee_id
+        for employee_id in set(previous) | set(current)
+        if previous.get(employee_id) != current.get(employee_id)
+    ]
+    if not changed:
+        return
+
+    if roles is None:
+        roles = dict(Employee.objects.filter(id__in=changed).values_list("id", "role"))
+
+    deltas = defaultdict(lambda: [0, Decimal("0"), Decimal("0")])
+    for employee_id in changed:
+        old = previous.get(employee_id)
+        new = current.get(employee_id)
+        count = (new is not None) - (old is not None)
+        gross_pay = (new[0] if new else 0) - (old[0] if old else 0)
+        hours = (new[1] if new else 0) - (old[1] if old else 0)
+
+        for role in sorted({ALL_ROLES, roles.get(employee_id) or ALL_ROLES}):
+            delta = deltas[role]
+            delta[0] += count
+            delta[1] += gross_pay
+            delta[2] += hours
+
+    # Rollup rows are locked in role order, so concurrent writers of a month
+    # cannot deadlock on each other's rows
+    now = timezone.now()
+    with transaction.atomic():
+        for role, (count, gross_pay, hours) in sorted(deltas.items()):
+            if not count and not gross_pay and not hours:
+                continue
+            MonthlyPayrollRollup.objects.get_or_create(
+                year=year, month=month, role=role
+            )
+            MonthlyPayrollRollup.objects.filter(
+                year=year, month=month, role=role
+            ).update(
+                employee_count=F("employee_count") + count,
+                total_gross_pay_sum=F("total_gross_pay_sum") + gross_pay,
+                total_hours_sum=F("total_hours_sum") + hours,
+                updated_at=now,
+            )
+
+
+def rebuild_rollups(year: Optional[int] = None) -> int:
+    """
+    Recompute rollups from MonthlyPayrollSummary.
+
+    Args:
+        year: Only rebuild this year (all years when omitted)
+
+    Returns:
+        int: Number of rollup rows written
+    """
+    summaries = MonthlyPayrollSummary.objects.all()
+    rollups = MonthlyPayrollRollup.objects.all()
+    if year is not None:
+        summaries = summaries.filter(year=year)
+        rollups = rollups.filter(year=year)
+
+    totals = {
+        "employee_count": Count("id"),
+        "total_gross_pay_sum": Sum("total_gross_pay"),
+        "total_hours_sum": Sum("total_hours"),
+    }
+    with transaction.atomic():
+        rows = [
+            {**row, "role": ALL_ROLES}
+            for row in summaries.values("year", "month").annotate(**totals)
+        ]
+        rows += [
+            {"role": row.pop("employee__role"), **row}
+            for row in summaries.values("year", "month", "employee__role").annotate(
+                **totals
+            )
+            if row["employee__role"]
+        ]
+
+        rollups.delete()
+        MonthlyPayrollRollup.objects.bulk_create(
+            [
+                MonthlyPayrollRollup(
+                    year=row["year"],
+                    month=row["month"],
+                    role=row["role"],
+                    employee_count=row["employee_count"],
+                    total_gross_pay_sum=row["total_gross_pay_sum"] or Decimal("0"),
+                    total_hours_sum=row["total_hours_sum"] or Decimal("0"),
+                )
+                for row in rows
+            ]
+        )
+
+    logger.info(
+        f"Rebuilt {len(rows)} payroll rollups",
+        extra={"year": year, "rows": len(rows), "action": "payroll_rollups_rebuilt"},
+    )
+    return len(rows)
+
+
+def get_year_rollups(year: int, role: str = ALL_ROLES) -> List[MonthlyPayrollRollup]:
+    """Non-empty monthly rollups of a year, ordered by month"""
+    return list(
+        MonthlyPayrollRollup.objects.filter(
+            year=year, role=role, employee_count__gt=0
+        ).order_by("month")
+    )
@@ -0,0 +1,282 @@
+"""
+Background backfill of missing and stale monthly payroll summaries.
+
+payroll_list used to call PayrollService.calculate() for every employee of
+the page whenever a single MonthlyPayrollSummary was missing, so the list
+request cost O(N) full calculations. It now always answers from stored
+summaries and hands the gaps to one bulk payroll job
+(payroll.tasks.run_bulk_payroll_job):
+
+- missing: employees of the list without a summary for the month
+- stale: summaries older than a WorkLog change of the month, or whose
+  employee-month is waiting in the recalculation queue
+
+At most one backfill job per month is active at a time. Requests made while
+it runs return that job; employees it does not cover are merged into the
+month's follow-up, which finish_backfill() queues as the next job once the
+active one ends (payroll.tasks.finish_payroll_backfill is linked to every
+backfill job). A follow-up merge lost to a concurrent request only delays
+those employees until the next list request detects them again.
+
+Example usage:
+    stale_ids = find_stale_employee_ids(page_employee_ids, 2025, 10)
+    job = enqueue_backfill(user_id, missing_ids + sorted(stale_ids), 2025, 10)
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+
+from payroll.services.enums import CalculationStrategy
+from payroll.services.recalculation_queue import make_pending_key
+
+from .jobs import JOB_PENDING, JOB_RUNNING, BulkPayrollJobStore
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_KEY_PREFIX = "payroll_backfill"
+
+# Placeholder while the claiming request creates and queues the job
+CLAIMED = "claimed"
+
+
+def make_backfill_key(year: int, month: int) -> str:
+    """Cache key holding the active backfill job of a month"""
+    return f"{BACKFILL_KEY_PREFIX}:{year}:{month:02d}"
+
+
+def make_follow_up_key(year: int, month: int) -> str:
+    """Cache key holding employees to backfill after the active job of a month"""
+    return f"{BACKFILL_KEY_PREFIX}:{year}:{month:02d}:follow_up"
+
+
+def find_stale_employee_ids(
+    employee_ids: Iterable[int], year: int, month: int
+) -> Set[int]:
+    """
+    Employees whose stored summary for the month is out of date.
+
+    One query for WorkLogs changed (or soft-deleted) after the summary was
+    written, one cache read for pending recalculations.
+
+    Returns:
+        Set[int]: Employee IDs with a stale summary
+    """
+    from worktime.models import WorkLog
+
+    employee_ids = list(employee_ids)
+    if not employee_ids:
+        return set()
+
+    stale = set(
+        WorkLog.all_objects.filter(
+            employee_id__in=employee_ids,
+            check_in__year=year,
+            check_in__month=month,
+            employee__monthly_payroll_summaries__year=year,
+            employee__monthly_payroll_summaries__month=month,
+            updated_at__gt=F("employee__monthly_payroll_summaries__last_updated"),
+        )
+        .values_list("employee_id", flat=True)
+        .distinct()
+    )
+
+    pending_keys = {
+        make_pending_key(employee_id, year, month): employee_id
+        for employee_id in employee_ids
+    }
+    try:
+        pending = cache.get_many(list(pending_keys))
+    except Exception as e:
+        logger.warning(f"Could not read pending payroll recalculations: {e}")
+        pending = {}
+    stale.update(pending_keys[key] for key in pending)
+
+    return stale
+
+
+def _active_job(store: BulkPayrollJobStore, job_id: str) -> Optional[Dict]:
+    job = store.get_job(job_id)
+    if job is not None and job["status"] in (JOB_PENDING, JOB_RUNNING):
+        return job
+    return None
+
+
+def _join_active_job(
+    job: Dict,
+    user_id: int,
+    employee_ids: List[int],
+    year: int,
+    month: int,
+    lock_seconds: int,
+) -> Dict:
+    """Merge employees the active job does not cover into the month's follow-up"""
+    deferred = set(employee_ids) - set(job["parameters"]["employee_ids"])
+    if not deferred:
+        return job
+
+    follow_up_key = make_follow_up_key(year, month)
+    follow_up = cache.get(follow_up_key) or {"employee_ids": []}
+    cache.set(
+        follow_up_key,
+        {
+            "user_id": user_id,
+            "employee_ids": sorted(deferred | set(follow_up["employee_ids"])),
+        },
+        timeout=lock_seconds,
+    )
+    logger.info(
+        f"Deferred payroll backfill of {len(deferred)} employees for "
+        f"{year}-{month:02d} until job {job['job_id']} ends",
+        extra={
+            "job_id": job["job_id"],
+            "employee_count": len(deferred),
+            "action": "payroll_backfill_deferred",
+        },
+    )
+    return job
+
+
+def _pop_follow_up(year: int, month: int) -> Optional[Dict]:
+    """Take the month's follow-up employees, if any"""
+    follow_up_key = make_follow_up_key(year, month)
+    follow_up = cache.get(follow_up_key)
+    if follow_up:
+        cache.delete(follow_up_key)
+    return follow_up
+
+
+def enqueue_backfill(
+    user_id: int, employee_ids: List[int], year: int, month: int
+) -> Optional[Dict]:
+    """
+    Queue one bulk payroll job that (re)calculates and saves the given
+    employee-months, unless a backfill of the month is already active -
+    then employees it does not cover are queued after it.
+
+    Args:
+        user_id: User the job is created for
+        employee_ids: Employees with missing or stale summaries
+        year: Payroll year
+        month: Payroll month
+
+    Returns:
+        Optional[Dict]: The new or already active job record (status
+        "failed" if it could not be queued), or None while another request
+        is queueing the month's backfill
+    """
+    if not employee_ids:
+        return None
+
+    store = BulkPayrollJobStore()
+    backfill_key = make_backfill_key(year, month)
+    lock_seconds = getattr(settings, "PAYROLL_BACKFILL_LOCK_SECONDS", 600)
+
+    current = cache.get(backfill_key)
+    if current == CLAIMED:
+        return None
+    if current:
+        job = _active_job(store, current)
+        if job is not None:
+            return _join_active_job(
+                job, user_id, employee_ids, year, month, lock_seconds
+            )
+        # Finished or expired: the next request may start a new backfill
+        cache.delete(backfill_key)
+
+    if not cache.add(backfill_key, CLAIMED, timeout=lock_seconds):
+        current = cache.get(backfill_key)
+        job = _active_job(store, current) if current and current != CLAIMED else None
+        if job is not None:
+            return _join_active_job(
+                job, user_id, employee_ids, year, month, lock_seconds
+            )
+        return None
+
+    # The new job also covers employees deferred while the previous one ran
+    follow_up = _pop_follow_up(year, month)
+    if follow_up:
+        employee_ids = [*employee_ids, *follow_up["employee_ids"]]
+
+    job = store.create_job(
+        user_id,
+        sorted(set(employee_ids)),
+        year,
+        month,
+        CalculationStrategy.ENHANCED.value,
+        save_to_db=True,
+    )
+    cache.set(backfill_key, job["job_id"], timeout=lock_seconds)
+
+    try:
+        from payroll.tasks import finish_payroll_backfill, run_bulk_payroll_job
+
+        finish = finish_payroll_backfill.si(job["job_id"], year, month)
+        run_bulk_payroll_job.apply_async(
+            args=[job["job_id"]], link=finish, link_error=finish
+        )
+    except Exception as e:
+        # Never calculate inline - the list keeps showing pending rows
+        logger.warning(
+            f"Could not queue payroll backfill for {year}-{month:02d}: {e}",
+            extra={
+                "job_id": job["job_id"],
+                "employee_count": len(job["parameters"]["employee_ids"]),
+                "action": "payroll_backfill_queue_error",
+            },
+        )
+        cache.delete(backfill_key)
+        return store.mark_failed(job["job_id"], f"Could not queue job: {e}") or job
+
+    logger.info(
+        f"Queued payroll backfill for {year}-{month:02d}",
+        extra={
+            "job_id": job["job_id"],
+            "employee_count": len(job["parameters"]["employee_ids"]),
+            "action": "payroll_backfill_queued",
+        },
+    )
+    return job
+
+
+def finish_backfill(job_id: str, year: int, month: int) -> Optional[Dict]:
+    """
+    Release the month's backfill lock held by a finished job and queue the
+    employees deferred while it ran.
+
+    Args:
+        job_id: The finished backfill job
+        year: Payroll year
+        month: Payroll month
+
+    Returns:
+        Optional[Dict]: The follow-up job, if one was queued
+    """
+    backfill_key = make_backfill_key(year, month)
+    if cache.get(backfill_key) == job_id:
+        cache.delete(backfill_key)
+
+    follow_up = _pop_follow_up(year, month)
+    if not follow_up:
+        return None
+
+    logger.info(
+        f"Queueing deferred payroll backfill for {year}-{month:02d}",
+        extra={
+            "job_id": job_id,
+            "employee_count": len(follow_up["employee_ids"]),
+            "action": "payroll_backfill_follow_up",
+        },
+    )
+    job = enqueue_backfill(follow_up["user_id"], follow_up["employee_ids"], year, month)
+    if job is None:
+        # Another request is queueing the month's backfill; it takes them over
+        cache.set(
+            make_follow_up_key(year, month),
+            follow_up,
+            timeout=getattr(settings, "PAYROLL_BACKFILL_LOCK_SECONDS", 600),
+        )
+    return job
@@ -8,7 +8,7 @@ Architecture:
 1. BulkDataLoader - Optimized data loading (3-5 queries total)
 2. BulkCacheManager - Redis pipeline operations
 3. ParallelExecutor - Multiprocessing/threading for calculations
-4. BulkPersister - Bulk database operations
+4. BulkPersister - Bulk database operations (COPY + upsert on PostgreSQL)
 5. ProgressReporter - Real-time monitoring
 
 Key features:
@@ -23,7 +23,7 @@ Key features:
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set
 
 from django.db import transaction
 
@@ -32,14 +32,20 @@ from payroll.services.enums import CalculationStrategy
 
 from .cache_manager import BulkCacheManager
 from .data_loader import BulkDataLoader
-from .parallel_executor import AdaptiveExecutor, ParallelExecutor
-from .persister import BulkPersister
+from .parallel_executor import (
+    AdaptiveExecutor,
+    ParallelExecutor,
+    get_worker_pool_statistics,
+)
+from .postgres_persister import get_bulk_persister
 from .progress_reporter import ProgressReporter
+from .shift_segmentation import ShiftSegmentationEngine
 from .types import (
     BulkCalculationResult,
     BulkCalculationSummary,
     BulkLoadedData,
     EmployeeCalculationError,
+    ProcessingStatus,
 )
 
 logger = logging.getLogger(__name__)
@@ -69,6 +75,7 @@ class BulkEnhancedPayrollService:
         max_workers: Optional[int] = None,
         batch_size: int = 1000,
         show_progress: bool = True,
+        use_batch_segmentation: bool = True,
     ):
         """
         Initialize bulk payroll service.
@@ -79,17 +86,19 @@ class BulkEnhancedPayrollService:
             max_workers: Maximum parallel workers (None = auto-detect)
             batch_size: Batch size for database operations
             show_progress: Show progress bar during calculation
+            use_batch_segmentation: Segment all shifts with the vectorized engine
         """
         self.use_cache = use_cache
         self.use_parallel = use_parallel
         self.max_workers = max_workers
         self.batch_size = batch_size
         self.show_progress = show_progress
+        self.use_batch_segmentation = use_batch_segmentation
 
         # Initialize components
         self.data_loader = BulkDataLoader()
         self.cache_manager = BulkCacheManager() if use_cache else None
-        self.persister = BulkPersister(batch_size=batch_size)
+        self.persister = get_bulk_persister(batch_size=batch_size)
 
         logger.info(
             "BulkEnhancedPayrollService initialized",
@@ -111,6 +120,7 @@ class BulkEnhancedPayrollService:
         save_to_db: bool = True,
         use_cache_warmup: bool = False,
         export_stats_path: Optional[Path] = None,
+        progress_publisher: Optional[Callable[[Dict], None]] = None,
     ) -> BulkCalculationResult:
         """
         Calculate payroll for multiple employees in bulk.
@@ -125,6 +135,8 @@ class BulkEnhancedPayrollService:
             save_to_db: Save results to database
             use_cache_warmup: Pre-warm cache before calculation
             export_stats_path: Optional path to export statistics
+            progress_publisher: Optional callback receiving live progress
+                snapshots (see ProgressReporter.snapshot)
 
         Returns:
             BulkCalculationResult: Calculation results and statistics
@@ -154,12 +166,17 @@ class BulkEnhancedPayrollService:
 
         # Initialize progress reporter
         progress = ProgressReporter(
-            total_employees=len(employee_ids), show_progress_bar=self.show_progress
+            total_employees=len(employee_ids),
+            show_progress_bar=self.show_progress,
+            publisher=progress_publisher,
         )
 
         try:
             with progress:
-                # Step 1: Load all data in bulk
+                # Step 1: Load all data in bulk, after snapshotting the cache
+                # versions the results will be read and cached under
+                progress.set_phase(ProcessingStatus.LOADING_DATA)
+                versions = self._snapshot_versions(employee_ids, year, month)
                 bulk_data = self._load_data(employee_ids, year, month, progress)
 
                 # Filter out employees without salary
@@ -173,8 +190,9 @@ class BulkEnhancedPayrollService:
                     )
 
                 # Step 2: Try to load from cache
+                progress.set_phase(ProcessingStatus.CHECKING_CACHE)
                 cached_results = self._load_from_cache(
-                    valid_employee_ids, year, month, progress
+                    valid_employee_ids, year, month, progress, versions
                 )
 
                 # Step 3: Calculate remaining employees
@@ -185,6 +203,7 @@ class BulkEnhancedPayrollService:
                 ]
 
                 calculated_results = {}
+                progress.set_phase(ProcessingStatus.CALCULATING)
                 if employee_ids_to_calculate:
                     calculated_results = self._calculate_employees(
                         employee_ids_to_calculate,
@@ -201,7 +220,7 @@ class BulkEnhancedPayrollService:
                 # Step 4: Save calculated results to cache
                 if self.cache_manager and calculated_results:
                     self.cache_manager.set_many_monthly_summaries(
-                        calculated_results, year, month
+                        calculated_results, year, month, versions=versions
                     )
 
                 # Step 5: Build contexts for persistence
@@ -211,6 +230,7 @@ class BulkEnhancedPayrollService:
 
                 # Step 6: Save to database
                 if save_to_db and all_results:
+                    progress.set_phase(ProcessingStatus.PERSISTING)
                     save_result = self.persister.save_all(
                         all_results, contexts, bulk_data
                     )
@@ -264,8 +284,6 @@ class BulkEnhancedPayrollService:
             )
 
             # Build error result
-            from .types import ProcessingStatus
-
             error_result = BulkCalculationResult(
                 results={},
                 errors={
@@ -316,8 +334,21 @@ class BulkEnhancedPayrollService:
 
         return bulk_data
 
+    def _snapshot_versions(
+        self, employee_ids: List[int], year: int, month: int
+    ) -> Dict[int, str]:
+        """Cache versions of the employees, read before their data is loaded."""
+        if not self.cache_manager:
+            return {}
+        return self.cache_manager.snapshot_versions(employee_ids, year, month)
+
     def _load_from_cache(
-        self, employee_ids: List[int], year: int, month: int, progress: ProgressReporter
+        self,
+        employee_ids: List[int],
+        year: int,
+        month: int,
+        progress: ProgressReporter,
+        versions: Optional[Dict[int, str]] = None,
     ) -> Dict[int, PayrollResult]:
         """Load results from cache if available."""
         if not self.cache_manager:
@@ -326,7 +357,7 @@ class BulkEnhancedPayrollService:
         logger.info("Checking cache...")
 
         cached_results = self.cache_manager.get_many_monthly_summaries(
-            employee_ids, year, month
+            employee_ids, year, month, versions=versions
         )
 
         # Update progress for cached employees
@@ -370,6 +401,9 @@ class BulkEnhancedPayrollService:
         if not contexts:
             return {}
 
+        if self.use_batch_segmentation:
+            self._attach_shift_segments(contexts, bulk_data)
+
         # Choose execution mode
         if self.use_parallel and len(contexts) >= 5:
             return self._calculate_parallel(contexts, strategy, progress)
@@ -379,7 +413,12 @@ class BulkEnhancedPayrollService:
     def _build_contexts(
         self, employee_ids: List[int], bulk_data: BulkLoadedData, year: int, month: int
     ) -> Dict[int, CalculationContext]:
-        """Build calculation contexts from bulk data."""
+        """
+        Build calculation contexts from bulk data.
+
+        Contexts carry the salary, work logs, holidays and Shabbat times, so
+        EnhancedPayrollStrategy calculates from them without per-employee queries.
+        """
         contexts = {}
 
         for employee_id in employee_ids:
@@ -409,12 +448,50 @@ class BulkEnhancedPayrollService:
                 ],
                 "holidays": bulk_data.holidays,
                 "shabbat_times": bulk_data.shabbat_times,
+                "shabbat_windows": bulk_data.shabbat_windows,
             }
 
             contexts[employee_id] = context
 
         return contexts
 
+    def _attach_shift_segments(
+        self, contexts: Dict[int, CalculationContext], bulk_data: BulkLoadedData
+    ) -> None:
+        """
+        Segment the shifts of all employees in one vectorized pass.
+
+        Each context gets the segments of its own shifts; the strategy falls
+        back to the scalar critical points path for shifts without segments.
+        """
+        if bulk_data.shabbat_windows is None:
+            return
+
+        shifts = [
+            (log["check_in"], log["check_out"])
+            for context in contexts.values()
+            for log in context["work_logs"]
+            if log.get("check_out") is not None
+        ]
+        if not shifts:
+            return
+
+        from payroll.services.strategies.enhanced import EnhancedPayrollStrategy
+
+        engine = ShiftSegmentationEngine.for_strategy(
+            EnhancedPayrollStrategy, holidays=bulk_data.holidays.keys()
+        )
+        segments = engine.segment_shifts(shifts, bulk_data.shabbat_windows)
+
+        for context in contexts.values():
+            context["shift_segments"] = {
+                key: segments[key]
+                for key in (
+                    (log["check_in"], log["check_out"]) for log in context["work_logs"]
+                )
+                if key in segments
+            }
+
     def _calculate_parallel(
         self,
         contexts: Dict[int, CalculationContext],
@@ -426,21 +503,22 @@ class BulkEnhancedPayrollService:
             f"Using parallel execution with {self.max_workers or 'auto'} workers..."
         )
 
-        # Create executor
+        # Create executor; its warm worker pool is shared with later runs
         executor = AdaptiveExecutor(
             max_workers=self.max_workers,
             task_timeout=300.0,  # 5 minute timeout per employee
         )
 
-        # Progress callback
+        # Per-employee progress is recorded below once the executor returns;
+        # meanwhile heartbeats keep published progress moving
         def on_progress(completed: int, total: int, status: str):
-            # Progress update is handled by executor
-            pass
+            progress.heartbeat(completed)
 
         # Execute in parallel
         results_or_errors = executor.map_calculations(
             list(contexts.values()), strategy, progress_callback=on_progress
         )
+        progress.heartbeat(0)
 
         # Separate successes from errors
         results = {}
@@ -545,6 +623,38 @@ class BulkEnhancedPayrollService:
 
         return deleted_count
 
+    def warm_up_workers(self, timeout: Optional[float] = 60.0) -> int:
+        """
+        Start the warm worker pool before the first bulk run.
+
+        Workers start, set up Django and preload their caches while nothing
+        waits for them, instead of during the first calculation.
+
+        Args:
+            timeout: Seconds to wait for the workers
+
+        Returns:
+            int: Number of workers started (0 without parallel processing)
+        """
+        if not self.use_parallel:
+            return 0
+
+        try:
+            started = AdaptiveExecutor(max_workers=self.max_workers).warm_up(timeout)
+        except Exception as e:
+            # The pool is restarted on first use; the run itself must not fail
+            logger.warning(
+                f"Worker pool warm-up failed: {e}",
+                extra={"error": str(e), "action": "worker_pool_warm_up_failed"},
+            )
+            return 0
+
+        logger.info(
+            f"Warmed up {started} payroll workers",
+            extra={"workers": started, "action": "worker_pool_warmed_up"},
+        )
+        return started
+
     def get_statistics(self) -> Dict:
         """
         Get service statistics.
@@ -568,4 +678,7 @@ class BulkEnhancedPayrollService:
                 "hit_rate": cache_stats.hit_rate,
             }
 
+        if self.use_parallel:
+            stats["worker_pools"] = get_worker_pool_statistics()
+
         return stats
@@ -8,14 +8,15 @@ Key features:
 - Bulk get (MGET) for multiple cache keys in one operation
 - Bulk set (pipeline) for multiple cache writes
 - Compatible with PayrollRedisCache key format
+- Compact binary values (result_codec) decoded lazily on access
+- Dependency-versioned keys: WorkLog/Salary/Holiday changes invalidate in O(1)
+- Version snapshots: results are cached under the versions read before their
+  inputs were loaded, so a change made meanwhile retires them
 - Cache warming and invalidation
 """
 
-import json
 import logging
 import os
-from datetime import date
-from decimal import Decimal
 from typing import Any, Dict, List, Optional, Set
 
 try:
@@ -27,8 +28,10 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+from payroll.services.cache_versions import bump_employee_months, get_monthly_versions
 from payroll.services.contracts import PayrollResult
 
+from .result_codec import decode_result, encode_result
 from .types import CacheStats
 
 logger = logging.getLogger(__name__)
@@ -57,9 +60,10 @@ class BulkCacheManager:
 
                 if redis_url:
                     # Use redis.from_url() for URL-based connection (Docker-compatible)
+                    # Values are binary (result_codec), so responses stay bytes
                     self.redis_client = redis.from_url(
                         redis_url,
-                        decode_responses=True,
+                        decode_responses=False,
                         socket_connect_timeout=5,
                         socket_timeout=5,
                     )
@@ -78,7 +82,9 @@ class BulkCacheManager:
                             "decode_responses": True,
                         },
                     )
-                    self.redis_client = redis.Redis(**redis_config)
+                    self.redis_client = redis.Redis(
+                        **{**redis_config, "decode_responses": False}
+                    )
                     logger.info(
                         f"🔗 Connecting to Redis via config: {redis_config.get('host')}:{redis_config.get('port')}"
                     )
@@ -108,30 +114,41 @@ class BulkCacheManager:
         key_parts = [prefix] + [str(arg) for arg in args]
         return ":".join(key_parts)
 
-    def _serialize_decimal(self, obj):
-        """Custom JSON serializer for Decimal and date objects."""
-        from datetime import date, datetime
+    def snapshot_versions(
+        self, employee_ids: List[int], year: int, month: int
+    ) -> Dict[int, str]:
+        """
+        Read the input versions of employees before loading their data.
 
-        if isinstance(obj, Decimal):
-            return float(obj)
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, date):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+        Pass the snapshot to get_many_monthly_summaries() and
+        set_many_monthly_summaries(): results calculated from the loaded data
+        are then cached under the versions they were calculated from.
+
+        Returns:
+            Dict mapping employee_id to its version ({} without cache)
+        """
+        if not self.cache_available or not employee_ids:
+            return {}
+        return get_monthly_versions(employee_ids, year, month)
 
     def get_many_monthly_summaries(
-        self, employee_ids: List[int], year: int, month: int
+        self,
+        employee_ids: List[int],
+        year: int,
+        month: int,
+        versions: Optional[Dict[int, str]] = None,
     ) -> Dict[int, PayrollResult]:
         """
         Get cached monthly summaries for multiple employees in one operation.
 
-        Uses MGET for efficient batch retrieval.
+        Uses MGET for efficient batch retrieval. Values are returned as
+        CachedPayrollResult mappings that decode fields on first access.
 
         Args:
             employee_ids: List of employee IDs
             year: Year of the period
             month: Month of the period
+            versions: Snapshot from snapshot_versions() (default: current)
 
         Returns:
             Dict mapping employee_id to PayrollResult (only cached results)
@@ -139,9 +156,10 @@ class BulkCacheManager:
         if not self.cache_available or not employee_ids:
             return {}
 
-        # Build cache keys
+        # Build versioned cache keys (one round trip for all generations)
+        versions = versions or get_monthly_versions(employee_ids, year, month)
         keys = [
-            self._make_key("monthly_summary", emp_id, year, month)
+            self._make_key("monthly_summary", emp_id, year, month, versions[emp_id])
             for emp_id in employee_ids
         ]
 
@@ -155,9 +173,9 @@ class BulkCacheManager:
             for emp_id, cached_value in zip(employee_ids, cached_values):
                 if cached_value:
                     try:
-                        results[emp_id] = json.loads(cached_value)
+                        results[emp_id] = decode_result(cached_value)
                         self._stats.hits += 1
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
                         logger.warning(
                             f"Failed to decode cache for employee {emp_id}: {e}"
                         )
@@ -182,18 +200,26 @@ class BulkCacheManager:
             return {}
 
     def set_many_monthly_summaries(
-        self, results: Dict[int, PayrollResult], year: int, month: int, ttl: int = 3600
+        self,
+        results: Dict[int, PayrollResult],
+        year: int,
+        month: int,
+        ttl: int = 3600,
+        versions: Optional[Dict[int, str]] = None,
     ) -> bool:
         """
         Cache monthly summaries for multiple employees using pipeline.
 
         Uses Redis pipeline to batch all SET operations into one round-trip.
+        Results are stored in the compact binary format of result_codec.
 
         Args:
             results: Dict mapping employee_id to PayrollResult
             year: Year of the period
             month: Month of the period
             ttl: Time-to-live in seconds (default: 1 hour)
+            versions: Snapshot from snapshot_versions() taken before the
+                results' data was loaded (default: current versions)
 
         Returns:
             bool: True if successful, False otherwise
@@ -204,12 +230,16 @@ class BulkCacheManager:
         try:
             # Use pipeline for bulk write (single round-trip)
             pipeline = self.redis_client.pipeline()
+            if versions is None:
+                versions = get_monthly_versions(results.keys(), year, month)
+            compress = getattr(settings, "PAYROLL_BULK_CACHE_COMPRESS", True)
 
             for emp_id, result in results.items():
-                cache_key = self._make_key("monthly_summary", emp_id, year, month)
+                cache_key = self._make_key(
+                    "monthly_summary", emp_id, year, month, versions[emp_id]
+                )
 
-                # Serialize result to JSON
-                serialized_data = json.dumps(result, default=self._serialize_decimal)
+                serialized_data = encode_result(result, compress=compress)
 
                 # Add to pipeline
                 pipeline.setex(cache_key, ttl, serialized_data)
@@ -235,53 +265,37 @@ class BulkCacheManager:
         """
         Invalidate cache for multiple employees.
 
+        Bumps each employee-month generation, which retires the monthly
+        summary and daily calculation keys without scanning Redis.
+
         Args:
             employee_ids: List of employee IDs to invalidate
             year: Year of the period
             month: Month of the period
 
         Returns:
-            int: Number of keys deleted
+            int: Number of employee-months invalidated
         """
-        if not self.cache_available or not employee_ids:
-            return 0
-
-        try:
-            # Build all keys to delete
-            keys_to_delete = []
-
-            for emp_id in employee_ids:
-                # Monthly summary key
-                monthly_key = self._make_key("monthly_summary", emp_id, year, month)
-                keys_to_delete.append(monthly_key)
-
-                # Daily calculation keys (using scan for pattern matching)
-                # Note: This is slower, only use if necessary
-                daily_pattern = self._make_key("daily_calc", emp_id, "*")
-                daily_keys = self.redis_client.keys(daily_pattern)
-                keys_to_delete.extend(daily_keys)
-
-            # Delete all keys
-            if keys_to_delete:
-                deleted_count = self.redis_client.delete(*keys_to_delete)
-                logger.info(
-                    f"Invalidated {deleted_count} cache keys for {len(employee_ids)} employees",
-                    extra={
-                        "deleted_count": deleted_count,
-                        "employee_count": len(employee_ids),
-                        "action": "bulk_cache_invalidate",
-                    },
-                )
-                return deleted_count
-
+        if not employee_ids:
             return 0
 
-        except Exception as e:
-            logger.error(f"Bulk cache invalidation failed: {e}", exc_info=True)
-            return 0
+        bump_employee_months((emp_id, year, month) for emp_id in employee_ids)
+        logger.info(
+            f"Invalidated cache for {len(employee_ids)} employees",
+            extra={
+                "employee_count": len(employee_ids),
+                "action": "bulk_cache_invalidate",
+            },
+        )
+        return len(set(employee_ids))
 
     def warm_up_cache(
-        self, results: Dict[int, PayrollResult], year: int, month: int, ttl: int = 3600
+        self,
+        results: Dict[int, PayrollResult],
+        year: int,
+        month: int,
+        ttl: int = 3600,
+        versions: Optional[Dict[int, str]] = None,
     ) -> bool:
         """
         Warm up cache with calculation results.
@@ -293,11 +307,12 @@ class BulkCacheManager:
             year: Year of the period
             month: Month of the period
             ttl: Time-to-live in seconds
+            versions: Snapshot from snapshot_versions() (default: current)
 
         Returns:
             bool: True if successful
         """
-        return self.set_many_monthly_summaries(results, year, month, ttl)
+        return self.set_many_monthly_summaries(results, year, month, ttl, versions)
 
     def get_cache_stats(self) -> CacheStats:
         """
@@ -332,7 +347,8 @@ class BulkCacheManager:
         """
         Flush all keys matching a pattern.
 
-        CAUTION: Use with care in production!
+        Not needed for invalidation (keys are versioned); kept for manual
+        maintenance. CAUTION: Use with care in production!
 
         Args:
             pattern: Redis key pattern (e.g., "monthly_summary:*")
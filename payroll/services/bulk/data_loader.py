@@ -25,6 +25,7 @@ from django.db.models import Prefetch
 from integrations.models import Holiday
 from integrations.services.unified_shabbat_service import get_shabbat_times
 from payroll.models import Salary
+from payroll.services.shabbat_windows import ShabbatWindowTable
 from users.models import Employee
 from worktime.models import WorkLog
 
@@ -117,6 +118,7 @@ class BulkDataLoader:
             shabbat_times=shabbat_times_dict,
             year=year,
             month=month,
+            shabbat_windows=ShabbatWindowTable.from_shabbat_times(shabbat_times_dict),
         )
 
     def _load_employees(self, employee_ids: List[int]) -> Dict[int, EmployeeData]:
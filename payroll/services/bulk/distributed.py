@@ -0,0 +1,342 @@
+"""
+Distributed bulk payroll calculation via Celery fan-out/fan-in.
+
+BulkEnhancedPayrollService is limited to the cores of the machine running it.
+The distributed mode shards employee IDs, calculates every shard as a Celery
+task on any worker node (each shard runs the regular bulk pipeline without
+persisting), then merges the shard results in a chord callback and persists
+them once, shard by shard:
+
+    group(calculate_payroll_shard(shard) for shard in shards)
+        | finalize_bulk_payroll(shard_payloads)
+
+Shard and finalize tasks retry on database errors and are idempotent per run
+(core.idempotency.idempotent_per_run, keyed on run_id and the shard index):
+only a completion marker is kept in the shared cache, a redelivered shard
+returns its payload from the result backend and a redelivered callback does
+not persist twice.
+
+Results travel through the Celery result backend as JSON; Decimal, date and
+datetime values are tagged so they are restored exactly (see encode_value).
+
+Example usage:
+    service = DistributedBulkPayrollService(shard_size=500)
+    result = service.calculate_bulk(employee_ids, year=2025, month=10)
+"""
+
+import logging
+import uuid
+from collections.abc import Mapping
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+
+from payroll.services.enums import CalculationStrategy
+
+from .types import BulkCalculationResult, EmployeeCalculationError, ProcessingStatus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_SIZE = 500
+
+
+def encode_value(value: Any) -> Any:
+    """
+    Convert a PayrollResult (or any nested value) to JSON-safe data.
+
+    Decimal, date and datetime values are tagged so decode_value() restores
+    them without precision loss.
+    """
+    if isinstance(value, Decimal):
+        return {"__decimal__": str(value)}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, Mapping):
+        return {str(key): encode_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    return value
+
+
+def decode_value(value: Any) -> Any:
+    """Inverse of encode_value()"""
+    if isinstance(value, dict):
+        if len(value) == 1:
+            if "__decimal__" in value:
+                return Decimal(value["__decimal__"])
+            if "__datetime__" in value:
+                return datetime.fromisoformat(value["__datetime__"])
+            if "__date__" in value:
+                return date.fromisoformat(value["__date__"])
+        return {key: decode_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_value(item) for item in value]
+    return value
+
+
+def shard_employee_ids(employee_ids: List[int], shard_size: int) -> List[List[int]]:
+    """Split employee IDs into shards of at most shard_size IDs"""
+    ordered = sorted(set(employee_ids))
+    return [
+        ordered[i : i + shard_size] for i in range(0, len(ordered), max(1, shard_size))
+    ]
+
+
+def calculate_shard(
+    employee_ids: List[int], year: int, month: int, strategy: CalculationStrategy
+) -> Dict[str, Any]:
+    """
+    Calculate one shard with the regular bulk pipeline, without persisting.
+
+    Args:
+        employee_ids: Employee IDs of the shard
+        year: Year for calculation
+        month: Month for calculation
+        strategy: Calculation strategy
+
+    Returns:
+        Dict: JSON-safe shard payload (see merge_shard_payloads)
+    """
+    from .bulk_service import BulkEnhancedPayrollService
+
+    service = BulkEnhancedPayrollService(
+        use_parallel=getattr(settings, "PAYROLL_BULK_SHARD_PARALLEL", False),
+        show_progress=False,
+    )
+    result = service.calculate_bulk(
+        employee_ids=employee_ids,
+        year=year,
+        month=month,
+        strategy=strategy,
+        save_to_db=False,
+    )
+
+    if result.status == ProcessingStatus.FAILED:
+        # The whole shard failed (e.g. data loading): report every employee
+        error = next(iter(result.errors.values()))
+        errors = {
+            employee_id: EmployeeCalculationError(
+                employee_id=employee_id,
+                error_type=error.error_type,
+                error_message=error.error_message,
+            )
+            for employee_id in employee_ids
+        }
+    else:
+        errors = result.errors
+
+    return {
+        "employee_ids": employee_ids,
+        "results": encode_value(result.results),
+        "errors": [
+            {
+                "employee_id": error.employee_id,
+                "error_type": error.error_type,
+                "error_message": error.error_message,
+            }
+            for error in errors.values()
+        ],
+        "cached_count": result.cached_count,
+        "db_queries_count": result.db_queries_count,
+        "duration_seconds": result.duration_seconds,
+    }
+
+
+def merge_shard_payloads(
+    payloads: List[Dict[str, Any]], start_time: datetime
+) -> BulkCalculationResult:
+    """
+    Merge shard payloads into one BulkCalculationResult.
+
+    Args:
+        payloads: Payloads returned by calculate_shard()
+        start_time: Start of the distributed run
+
+    Returns:
+        BulkCalculationResult: Combined result
+    """
+    results = {}
+    errors = {}
+    total_count = cached_count = db_queries = 0
+
+    for payload in payloads:
+        total_count += len(payload["employee_ids"])
+        cached_count += payload["cached_count"]
+        db_queries += payload["db_queries_count"]
+        for employee_id, result in decode_value(payload["results"]).items():
+            results[int(employee_id)] = result
+        for error in payload["errors"]:
+            errors[error["employee_id"]] = EmployeeCalculationError(**error)
+
+    end_time = datetime.now()
+    successful_count = len([emp_id for emp_id in results if emp_id not in errors])
+
+    return BulkCalculationResult(
+        results=results,
+        errors=errors,
+        total_count=total_count,
+        successful_count=successful_count,
+        failed_count=len(errors),
+        cached_count=cached_count,
+        calculated_count=successful_count - cached_count,
+        duration_seconds=(end_time - start_time).total_seconds(),
+        start_time=start_time,
+        end_time=end_time,
+        cache_hit_rate=(cached_count / total_count * 100) if total_count else 0.0,
+        db_queries_count=db_queries,
+        status=(
+            ProcessingStatus.COMPLETED
+            if successful_count or not total_count
+            else ProcessingStatus.FAILED
+        ),
+    )
+
+
+def persist_merged_results(
+    results: Dict[int, Dict],
+    year: int,
+    month: int,
+    batch_size: int = 1000,
+    shard_size: Optional[int] = None,
+) -> int:
+    """
+    Persist merged shard results with the regular BulkPersister, shard by shard.
+
+    Each shard commits on its own and only loads the data persistence needs
+    (employees, work logs and holidays - no Shabbat times), so the callback
+    never holds the bulk data of the whole run. Saves replace existing rows,
+    so a retried callback re-persists committed shards safely.
+
+    Returns:
+        int: Number of records saved
+    """
+    from .bulk_service import BulkEnhancedPayrollService
+
+    if not results:
+        return 0
+
+    service = BulkEnhancedPayrollService(
+        use_cache=False, use_parallel=False, batch_size=batch_size, show_progress=False
+    )
+    shard_size = shard_size or getattr(
+        settings, "PAYROLL_BULK_SHARD_SIZE", DEFAULT_SHARD_SIZE
+    )
+
+    total_records = 0
+    for shard in shard_employee_ids(list(results.keys()), shard_size):
+        bulk_data = service.data_loader.load_all_data(
+            shard, year, month, include_shabbat_times=False
+        )
+        contexts = service._build_contexts(shard, bulk_data, year, month)
+        shard_results = {employee_id: results[employee_id] for employee_id in shard}
+
+        save_result = service.persister.save_all(shard_results, contexts, bulk_data)
+        total_records += save_result.total_records
+    return total_records
+
+
+def summarize_result(result: BulkCalculationResult) -> Dict[str, Any]:
+    """JSON-safe summary of a merged result (chord callback return value)"""
+    return {
+        **result.get_detailed_report().to_dict(),
+        "start_time": result.start_time.isoformat(),
+        "status": result.status.value,
+    }
+
+
+class DistributedBulkPayrollService:
+    """
+    Bulk payroll calculation sharded across Celery worker nodes.
+
+    The interface mirrors BulkEnhancedPayrollService.calculate_bulk().
+    """
+
+    def __init__(self, shard_size: Optional[int] = None):
+        """
+        Initialize distributed service.
+
+        Args:
+            shard_size: Employees per shard (default PAYROLL_BULK_SHARD_SIZE)
+        """
+        self.shard_size = shard_size or getattr(
+            settings, "PAYROLL_BULK_SHARD_SIZE", DEFAULT_SHARD_SIZE
+        )
+
+    def dispatch(
+        self,
+        employee_ids: List[int],
+        year: int,
+        month: int,
+        strategy: CalculationStrategy = CalculationStrategy.ENHANCED,
+        save_to_db: bool = True,
+    ):
+        """
+        Start the fan-out/fan-in without waiting for it.
+
+        Returns:
+            AsyncResult of the chord callback (returns summarize_result())
+        """
+        from celery import chord
+
+        from payroll.tasks import calculate_payroll_shard, finalize_bulk_payroll
+
+        run_id = uuid.uuid4().hex
+        shards = shard_employee_ids(employee_ids, self.shard_size)
+
+        logger.info(
+            f"Dispatching distributed bulk payroll for {len(employee_ids)} employees "
+            f"in {len(shards)} shards ({year}-{month:02d})",
+            extra={
+                "run_id": run_id,
+                "employee_count": len(employee_ids),
+                "shard_count": len(shards),
+                "shard_size": self.shard_size,
+                "year": year,
+                "month": month,
+                "action": "distributed_bulk_dispatch",
+            },
+        )
+
+        header = [
+            calculate_payroll_shard.s(
+                shard, year, month, strategy.value, run_id, shard_index
+            )
+            for shard_index, shard in enumerate(shards)
+        ]
+        callback = finalize_bulk_payroll.s(
+            year, month, save_to_db, datetime.now().isoformat(), run_id
+        )
+        return chord(header)(callback)
+
+    def calculate_bulk(
+        self,
+        employee_ids: List[int],
+        year: int,
+        month: int,
+        strategy: CalculationStrategy = CalculationStrategy.ENHANCED,
+        save_to_db: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the distributed calculation and wait for the merged summary.
+
+        Args:
+            employee_ids: Employee IDs to process
+            year: Year for calculation
+            month: Month for calculation
+            strategy: Calculation strategy
+            save_to_db: Persist merged results
+            timeout: Seconds to wait for the workers (None = no limit)
+
+        Returns:
+            Dict: Summary of the merged result (see summarize_result)
+        """
+        if not employee_ids:
+            return summarize_result(merge_shard_payloads([], datetime.now()))
+
+        async_result = self.dispatch(employee_ids, year, month, strategy, save_to_db)
+        return async_result.get(timeout=timeout, disable_sync_subtasks=False)
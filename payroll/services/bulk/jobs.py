@@ -0,0 +1,266 @@
+"""
+Asynchronous bulk payroll jobs.
+
+The bulk API used to run the whole calculation inside the HTTP request. A
+job is now created instead and the calculation runs in a Celery task
+(payroll.tasks.run_bulk_payroll_job):
+
+- The job record (parameters, status, final summary) and its live progress
+  are stored in the shared Redis cache (CACHES in settings) under separate
+  keys, so the web process that creates a job, the Celery worker running it
+  and the status view all see the same record, and progress updates never
+  rewrite it.
+- A progress snapshot that cannot be stored is logged and dropped; it
+  never fails the calculation.
+- The task passes BulkPayrollJobStore.progress_publisher() to
+  BulkEnhancedPayrollService, whose ProgressReporter publishes completed
+  count, rate, ETA and cache statistics while the job runs.
+- bulk_calculation_status returns the job record with its latest progress.
+
+Example usage:
+    store = BulkPayrollJobStore()
+    job = store.create_job(user_id, employee_ids, 2025, 10, "enhanced")
+    ...
+    store.get_job(job["job_id"])
+"""
+
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+JOB_KEY_PREFIX = "payroll_bulk_job"
+
+# Job statuses
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+def make_job_key(job_id: str) -> str:
+    """Cache key of a job record"""
+    return f"{JOB_KEY_PREFIX}:{job_id}"
+
+
+def make_progress_key(job_id: str) -> str:
+    """Cache key of a job's latest progress snapshot"""
+    return f"{JOB_KEY_PREFIX}:{job_id}:progress"
+
+
+class BulkPayrollJobStore:
+    """
+    Storage of bulk payroll jobs and their progress in the shared cache.
+
+    Cache errors propagate, except from publish_progress().
+    """
+
+    @property
+    def ttl(self) -> int:
+        """Seconds a job is kept after its last update"""
+        return getattr(settings, "PAYROLL_BULK_JOB_TTL_SECONDS", 86400)
+
+    def create_job(
+        self,
+        user_id: int,
+        employee_ids: List[int],
+        year: int,
+        month: int,
+        strategy: str,
+        use_parallel: bool = True,
+        use_cache: bool = True,
+        save_to_db: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Create a pending job.
+
+        Returns:
+            Dict: Job record
+        """
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "status": JOB_PENDING,
+            "created_by": user_id,
+            "created_at": datetime.now().isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "parameters": {
+                "employee_ids": list(employee_ids),
+                "year": year,
+                "month": month,
+                "strategy": strategy,
+                "use_parallel": use_parallel,
+                "use_cache": use_cache,
+                "save_to_db": save_to_db,
+            },
+            "summary": None,
+            "error": None,
+        }
+        cache.set(make_job_key(job["job_id"]), job, timeout=self.ttl)
+
+        logger.info(
+            f"Created bulk payroll job {job['job_id']} "
+            f"for {len(employee_ids)} employees",
+            extra={
+                "job_id": job["job_id"],
+                "user_id": user_id,
+                "employee_count": len(employee_ids),
+                "year": year,
+                "month": month,
+                "action": "bulk_job_created",
+            },
+        )
+        return job
+
+    def get_job(self, job_id: str, include_progress: bool = True) -> Optional[Dict]:
+        """
+        Get a job record with its latest progress.
+
+        Returns:
+            Optional[Dict]: Job record, or None if unknown or expired
+        """
+        job = cache.get(make_job_key(job_id))
+        if job is not None and include_progress:
+            job["progress"] = cache.get(make_progress_key(job_id))
+        return job
+
+    def update_job(self, job_id: str, **fields) -> Optional[Dict]:
+        """
+        Update fields of a job record.
+
+        Only the job's task writes the record after creation.
+
+        Returns:
+            Optional[Dict]: Updated record, or None if the job is unknown
+        """
+        job = cache.get(make_job_key(job_id))
+        if job is None:
+            return None
+        job.update(fields)
+        cache.set(make_job_key(job_id), job, timeout=self.ttl)
+        return job
+
+    def mark_running(self, job_id: str) -> Optional[Dict]:
+        return self.update_job(
+            job_id, status=JOB_RUNNING, started_at=datetime.now().isoformat()
+        )
+
+    def mark_completed(self, job_id: str, summary: Dict[str, Any]) -> Optional[Dict]:
+        return self.update_job(
+            job_id,
+            status=JOB_COMPLETED,
+            summary=summary,
+            finished_at=datetime.now().isoformat(),
+        )
+
+    def mark_failed(self, job_id: str, error: str) -> Optional[Dict]:
+        return self.update_job(
+            job_id,
+            status=JOB_FAILED,
+            error=error,
+            finished_at=datetime.now().isoformat(),
+        )
+
+    def publish_progress(self, job_id: str, snapshot: Dict[str, Any]) -> None:
+        """Store the latest progress snapshot of a job"""
+        try:
+            cache.set(make_progress_key(job_id), snapshot, timeout=self.ttl)
+        except Exception as e:
+            logger.warning(
+                f"Could not publish progress of bulk payroll job {job_id}: {e}",
+                extra={"job_id": job_id, "action": "bulk_job_progress_error"},
+            )
+
+    def progress_publisher(self, job_id: str) -> Callable[[Dict[str, Any]], None]:
+        """Publisher callback for ProgressReporter"""
+        return lambda snapshot: self.publish_progress(job_id, snapshot)
+
+
+def format_employee_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Per-employee result as returned by the bulk API"""
+    return {
+        "total_salary": float(result["total_salary"]),
+        "total_hours": float(result["total_hours"]),
+        "regular_hours": float(result["regular_hours"]),
+        "overtime_hours": float(result["overtime_hours"]),
+        "holiday_hours": float(result["holiday_hours"]),
+        "sabbath_hours": float(result["shabbat_hours"]),
+        "worked_days": result.get("worked_days", 0),
+        "status": result.get("metadata", {}).get("status", "calculated"),
+    }
+
+
+def run_job(job_id: str, store: Optional[BulkPayrollJobStore] = None) -> Dict:
+    """
+    Run a bulk payroll job (body of payroll.tasks.run_bulk_payroll_job).
+
+    Returns:
+        Dict: Final job record
+
+    Raises:
+        ValueError: If the job is unknown or expired
+    """
+    from payroll.services.enums import CalculationStrategy
+
+    from .bulk_service import BulkEnhancedPayrollService
+    from .parallel_executor import processes_available
+    from .types import ProcessingStatus
+
+    store = store or BulkPayrollJobStore()
+    job = store.mark_running(job_id)
+    if job is None:
+        raise ValueError(f"Unknown bulk payroll job: {job_id}")
+
+    params = job["parameters"]
+    # A prefork Celery worker is daemonic and cannot start a process pool;
+    # jobs scale with the worker concurrency instead
+    service = BulkEnhancedPayrollService(
+        use_cache=params["use_cache"],
+        use_parallel=params["use_parallel"] and processes_available(),
+        show_progress=False,
+    )
+
+    try:
+        result = service.calculate_bulk(
+            employee_ids=params["employee_ids"],
+            year=params["year"],
+            month=params["month"],
+            strategy=CalculationStrategy.from_string(params["strategy"]),
+            save_to_db=params["save_to_db"],
+            progress_publisher=store.progress_publisher(job_id),
+        )
+    except Exception as e:
+        logger.exception(
+            f"Bulk payroll job {job_id} failed",
+            extra={"job_id": job_id, "action": "bulk_job_failed"},
+        )
+        return store.mark_failed(job_id, str(e))
+
+    if result.status == ProcessingStatus.FAILED:
+        error = next(iter(result.errors.values()), None)
+        return store.mark_failed(
+            job_id, error.error_message if error else "Bulk calculation failed"
+        )
+
+    summary = result.get_detailed_report().to_dict()
+    summary["results"] = {
+        str(emp_id): format_employee_result(employee_result)
+        for emp_id, employee_result in result.get_successful_results().items()
+    }
+
+    logger.info(
+        f"Bulk payroll job {job_id} completed: {result.successful_count} "
+        f"successful, {result.failed_count} failed",
+        extra={
+            "job_id": job_id,
+            "successful": result.successful_count,
+            "failed": result.failed_count,
+            "action": "bulk_job_completed",
+        },
+    )
+    return store.mark_completed(job_id, summary)
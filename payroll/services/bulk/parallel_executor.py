@@ -7,22 +7,33 @@ or threading, with automatic worker management and error handling.
 Key features:
 - Automatic worker count based on CPU cores
 - Support for both multiprocessing and threading
+- Persistent warm worker pools reused across bulk runs, started ahead of the
+  first run by the bulk command and by non-prefork Celery workers
+- Workers preload the calendar and strategy caches when they start
+- Chunked task submission
 - Graceful error handling with continuation
 - Timeout support for individual tasks
 - Clean shutdown handling
+- Thread fallback in daemonic processes (Celery prefork workers), which may
+  not start worker processes
 """
 
+import atexit
 import logging
+import math
 import multiprocessing
 import os
+import threading
+import time
 from concurrent.futures import (
     ProcessPoolExecutor,
     ThreadPoolExecutor,
     TimeoutError,
     as_completed,
 )
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Union
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from payroll.services.contracts import CalculationContext, PayrollResult
 from payroll.services.enums import CalculationStrategy
@@ -33,6 +44,122 @@ from .types import EmployeeCalculationError
 logger = logging.getLogger(__name__)
 
 
+# Factory of the current worker process, created once by _initialize_worker
+_worker_factory = None
+
+
+def _initialize_worker() -> None:
+    """
+    Prepare a pool worker process once, before it receives any task.
+
+    Sets up Django (spawned workers start without it), drops database
+    connections inherited from the parent, imports the strategy stack and
+    preloads the calendar and strategy caches so that the first task does not
+    pay for it.
+    """
+    global _worker_factory
+
+    import django
+    from django.apps import apps
+    from django.db import connections
+
+    if not apps.ready:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "myhours.settings")
+        django.setup()
+
+    # A forked worker must not reuse the parent's sockets; closing them would
+    # terminate the parent's sessions, so just forget them
+    for connection in connections.all():
+        connection.connection = None
+
+    from payroll.services.bulk.shift_segmentation import (  # noqa: F401
+        ShiftSegmentationEngine,
+    )
+    from payroll.services.strategies.enhanced import (  # noqa: F401
+        EnhancedPayrollStrategy,
+    )
+
+    _worker_factory = get_payroll_factory()
+
+    # A failing initializer breaks the whole pool; a failed preload only
+    # costs the first task a cache miss
+    try:
+        _preload_worker_caches()
+    except Exception as e:
+        logger.warning(f"Could not preload payroll worker caches: {e}")
+
+    logger.debug(
+        f"Payroll worker {os.getpid()} initialized",
+        extra={"pid": os.getpid(), "action": "payroll_worker_initialized"},
+    )
+
+
+def _preload_worker_caches() -> None:
+    """
+    Fill the process-local caches of a new worker.
+
+    Registers the default strategies if needed, reads the strategy holidays of
+    the current and previous month (the months bulk runs calculate) into the
+    L1 calendar cache and precomputes the sunset table of those years.
+    """
+    from integrations.services.unified_shabbat_service import (
+        unified_shabbat_service,
+    )
+    from payroll.enhanced_redis_cache import enhanced_payroll_cache
+    from payroll.services.factory import register_default_strategies
+
+    if not _worker_factory.is_strategy_available(CalculationStrategy.ENHANCED):
+        register_default_strategies()
+
+    today = date.today()
+    previous = today.replace(day=1) - timedelta(days=1)
+    for period in ((previous.year, previous.month), (today.year, today.month)):
+        enhanced_payroll_cache.get_holidays(*period)
+    unified_shabbat_service.preload_sunset_table(previous.year, today.year)
+
+
+def processes_available() -> bool:
+    """
+    Whether this process may start worker processes.
+
+    Daemonic processes, such as the pool workers of a prefork Celery worker,
+    are not allowed to have children.
+    """
+    return not multiprocessing.current_process().daemon
+
+
+def _worker_ping() -> int:
+    """No-op task used to start and initialize pool workers ahead of time"""
+    return os.getpid()
+
+
+def _calculate_payroll_chunk(
+    contexts: List[CalculationContext], strategy: CalculationStrategy
+) -> List[Tuple[int, Union[PayrollResult, Exception]]]:
+    """
+    Calculate a chunk of contexts in one worker task.
+
+    Errors are returned per employee so that one failing calculation does
+    not discard the rest of the chunk.
+
+    Args:
+        contexts: Calculation contexts
+        strategy: Strategy to use for all calculations
+
+    Returns:
+        List of (employee_id, result or error) pairs
+    """
+    results = []
+    for context in contexts:
+        try:
+            results.append(
+                (context["employee_id"], _calculate_payroll_worker(context, strategy))
+            )
+        except Exception as e:
+            results.append((context["employee_id"], e))
+    return results
+
+
 def _calculate_payroll_worker(
     context: CalculationContext, strategy: CalculationStrategy
 ) -> PayrollResult:
@@ -40,8 +167,9 @@ def _calculate_payroll_worker(
     Worker function for parallel payroll calculation.
 
     This function is designed to be serializable for multiprocessing.
-    It creates its own factory and calculator instances to avoid
-    sharing state between processes.
+    It uses the factory of the worker process (see _initialize_worker) and
+    creates its own calculator instance to avoid sharing state between
+    processes.
 
     Args:
         context: Calculation context for single employee
@@ -54,8 +182,7 @@ def _calculate_payroll_worker(
         Exception: Any error during calculation
     """
     try:
-        # Create fresh factory instance for this worker
-        factory = get_payroll_factory()
+        factory = _worker_factory or get_payroll_factory()
 
         # Create calculator and perform calculation
         calculator = factory.create_calculator(strategy, context)
@@ -78,6 +205,237 @@ def _calculate_payroll_worker(
         raise
 
 
+class WarmWorkerPool:
+    """
+    Long-lived worker pool shared by all bulk runs of a process.
+
+    Creating a ProcessPoolExecutor per run pays for process start-up, Django
+    setup and importing the strategy stack every time. A warm pool is started
+    once (workers run _initialize_worker), reused by API requests and
+    management commands, and recreated automatically if a worker dies.
+
+    Use get_worker_pool() instead of instantiating directly.
+    """
+
+    def __init__(self, max_workers: int, use_processes: bool = True):
+        """
+        Initialize the pool (workers start on first use).
+
+        Args:
+            max_workers: Number of workers
+            use_processes: Use processes (True) or threads (False)
+        """
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self._executor = None
+        self._lock = threading.Lock()
+        self._started_at: Optional[float] = None
+        self._stats = {
+            "starts": 0,
+            "restarts": 0,
+            "runs": 0,
+            "chunks_submitted": 0,
+            "tasks_completed": 0,
+            "tasks_failed": 0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        """True if the workers have been started and not shut down"""
+        return self._executor is not None
+
+    def get_executor(self):
+        """
+        Get the running executor, starting the workers if needed.
+
+        Returns:
+            ProcessPoolExecutor or ThreadPoolExecutor
+        """
+        with self._lock:
+            if self._executor is None:
+                if self.use_processes:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers, initializer=_initialize_worker
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="payroll-worker",
+                    )
+                self._started_at = time.monotonic()
+                self._stats["starts"] += 1
+
+                logger.info(
+                    f"Started warm payroll worker pool with {self.max_workers} "
+                    f"{'processes' if self.use_processes else 'threads'}",
+                    extra={
+                        "max_workers": self.max_workers,
+                        "use_processes": self.use_processes,
+                        "action": "worker_pool_started",
+                    },
+                )
+            return self._executor
+
+    def warm_up(self, timeout: Optional[float] = 60.0) -> int:
+        """
+        Start and initialize all workers before the first bulk run.
+
+        Args:
+            timeout: Seconds to wait for the workers
+
+        Returns:
+            int: Number of distinct workers that answered
+        """
+        futures = [self.submit(_worker_ping) for _ in range(self.max_workers)]
+        return len({future.result(timeout=timeout) for future in futures})
+
+    def submit(self, fn: Callable, *args: Any):
+        """Submit a task, restarting the pool once if it is broken"""
+        try:
+            return self.get_executor().submit(fn, *args)
+        except (BrokenProcessPool, RuntimeError) as e:
+            self.restart(reason=str(e))
+            return self.get_executor().submit(fn, *args)
+
+    def restart(self, reason: str = "") -> None:
+        """Replace the workers, e.g. after a worker process died"""
+        logger.warning(
+            f"Restarting payroll worker pool: {reason}",
+            extra={"reason": reason, "action": "worker_pool_restart"},
+        )
+        self.shutdown(wait=False)
+        with self._lock:
+            self._stats["restarts"] += 1
+
+    def record_run(self, chunks: int, completed: int, failed: int) -> None:
+        """Update usage counters after a bulk run"""
+        with self._lock:
+            self._stats["runs"] += 1
+            self._stats["chunks_submitted"] += chunks
+            self._stats["tasks_completed"] += completed
+            self._stats["tasks_failed"] += failed
+
+    def get_statistics(self) -> Dict:
+        """
+        Get pool health and usage statistics.
+
+        Returns:
+            Dict with worker counts, worker state and usage counters
+        """
+        with self._lock:
+            stats = {
+                "max_workers": self.max_workers,
+                "use_processes": self.use_processes,
+                "running": self._executor is not None,
+                "uptime_seconds": (
+                    time.monotonic() - self._started_at
+                    if self._started_at is not None and self._executor is not None
+                    else 0.0
+                ),
+                **self._stats,
+            }
+
+            if self.use_processes and self._executor is not None:
+                processes = getattr(self._executor, "_processes", None) or {}
+                stats["alive_workers"] = sum(
+                    1 for process in processes.values() if process.is_alive()
+                )
+                stats["broken"] = bool(getattr(self._executor, "_broken", False))
+
+        return stats
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the workers.
+
+        Args:
+            wait: Wait for pending tasks to complete
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._started_at = None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+_worker_pools: Dict[Tuple[bool, int], WarmWorkerPool] = {}
+_worker_pools_lock = threading.Lock()
+
+
+def get_worker_pool(max_workers: int, use_processes: bool = True) -> WarmWorkerPool:
+    """
+    Get the process-wide warm pool for a worker type and size.
+
+    Args:
+        max_workers: Number of workers
+        use_processes: Use processes (True) or threads (False)
+
+    Returns:
+        WarmWorkerPool: Shared pool instance
+    """
+    key = (use_processes, max_workers)
+    with _worker_pools_lock:
+        pool = _worker_pools.get(key)
+        if pool is None:
+            pool = _worker_pools[key] = WarmWorkerPool(max_workers, use_processes)
+        return pool
+
+
+def get_worker_pool_statistics() -> List[Dict]:
+    """Statistics of all warm pools of this process"""
+    with _worker_pools_lock:
+        pools = list(_worker_pools.values())
+    return [pool.get_statistics() for pool in pools]
+
+
+def shutdown_worker_pools(wait: bool = True) -> None:
+    """Stop all warm pools (registered with atexit)"""
+    with _worker_pools_lock:
+        pools = list(_worker_pools.values())
+        _worker_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
+
+atexit.register(shutdown_worker_pools, wait=False)
+
+
+def _warm_up_on_worker_ready(sender=None, **kwargs) -> None:
+    """
+    Warm up the worker pool when a Celery worker is ready.
+
+    Only solo and threads Celery pools run tasks in the main worker process.
+    Prefork children are daemonic and calculate with threads (see
+    processes_available), so a pool started in their parent would be unused.
+    """
+    from celery.concurrency.solo import TaskPool as SoloTaskPool
+    from celery.concurrency.thread import TaskPool as ThreadTaskPool
+
+    if not isinstance(getattr(sender, "pool", None), (SoloTaskPool, ThreadTaskPool)):
+        return
+
+    try:
+        started = AdaptiveExecutor().warm_up()
+    except Exception as e:
+        logger.warning(
+            f"Worker pool warm-up failed: {e}",
+            extra={"error": str(e), "action": "worker_pool_warm_up_failed"},
+        )
+        return
+
+    logger.info(
+        f"Warmed up {started} payroll workers for Celery",
+        extra={"workers": started, "action": "worker_pool_warmed_up"},
+    )
+
+
+def install_worker_pool_warm_up() -> None:
+    """Warm up the worker pool when a Celery worker of this process is ready"""
+    from celery.signals import worker_ready
+
+    worker_ready.connect(_warm_up_on_worker_ready, weak=False)
+
+
 class ParallelExecutor:
     """
     Parallel executor for bulk payroll calculations.
@@ -87,17 +445,24 @@ class ParallelExecutor:
 
     Features:
     - Automatic worker count determination
+    - Persistent warm worker pool (see WarmWorkerPool)
+    - Chunked task submission
     - Graceful error handling
     - Task timeout support
     - Progress tracking
     - Clean shutdown
     """
 
+    # Chunks per worker: fewer round trips, still balanced between workers
+    CHUNKS_PER_WORKER = 4
+
     def __init__(
         self,
         max_workers: Optional[int] = None,
         use_processes: bool = True,
         task_timeout: Optional[float] = None,
+        persistent: bool = True,
+        chunk_size: Optional[int] = None,
     ):
         """
         Initialize parallel executor.
@@ -106,10 +471,14 @@ class ParallelExecutor:
             max_workers: Maximum number of workers (None = auto-detect)
             use_processes: Use processes (True) or threads (False)
             task_timeout: Timeout per task in seconds (None = no timeout)
+            persistent: Reuse the process-wide warm pool (False = pool per run)
+            chunk_size: Contexts per submitted task (None = auto)
         """
-        self.max_workers = max_workers or self._get_optimal_worker_count()
         self.use_processes = use_processes
+        self.max_workers = max_workers or self._get_optimal_worker_count()
         self.task_timeout = task_timeout
+        self.persistent = persistent
+        self.chunk_size = chunk_size
         self._executor = None
 
         logger.info(
@@ -119,6 +488,7 @@ class ParallelExecutor:
                 "max_workers": self.max_workers,
                 "use_processes": use_processes,
                 "task_timeout": task_timeout,
+                "persistent": persistent,
                 "action": "parallel_executor_init",
             },
         )
@@ -145,6 +515,40 @@ class ParallelExecutor:
         except Exception:
             return 4  # Safe default
 
+    def _get_pool(self) -> WarmWorkerPool:
+        """Warm pool for the current mode, or a private one-run pool"""
+        if self.persistent:
+            return get_worker_pool(self.max_workers, self.use_processes)
+        if self._executor is None:
+            self._executor = WarmWorkerPool(self.max_workers, self.use_processes)
+        return self._executor
+
+    def warm_up(self, timeout: Optional[float] = 60.0) -> int:
+        """
+        Start and initialize the workers of this executor ahead of a run.
+
+        Args:
+            timeout: Seconds to wait for the workers
+
+        Returns:
+            int: Number of workers that answered (0 if processes are not
+                available here - threads need no warm-up)
+        """
+        if self.use_processes and not processes_available():
+            return 0
+        return self._get_pool().warm_up(timeout)
+
+    def _split_chunks(
+        self, contexts: List[CalculationContext]
+    ) -> List[List[CalculationContext]]:
+        """Split contexts into chunks submitted as single tasks"""
+        chunk_size = self.chunk_size or max(
+            1, math.ceil(len(contexts) / (self.max_workers * self.CHUNKS_PER_WORKER))
+        )
+        return [
+            contexts[i : i + chunk_size] for i in range(0, len(contexts), chunk_size)
+        ]
+
     def map_calculations(
         self,
         contexts: List[CalculationContext],
@@ -165,73 +569,70 @@ class ParallelExecutor:
         if not contexts:
             return {}
 
+        if self.use_processes and not processes_available():
+            logger.info(
+                "Using threads: daemonic process cannot start worker processes",
+                extra={"action": "parallel_executor_thread_fallback"},
+            )
+            self.use_processes = False
+
         start_time = datetime.now()
         results: Dict[int, Union[PayrollResult, Exception]] = {}
+        chunks = self._split_chunks(contexts)
 
         logger.info(
             f"Starting parallel calculation for {len(contexts)} employees",
             extra={
                 "total_contexts": len(contexts),
+                "chunks": len(chunks),
                 "strategy": strategy.value,
                 "max_workers": self.max_workers,
                 "action": "parallel_calculation_start",
             },
         )
 
-        # Choose executor type
-        executor_class = (
-            ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
-        )
+        pool = self._get_pool()
+        total_tasks = len(contexts)
+        completed_tasks = 0
 
-        try:
-            with executor_class(max_workers=self.max_workers) as executor:
-                # Submit all tasks
-                future_to_context = {
-                    executor.submit(
-                        _calculate_payroll_worker, context, strategy
-                    ): context
-                    for context in contexts
-                }
-
-                total_tasks = len(future_to_context)
-                completed_tasks = 0
-
-                # Process completed tasks
-                for future in as_completed(future_to_context):
-                    context = future_to_context[future]
-                    employee_id = context["employee_id"]
-
-                    try:
-                        # Get result with optional timeout
-                        result = future.result(timeout=self.task_timeout)
-                        results[employee_id] = result
-
-                        completed_tasks += 1
-
-                        # Call progress callback if provided
-                        if progress_callback:
-                            progress_callback(completed_tasks, total_tasks, "success")
+        def record(employee_id: int, outcome, status: str) -> None:
+            nonlocal completed_tasks
+            results[employee_id] = outcome
+            completed_tasks += 1
+            if progress_callback:
+                progress_callback(completed_tasks, total_tasks, status)
 
-                        logger.debug(
-                            f"Calculation completed for employee {employee_id}",
-                            extra={
-                                "employee_id": employee_id,
-                                "completed": completed_tasks,
-                                "total": total_tasks,
-                                "action": "calculation_completed",
-                            },
+        try:
+            # Submit all chunks
+            future_to_chunk = {
+                pool.submit(_calculate_payroll_chunk, chunk, strategy): chunk
+                for chunk in chunks
+            }
+
+            # Process completed chunks
+            for future in as_completed(future_to_chunk):
+                chunk = future_to_chunk[future]
+
+                try:
+                    # Get result with optional timeout
+                    chunk_results = future.result(
+                        timeout=(
+                            self.task_timeout * len(chunk)
+                            if self.task_timeout
+                            else None
                         )
-
-                    except TimeoutError:
-                        error = TimeoutError(
-                            f"Calculation timed out after {self.task_timeout}s"
+                    )
+
+                except TimeoutError:
+                    for context in chunk:
+                        employee_id = context["employee_id"]
+                        record(
+                            employee_id,
+                            TimeoutError(
+                                f"Calculation timed out after {self.task_timeout}s"
+                            ),
+                            "timeout",
                         )
-                        results[employee_id] = error
-                        completed_tasks += 1
-
-                        if progress_callback:
-                            progress_callback(completed_tasks, total_tasks, "timeout")
-
                         logger.error(
                             f"Calculation timeout for employee {employee_id}",
                             extra={
@@ -240,23 +641,38 @@ class ParallelExecutor:
                                 "action": "calculation_timeout",
                             },
                         )
+                    continue
 
-                    except Exception as e:
-                        results[employee_id] = e
-                        completed_tasks += 1
+                except BrokenProcessPool:
+                    # A worker died; the remaining chunks fail with the pool
+                    raise
 
-                        if progress_callback:
-                            progress_callback(completed_tasks, total_tasks, "error")
+                except Exception as e:
+                    chunk_results = [(context["employee_id"], e) for context in chunk]
 
+                for employee_id, outcome in chunk_results:
+                    if isinstance(outcome, Exception):
+                        record(employee_id, outcome, "error")
                         logger.error(
-                            f"Calculation error for employee {employee_id}: {e}",
+                            f"Calculation error for employee {employee_id}: {outcome}",
                             extra={
                                 "employee_id": employee_id,
-                                "error": str(e),
-                                "error_type": type(e).__name__,
+                                "error": str(outcome),
+                                "error_type": type(outcome).__name__,
                                 "action": "calculation_error",
                             },
                         )
+                    else:
+                        record(employee_id, outcome, "success")
+                        logger.debug(
+                            f"Calculation completed for employee {employee_id}",
+                            extra={
+                                "employee_id": employee_id,
+                                "completed": completed_tasks,
+                                "total": total_tasks,
+                                "action": "calculation_completed",
+                            },
+                        )
 
         except Exception as e:
             logger.error(
@@ -269,6 +685,10 @@ class ParallelExecutor:
                 exc_info=True,
             )
 
+            # A broken pool cannot be reused by the next run
+            if isinstance(e, BrokenProcessPool):
+                pool.restart(reason=str(e))
+
             # Return errors for all remaining contexts
             for context in contexts:
                 employee_id = context["employee_id"]
@@ -280,6 +700,10 @@ class ParallelExecutor:
         # Count successes and failures
         success_count = sum(1 for r in results.values() if not isinstance(r, Exception))
         error_count = len(results) - success_count
+        pool.record_run(len(chunks), success_count, error_count)
+
+        if not self.persistent:
+            self.shutdown(wait=True)
 
         logger.info(
             f"Parallel calculation completed: {success_count} success, {error_count} errors in {duration:.2f}s",
@@ -295,10 +719,33 @@ class ParallelExecutor:
 
         return results
 
+    def get_statistics(self) -> Dict:
+        """
+        Get executor and worker pool statistics.
+
+        Returns:
+            Dict with executor settings and pool health
+        """
+        stats = {
+            "max_workers": self.max_workers,
+            "use_processes": self.use_processes,
+            "persistent": self.persistent,
+            "chunk_size": self.chunk_size,
+            "task_timeout": self.task_timeout,
+        }
+        if self.persistent:
+            stats["pool"] = get_worker_pool(
+                self.max_workers, self.use_processes
+            ).get_statistics()
+        return stats
+
     def shutdown(self, wait: bool = True):
         """
         Shutdown the executor gracefully.
 
+        The shared warm pool stays up for the next run; use
+        shutdown_worker_pools() to stop it.
+
         Args:
             wait: Wait for pending tasks to complete
         """
@@ -335,6 +782,8 @@ class AdaptiveExecutor(ParallelExecutor):
         max_workers: Optional[int] = None,
         task_timeout: Optional[float] = None,
         prefer_processes: bool = True,
+        persistent: bool = True,
+        chunk_size: Optional[int] = None,
     ):
         """
         Initialize adaptive executor.
@@ -343,12 +792,16 @@ class AdaptiveExecutor(ParallelExecutor):
             max_workers: Maximum number of workers (None = auto)
             task_timeout: Timeout per task in seconds
             prefer_processes: Prefer processes over threads when uncertain
+            persistent: Reuse the process-wide warm pool (False = pool per run)
+            chunk_size: Contexts per submitted task (None = auto)
         """
         # Start with preferred mode
         super().__init__(
             max_workers=max_workers,
             use_processes=prefer_processes,
             task_timeout=task_timeout,
+            persistent=persistent,
+            chunk_size=chunk_size,
         )
         self.prefer_processes = prefer_processes
 
@@ -390,3 +843,9 @@ class AdaptiveExecutor(ParallelExecutor):
 
         # Execute with selected mode
         return super().map_calculations(contexts, strategy, progress_callback)
+
+    def warm_up(self, timeout: Optional[float] = 60.0) -> int:
+        """Warm up the pool map_calculations() uses for large batches"""
+        self.use_processes = self.prefer_processes
+        self.max_workers = self._get_optimal_worker_count()
+        return super().warm_up(timeout)
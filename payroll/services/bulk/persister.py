@@ -8,6 +8,7 @@ Key features:
 - Bulk insert/update for MonthlyPayrollSummary
 - Bulk insert for DailyPayrollCalculation
 - Bulk insert for CompensatoryDay
+- Incremental analytics rollups (bulk writes bypass model signals)
 - Transaction safety
 - Error handling and rollback
 """
@@ -26,6 +27,11 @@ from payroll.models import (
     DailyPayrollCalculation,
     MonthlyPayrollSummary,
 )
+from payroll.services.analytics_rollup import (
+    apply_summary_changes,
+    load_summary_totals,
+    summary_totals,
+)
 from payroll.services.contracts import CalculationContext, PayrollResult
 from users.models import Employee
 from worktime.models import WorkLog
@@ -34,6 +40,23 @@ from .types import BulkLoadedData, BulkSaveResult
 
 logger = logging.getLogger(__name__)
 
+# MonthlyPayrollSummary fields written by a bulk save
+SUMMARY_FIELDS = (
+    "total_gross_pay",
+    "total_hours",
+    "regular_hours",
+    "overtime_hours",
+    "holiday_hours",
+    "sabbath_hours",
+    "base_pay",
+    "overtime_pay",
+    "holiday_pay",
+    "sabbath_pay",
+    "proportional_monthly",
+    "total_bonuses_monthly",
+    "worked_days",
+)
+
 
 class BulkPersister:
     """
@@ -81,8 +104,11 @@ class BulkPersister:
 
         try:
             with transaction.atomic():
+                previous_totals = self._load_previous_totals(results, contexts)
+
                 # Save monthly summaries
                 monthly_result = self._save_monthly_summaries(results, contexts)
+                self._update_rollups(results, contexts, previous_totals)
                 save_result.monthly_summaries_created = monthly_result["created"]
                 save_result.monthly_summaries_updated = monthly_result["updated"]
 
@@ -159,44 +185,21 @@ class BulkPersister:
 
         summaries_to_update = []
         summaries_to_create = []
+        # bulk_update skips auto_now, and find_stale_employee_ids compares
+        # WorkLog.updated_at against last_updated
+        now = timezone.now()
 
         for employee_id, result in results.items():
-            context = contexts[employee_id]
-            breakdown = result.get("breakdown", {})
-
-            # Prepare summary data
-            summary_data = {
-                "total_gross_pay": result.get("total_salary", Decimal("0")),
-                "total_hours": result.get("total_hours", Decimal("0")),
-                "regular_hours": result.get("regular_hours", Decimal("0")),
-                "overtime_hours": result.get("overtime_hours", Decimal("0")),
-                "holiday_hours": result.get("holiday_hours", Decimal("0")),
-                "sabbath_hours": result.get("shabbat_hours", Decimal("0")),
-                "base_pay": Decimal(str(breakdown.get("regular_pay", 0))),
-                "overtime_pay": (
-                    Decimal(str(breakdown.get("overtime_125_pay", 0)))
-                    + Decimal(str(breakdown.get("overtime_150_pay", 0)))
-                ),
-                "holiday_pay": Decimal(str(breakdown.get("holiday_pay", 0))),
-                "sabbath_pay": (
-                    Decimal(str(breakdown.get("sabbath_regular_pay", 0)))
-                    + Decimal(str(breakdown.get("sabbath_overtime_175_pay", 0)))
-                    + Decimal(str(breakdown.get("sabbath_overtime_200_pay", 0)))
-                ),
-                "proportional_monthly": Decimal(
-                    str(breakdown.get("proportional_base", 0))
-                ),
-                "total_bonuses_monthly": Decimal(
-                    str(breakdown.get("total_bonuses_monthly", 0))
-                ),
-                "worked_days": self._count_worked_days(employee_id, context, result),
-            }
+            summary_data = self._build_summary_data(
+                employee_id, result, contexts[employee_id]
+            )
 
             if employee_id in existing_summaries:
                 # Update existing
                 summary = existing_summaries[employee_id]
                 for field, value in summary_data.items():
                     setattr(summary, field, value)
+                summary.last_updated = now
                 summaries_to_update.append(summary)
             else:
                 # Create new
@@ -219,21 +222,7 @@ class BulkPersister:
         if summaries_to_update:
             MonthlyPayrollSummary.objects.bulk_update(
                 summaries_to_update,
-                fields=[
-                    "total_gross_pay",
-                    "total_hours",
-                    "regular_hours",
-                    "overtime_hours",
-                    "holiday_hours",
-                    "sabbath_hours",
-                    "base_pay",
-                    "overtime_pay",
-                    "holiday_pay",
-                    "sabbath_pay",
-                    "proportional_monthly",
-                    "total_bonuses_monthly",
-                    "worked_days",
-                ],
+                fields=[*SUMMARY_FIELDS, "last_updated"],
                 batch_size=self.batch_size,
             )
             updated_count = len(summaries_to_update)
@@ -241,7 +230,7 @@ class BulkPersister:
         logger.info(
             f"Saved monthly summaries: {created_count} created, {updated_count} updated",
             extra={
-                "created": created_count,
+                "created_count": created_count,
                 "updated": updated_count,
                 "action": "monthly_summaries_saved",
             },
@@ -249,6 +238,72 @@ class BulkPersister:
 
         return {"created": created_count, "updated": updated_count}
 
+    def _load_previous_totals(
+        self, results: Dict[int, PayrollResult], contexts: Dict[int, CalculationContext]
+    ) -> Dict:
+        """Totals of the summaries about to be overwritten (for the rollups)"""
+        if not results:
+            return {}
+        first_context = next(iter(contexts.values()))
+        return load_summary_totals(
+            results.keys(), first_context["year"], first_context["month"]
+        )
+
+    def _update_rollups(
+        self,
+        results: Dict[int, PayrollResult],
+        contexts: Dict[int, CalculationContext],
+        previous_totals: Dict,
+    ) -> None:
+        """Apply the written summaries to the monthly analytics rollups"""
+        if not results:
+            return
+        first_context = next(iter(contexts.values()))
+        apply_summary_changes(
+            first_context["year"],
+            first_context["month"],
+            previous_totals,
+            {
+                employee_id: summary_totals(
+                    result.get("total_salary"), result.get("total_hours")
+                )
+                for employee_id, result in results.items()
+            },
+        )
+
+    def _build_summary_data(
+        self, employee_id: int, result: PayrollResult, context: CalculationContext
+    ) -> Dict:
+        """
+        Build MonthlyPayrollSummary field values (SUMMARY_FIELDS) for a result.
+        """
+        breakdown = result.get("breakdown", {})
+
+        return {
+            "total_gross_pay": result.get("total_salary", Decimal("0")),
+            "total_hours": result.get("total_hours", Decimal("0")),
+            "regular_hours": result.get("regular_hours", Decimal("0")),
+            "overtime_hours": result.get("overtime_hours", Decimal("0")),
+            "holiday_hours": result.get("holiday_hours", Decimal("0")),
+            "sabbath_hours": result.get("shabbat_hours", Decimal("0")),
+            "base_pay": Decimal(str(breakdown.get("regular_pay", 0))),
+            "overtime_pay": (
+                Decimal(str(breakdown.get("overtime_125_pay", 0)))
+                + Decimal(str(breakdown.get("overtime_150_pay", 0)))
+            ),
+            "holiday_pay": Decimal(str(breakdown.get("holiday_pay", 0))),
+            "sabbath_pay": (
+                Decimal(str(breakdown.get("sabbath_regular_pay", 0)))
+                + Decimal(str(breakdown.get("sabbath_overtime_175_pay", 0)))
+                + Decimal(str(breakdown.get("sabbath_overtime_200_pay", 0)))
+            ),
+            "proportional_monthly": Decimal(str(breakdown.get("proportional_base", 0))),
+            "total_bonuses_monthly": Decimal(
+                str(breakdown.get("total_bonuses_monthly", 0))
+            ),
+            "worked_days": self._count_worked_days(employee_id, context, result),
+        }
+
     def _save_daily_calculations(
         self,
         results: Dict[int, PayrollResult],
@@ -284,7 +339,34 @@ class BulkPersister:
         if deleted_count > 0:
             logger.debug(f"Deleted {deleted_count} existing daily calculations")
 
-        # Prepare daily calculations
+        daily_calculations = self._build_daily_calculations(results, bulk_data)
+
+        # Bulk create
+        created_count = 0
+        if daily_calculations:
+            DailyPayrollCalculation.objects.bulk_create(
+                daily_calculations, batch_size=self.batch_size
+            )
+            created_count = len(daily_calculations)
+
+        logger.info(
+            f"Created {created_count} daily calculations",
+            extra={
+                "created_count": created_count,
+                "action": "daily_calculations_saved",
+            },
+        )
+
+        return {"created": created_count}
+
+    def _build_daily_calculations(
+        self, results: Dict[int, PayrollResult], bulk_data: BulkLoadedData
+    ) -> List[DailyPayrollCalculation]:
+        """
+        Build unsaved DailyPayrollCalculation rows (one per employee work day).
+
+        Amounts are distributed proportionally to the hours of each day.
+        """
         daily_calculations = []
 
         for employee_id, result in results.items():
@@ -340,20 +422,7 @@ class BulkPersister:
                     )
                 )
 
-        # Bulk create
-        created_count = 0
-        if daily_calculations:
-            DailyPayrollCalculation.objects.bulk_create(
-                daily_calculations, batch_size=self.batch_size
-            )
-            created_count = len(daily_calculations)
-
-        logger.info(
-            f"Created {created_count} daily calculations",
-            extra={"created": created_count, "action": "daily_calculations_saved"},
-        )
-
-        return {"created": created_count}
+        return daily_calculations
 
     def _save_compensatory_days(
         self,
@@ -438,7 +507,7 @@ class BulkPersister:
 
         logger.info(
             f"Created {created_count} compensatory days",
-            extra={"created": created_count, "action": "compensatory_days_saved"},
+            extra={"created_count": created_count, "action": "compensatory_days_saved"},
         )
 
         return {"created": created_count}
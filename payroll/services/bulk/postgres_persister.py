@@ -0,0 +1,245 @@
+"""
+PostgreSQL fast path for bulk payroll persistence.
+
+The ORM path of BulkPersister locks all existing summaries with
+select_for_update(), then rewrites them with bulk_update (compiled into large
+CASE statements) and re-inserts daily rows with multi-row INSERTs. On
+PostgreSQL this backend streams rows with COPY instead:
+
+- Monthly summaries are copied into a temporary table and merged with a
+  single INSERT ... ON CONFLICT (employee_id, year, month) DO UPDATE, so
+  existing rows are locked only for the duration of one statement.
+- Daily calculations (no natural key) are deleted for the period and copied
+  straight into their table.
+
+Rows are still built as model instances by BulkPersister, so field defaults,
+auto_now values and rounding match the ORM path. Compensatory days keep the
+ORM path (bulk_create with ignore_conflicts is already one statement per
+batch).
+
+Example usage:
+    persister = get_bulk_persister(batch_size=1000)  # picks backend by vendor
+    persister.save_all(results, contexts, bulk_data)
+"""
+
+import csv
+import io
+import json
+import logging
+from typing import Dict, Iterable, List, Sequence
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, models
+
+from payroll.models import DailyPayrollCalculation, MonthlyPayrollSummary
+from payroll.services.contracts import CalculationContext, PayrollResult
+
+from .persister import SUMMARY_FIELDS, BulkPersister
+from .types import BulkLoadedData
+
+logger = logging.getLogger(__name__)
+
+# NULL marker of the CSV COPY format used below (keeps '' distinct from NULL)
+COPY_NULL = r"\N"
+
+
+def copy_value(field: models.Field, instance: models.Model, add: bool = True) -> str:
+    """
+    Render a model field value as a CSV COPY value.
+
+    Uses pre_save() so auto_now/auto_now_add and defaults match a regular
+    ORM insert.
+    """
+    value = field.pre_save(instance, add)
+    if value is None:
+        return COPY_NULL
+    if isinstance(field, models.JSONField):
+        return json.dumps(value, cls=field.encoder or DjangoJSONEncoder)
+
+    value = field.get_db_prep_save(value, connection)
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return str(value)
+
+
+def copy_fields(model) -> List[models.Field]:
+    """Concrete fields of a model written by COPY (all but the primary key)"""
+    return [field for field in model._meta.concrete_fields if not field.primary_key]
+
+
+def copy_rows(
+    cursor, table: str, fields: Sequence[models.Field], instances: Iterable
+) -> int:
+    """
+    Stream model instances into a table with COPY ... FROM STDIN.
+
+    Returns:
+        int: Number of rows copied
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    count = 0
+    for instance in instances:
+        writer.writerow([copy_value(field, instance) for field in fields])
+        count += 1
+
+    if not count:
+        return 0
+
+    buffer.seek(0)
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    cursor.copy_expert(
+        f"COPY {table} ({columns}) FROM STDIN "
+        f"WITH (FORMAT csv, NULL '{COPY_NULL}')",
+        buffer,
+    )
+    return count
+
+
+class PostgresBulkPersister(BulkPersister):
+    """
+    BulkPersister writing summaries and daily rows with COPY and one upsert.
+
+    Must run inside save_all()'s transaction (the staging table is dropped
+    on commit).
+    """
+
+    STAGING_TABLE = "payroll_summary_staging"
+
+    def _save_monthly_summaries(
+        self, results: Dict[int, PayrollResult], contexts: Dict[int, CalculationContext]
+    ) -> Dict[str, int]:
+        """
+        Upsert monthly summaries via a COPY-filled staging table.
+
+        Returns:
+            Dict with 'created' and 'updated' counts
+        """
+        if not results:
+            return {"created": 0, "updated": 0}
+
+        first_context = next(iter(contexts.values()))
+        year = first_context["year"]
+        month = first_context["month"]
+
+        summaries = [
+            MonthlyPayrollSummary(
+                employee_id=employee_id,
+                year=year,
+                month=month,
+                **self._build_summary_data(employee_id, result, contexts[employee_id]),
+            )
+            for employee_id, result in results.items()
+        ]
+
+        quote = connection.ops.quote_name
+        table = quote(MonthlyPayrollSummary._meta.db_table)
+        staging = quote(self.STAGING_TABLE)
+        fields = copy_fields(MonthlyPayrollSummary)
+        columns = ", ".join(quote(field.column) for field in fields)
+
+        opts = MonthlyPayrollSummary._meta
+        update_columns = [opts.get_field(name).column for name in SUMMARY_FIELDS]
+        update_columns.append(opts.get_field("last_updated").column)
+        conflict_columns = ", ".join(
+            quote(opts.get_field(name).column) for name in ("employee", "year", "month")
+        )
+        assignments = ", ".join(
+            f"{quote(column)} = EXCLUDED.{quote(column)}" for column in update_columns
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE IF NOT EXISTS {staging} ON COMMIT DROP "
+                f"AS SELECT {columns} FROM {table} WITH NO DATA"
+            )
+            cursor.execute(f"TRUNCATE {staging}")
+            copy_rows(cursor, staging, fields, summaries)
+
+            # xmax = 0 only for rows inserted by this statement
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} "
+                f"ON CONFLICT ({conflict_columns}) DO UPDATE SET {assignments} "
+                f"RETURNING (xmax = 0)"
+            )
+            inserted = [row[0] for row in cursor.fetchall()]
+
+        created_count = sum(1 for was_inserted in inserted if was_inserted)
+        updated_count = len(inserted) - created_count
+
+        logger.info(
+            f"Upserted monthly summaries: {created_count} created, {updated_count} updated",
+            extra={
+                "created_count": created_count,
+                "updated": updated_count,
+                "backend": "postgres_copy",
+                "action": "monthly_summaries_saved",
+            },
+        )
+
+        return {"created": created_count, "updated": updated_count}
+
+    def _save_daily_calculations(
+        self,
+        results: Dict[int, PayrollResult],
+        contexts: Dict[int, CalculationContext],
+        bulk_data: BulkLoadedData,
+    ) -> Dict[str, int]:
+        """
+        Replace the period's daily calculations, copying new rows with COPY.
+
+        Returns:
+            Dict with 'created' count
+        """
+        if not results:
+            return {"created": 0}
+
+        first_context = next(iter(contexts.values()))
+        year = first_context["year"]
+        month = first_context["month"]
+
+        deleted_count, _ = DailyPayrollCalculation.objects.filter(
+            employee_id__in=results.keys(), work_date__year=year, work_date__month=month
+        ).delete()
+
+        if deleted_count > 0:
+            logger.debug(f"Deleted {deleted_count} existing daily calculations")
+
+        daily_calculations = self._build_daily_calculations(results, bulk_data)
+
+        with connection.cursor() as cursor:
+            created_count = copy_rows(
+                cursor,
+                connection.ops.quote_name(DailyPayrollCalculation._meta.db_table),
+                copy_fields(DailyPayrollCalculation),
+                daily_calculations,
+            )
+
+        logger.info(
+            f"Copied {created_count} daily calculations",
+            extra={
+                "created_count": created_count,
+                "backend": "postgres_copy",
+                "action": "daily_calculations_saved",
+            },
+        )
+
+        return {"created": created_count}
+
+
+def get_bulk_persister(batch_size: int = 1000) -> BulkPersister:
+    """
+    Bulk persister for the default database.
+
+    PostgreSQL uses PostgresBulkPersister unless PAYROLL_BULK_USE_COPY is
+    disabled; other databases (SQLite in development and tests) use the ORM
+    path.
+    """
+    if connection.vendor == "postgresql" and getattr(
+        settings, "PAYROLL_BULK_USE_COPY", True
+    ):
+        return PostgresBulkPersister(batch_size=batch_size)
+    return BulkPersister(batch_size=batch_size)
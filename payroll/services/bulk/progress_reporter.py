@@ -10,16 +10,18 @@ Key features:
 - Detailed error logging
 - Performance metrics (calculations/second, avg time)
 - Export capabilities (JSON/CSV reports)
+- Live progress publishing (e.g. to Redis for asynchronous bulk jobs)
 """
 
 import csv
 import json
 import logging
+import time
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 try:
     from tqdm import tqdm
@@ -29,7 +31,7 @@ except ImportError:
     TQDM_AVAILABLE = False
     tqdm = None
 
-from .types import EmployeeCalculationError
+from .types import EmployeeCalculationError, ProcessingStatus
 
 logger = logging.getLogger(__name__)
 
@@ -150,6 +152,8 @@ class ProgressReporter:
         total_employees: int,
         show_progress_bar: bool = True,
         log_level: int = logging.INFO,
+        publisher: Optional[Callable[[Dict[str, Any]], None]] = None,
+        publish_interval: float = 1.0,
     ):
         """
         Initialize progress reporter.
@@ -158,13 +162,20 @@ class ProgressReporter:
             total_employees: Total number of employees to process
             show_progress_bar: Show tqdm progress bar (if available)
             log_level: Logging level for progress messages
+            publisher: Optional callback receiving progress snapshots
+            publish_interval: Minimum seconds between published snapshots
         """
         self.stats = ProgressStats(total_employees=total_employees)
         self.show_progress_bar = show_progress_bar and TQDM_AVAILABLE
         self.log_level = log_level
+        self.publisher = publisher
+        self.publish_interval = publish_interval
 
         self._progress_bar = None
         self._last_update_time = None
+        self._last_publish_time: Optional[float] = None
+        self._phase = ProcessingStatus.PENDING
+        self._in_flight_completed = 0
 
     def start(self):
         """Start progress tracking."""
@@ -190,6 +201,8 @@ class ProgressReporter:
                 bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
             )
 
+        self.publish(force=True)
+
     def update(
         self,
         employee_id: int,
@@ -236,6 +249,8 @@ class ProgressReporter:
         if self._should_log_update():
             self._log_progress()
 
+        self.publish()
+
     def _should_log_update(self) -> bool:
         """Check if we should log a progress update."""
         # Log every 10% completion
@@ -280,6 +295,11 @@ class ProgressReporter:
         # Log final summary
         self._log_summary()
 
+        self._in_flight_completed = 0
+        if self._phase != ProcessingStatus.FAILED:
+            self._phase = ProcessingStatus.COMPLETED
+        self.publish(force=True)
+
     def _log_summary(self):
         """Log final summary."""
         logger.log(
@@ -329,10 +349,99 @@ class ProgressReporter:
         """Update cache statistics."""
         self.stats.cache_hits = hits
         self.stats.cache_misses = misses
+        self.publish()
 
     def update_save_stats(self, records_saved: int):
         """Update database save statistics."""
         self.stats.total_records_saved += records_saved
+        self.publish()
+
+    def set_phase(self, phase: ProcessingStatus):
+        """Record the current processing phase and publish it."""
+        self._phase = phase
+        self.publish(force=True)
+
+    def heartbeat(self, completed: int):
+        """
+        Report work that is done but not yet recorded per employee.
+
+        Parallel calculations report results per employee only after all
+        workers finish; heartbeats keep published progress moving meanwhile.
+
+        Args:
+            completed: Calculations finished so far (0 to reset)
+        """
+        self._in_flight_completed = completed
+        self.publish()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current progress as a JSON-safe dictionary.
+
+        Returns:
+            Dict with counts, rate, ETA and cache statistics
+        """
+        completed = min(
+            self.stats.completed + self._in_flight_completed,
+            self.stats.total_employees,
+        )
+        duration = self.stats.duration_seconds
+        rate = completed / duration if duration > 0 else 0.0
+        remaining = self.stats.total_employees - completed
+
+        return {
+            "phase": self._phase.value,
+            "total_employees": self.stats.total_employees,
+            "completed": completed,
+            "successful": self.stats.successful,
+            "failed": self.stats.failed,
+            "skipped": self.stats.skipped,
+            "percent": (
+                completed / self.stats.total_employees * 100
+                if self.stats.total_employees
+                else 100.0
+            ),
+            "calculations_per_second": rate,
+            "estimated_time_remaining": (
+                remaining / rate if rate > 0 and remaining > 0 else None
+            ),
+            "duration_seconds": duration,
+            "cache_hits": self.stats.cache_hits,
+            "cache_misses": self.stats.cache_misses,
+            "cache_hit_rate": self.stats.cache_hit_rate,
+            "records_saved": self.stats.total_records_saved,
+            "error_count": len(self.stats.errors),
+            "updated_at": datetime.now().isoformat(),
+        }
+
+    def publish(self, force: bool = False):
+        """
+        Send a progress snapshot to the publisher (throttled).
+
+        Publishing errors are logged and never interrupt the calculation.
+
+        Args:
+            force: Publish even if publish_interval has not elapsed
+        """
+        if not self.publisher:
+            return
+
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_publish_time is not None
+            and now - self._last_publish_time < self.publish_interval
+        ):
+            return
+
+        self._last_publish_time = now
+        try:
+            self.publisher(self.snapshot())
+        except Exception as e:
+            logger.warning(
+                f"Failed to publish bulk calculation progress: {e}",
+                extra={"error": str(e), "action": "progress_publish_error"},
+            )
 
     def get_stats(self) -> ProgressStats:
         """Get current statistics."""
@@ -471,5 +580,7 @@ class ProgressReporter:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
+        if exc_type is not None:
+            self._phase = ProcessingStatus.FAILED
         self.finish()
         return False
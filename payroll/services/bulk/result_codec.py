@@ -0,0 +1,272 @@
+"""
+Compact binary codec for cached PayrollResult objects.
+
+BulkCacheManager used to store each result as JSON, with Decimals written as
+floats and the full breakdown and daily_results included, and every cache
+hit was json.loads'ed in full. For 5k-employee runs this dominated Redis
+memory and the MGET payload.
+
+Layout (version 1, big-endian):
+
+    header    "PR", version (B), flags (B), presence mask (H)
+    numbers   NUMERIC_FIELDS in fixed order, each as unscaled int64 and
+              exponent int8 (integer minor units: Decimal("123.45") is
+              (12345, -2)), so totals round-trip exactly
+    sections  SECTION_FIELDS in fixed order, each as length (I) + compact
+              JSON; daily_results is zlib-compressed when large enough
+              (FLAG_ZLIB_DAILY), "extra" holds any other keys
+
+decode_result() returns a CachedPayrollResult, a read-only Mapping that only
+unpacks the fields a caller reads: loading 5k results for persistence never
+decompresses or parses daily details that are not used. Blobs written by the
+previous JSON format are still accepted and decoded to plain dicts.
+
+Nested section values decode like the JSON cache did (Decimals as floats).
+
+Example usage:
+    payload = encode_result(result)
+    cached = decode_result(payload)
+    cached["total_salary"]  # Decimal, daily_results untouched
+"""
+
+import json
+import struct
+import zlib
+from collections.abc import Mapping
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterator, Optional, Union
+
+CODEC_MAGIC = b"PR"
+CODEC_VERSION = 1
+
+NUMERIC_FIELDS = (
+    "total_salary",
+    "total_hours",
+    "regular_hours",
+    "overtime_hours",
+    "holiday_hours",
+    "shabbat_hours",
+    "night_hours",
+)
+SECTION_FIELDS = ("breakdown", "metadata", "daily_results")
+EXTRA_SECTION = "extra"
+
+FLAG_ZLIB_DAILY = 0x01
+
+# daily_results sections smaller than this are not worth compressing
+COMPRESS_MIN_BYTES = 256
+
+_HEADER = struct.Struct(">2sBBH")
+_NUMBER = struct.Struct(">qb")
+_LENGTH = struct.Struct(">I")
+_NUMBERS_OFFSET = _HEADER.size
+_SECTIONS_OFFSET = _NUMBERS_OFFSET + _NUMBER.size * len(NUMERIC_FIELDS)
+_SECTION_BITS = {
+    name: len(NUMERIC_FIELDS) + index
+    for index, name in enumerate(SECTION_FIELDS + (EXTRA_SECTION,))
+}
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+class ResultCodecError(ValueError):
+    """Payload is not a (supported) encoded PayrollResult"""
+
+
+def _json_default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+def _dump_json(value: Any) -> bytes:
+    return json.dumps(value, default=_json_default, separators=(",", ":")).encode()
+
+
+def _pack_number(value: Any) -> Optional[bytes]:
+    """Pack a number as (unscaled, exponent), or None if it does not fit"""
+    if isinstance(value, bool) or not isinstance(value, (Decimal, int, float)):
+        return None
+    number = value if isinstance(value, Decimal) else Decimal(str(value))
+    if not number.is_finite():
+        return None
+    sign, digits, exponent = number.as_tuple()
+    unscaled = int("".join(map(str, digits)) or "0")
+    if sign:
+        unscaled = -unscaled
+    if not (_INT64_MIN <= unscaled <= _INT64_MAX and -128 <= exponent <= 127):
+        return None
+    return _NUMBER.pack(unscaled, exponent)
+
+
+def encode_result(result: Dict[str, Any], compress: bool = True) -> bytes:
+    """
+    Encode a PayrollResult to the compact binary format.
+
+    Args:
+        result: PayrollResult (or any mapping with the same keys)
+        compress: zlib-compress large daily_results sections
+
+    Returns:
+        bytes: Encoded payload
+    """
+    mask = 0
+    flags = 0
+    numbers = []
+    extra = {}
+
+    for bit, name in enumerate(NUMERIC_FIELDS):
+        packed = _pack_number(result[name]) if name in result else None
+        if packed is None:
+            packed = _NUMBER.pack(0, 0)
+            if name in result:
+                extra[name] = result[name]
+        else:
+            mask |= 1 << bit
+        numbers.append(packed)
+
+    sections = []
+    for name in SECTION_FIELDS:
+        data = b""
+        if name in result:
+            mask |= 1 << _SECTION_BITS[name]
+            data = _dump_json(result[name])
+            if name == "daily_results" and compress and len(data) >= COMPRESS_MIN_BYTES:
+                data = zlib.compress(data)
+                flags |= FLAG_ZLIB_DAILY
+        sections.append(_LENGTH.pack(len(data)) + data)
+
+    known = set(NUMERIC_FIELDS) | set(SECTION_FIELDS)
+    extra.update((key, value) for key, value in result.items() if key not in known)
+    data = b""
+    if extra:
+        mask |= 1 << _SECTION_BITS[EXTRA_SECTION]
+        data = _dump_json(extra)
+    sections.append(_LENGTH.pack(len(data)) + data)
+
+    header = _HEADER.pack(CODEC_MAGIC, CODEC_VERSION, flags, mask)
+    return b"".join([header, *numbers, *sections])
+
+
+class CachedPayrollResult(Mapping):
+    """
+    Read-only PayrollResult view over an encoded payload.
+
+    Fields are unpacked on first access and memoized; to_dict() materialises
+    everything (e.g. before mutating or serializing the result).
+    """
+
+    def __init__(self, payload: bytes):
+        if len(payload) < _SECTIONS_OFFSET or payload[:2] != CODEC_MAGIC:
+            raise ResultCodecError("Not an encoded PayrollResult")
+        _, version, self._flags, self._mask = _HEADER.unpack_from(payload)
+        if version != CODEC_VERSION:
+            raise ResultCodecError(f"Unsupported PayrollResult codec v{version}")
+
+        self._payload = payload
+        self._values: Dict[str, Any] = {}
+        self._section_offsets: Dict[str, tuple] = {}
+
+        offset = _SECTIONS_OFFSET
+        for name in SECTION_FIELDS + (EXTRA_SECTION,):
+            if offset + _LENGTH.size > len(payload):
+                raise ResultCodecError("Truncated PayrollResult payload")
+            (length,) = _LENGTH.unpack_from(payload, offset)
+            offset += _LENGTH.size
+            self._section_offsets[name] = (offset, length)
+            offset += length
+        if offset != len(payload):
+            raise ResultCodecError("Truncated PayrollResult payload")
+
+    def _has(self, bit: int) -> bool:
+        return bool(self._mask & (1 << bit))
+
+    def _section(self, name: str) -> Any:
+        offset, length = self._section_offsets[name]
+        data = self._payload[offset : offset + length]
+        if name == "daily_results" and self._flags & FLAG_ZLIB_DAILY:
+            data = zlib.decompress(data)
+        return json.loads(data)
+
+    def _extra(self) -> Dict[str, Any]:
+        if EXTRA_SECTION not in self._values:
+            bit = _SECTION_BITS[EXTRA_SECTION]
+            self._values[EXTRA_SECTION] = (
+                self._section(EXTRA_SECTION) if self._has(bit) else {}
+            )
+        return self._values[EXTRA_SECTION]
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values and key != EXTRA_SECTION:
+            return self._values[key]
+
+        if key in NUMERIC_FIELDS:
+            bit = NUMERIC_FIELDS.index(key)
+            if not self._has(bit):
+                return self._extra()[key]
+            unscaled, exponent = _NUMBER.unpack_from(
+                self._payload, _NUMBERS_OFFSET + _NUMBER.size * bit
+            )
+            value = Decimal(unscaled).scaleb(exponent)
+        elif key in SECTION_FIELDS:
+            if not self._has(_SECTION_BITS[key]):
+                raise KeyError(key)
+            value = self._section(key)
+        else:
+            return self._extra()[key]
+
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for bit, name in enumerate(NUMERIC_FIELDS):
+            if self._has(bit):
+                yield name
+        for name in SECTION_FIELDS:
+            if self._has(_SECTION_BITS[name]):
+                yield name
+        yield from self._extra()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        if key in NUMERIC_FIELDS and self._has(NUMERIC_FIELDS.index(key)):
+            return True
+        if key in SECTION_FIELDS:
+            return self._has(_SECTION_BITS[key])
+        return key in self._extra()
+
+    def __repr__(self):
+        return f"CachedPayrollResult({len(self._payload)} bytes)"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Fully decoded result as a plain dict"""
+        return {key: self[key] for key in self}
+
+
+def decode_result(payload: Union[bytes, str]) -> Mapping:
+    """
+    Decode a cached PayrollResult.
+
+    Args:
+        payload: Encoded payload, or a JSON blob from the previous cache format
+
+    Returns:
+        Mapping: CachedPayrollResult, or a dict for JSON blobs
+
+    Raises:
+        ResultCodecError: If the payload is neither format
+    """
+    if isinstance(payload, str):
+        payload = payload.encode()
+    if payload[:1] == b"{":
+        try:
+            return json.loads(payload)
+        except json.JSONDecodeError as e:
+            raise ResultCodecError(f"Invalid JSON PayrollResult: {e}") from e
+    return CachedPayrollResult(payload)
@@ -0,0 +1,474 @@
+"""
+Vectorized shift segmentation for bulk payroll runs.
+
+EnhancedPayrollStrategy._calculate_shift_critical_points splits every shift
+at its critical points (norm end, overtime tier 1 end, Sabbath start/end)
+and classifies the segments one by one with datetime objects. This module
+does the same for all shifts of a payroll run at once: shifts become int64
+arrays of epoch microseconds and the critical points, segment buckets and
+night hours are computed with NumPy in a single pass.
+
+The strategy turns the resulting segments into a breakdown with the same
+accumulation code as the scalar path, so results are identical (see
+payroll/tests/bulk/test_shift_segmentation.py).
+
+Example usage:
+    engine = ShiftSegmentationEngine(holidays=bulk_data.holidays.keys())
+    segments = engine.segment_shifts(shifts, bulk_data.shabbat_windows)
+    context["shift_segments"] = segments
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from payroll.services.fixed_point import BUCKET_BY_TERRITORY_AND_TIER, SEGMENT_BUCKETS
+from payroll.services.shabbat_windows import ISRAEL_TZ, ShabbatWindowTable
+
+logger = logging.getLogger(__name__)
+
+US_PER_SECOND = 1_000_000
+US_PER_HOUR = 3_600 * US_PER_SECOND
+US_PER_DAY = 86_400 * US_PER_SECOND
+
+NIGHT_START_US = 22 * US_PER_HOUR  # 22:00
+NIGHT_END_US = 6 * US_PER_HOUR  # 06:00
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Sorts after every real timestamp; marks unused critical point slots
+_NO_POINT = np.iinfo(np.int64).max
+
+# Bucket by territory (row: weekday, Sabbath, holiday) and overtime tier (column).
+# Holiday overtime is paid at the Sabbath overtime rates.
+_BUCKET_BY_TERRITORY_AND_TIER = np.array(BUCKET_BY_TERRITORY_AND_TIER)
+
+# Matches the epsilon used for tier boundaries by the scalar path
+_TIER_EPSILON_HOURS = 0.0001
+
+
+def to_epoch_us(moment: datetime) -> int:
+    """Convert an aware datetime to integer microseconds since the Unix epoch"""
+    delta = moment - EPOCH
+    return (delta.days * 86_400 + delta.seconds) * US_PER_SECOND + delta.microseconds
+
+
+def _hours_to_decimal(microseconds) -> Decimal:
+    """Convert a duration to Decimal hours exactly like the scalar path"""
+    return Decimal(str(int(microseconds) / US_PER_SECOND / 3600))
+
+
+@dataclass(frozen=True)
+class ShiftSegments:
+    """
+    Critical points segmentation of one shift.
+
+    Attributes:
+        segments: (bucket index into SEGMENT_BUCKETS, hours) in time order
+        night_hours: Hours inside the 22:00-06:00 night period
+        durations_us: Segment durations in microseconds (fixed-point mode)
+        night_us: Night period time in microseconds (fixed-point mode)
+    """
+
+    segments: Tuple[Tuple[int, Decimal], ...]
+    night_hours: Decimal
+    durations_us: Tuple[int, ...] = ()
+    night_us: int = 0
+
+
+@dataclass
+class SegmentationArrays:
+    """Raw NumPy output of ShiftSegmentationEngine.segment_arrays"""
+
+    shift_index: np.ndarray  # (segments,) shift of each segment, ascending
+    segment_us: np.ndarray  # (segments,) segment duration in microseconds
+    bucket: np.ndarray  # (segments,) index into SEGMENT_BUCKETS
+    night_us: np.ndarray  # (shifts, 2) night hour pieces, -1 if unused
+    is_night_shift: np.ndarray  # (shifts,) bool
+    bucket_hours: np.ndarray  # (shifts, buckets) float hours per bucket
+
+
+def lookup_sabbath_windows(
+    table: ShabbatWindowTable, moments_us: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized ShabbatWindowTable.window_for over epoch microseconds.
+
+    Args:
+        table: Month-scoped Shabbat window table
+        moments_us: Shift starts in epoch microseconds
+
+    Returns:
+        Tuple of window starts, window ends (epoch microseconds) and a mask of
+        shifts the table covers (same semantics as window_for returning None)
+    """
+    windows = table.windows
+    count = len(moments_us)
+    if not windows:
+        empty = np.zeros(count, dtype=np.int64)
+        return empty, empty, np.zeros(count, dtype=bool)
+
+    starts = np.array([to_epoch_us(w.start) for w in windows], dtype=np.int64)
+    ends = np.array([to_epoch_us(w.end) for w in windows], dtype=np.int64)
+    fridays = np.array([w.friday_date.toordinal() for w in windows], dtype=np.int64)
+    week_starts = np.array(
+        [
+            to_epoch_us(
+                ISRAEL_TZ.localize(
+                    datetime.combine(
+                        w.friday_date - timedelta(days=5), datetime.min.time()
+                    )
+                )
+            )
+            for w in windows
+        ],
+        dtype=np.int64,
+    )
+
+    index = np.searchsorted(starts, moments_us, side="right")
+    previous = np.clip(index - 1, 0, len(windows) - 1)
+    upcoming = np.clip(index, 0, len(windows) - 1)
+
+    containing = (index > 0) & (moments_us < ends[previous])
+    follows_previous_week = (index > 0) & (fridays[upcoming] - fridays[previous] <= 7)
+    upcoming_found = (
+        ~containing
+        & (index < len(windows))
+        & (follows_previous_week | (moments_us >= week_starts[upcoming]))
+    )
+
+    chosen = np.where(containing, previous, upcoming)
+    return starts[chosen], ends[chosen], containing | upcoming_found
+
+
+class ShiftSegmentationEngine:
+    """
+    Batch critical points segmentation for many shifts.
+
+    Produces the same segments as EnhancedPayrollStrategy's scalar path for
+    shifts given in UTC (as loaded from the database).
+    """
+
+    def __init__(
+        self,
+        holidays: Iterable[date] = (),
+        day_norm_hours: Decimal = Decimal("8.6"),
+        night_norm_hours: Decimal = Decimal("7.0"),
+        overtime_tier1_hours: Decimal = Decimal("2.0"),
+        night_detection_minimum: Decimal = Decimal("2.0"),
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            holidays: Holiday dates (segments whose midpoint falls on them)
+            day_norm_hours: Daily norm of day shifts
+            night_norm_hours: Daily norm of night shifts
+            overtime_tier1_hours: Length of the first overtime tier
+            night_detection_minimum: Night period hours that make a night shift
+        """
+        self.holiday_ordinals = np.array(
+            sorted({day.toordinal() - EPOCH_ORDINAL for day in holidays}),
+            dtype=np.int64,
+        )
+        self.day_norm_hours = float(day_norm_hours)
+        self.night_norm_hours = float(night_norm_hours)
+        self.tier1_hours = float(overtime_tier1_hours)
+        self.night_detection_minimum = night_detection_minimum
+
+        # Same microsecond rounding as timedelta(hours=float(...)) in the scalar path
+        self._day_norm_us = timedelta(hours=self.day_norm_hours) // timedelta(
+            microseconds=1
+        )
+        self._night_norm_us = timedelta(hours=self.night_norm_hours) // timedelta(
+            microseconds=1
+        )
+        self._tier1_us = timedelta(hours=self.tier1_hours) // timedelta(microseconds=1)
+
+    @classmethod
+    def for_strategy(cls, strategy_class, holidays: Iterable[date] = ()):
+        """Create an engine using the norms of a payroll strategy class"""
+        return cls(
+            holidays=holidays,
+            day_norm_hours=strategy_class.DAY_NORM,
+            night_norm_hours=strategy_class.NIGHT_NORM,
+            overtime_tier1_hours=strategy_class.OVERTIME_TIER1_HOURS,
+            night_detection_minimum=strategy_class.NIGHT_DETECTION_MINIMUM,
+        )
+
+    def segment_shifts(
+        self,
+        shifts: Sequence[Tuple[datetime, datetime]],
+        shabbat_windows: ShabbatWindowTable,
+    ) -> Dict[Tuple[datetime, datetime], ShiftSegments]:
+        """
+        Segment shifts given as (check_in, check_out) pairs.
+
+        Shifts that are not in UTC or not covered by the Shabbat window table
+        are skipped - the strategy calculates those with the scalar path.
+
+        Args:
+            shifts: (check_in, check_out) pairs of aware datetimes
+            shabbat_windows: Shabbat window table of the payroll month
+
+        Returns:
+            Dict mapping (check_in, check_out) to ShiftSegments
+        """
+        zero = timedelta(0)
+        candidates = [
+            (check_in, check_out)
+            for check_in, check_out in shifts
+            if check_in is not None
+            and check_out is not None
+            and check_in.utcoffset() == zero
+            and check_out.utcoffset() == zero
+        ]
+        if not candidates:
+            return {}
+
+        starts_us = np.array([to_epoch_us(s) for s, _ in candidates], dtype=np.int64)
+        ends_us = np.array([to_epoch_us(e) for _, e in candidates], dtype=np.int64)
+        start_offsets_us = np.array(
+            [_israel_offset_us(s) for s, _ in candidates], dtype=np.int64
+        )
+        end_offsets_us = np.array(
+            [_israel_offset_us(e) for _, e in candidates], dtype=np.int64
+        )
+
+        sabbath_starts, sabbath_ends, covered = lookup_sabbath_windows(
+            shabbat_windows, starts_us
+        )
+
+        arrays = self.segment_arrays(
+            starts_us,
+            ends_us,
+            start_offsets_us,
+            end_offsets_us,
+            sabbath_starts,
+            sabbath_ends,
+        )
+        segments = self.to_shift_segments(arrays)
+
+        result = {}
+        for i, shift in enumerate(candidates):
+            if covered[i]:
+                result[shift] = segments[i]
+
+        logger.debug(
+            f"Segmented {len(result)} of {len(shifts)} shifts in batch",
+            extra={
+                "shifts_total": len(shifts),
+                "shifts_segmented": len(result),
+                "segments": int(len(arrays.bucket)),
+                "action": "batch_shift_segmentation",
+            },
+        )
+        return result
+
+    def segment_arrays(
+        self,
+        starts_us: np.ndarray,
+        ends_us: np.ndarray,
+        start_offsets_us: np.ndarray,
+        end_offsets_us: np.ndarray,
+        sabbath_starts_us: np.ndarray,
+        sabbath_ends_us: np.ndarray,
+    ) -> SegmentationArrays:
+        """
+        Segment shifts given as arrays of epoch microseconds.
+
+        Args:
+            starts_us: Shift starts
+            ends_us: Shift ends
+            start_offsets_us: Israel UTC offset at each shift start
+            end_offsets_us: Israel UTC offset at each shift end
+            sabbath_starts_us: Start of the Sabbath window of each shift
+            sabbath_ends_us: End of the Sabbath window of each shift
+
+        Returns:
+            SegmentationArrays: Segments, night hours and per-bucket hours
+        """
+        night_us = self._night_pieces(
+            starts_us, ends_us, start_offsets_us, end_offsets_us
+        )
+        is_night_shift = self._is_night_shift(night_us)
+
+        # Step 2: critical points, one row per shift
+        norm_end = starts_us + np.where(
+            is_night_shift, self._night_norm_us, self._day_norm_us
+        )
+        tier1_end = norm_end + self._tier1_us
+
+        def inside(points):
+            return np.where(
+                (starts_us <= points) & (points <= ends_us), points, _NO_POINT
+            )
+
+        points = np.stack(
+            [
+                starts_us,
+                ends_us,
+                inside(sabbath_starts_us),
+                inside(sabbath_ends_us),
+                inside(norm_end),
+                inside(tier1_end),
+            ],
+            axis=1,
+        )
+        points.sort(axis=1)
+
+        # Step 3: classify segments between consecutive critical points
+        segment_starts = points[:, :-1]
+        segment_ends = points[:, 1:]
+        valid = (segment_ends != _NO_POINT) & (segment_ends > segment_starts)
+        shift_index, column = np.nonzero(valid)
+
+        seg_start = segment_starts[shift_index, column]
+        seg_us = segment_ends[shift_index, column] - seg_start
+
+        # Midpoint rounded half-to-even like timedelta / 2
+        half = seg_us // 2
+        half += (seg_us % 2 == 1) & (half % 2 == 1)
+        midpoint = seg_start + half
+
+        in_sabbath = (sabbath_starts_us[shift_index] <= midpoint) & (
+            midpoint < sabbath_ends_us[shift_index]
+        )
+        in_holiday = np.isin(midpoint // US_PER_DAY, self.holiday_ordinals)
+        territory = np.where(in_sabbath, 1, np.where(in_holiday, 2, 0))
+
+        worked_hours = (seg_start - starts_us[shift_index]) / US_PER_HOUR
+        norm_hours = np.where(
+            is_night_shift[shift_index], self.night_norm_hours, self.day_norm_hours
+        )
+        tier = np.where(
+            worked_hours < norm_hours - _TIER_EPSILON_HOURS,
+            0,
+            np.where(
+                worked_hours < norm_hours + self.tier1_hours - _TIER_EPSILON_HOURS,
+                1,
+                2,
+            ),
+        )
+        bucket = _BUCKET_BY_TERRITORY_AND_TIER[territory, tier]
+
+        bucket_hours = np.zeros((len(starts_us), len(SEGMENT_BUCKETS)))
+        np.add.at(bucket_hours, (shift_index, bucket), seg_us / US_PER_HOUR)
+
+        return SegmentationArrays(
+            shift_index=shift_index,
+            segment_us=seg_us,
+            bucket=bucket,
+            night_us=night_us,
+            is_night_shift=is_night_shift,
+            bucket_hours=bucket_hours,
+        )
+
+    def to_shift_segments(self, arrays: SegmentationArrays) -> List[ShiftSegments]:
+        """
+        Convert segmentation arrays to per-shift Decimal segments.
+
+        Args:
+            arrays: Output of segment_arrays
+
+        Returns:
+            List[ShiftSegments]: One entry per shift, in input order
+        """
+        shift_count = len(arrays.is_night_shift)
+        boundaries = np.searchsorted(arrays.shift_index, np.arange(shift_count + 1))
+        segment_us = arrays.segment_us.tolist()
+        segment_hours = [_hours_to_decimal(us) for us in segment_us]
+        buckets = arrays.bucket.tolist()
+        night_us = np.where(arrays.night_us >= 0, arrays.night_us, 0).sum(axis=1)
+
+        result = []
+        for i in range(shift_count):
+            first, last = boundaries[i], boundaries[i + 1]
+            result.append(
+                ShiftSegments(
+                    segments=tuple(zip(buckets[first:last], segment_hours[first:last])),
+                    night_hours=_night_hours_decimal(arrays.night_us[i]),
+                    durations_us=tuple(segment_us[first:last]),
+                    night_us=int(night_us[i]),
+                )
+            )
+        return result
+
+    def _night_pieces(self, starts_us, ends_us, start_offsets_us, end_offsets_us):
+        """
+        Night period (22:00-06:00 Israel time) pieces of each shift.
+
+        Mirrors EnhancedPayrollStrategy._calculate_night_hours: shifts crossing
+        midnight have an evening piece and a morning piece, other shifts one.
+        """
+        local_starts = starts_us + start_offsets_us
+        local_ends = ends_us + end_offsets_us
+        start_days = local_starts // US_PER_DAY
+        end_days = local_ends // US_PER_DAY
+        start_tods = local_starts - start_days * US_PER_DAY
+        end_tods = local_ends - end_days * US_PER_DAY
+
+        # Case 1: shift crosses midnight
+        evening = np.where(
+            start_tods < NIGHT_START_US, 2 * US_PER_HOUR, US_PER_DAY - start_tods
+        )
+        morning = np.where(end_tods <= NIGHT_END_US, end_tods, NIGHT_END_US)
+
+        # Case 2: shift within one day
+        duration = ends_us - starts_us
+        night_start_real = start_days * US_PER_DAY + NIGHT_START_US - start_offsets_us
+        same_day = np.select(
+            [
+                start_tods >= NIGHT_START_US,
+                end_tods >= NIGHT_START_US,
+                (end_tods <= NIGHT_END_US) & (start_tods <= NIGHT_END_US),
+                end_tods <= NIGHT_END_US,
+                (start_tods < NIGHT_END_US) & (NIGHT_END_US < end_tods),
+            ],
+            [
+                duration,
+                ends_us - night_start_real,
+                duration,
+                0,
+                NIGHT_END_US - start_tods,
+            ],
+            default=0,
+        )
+
+        crosses = end_days > start_days
+        return np.stack(
+            [np.where(crosses, evening, same_day), np.where(crosses, morning, -1)],
+            axis=1,
+        )
+
+    def _is_night_shift(self, night_us: np.ndarray) -> np.ndarray:
+        """Night shift flags; near-threshold shifts are decided in Decimal"""
+        total_hours = np.where(night_us >= 0, night_us, 0).sum(axis=1) / US_PER_HOUR
+        threshold = float(self.night_detection_minimum)
+        is_night_shift = total_hours > threshold
+
+        for i in np.flatnonzero(np.abs(total_hours - threshold) < 1e-9):
+            is_night_shift[i] = (
+                _night_hours_decimal(night_us[i]) > self.night_detection_minimum
+            )
+        return is_night_shift
+
+
+def _night_hours_decimal(pieces) -> Decimal:
+    """Sum night pieces in Decimal exactly like the scalar path"""
+    evening, morning = int(pieces[0]), int(pieces[1])
+    if morning < 0:
+        return Decimal("0") if evening == 0 else _hours_to_decimal(evening)
+    return _hours_to_decimal(evening) + _hours_to_decimal(morning)
+
+
+def _israel_offset_us(moment: datetime) -> int:
+    """UTC offset of Israel time at the given moment, in microseconds"""
+    offset = moment.astimezone(ISRAEL_TZ).utcoffset()
+    return (offset.days * 86_400 + offset.seconds) * US_PER_SECOND
@@ -0,0 +1,412 @@
+"""
+Streaming bulk payroll calculation with bounded memory.
+
+BulkEnhancedPayrollService.calculate_bulk() loads data, builds contexts and
+keeps results for all employees before persisting them in one transaction.
+The streaming mode processes employees in fixed-size chunks instead:
+
+    for each chunk: load -> check cache -> calculate -> cache -> persist
+
+Every chunk is committed in its own transaction and yielded as a
+BulkChunkResult, so peak memory is bounded by the chunk size rather than the
+tenant size. Completed chunks are recorded in a checkpoint in the shared
+Redis cache (CACHES in settings), keyed by run_id, so rerunning with the
+same run_id - in a new process or on another host - after a crash skips the
+chunks that were already committed. If the checkpoint cannot be read, the
+run starts over; persisting a chunk again only rewrites the same rows.
+
+Example usage:
+    service = StreamingBulkPayrollService(chunk_size=500)
+    for chunk in service.iter_chunks(employee_ids, 2025, 10, run_id="oct-2025"):
+        ...
+
+    # or aggregated, without keeping per-employee results
+    result = service.calculate_bulk(employee_ids, 2025, 10, run_id="oct-2025")
+"""
+
+import hashlib
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+
+from payroll.services.enums import CalculationStrategy
+
+from .bulk_service import BulkEnhancedPayrollService
+from .progress_reporter import ProgressReporter
+from .types import (
+    BulkCalculationResult,
+    BulkChunkResult,
+    EmployeeCalculationError,
+    ProcessingStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+CHECKPOINT_KEY_PREFIX = "payroll_bulk_stream"
+
+
+def chunk_employee_ids(employee_ids: List[int], chunk_size: int) -> List[List[int]]:
+    """Split employee IDs into sorted chunks (stable across runs)"""
+    ordered = sorted(set(employee_ids))
+    chunk_size = max(1, chunk_size)
+    return [ordered[i : i + chunk_size] for i in range(0, len(ordered), chunk_size)]
+
+
+class StreamingCheckpoint:
+    """
+    Record of the chunks a streaming run has committed, in the shared cache.
+
+    The checkpoint is bound to the run's period, strategy and chunk layout;
+    a rerun with different parameters starts from scratch.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        year: int,
+        month: int,
+        strategy: CalculationStrategy,
+        chunks: List[List[int]],
+    ):
+        self.run_id = run_id
+        self.key = f"{CHECKPOINT_KEY_PREFIX}:{run_id}"
+
+        layout = repr((year, month, strategy.value, chunks)).encode()
+        self.fingerprint = hashlib.sha256(layout).hexdigest()
+
+    @property
+    def ttl(self) -> int:
+        return getattr(settings, "PAYROLL_BULK_STREAM_CHECKPOINT_TTL", 7 * 86400)
+
+    def completed_chunks(self) -> Set[int]:
+        """Indexes of chunks committed by earlier runs"""
+        try:
+            state = cache.get(self.key)
+        except Exception as e:
+            logger.warning(f"Could not read checkpoint of run {self.run_id}: {e}")
+            return set()
+        if not state or state.get("fingerprint") != self.fingerprint:
+            return set()
+        return set(state["completed_chunks"])
+
+    def mark_completed(self, chunk_index: int) -> None:
+        """Record a committed chunk (called after its transaction commits)"""
+        completed = self.completed_chunks()
+        completed.add(chunk_index)
+        try:
+            cache.set(
+                self.key,
+                {
+                    "fingerprint": self.fingerprint,
+                    "completed_chunks": sorted(completed),
+                    "updated_at": datetime.now().isoformat(),
+                },
+                timeout=self.ttl,
+            )
+        except Exception as e:
+            # The chunk is committed; a resumed run only recalculates it
+            logger.warning(
+                f"Could not checkpoint chunk {chunk_index} of run {self.run_id}: {e}"
+            )
+
+    def clear(self) -> None:
+        cache.delete(self.key)
+
+
+class StreamingBulkPayrollService(BulkEnhancedPayrollService):
+    """
+    Bulk payroll calculation in committed, fixed-size chunks.
+
+    Runs must not be wrapped in an outer transaction, otherwise chunks are
+    not committed independently.
+    """
+
+    def __init__(self, chunk_size: Optional[int] = None, **kwargs):
+        """
+        Initialize streaming service.
+
+        Args:
+            chunk_size: Employees per chunk (default PAYROLL_BULK_CHUNK_SIZE)
+            **kwargs: BulkEnhancedPayrollService options
+        """
+        super().__init__(**kwargs)
+        self.chunk_size = chunk_size or getattr(
+            settings, "PAYROLL_BULK_CHUNK_SIZE", DEFAULT_CHUNK_SIZE
+        )
+
+    def iter_chunks(
+        self,
+        employee_ids: List[int],
+        year: int,
+        month: int,
+        strategy: CalculationStrategy = CalculationStrategy.ENHANCED,
+        save_to_db: bool = True,
+        run_id: Optional[str] = None,
+        progress: Optional[ProgressReporter] = None,
+    ) -> Iterator[BulkChunkResult]:
+        """
+        Calculate and persist employees chunk by chunk.
+
+        Args:
+            employee_ids: Employee IDs to process
+            year: Year for calculation
+            month: Month for calculation
+            strategy: Calculation strategy
+            save_to_db: Persist each chunk before yielding it
+            run_id: Checkpoint ID; chunks committed under it are skipped
+            progress: Progress reporter (a silent one is used if omitted)
+
+        Yields:
+            BulkChunkResult: One per chunk, after the chunk is committed
+
+        Raises:
+            RuntimeError: If a chunk cannot be persisted (earlier chunks stay
+                committed and are skipped when resumed with the same run_id)
+        """
+        chunks = chunk_employee_ids(employee_ids, self.chunk_size)
+        progress = progress or ProgressReporter(
+            total_employees=sum(len(chunk) for chunk in chunks),
+            show_progress_bar=False,
+        )
+
+        checkpoint = None
+        completed_chunks: Set[int] = set()
+        if run_id and save_to_db:
+            checkpoint = StreamingCheckpoint(run_id, year, month, strategy, chunks)
+            completed_chunks = checkpoint.completed_chunks()
+            if completed_chunks:
+                logger.info(
+                    f"Resuming streaming run {run_id}: "
+                    f"{len(completed_chunks)}/{len(chunks)} chunks already committed",
+                    extra={
+                        "run_id": run_id,
+                        "completed_chunks": len(completed_chunks),
+                        "total_chunks": len(chunks),
+                        "action": "bulk_stream_resume",
+                    },
+                )
+
+        for chunk_index, chunk_ids in enumerate(chunks):
+            if chunk_index in completed_chunks:
+                for employee_id in chunk_ids:
+                    progress.update(employee_id, status="skipped")
+                yield BulkChunkResult(
+                    chunk_index=chunk_index, employee_ids=chunk_ids, resumed=True
+                )
+                continue
+
+            chunk = self._process_chunk(
+                chunk_index, chunk_ids, year, month, strategy, save_to_db, progress
+            )
+            if checkpoint:
+                checkpoint.mark_completed(chunk_index)
+
+            logger.debug(
+                f"Committed chunk {chunk_index + 1}/{len(chunks)}: {chunk}",
+                extra={
+                    "run_id": run_id,
+                    "chunk_index": chunk_index,
+                    "saved_records": chunk.saved_records,
+                    "action": "bulk_stream_chunk_committed",
+                },
+            )
+            yield chunk
+
+    def _process_chunk(
+        self,
+        chunk_index: int,
+        chunk_ids: List[int],
+        year: int,
+        month: int,
+        strategy: CalculationStrategy,
+        save_to_db: bool,
+        progress: ProgressReporter,
+    ) -> BulkChunkResult:
+        """Load, calculate, cache and persist one chunk"""
+        start_time = datetime.now()
+        errors_before = len(progress.stats.errors)
+
+        progress.set_phase(ProcessingStatus.LOADING_DATA)
+        versions = self._snapshot_versions(chunk_ids, year, month)
+        bulk_data = self._load_data(chunk_ids, year, month, progress)
+        valid_employee_ids = list(bulk_data.employees.keys())
+
+        progress.set_phase(ProcessingStatus.CHECKING_CACHE)
+        cached_results = self._load_from_cache(
+            valid_employee_ids, year, month, progress, versions
+        )
+
+        progress.set_phase(ProcessingStatus.CALCULATING)
+        employee_ids_to_calculate = [
+            emp_id for emp_id in valid_employee_ids if emp_id not in cached_results
+        ]
+        calculated_results = {}
+        if employee_ids_to_calculate:
+            calculated_results = self._calculate_employees(
+                employee_ids_to_calculate, bulk_data, year, month, strategy, progress
+            )
+
+        if self.cache_manager and calculated_results:
+            self.cache_manager.set_many_monthly_summaries(
+                calculated_results, year, month, versions=versions
+            )
+
+        results = {**cached_results, **calculated_results}
+
+        saved_records = 0
+        if save_to_db and results:
+            progress.set_phase(ProcessingStatus.PERSISTING)
+            contexts = self._build_contexts(valid_employee_ids, bulk_data, year, month)
+            save_result = self.persister.save_all(results, contexts, bulk_data)
+            if save_result.errors:
+                raise RuntimeError(
+                    f"Chunk {chunk_index} could not be saved: "
+                    f"{save_result.errors[0]['message']}"
+                )
+            saved_records = save_result.total_records
+            progress.update_save_stats(saved_records)
+
+        return BulkChunkResult(
+            chunk_index=chunk_index,
+            employee_ids=chunk_ids,
+            results=results,
+            errors={
+                error.employee_id: error
+                for error in progress.stats.errors[errors_before:]
+            },
+            cached_count=len(cached_results),
+            saved_records=saved_records,
+            db_queries_count=self.data_loader.query_count,
+            duration_seconds=(datetime.now() - start_time).total_seconds(),
+        )
+
+    def calculate_bulk(
+        self,
+        employee_ids: List[int],
+        year: int,
+        month: int,
+        strategy: CalculationStrategy = CalculationStrategy.ENHANCED,
+        save_to_db: bool = True,
+        use_cache_warmup: bool = False,
+        export_stats_path: Optional[Path] = None,
+        progress_publisher: Optional[Callable[[Dict], None]] = None,
+        run_id: Optional[str] = None,
+        keep_results: bool = False,
+    ) -> BulkCalculationResult:
+        """
+        Run all chunks and aggregate their statistics.
+
+        Same interface as BulkEnhancedPayrollService.calculate_bulk(), plus:
+
+        Args:
+            run_id: Checkpoint ID for resuming an interrupted run
+            keep_results: Keep per-employee results in the returned result
+                (off by default to keep memory bounded)
+
+        Returns:
+            BulkCalculationResult: Aggregated statistics (results only with
+                keep_results)
+        """
+        start_time = datetime.now()
+        results: Dict[int, Any] = {}
+        cached_count = 0
+        db_queries = 0
+        chunk_count = 0
+
+        logger.info(
+            f"Starting streaming bulk calculation for {len(employee_ids)} employees "
+            f"in chunks of {self.chunk_size} ({year}-{month:02d})",
+            extra={
+                "employee_count": len(employee_ids),
+                "chunk_size": self.chunk_size,
+                "run_id": run_id,
+                "year": year,
+                "month": month,
+                "action": "bulk_stream_start",
+            },
+        )
+
+        progress = ProgressReporter(
+            total_employees=len(set(employee_ids)),
+            show_progress_bar=self.show_progress,
+            publisher=progress_publisher,
+        )
+
+        try:
+            with progress:
+                for chunk in self.iter_chunks(
+                    employee_ids, year, month, strategy, save_to_db, run_id, progress
+                ):
+                    chunk_count += 1
+                    cached_count += chunk.cached_count
+                    db_queries += chunk.db_queries_count
+                    if keep_results:
+                        results.update(chunk.results)
+
+            result = self._build_result(
+                results, progress.get_stats(), start_time, cached_count
+            )
+            result.db_queries_count = db_queries
+
+            if export_stats_path:
+                progress.export_to_json(export_stats_path)
+                progress.export_errors_to_csv(
+                    export_stats_path.parent / f"{export_stats_path.stem}_errors.csv"
+                )
+
+            logger.info(
+                f"Streaming bulk calculation completed: {result.successful_count} "
+                f"successful, {result.failed_count} failed in {chunk_count} chunks "
+                f"({result.duration_seconds:.2f}s)",
+                extra={
+                    "run_id": run_id,
+                    "successful": result.successful_count,
+                    "failed": result.failed_count,
+                    "chunks": chunk_count,
+                    "duration_seconds": result.duration_seconds,
+                    "action": "bulk_stream_complete",
+                },
+            )
+            return result
+
+        except Exception as e:
+            end_time = datetime.now()
+            logger.error(
+                f"Streaming bulk calculation failed after {chunk_count} chunks: {e}",
+                extra={
+                    "run_id": run_id,
+                    "chunks_committed": chunk_count,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "action": "bulk_stream_error",
+                },
+                exc_info=True,
+            )
+            stats = progress.get_stats()
+            return BulkCalculationResult(
+                results=results,
+                errors={
+                    0: EmployeeCalculationError(
+                        employee_id=0,
+                        error_type=type(e).__name__,
+                        error_message=str(e),
+                        timestamp=end_time,
+                    )
+                },
+                total_count=stats.total_employees,
+                successful_count=stats.successful,
+                failed_count=stats.total_employees - stats.successful - stats.skipped,
+                cached_count=cached_count,
+                calculated_count=stats.successful - cached_count,
+                duration_seconds=(end_time - start_time).total_seconds(),
+                start_time=start_time,
+                end_time=end_time,
+                cache_hit_rate=stats.cache_hit_rate,
+                db_queries_count=db_queries,
+                status=ProcessingStatus.FAILED,
+            )
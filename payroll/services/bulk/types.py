@@ -12,6 +12,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
 from payroll.services.contracts import PayrollResult
+from payroll.services.shabbat_windows import ShabbatWindowTable
 
 
 class ProcessingStatus(Enum):
@@ -114,6 +115,9 @@ class BulkLoadedData:
     year: int
     month: int
 
+    # Sorted Shabbat intervals built from shabbat_times for O(log n) lookup
+    shabbat_windows: Optional[ShabbatWindowTable] = None
+
     def get_employee(self, employee_id: int) -> Optional[EmployeeData]:
         """Get employee data by ID."""
         return self.employees.get(employee_id)
@@ -304,6 +308,37 @@ class BulkSaveResult:
         )
 
 
+@dataclass
+class BulkChunkResult:
+    """
+    Result of one chunk of a streaming bulk calculation.
+
+    Yielded once the chunk is calculated, cached and committed.
+    """
+
+    chunk_index: int
+    employee_ids: List[int]
+
+    # Results and errors of this chunk only
+    results: Dict[int, PayrollResult] = field(default_factory=dict)
+    errors: Dict[int, EmployeeCalculationError] = field(default_factory=dict)
+
+    cached_count: int = 0
+    saved_records: int = 0
+    db_queries_count: int = 0
+    duration_seconds: float = 0.0
+
+    # Chunk was committed by an earlier (interrupted) run and not recalculated
+    resumed: bool = False
+
+    def __repr__(self):
+        return (
+            f"BulkChunkResult(chunk={self.chunk_index}, "
+            f"employees={len(self.employee_ids)}, results={len(self.results)}, "
+            f"errors={len(self.errors)}, resumed={self.resumed})"
+        )
+
+
 @dataclass
 class CacheStats:
     """Cache operation statistics."""
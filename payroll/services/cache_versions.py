@@ -0,0 +1,174 @@
+"""
+Generation counters for dependency-versioned payroll cache keys.
+
+Cached payroll values used to be keyed only by (employee, year, month) with a
+TTL, so a WorkLog, Salary or Holiday change served stale pay until the TTL
+expired or someone deleted the keys (KEYS/SCAN sweeps). Each input now has a
+generation counter:
+
+- employee-month: bumped when a WorkLog of that month is saved or deleted
+- salary: bumped when an employee's Salary is saved or deleted
+- holiday-month: bumped when a Holiday of that month is saved or deleted
+- calendar: bumped whenever holidays are synced or edited; versions the
+  process-local calendar caches (integrations.services.calendar_cache)
+
+The counters are part of every cache key (PayrollRedisCache,
+BulkCacheManager), so a bump is an O(1) invalidation: later reads build new
+keys and miss, and the old entries simply expire.
+
+Counters live in the Django cache without expiry. It must be shared by all
+web and Celery processes (Redis, see CACHES in settings), otherwise a bump
+reaches only the process that made it. A missing counter (first use,
+eviction) is initialised from the clock rather than 0, so an evicted counter
+never returns to a version used before. While the cache is unreachable,
+reads get a fresh clock value, so nothing cached is served.
+
+Bumps are deferred to transaction commit (see payroll/signals.py): a reader
+that recalculates between the write and the commit caches under the old
+version, which the bump then retires.
+
+Example usage:
+    version = get_monthly_version(employee_id, 2025, 10)  # "v1700.1698.1650"
+    bump_employee_month(employee_id, 2025, 10)
+"""
+
+import logging
+import time
+from typing import Dict, Iterable, List, Tuple
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = "payroll_gen"
+
+
+def make_employee_month_key(employee_id: int, year: int, month: int) -> str:
+    return f"{VERSION_KEY_PREFIX}:employee:{employee_id}:{year}:{month:02d}"
+
+
+def make_salary_key(employee_id: int) -> str:
+    return f"{VERSION_KEY_PREFIX}:salary:{employee_id}"
+
+
+def make_holiday_month_key(year: int, month: int) -> str:
+    return f"{VERSION_KEY_PREFIX}:holidays:{year}:{month:02d}"
+
+
+def make_calendar_key() -> str:
+    return f"{VERSION_KEY_PREFIX}:calendar"
+
+
+def _initial_generation() -> int:
+    """Starting value of a missing counter (milliseconds, never reused)"""
+    return time.time_ns() // 1_000_000
+
+
+def _get_generations(keys: List[str]) -> Dict[str, int]:
+    """Current generation of each counter (one round trip when all exist)"""
+    try:
+        generations = cache.get_many(keys)
+    except Exception as e:
+        logger.warning(f"Could not read payroll cache generations: {e}")
+        generations = {}
+
+    for key in keys:
+        if key not in generations:
+            generations[key] = _init_generation(key)
+    return generations
+
+
+def _init_generation(key: str) -> int:
+    """Initialise a missing counter; concurrent initialisations agree"""
+    try:
+        cache.add(key, _initial_generation(), timeout=None)
+        generation = cache.get(key)
+    except Exception as e:
+        logger.warning(f"Could not initialise payroll cache generation {key}: {e}")
+        generation = None
+    return generation or _initial_generation()
+
+
+def _bump(key: str) -> None:
+    try:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Missing counter: any fresh value retires the previous keys
+            cache.set(key, _initial_generation(), timeout=None)
+    except Exception as e:
+        logger.warning(f"Could not bump payroll cache generation {key}: {e}")
+
+
+def _format_version(*generations: int) -> str:
+    return "v" + ".".join(str(generation) for generation in generations)
+
+
+def get_monthly_version(employee_id: int, year: int, month: int) -> str:
+    """Version of an employee's payroll inputs for a month"""
+    return get_monthly_versions([employee_id], year, month)[employee_id]
+
+
+def get_monthly_versions(
+    employee_ids: Iterable[int], year: int, month: int
+) -> Dict[int, str]:
+    """
+    Versions of the payroll inputs of many employees for a month.
+
+    Returns:
+        Dict mapping employee_id to its version string
+    """
+    employee_ids = list(employee_ids)
+    holiday_key = make_holiday_month_key(year, month)
+    keys = [holiday_key]
+    for employee_id in employee_ids:
+        keys.append(make_employee_month_key(employee_id, year, month))
+        keys.append(make_salary_key(employee_id))
+
+    generations = _get_generations(keys)
+    return {
+        employee_id: _format_version(
+            generations[make_employee_month_key(employee_id, year, month)],
+            generations[make_salary_key(employee_id)],
+            generations[holiday_key],
+        )
+        for employee_id in employee_ids
+    }
+
+
+def get_holiday_version(year: int, month: int) -> str:
+    """Version of a month's holidays"""
+    key = make_holiday_month_key(year, month)
+    return _format_version(_get_generations([key])[key])
+
+
+def get_calendar_generation() -> int:
+    """Generation of all calendar data (holidays, Shabbat times)"""
+    key = make_calendar_key()
+    return _get_generations([key])[key]
+
+
+def bump_employee_month(employee_id: int, year: int, month: int) -> None:
+    """Invalidate cached payroll of an employee-month"""
+    _bump(make_employee_month_key(employee_id, year, month))
+
+
+def bump_employee_months(keys: Iterable[Tuple[int, int, int]]) -> None:
+    """Invalidate cached payroll of (employee_id, year, month) keys"""
+    for employee_id, year, month in set(keys):
+        bump_employee_month(employee_id, year, month)
+
+
+def bump_salary(employee_id: int) -> None:
+    """Invalidate all cached payroll of an employee (salary changed)"""
+    _bump(make_salary_key(employee_id))
+
+
+def bump_holiday_month(year: int, month: int) -> None:
+    """Invalidate cached holidays and payroll of a month"""
+    _bump(make_holiday_month_key(year, month))
+
+
+def bump_calendar() -> None:
+    """Invalidate the process-local calendar caches of all processes"""
+    _bump(make_calendar_key())
@@ -170,6 +170,20 @@ class CalculationContext(TypedDict):
     # Additional context (optional, with defaults)
     include_breakdown: bool
     include_daily_details: bool
+    fixed_point_arithmetic: bool  # Defaults to PAYROLL_FIXED_POINT_ARITHMETIC
+    worklog_ids: List[int]  # Calculate only these work logs (incremental updates)
+
+    # Preloaded data (optional, set by BulkEnhancedPayrollService).
+    # When work_logs and calculation_type are present the enhanced strategy
+    # calculates from this data only, without ORM, cache or API access.
+    calculation_type: str
+    hourly_rate: Optional[Decimal]
+    base_salary: Optional[Decimal]
+    work_logs: List[Dict[str, Any]]  # worklog_id, work_date, check_in, check_out
+    holidays: Dict[date, Any]  # HolidayData keyed by date
+    shabbat_times: Dict[date, Any]  # ShabbatTimesData keyed by Friday date
+    shabbat_windows: Any  # ShabbatWindowTable built from shabbat_times
+    shift_segments: Dict[Any, Any]  # ShiftSegments keyed by (check_in, check_out)
 
 
 class ShabbatTimes(TypedDict):
@@ -194,7 +208,9 @@ class ShabbatTimes(TypedDict):
     # Metadata (required)
     timezone: str  # Always "Asia/Jerusalem" for Israeli labor law compliance
     is_estimated: bool  # True if fallback/approximate times were used
-    calculation_method: str  # "api_precise" | "api_estimated" | "fallback"
+    calculation_method: (
+        str  # "astronomical" | "api_precise" | "api_estimated" | "fallback"
+    )
 
     # Location context (required)
     coordinates: Dict[
@@ -247,7 +263,7 @@ def validate_shabbat_times(result: dict) -> ShabbatTimes:
         )
 
     # Validate calculation method
-    valid_methods = ["api_precise", "api_estimated", "fallback"]
+    valid_methods = ["astronomical", "api_precise", "api_estimated", "fallback"]
     if result.get("calculation_method") not in valid_methods:
         raise ValidationError(
             f"Invalid calculation_method: {result.get('calculation_method')}. Must be one of {valid_methods}"
@@ -0,0 +1,211 @@
+"""
+Streaming export of a month of payroll (CSV / NDJSON).
+
+Rows are read with QuerySet.values_list().iterator(chunk_size=...) - a
+server-side cursor on PostgreSQL - and encoded one line at a time, so an
+export of 500k daily rows runs in constant memory whether it is written to
+a StreamingHttpResponse (payroll_export) or a file (manage.py
+export_payroll).
+
+API consumers page with a keyset cursor instead of OFFSET: rows are ordered
+by primary key and each page starts after the last id of the previous one
+(see get_page_bounds()).
+
+Example usage:
+    rows = iter_rows(DATASET_SUMMARIES, 2025, 10)
+    for line in encode_rows(rows, DATASET_SUMMARIES, FORMAT_CSV):
+        output.write(line)
+"""
+
+import calendar
+import csv
+import json
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Iterator, Optional, Tuple
+
+from django.conf import settings
+
+from payroll.models import DailyPayrollCalculation, MonthlyPayrollSummary
+
+DATASET_SUMMARIES = "summaries"
+DATASET_DAILY = "daily"
+
+FORMAT_CSV = "csv"
+FORMAT_NDJSON = "ndjson"
+
+CONTENT_TYPES = {
+    FORMAT_CSV: "text/csv; charset=utf-8",
+    FORMAT_NDJSON: "application/x-ndjson",
+}
+
+# Exported columns: (output name, queryset lookup)
+SUMMARY_COLUMNS = (
+    ("id", "id"),
+    ("employee_id", "employee_id"),
+    ("first_name", "employee__first_name"),
+    ("last_name", "employee__last_name"),
+    ("email", "employee__email"),
+    ("year", "year"),
+    ("month", "month"),
+    ("total_hours", "total_hours"),
+    ("regular_hours", "regular_hours"),
+    ("overtime_hours", "overtime_hours"),
+    ("holiday_hours", "holiday_hours"),
+    ("sabbath_hours", "sabbath_hours"),
+    ("base_pay", "base_pay"),
+    ("overtime_pay", "overtime_pay"),
+    ("holiday_pay", "holiday_pay"),
+    ("sabbath_pay", "sabbath_pay"),
+    ("proportional_monthly", "proportional_monthly"),
+    ("total_bonuses_monthly", "total_bonuses_monthly"),
+    ("total_gross_pay", "total_gross_pay"),
+    ("worked_days", "worked_days"),
+    ("last_updated", "last_updated"),
+)
+
+DAILY_COLUMNS = (
+    ("id", "id"),
+    ("employee_id", "employee_id"),
+    ("email", "employee__email"),
+    ("work_date", "work_date"),
+    ("worklog_id", "worklog_id"),
+    ("regular_hours", "regular_hours"),
+    ("overtime_hours_1", "overtime_hours_1"),
+    ("overtime_hours_2", "overtime_hours_2"),
+    ("sabbath_regular_hours", "sabbath_regular_hours"),
+    ("sabbath_overtime_hours_1", "sabbath_overtime_hours_1"),
+    ("sabbath_overtime_hours_2", "sabbath_overtime_hours_2"),
+    ("night_hours", "night_hours"),
+    ("base_pay", "base_pay"),
+    ("bonus_pay", "bonus_pay"),
+    ("proportional_monthly", "proportional_monthly"),
+    ("total_gross_pay", "total_gross_pay"),
+    ("is_holiday", "is_holiday"),
+    ("is_sabbath", "is_sabbath"),
+    ("is_night_shift", "is_night_shift"),
+)
+
+COLUMNS = {DATASET_SUMMARIES: SUMMARY_COLUMNS, DATASET_DAILY: DAILY_COLUMNS}
+
+
+def get_chunk_size() -> int:
+    """Rows fetched per cursor round-trip"""
+    return getattr(settings, "PAYROLL_EXPORT_CHUNK_SIZE", 2000)
+
+
+def get_queryset(
+    dataset: str, year: int, month: int, employee_id: Optional[int] = None
+):
+    """
+    Unordered rows of one dataset for a month.
+
+    Raises:
+        ValueError: Unknown dataset
+    """
+    if dataset == DATASET_SUMMARIES:
+        queryset = MonthlyPayrollSummary.objects.filter(year=year, month=month)
+    elif dataset == DATASET_DAILY:
+        _, last_day = calendar.monthrange(year, month)
+        queryset = DailyPayrollCalculation.objects.filter(
+            work_date__gte=date(year, month, 1),
+            work_date__lte=date(year, month, last_day),
+        )
+    else:
+        raise ValueError(f"Unknown export dataset: {dataset}")
+
+    if employee_id is not None:
+        queryset = queryset.filter(employee_id=employee_id)
+    return queryset
+
+
+def get_page_bounds(queryset, after_id: int, limit: int) -> Tuple[Optional[int], bool]:
+    """
+    Keyset page of `limit` rows after `after_id`.
+
+    One index-only lookup finds the id of the page's last row, so the page can
+    be streamed as the id range (after_id, last_id].
+
+    Returns:
+        Tuple[Optional[int], bool]: Last id of the page (None if the page
+        holds all remaining rows) and whether more rows follow it
+    """
+    ids = list(
+        queryset.filter(id__gt=after_id)
+        .order_by("id")
+        .values_list("id", flat=True)[limit - 1 : limit + 1]
+    )
+    if not ids:
+        return None, False
+    return ids[0], len(ids) > 1
+
+
+def iter_rows(
+    dataset: str,
+    year: int,
+    month: int,
+    employee_id: Optional[int] = None,
+    after_id: int = 0,
+    last_id: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> Iterator[Tuple]:
+    """
+    Stream rows in primary-key order as tuples of COLUMNS[dataset].
+
+    Args:
+        dataset: DATASET_SUMMARIES or DATASET_DAILY
+        year: Payroll year
+        month: Payroll month
+        employee_id: Only this employee
+        after_id: Keyset cursor - rows with a greater id
+        last_id: Last id of the page (inclusive), None for all remaining rows
+        chunk_size: Rows per cursor fetch (defaults to PAYROLL_EXPORT_CHUNK_SIZE)
+    """
+    queryset = get_queryset(dataset, year, month, employee_id).filter(id__gt=after_id)
+    if last_id is not None:
+        queryset = queryset.filter(id__lte=last_id)
+
+    lookups = [lookup for _, lookup in COLUMNS[dataset]]
+    return (
+        queryset.order_by("id")
+        .values_list(*lookups)
+        .iterator(chunk_size=chunk_size or get_chunk_size())
+    )
+
+
+class _Echo:
+    """File-like object returning what is written (for csv.writer)"""
+
+    def write(self, value):
+        return value
+
+
+def _json_value(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def encode_rows(
+    rows: Iterable[Tuple], dataset: str, output_format: str
+) -> Iterator[str]:
+    """
+    Encode rows as CSV (with a header line) or NDJSON, one line per item.
+
+    Raises:
+        ValueError: Unknown format
+    """
+    names = [name for name, _ in COLUMNS[dataset]]
+
+    if output_format == FORMAT_CSV:
+        writer = csv.writer(_Echo())
+        yield writer.writerow(names)
+        for row in rows:
+            yield writer.writerow(row)
+    elif output_format == FORMAT_NDJSON:
+        for row in rows:
+            yield json.dumps(dict(zip(names, row)), default=_json_value) + "\n"
+    else:
+        raise ValueError(f"Unknown export format: {output_format}")
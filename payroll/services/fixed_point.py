@@ -0,0 +1,175 @@
+"""
+Fixed-point arithmetic for payroll calculations.
+
+The Decimal path of EnhancedPayrollStrategy converts every segment duration
+with Decimal(str(seconds / 3600)) and multiplies Decimals per segment. In
+fixed-point mode time is tracked in integer microseconds (the resolution of
+work log timestamps) and money in integer agorot. Rates and multipliers are
+exact Fractions, so each amount is the exact value rounded once to agorot.
+Values become Decimal only when the PayrollResult is built, which makes the
+results reproducible bit for bit across processes and platforms.
+
+Example usage:
+    rate = agorot_rate(Decimal("45.50"))  # agorot per hour
+    shift = FixedPointShift()
+    shift.add(bucket, segment_us)
+    pay = pay_agorot(shift.bucket_us[bucket], rate, multiplier(Decimal("1.25")))
+    pay_decimal = agorot_to_decimal(pay)
+"""
+
+from datetime import timedelta
+from decimal import ROUND_HALF_EVEN, Context, Decimal
+from fractions import Fraction
+from typing import List, Tuple
+
+US_PER_SECOND = 1_000_000
+US_PER_HOUR = 3_600 * US_PER_SECOND
+AGOROT_PER_SHEKEL = 100
+
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Matches the 0.0001 hour epsilon of the Decimal tier comparisons
+TIER_EPSILON_US = US_PER_HOUR // 10_000
+
+# Segment buckets: (hours_key, pay_key, rate attribute of EnhancedPayrollStrategy)
+SEGMENT_BUCKETS: Tuple[Tuple[str, str, str], ...] = (
+    ("regular_hours", "regular_pay", "RATE_REGULAR"),
+    ("overtime_125_hours", "overtime_125_pay", "OVERTIME_RATE_125"),
+    ("overtime_150_hours", "overtime_150_pay", "OVERTIME_RATE_150"),
+    ("sabbath_regular_hours", "sabbath_regular_pay", "SABBATH_RATE"),
+    (
+        "sabbath_overtime_175_hours",
+        "sabbath_overtime_175_pay",
+        "SABBATH_OVERTIME_RATE_175",
+    ),
+    (
+        "sabbath_overtime_200_hours",
+        "sabbath_overtime_200_pay",
+        "SABBATH_OVERTIME_RATE_200",
+    ),
+    ("holiday_hours", "holiday_pay", "HOLIDAY_RATE"),
+)
+
+# Segment bucket (index into SEGMENT_BUCKETS) by territory and overtime tier.
+# Rows: weekday, Sabbath, holiday; columns: regular, overtime tier 1, tier 2.
+# Holiday overtime is paid at the Sabbath overtime rates.
+TERRITORY_WEEKDAY = 0
+TERRITORY_SABBATH = 1
+TERRITORY_HOLIDAY = 2
+BUCKET_BY_TERRITORY_AND_TIER: Tuple[Tuple[int, int, int], ...] = (
+    (0, 1, 2),
+    (3, 4, 5),
+    (6, 4, 5),
+)
+
+# Deterministic context for the final microseconds -> Decimal hours conversion
+_DECIMAL_CONTEXT = Context(prec=28, rounding=ROUND_HALF_EVEN)
+_US_PER_HOUR_DECIMAL = Decimal(US_PER_HOUR)
+
+
+def hours_to_us(hours) -> int:
+    """
+    Convert a duration in hours to integer microseconds.
+
+    Uses the same rounding as timedelta(hours=float(hours)), so norm and tier
+    boundaries land on the critical points of the Decimal path.
+    """
+    return timedelta(hours=float(hours)) // ONE_MICROSECOND
+
+
+def duration_us(start, end) -> int:
+    """Duration between two datetimes in integer microseconds"""
+    return (end - start) // ONE_MICROSECOND
+
+
+def multiplier(value: Decimal) -> Fraction:
+    """Exact rational form of a rate multiplier such as Decimal("1.25")"""
+    return Fraction(value)
+
+
+def agorot_rate(hourly_rate) -> Fraction:
+    """Exact hourly rate in agorot per hour"""
+    return Fraction(Decimal(str(hourly_rate or 0))) * AGOROT_PER_SHEKEL
+
+
+def monthly_agorot_rate(base_salary, monthly_hours_norm) -> Fraction:
+    """Exact effective hourly rate (salary / monthly norm) in agorot per hour"""
+    return agorot_rate(base_salary) / Fraction(Decimal(str(monthly_hours_norm)))
+
+
+def round_half_up(value: Fraction) -> int:
+    """Round a non-negative exact amount to the nearest integer, halves up"""
+    return (value.numerator * 2 + value.denominator) // (value.denominator * 2)
+
+
+def pay_agorot(us: int, rate: Fraction, factor: Fraction = Fraction(1)) -> int:
+    """
+    Pay for a duration, rounded once to whole agorot.
+
+    Args:
+        us: Duration in microseconds
+        rate: Hourly rate in agorot per hour
+        factor: Rate multiplier or premium
+
+    Returns:
+        int: Amount in agorot
+    """
+    if not us:
+        return 0
+    return round_half_up(us * rate * factor / US_PER_HOUR)
+
+
+def overtime_tier(worked_us: int, norm_us: int, tier1_us: int) -> int:
+    """
+    Overtime tier (0 regular, 1 first tier, 2 second tier) of a segment.
+
+    Args:
+        worked_us: Time worked in the shift before the segment
+        norm_us: Daily norm of the shift
+        tier1_us: Length of the first overtime tier
+    """
+    if worked_us < norm_us - TIER_EPSILON_US:
+        return 0
+    if worked_us < norm_us + tier1_us - TIER_EPSILON_US:
+        return 1
+    return 2
+
+
+def us_to_hours(us: int) -> Decimal:
+    """Convert microseconds to Decimal hours (PayrollResult boundary)"""
+    return _DECIMAL_CONTEXT.divide(Decimal(us), _US_PER_HOUR_DECIMAL)
+
+
+def agorot_to_decimal(agorot: int) -> Decimal:
+    """Convert agorot to a Decimal amount in shekels (PayrollResult boundary)"""
+    return Decimal(agorot).scaleb(-2)
+
+
+def fraction_to_decimal(value: Fraction) -> Decimal:
+    """Convert an exact rational to Decimal with the deterministic context"""
+    return _DECIMAL_CONTEXT.divide(Decimal(value.numerator), Decimal(value.denominator))
+
+
+class FixedPointShift:
+    """
+    Per-bucket time of one shift in integer microseconds.
+
+    Attributes:
+        bucket_us: Microseconds per SEGMENT_BUCKETS index
+        night_us: Microseconds inside the night period (22:00-06:00)
+    """
+
+    __slots__ = ("bucket_us", "night_us")
+
+    def __init__(self, bucket_count: int = 7):
+        self.bucket_us: List[int] = [0] * bucket_count
+        self.night_us = 0
+
+    def add(self, bucket: int, us: int) -> None:
+        """Add a classified segment"""
+        self.bucket_us[bucket] += us
+
+    @property
+    def total_us(self) -> int:
+        """Total classified time of the shift"""
+        return sum(self.bucket_us)
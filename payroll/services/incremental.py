@@ -0,0 +1,431 @@
+"""
+Incremental (delta) payroll updates for single WorkLog changes.
+
+A full recalculation recomputes every shift of the month and replaces all
+DailyPayrollCalculation records. In the critical points model a shift's pay
+depends only on the shift itself (daily norms, Sabbath/holiday context), so
+when a few work logs change only those shifts need to be recomputed:
+
+1. Every DailyPayrollCalculation stores the check-in/check-out it was
+   calculated from and its contribution to the MonthlyPayrollSummary fields
+   (calculation_details).
+2. The updater compares the month's work logs with those records and finds
+   new, changed and removed shifts.
+3. Only those shifts are calculated (context "worklog_ids"); the difference
+   between new and old contributions is applied to the exact summary totals
+   kept in MonthlyPayrollSummary.calculation_details, and only the affected
+   daily records are replaced.
+
+The updater falls back to a full recalculation whenever deltas would not be
+exact: no summary yet, records without stored contributions, a changed
+salary configuration, a strategy whose shifts are not independent (e.g.
+weekly thresholds), or when most of the month changed anyway. A holiday
+change clears the stored totals of its month (clear_incremental_state), so
+the next recalculation there is a full one.
+
+Example usage:
+    updater = IncrementalPayrollUpdater(PayrollService())
+    outcome = updater.recalculate(context)
+"""
+
+import logging
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from .contracts import CalculationContext
+from .enums import CalculationStrategy
+
+logger = logging.getLogger(__name__)
+
+# MonthlyPayrollSummary fields maintained by deltas (worked_days is recounted)
+SUMMARY_FIELDS = (
+    "total_gross_pay",
+    "total_hours",
+    "regular_hours",
+    "overtime_hours",
+    "holiday_hours",
+    "sabbath_hours",
+    "base_pay",
+    "overtime_pay",
+    "holiday_pay",
+    "sabbath_pay",
+    "proportional_monthly",
+    "total_bonuses_monthly",
+)
+
+_SHIFT_HOURS_KEYS = (
+    "regular_hours",
+    "overtime_125_hours",
+    "overtime_150_hours",
+    "holiday_hours",
+    "sabbath_regular_hours",
+    "sabbath_overtime_175_hours",
+    "sabbath_overtime_200_hours",
+)
+_SABBATH_HOURS_KEYS = _SHIFT_HOURS_KEYS[4:]
+_SABBATH_PAY_KEYS = (
+    "sabbath_regular_pay",
+    "sabbath_overtime_175_pay",
+    "sabbath_overtime_200_pay",
+)
+
+
+def _value(daily_shift: Dict[str, Any], key: str) -> Decimal:
+    return Decimal(str(daily_shift.get(key, 0) or 0))
+
+
+def shift_contribution(
+    daily_shift: Dict[str, Any], employee_type: str
+) -> Dict[str, Decimal]:
+    """
+    Contribution of one shift (DailyPayrollBreakdown) to the summary fields.
+
+    Mirrors how PayrollService derives the summary from a PayrollResult, so
+    the contributions of all shifts add up to a full recalculation.
+
+    Args:
+        daily_shift: Shift-level result of a strategy
+        employee_type: "hourly" or "monthly" (result metadata)
+
+    Returns:
+        Dict[str, Decimal]: Value per SUMMARY_FIELDS entry
+    """
+    is_monthly = employee_type == "monthly"
+    return {
+        "total_gross_pay": _value(daily_shift, "total_gross_pay"),
+        "total_hours": sum(
+            (_value(daily_shift, key) for key in _SHIFT_HOURS_KEYS), Decimal("0")
+        ),
+        "regular_hours": _value(daily_shift, "regular_hours"),
+        "overtime_hours": _value(daily_shift, "overtime_125_hours")
+        + _value(daily_shift, "overtime_150_hours"),
+        "holiday_hours": _value(daily_shift, "holiday_hours"),
+        "sabbath_hours": sum(
+            (_value(daily_shift, key) for key in _SABBATH_HOURS_KEYS), Decimal("0")
+        ),
+        "base_pay": _value(daily_shift, "regular_pay"),
+        "overtime_pay": _value(daily_shift, "overtime_125_pay")
+        + _value(daily_shift, "overtime_150_pay"),
+        "holiday_pay": _value(daily_shift, "holiday_pay"),
+        "sabbath_pay": sum(
+            (_value(daily_shift, key) for key in _SABBATH_PAY_KEYS), Decimal("0")
+        ),
+        "proportional_monthly": (
+            _value(daily_shift, "base_pay") if is_monthly else Decimal("0")
+        ),
+        "total_bonuses_monthly": (
+            _value(daily_shift, "bonus_pay") if is_monthly else Decimal("0")
+        ),
+    }
+
+
+def salary_fingerprint(salary, metadata: Optional[Dict[str, Any]] = None) -> Dict:
+    """
+    Salary configuration a month was calculated with.
+
+    Contributions are only comparable while this stays the same.
+    """
+    metadata = metadata or {}
+    return {
+        "calculation_type": getattr(salary, "calculation_type", None),
+        "hourly_rate": str(getattr(salary, "hourly_rate", None)),
+        "base_salary": str(getattr(salary, "base_salary", None)),
+        "arithmetic": metadata.get("arithmetic", "decimal"),
+    }
+
+
+def clear_incremental_state(year: int, month: int) -> int:
+    """
+    Make the next recalculation of every summary of a month a full one.
+
+    Called when the month's calendar (holidays) changed: the stored totals
+    and shift contributions were calculated with the old calendar.
+
+    Returns:
+        int: Number of summaries cleared
+    """
+    from payroll.models import MonthlyPayrollSummary
+
+    summaries = list(
+        MonthlyPayrollSummary.objects.filter(
+            year=year, month=month, calculation_details__has_key="incremental"
+        ).only("id", "calculation_details")
+    )
+    for summary in summaries:
+        summary.calculation_details.pop("incremental", None)
+    # bulk_update: totals are unchanged, so no rollup signals are needed
+    MonthlyPayrollSummary.objects.bulk_update(
+        summaries, ["calculation_details"], batch_size=500
+    )
+    return len(summaries)
+
+
+def serialize_values(values: Dict[str, Decimal]) -> Dict[str, str]:
+    """Decimal values -> JSON-safe strings (exact)"""
+    return {key: str(value) for key, value in values.items()}
+
+
+def deserialize_values(values: Dict[str, str]) -> Dict[str, Decimal]:
+    """Strings written by serialize_values -> Decimal values"""
+    return {key: Decimal(value) for key, value in values.items()}
+
+
+class IncrementalPayrollUpdater:
+    """
+    Applies WorkLog changes to a month's payroll by recomputing changed shifts.
+    """
+
+    # Recalculate everything when more than this share of the shifts changed
+    FULL_RECALCULATION_RATIO = 0.5
+
+    def __init__(self, service):
+        """
+        Initialize the updater.
+
+        Args:
+            service: PayrollService used for calculations and full fallbacks
+        """
+        self.service = service
+
+    def recalculate(
+        self,
+        context: CalculationContext,
+        strategy: CalculationStrategy = CalculationStrategy.ENHANCED,
+    ) -> Dict[str, Any]:
+        """
+        Bring the month's persisted payroll up to date.
+
+        Args:
+            context: Calculation context of the employee-month
+            strategy: Calculation strategy
+
+        Returns:
+            Dict: mode ("incremental", "unchanged" or "full"), total_salary,
+            total_hours and the number of recalculated shifts
+        """
+        outcome = self.apply_incremental(context, strategy)
+        if outcome is not None:
+            return outcome
+
+        result = self.service.calculate(context, strategy)
+        return {
+            "mode": "full",
+            "total_salary": result.get("total_salary", Decimal("0")),
+            "total_hours": result.get("total_hours", Decimal("0")),
+            "changed_shifts": None,
+        }
+
+    def apply_incremental(
+        self,
+        context: CalculationContext,
+        strategy: CalculationStrategy = CalculationStrategy.ENHANCED,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Apply changed shifts as deltas.
+
+        Returns:
+            Optional[Dict]: Outcome, or None if a full recalculation is needed
+        """
+        from payroll.models import DailyPayrollCalculation, MonthlyPayrollSummary
+        from users.models import Employee
+
+        employee_id, year, month = (
+            context["employee_id"],
+            context["year"],
+            context["month"],
+        )
+
+        reason = self._full_recalculation_reason(strategy)
+        if reason:
+            return self._fallback(context, reason)
+
+        with transaction.atomic():
+            summary = (
+                MonthlyPayrollSummary.objects.select_for_update()
+                .filter(employee_id=employee_id, year=year, month=month)
+                .first()
+            )
+            if summary is None:
+                return self._fallback(context, "no_summary")
+
+            state = (summary.calculation_details or {}).get("incremental")
+            if not state:
+                return self._fallback(context, "summary_without_totals")
+
+            employee = Employee.objects.get(id=employee_id)
+            salary = employee.salaries.filter(is_active=True).first()
+            if state.get("salary") != salary_fingerprint(
+                salary, {"arithmetic": self._arithmetic(context)}
+            ):
+                return self._fallback(context, "salary_changed")
+
+            work_logs = self.service._get_work_logs_for_context(context)
+            records = list(
+                DailyPayrollCalculation.objects.filter(
+                    employee_id=employee_id,
+                    work_date__year=year,
+                    work_date__month=month,
+                )
+            )
+
+            records_by_worklog = {}
+            for record in records:
+                details = record.calculation_details or {}
+                if record.worklog_id is None or "contribution" not in details:
+                    return self._fallback(context, "records_without_contribution")
+                records_by_worklog[record.worklog_id] = record
+
+            # Records deleted or edited outside the updater (e.g. the record of
+            # a soft-deleted log) leave the totals without a matching record
+            totals = deserialize_values(state["totals"])
+            recorded = {field: Decimal("0") for field in SUMMARY_FIELDS}
+            for record in records:
+                contribution = deserialize_values(
+                    record.calculation_details["contribution"]
+                )
+                for field in SUMMARY_FIELDS:
+                    recorded[field] += contribution.get(field, Decimal("0"))
+            if recorded != totals:
+                return self._fallback(context, "records_out_of_sync")
+
+            logs_by_id = {log.id: log for log in work_logs}
+            changed_ids = [
+                log.id
+                for log in work_logs
+                if not self._record_matches(records_by_worklog.get(log.id), log)
+            ]
+            removed_ids = [
+                worklog_id
+                for worklog_id in records_by_worklog
+                if worklog_id not in logs_by_id
+            ]
+
+            if not changed_ids and not removed_ids:
+                return self._outcome("unchanged", state, 0)
+
+            if len(changed_ids) > len(work_logs) * self.FULL_RECALCULATION_RATIO:
+                return self._fallback(context, "most_shifts_changed")
+
+            # Calculate only the changed shifts
+            daily_results = []
+            employee_type = state.get("employee_type", "hourly")
+            if changed_ids:
+                shift_context = dict(context)
+                shift_context["worklog_ids"] = changed_ids
+                calculator = self.service.factory.create_calculator(
+                    strategy, shift_context
+                )
+                result = calculator.calculate_with_logging()
+                daily_results = result.get("daily_results") or []
+                employee_type = result.get("metadata", {}).get(
+                    "employee_type", employee_type
+                )
+                if len(daily_results) != len(changed_ids):
+                    return self._fallback(context, "shift_results_missing")
+
+            for worklog_id in changed_ids + removed_ids:
+                record = records_by_worklog.get(worklog_id)
+                if record is not None:
+                    old = deserialize_values(record.calculation_details["contribution"])
+                    for field in SUMMARY_FIELDS:
+                        totals[field] -= old.get(field, Decimal("0"))
+            for daily_shift in daily_results:
+                new = shift_contribution(daily_shift, employee_type)
+                for field in SUMMARY_FIELDS:
+                    totals[field] += new[field]
+
+            # Replace only the affected daily records
+            replaced_ids = changed_ids + removed_ids
+            DailyPayrollCalculation.objects.filter(
+                employee_id=employee_id,
+                worklog_id__in=replaced_ids,
+            ).delete()
+            DailyPayrollCalculation.objects.bulk_create(
+                [
+                    self.service._build_daily_record(
+                        employee,
+                        daily_shift,
+                        logs_by_id.get(daily_shift.get("worklog_id")),
+                        employee_type,
+                    )
+                    for daily_shift in daily_results
+                ]
+            )
+
+            for field in SUMMARY_FIELDS:
+                setattr(summary, field, totals[field])
+            summary.worked_days = self.service._calculate_worked_days(work_logs)
+            state["totals"] = serialize_values(totals)
+            summary.calculation_details = {
+                **(summary.calculation_details or {}),
+                "incremental": state,
+            }
+            summary.save()
+
+            self.service._create_compensatory_days(employee, context, work_logs)
+
+        logger.info(
+            f"Applied {len(replaced_ids)} shift change(s) to payroll of employee "
+            f"{employee_id} for {year}-{month:02d}",
+            extra={
+                "employee_id": employee_id,
+                "year": year,
+                "month": month,
+                "changed_shifts": len(changed_ids),
+                "removed_shifts": len(removed_ids),
+                "action": "payroll_incremental_update",
+            },
+        )
+        return self._outcome("incremental", state, len(replaced_ids))
+
+    def _full_recalculation_reason(
+        self, strategy: CalculationStrategy
+    ) -> Optional[str]:
+        """Reason why the strategy cannot be updated per shift, if any"""
+        strategy_class = self.service.factory._strategies.get(strategy)
+        if not getattr(strategy_class, "SHIFTS_ARE_INDEPENDENT", False):
+            return "strategy_has_cross_shift_rules"
+        return None
+
+    def _arithmetic(self, context: CalculationContext) -> str:
+        """Arithmetic mode the strategy will use (see salary_fingerprint)"""
+        fixed_point = context.get(
+            "fixed_point_arithmetic",
+            getattr(settings, "PAYROLL_FIXED_POINT_ARITHMETIC", False),
+        )
+        return "fixed_point" if fixed_point else "decimal"
+
+    def _record_matches(self, record, log) -> bool:
+        """True if the record was calculated from the log's current times"""
+        if record is None:
+            return False
+        details = record.calculation_details or {}
+        return details.get("check_in") == log.check_in.isoformat() and details.get(
+            "check_out"
+        ) == (log.check_out.isoformat() if log.check_out else None)
+
+    def _fallback(self, context: CalculationContext, reason: str) -> None:
+        logger.debug(
+            f"Full payroll recalculation needed for employee "
+            f"{context['employee_id']}: {reason}",
+            extra={
+                "employee_id": context["employee_id"],
+                "year": context["year"],
+                "month": context["month"],
+                "reason": reason,
+                "action": "payroll_incremental_fallback",
+            },
+        )
+        return None
+
+    def _outcome(self, mode: str, state: Dict, changed: int) -> Dict[str, Any]:
+        totals = state["totals"]
+        return {
+            "mode": mode,
+            "total_salary": Decimal(totals["total_gross_pay"]),
+            "total_hours": Decimal(totals["total_hours"]),
+            "changed_shifts": changed,
+        }
@@ -24,6 +24,12 @@ from .bulk import BulkEnhancedPayrollService
 from .contracts import CalculationContext, PayrollResult, create_empty_payroll_result
 from .enums import CacheSource, CalculationStrategy, PayrollStatus
 from .factory import StrategyNotFoundError, get_payroll_factory
+from .incremental import (
+    SUMMARY_FIELDS,
+    salary_fingerprint,
+    serialize_values,
+    shift_contribution,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -606,38 +612,46 @@ class PayrollService:
             employee = Employee.objects.get(id=context["employee_id"])
             breakdown = result.get("breakdown", {})
 
+            summary_values = {
+                # 'total_salary': result['total_salary'],  # TEMPORARILY DISABLED - field missing
+                "total_gross_pay": result["total_salary"],
+                "total_hours": result["total_hours"],
+                "regular_hours": result["regular_hours"],
+                "overtime_hours": result["overtime_hours"],
+                "holiday_hours": result["holiday_hours"],
+                "sabbath_hours": result["shabbat_hours"],
+                "base_pay": Decimal(str(breakdown.get("regular_pay", 0))),
+                "overtime_pay": Decimal(str(breakdown.get("overtime_125_pay", 0)))
+                + Decimal(str(breakdown.get("overtime_150_pay", 0))),
+                "holiday_pay": Decimal(str(breakdown.get("holiday_pay", 0))),
+                "sabbath_pay": Decimal(str(breakdown.get("sabbath_regular_pay", 0)))
+                + Decimal(str(breakdown.get("sabbath_overtime_175_pay", 0)))
+                + Decimal(str(breakdown.get("sabbath_overtime_200_pay", 0))),
+                "proportional_monthly": Decimal(
+                    str(breakdown.get("proportional_base", 0))
+                ),
+                "total_bonuses_monthly": Decimal(
+                    str(breakdown.get("total_bonuses_monthly", 0))
+                ),
+            }
+            employee_type = result.get("metadata", {}).get("employee_type", "hourly")
+
             # Create or update monthly summary
             MonthlyPayrollSummary.objects.update_or_create(
                 employee=employee,
                 year=context["year"],
                 month=context["month"],
                 defaults={
-                    # 'total_salary': result['total_salary'],  # TEMPORARILY DISABLED - field missing
-                    "total_gross_pay": result["total_salary"],
-                    "total_hours": result["total_hours"],
-                    "regular_hours": result["regular_hours"],
-                    "overtime_hours": result["overtime_hours"],
-                    "holiday_hours": result["holiday_hours"],
-                    "sabbath_hours": result["shabbat_hours"],
-                    "base_pay": Decimal(str(breakdown.get("regular_pay", 0))),
-                    "overtime_pay": Decimal(str(breakdown.get("overtime_125_pay", 0)))
-                    + Decimal(str(breakdown.get("overtime_150_pay", 0))),
-                    "holiday_pay": Decimal(str(breakdown.get("holiday_pay", 0))),
-                    "sabbath_pay": Decimal(str(breakdown.get("sabbath_regular_pay", 0)))
-                    + Decimal(str(breakdown.get("sabbath_overtime_175_pay", 0)))
-                    + Decimal(str(breakdown.get("sabbath_overtime_200_pay", 0))),
-                    "proportional_monthly": Decimal(
-                        str(breakdown.get("proportional_base", 0))
-                    ),
-                    "total_bonuses_monthly": Decimal(
-                        str(breakdown.get("total_bonuses_monthly", 0))
-                    ),
+                    **summary_values,
                     "worked_days": self._calculate_worked_days(work_logs),
+                    "calculation_details": self._build_summary_details(
+                        employee, result, summary_values, employee_type
+                    ),
                 },
             )
 
             # Create daily calculations from detailed shift results
-            self._create_daily_records(employee, context, result)
+            self._create_daily_records(employee, context, result, work_logs)
 
             # Create compensatory days for Sabbath/Holiday work
             self._create_compensatory_days(employee, context, work_logs)
@@ -667,11 +681,48 @@ class PayrollService:
         """Calculate unique days worked in the period."""
         return len(set(log.check_in.date() for log in work_logs))
 
+    def _build_summary_details(
+        self,
+        employee: Employee,
+        result: PayrollResult,
+        summary_values: Dict[str, Decimal],
+        employee_type: str,
+    ) -> Dict[str, Any]:
+        """
+        Exact summary totals for incremental updates (see incremental.py).
+
+        Totals are kept only when the shift contributions add up to the
+        persisted summary; otherwise the month is always recalculated in full.
+        """
+        totals = {field: Decimal("0") for field in SUMMARY_FIELDS}
+        for daily_shift in result.get("daily_results") or []:
+            contribution = shift_contribution(daily_shift, employee_type)
+            for field in SUMMARY_FIELDS:
+                totals[field] += contribution[field]
+
+        quantum = Decimal("0.01")
+        if any(
+            totals[field].quantize(quantum)
+            != Decimal(str(summary_values[field])).quantize(quantum)
+            for field in SUMMARY_FIELDS
+        ):
+            return {}
+
+        salary = employee.salaries.filter(is_active=True).first()
+        return {
+            "incremental": {
+                "employee_type": employee_type,
+                "salary": salary_fingerprint(salary, result.get("metadata")),
+                "totals": serialize_values(totals),
+            }
+        }
+
     def _create_daily_records(
         self,
         employee: Employee,
         context: CalculationContext,
         result: PayrollResult,
+        work_logs: Optional[List[WorkLog]] = None,
     ) -> None:
         """
         Create DailyPayrollCalculation records from daily_results in PayrollResult.
@@ -697,94 +748,121 @@ class PayrollService:
             )
             return
 
+        logs_by_id = {log.id: log for log in work_logs or []}
+        employee_type = result.get("metadata", {}).get("employee_type", "hourly")
+
         # Build DailyPayrollCalculation objects for bulk create
-        daily_calculations = []
-
-        for daily_shift in daily_results:
-            # Get holiday name if applicable
-            holiday_name = ""
-            if daily_shift.get("is_holiday", False):
-                holiday_record = Holiday.objects.filter(
-                    date=daily_shift["work_date"], is_holiday=True
-                ).first()
-                if holiday_record:
-                    holiday_name = holiday_record.name
-
-            daily_calculations.append(
-                DailyPayrollCalculation(
-                    employee=employee,
-                    work_date=daily_shift["work_date"],
-                    worklog_id=daily_shift.get("worklog_id"),
-                    # Hours breakdown
-                    regular_hours=daily_shift.get("regular_hours", Decimal("0")),
-                    overtime_hours_1=daily_shift.get(
-                        "overtime_125_hours", Decimal("0")
-                    ),
-                    overtime_hours_2=daily_shift.get(
-                        "overtime_150_hours", Decimal("0")
-                    ),
-                    sabbath_regular_hours=daily_shift.get(
-                        "sabbath_regular_hours", Decimal("0")
-                    ),
-                    sabbath_overtime_hours_1=daily_shift.get(
-                        "sabbath_overtime_175_hours", Decimal("0")
-                    ),
-                    sabbath_overtime_hours_2=daily_shift.get(
-                        "sabbath_overtime_200_hours", Decimal("0")
-                    ),
-                    night_hours=daily_shift.get("night_shift_hours", Decimal("0")),
-                    # Payment breakdown
-                    base_regular_pay=daily_shift.get("regular_pay", Decimal("0")),
-                    bonus_overtime_pay_1=(
-                        daily_shift.get("overtime_125_pay", Decimal("0"))
-                        - daily_shift.get("overtime_125_hours", Decimal("0"))
-                        * (
-                            daily_shift.get("regular_pay", Decimal("0"))
-                            / max(
-                                daily_shift.get("regular_hours", Decimal("1")),
-                                Decimal("1"),
-                            )
-                        )
-                        if daily_shift.get("regular_hours", Decimal("0")) > 0
-                        else daily_shift.get("overtime_125_pay", Decimal("0"))
-                        * Decimal("0.2")
-                    ),
-                    bonus_overtime_pay_2=(
-                        daily_shift.get("overtime_150_pay", Decimal("0"))
-                        - daily_shift.get("overtime_150_hours", Decimal("0"))
-                        * (
-                            daily_shift.get("regular_pay", Decimal("0"))
-                            / max(
-                                daily_shift.get("regular_hours", Decimal("1")),
-                                Decimal("1"),
-                            )
-                        )
-                        if daily_shift.get("regular_hours", Decimal("0")) > 0
-                        else daily_shift.get("overtime_150_pay", Decimal("0"))
-                        * Decimal("0.333")
-                    ),
-                    bonus_sabbath_overtime_pay_1=daily_shift.get(
-                        "sabbath_overtime_175_pay", Decimal("0")
-                    ),
-                    bonus_sabbath_overtime_pay_2=daily_shift.get(
-                        "sabbath_overtime_200_pay", Decimal("0")
-                    ),
-                    # Aggregated payment fields
-                    base_pay=daily_shift.get("base_pay", Decimal("0")),
-                    bonus_pay=daily_shift.get("bonus_pay", Decimal("0")),
-                    total_gross_pay=daily_shift.get("total_gross_pay", Decimal("0")),
-                    # Flags
-                    is_holiday=daily_shift.get("is_holiday", False),
-                    is_sabbath=daily_shift.get("is_sabbath", False),
-                    holiday_name=holiday_name,
-                    calculated_by_service="PayrollService",
-                )
+        daily_calculations = [
+            self._build_daily_record(
+                employee,
+                daily_shift,
+                logs_by_id.get(daily_shift.get("worklog_id")),
+                employee_type,
             )
+            for daily_shift in daily_results
+        ]
 
         # Bulk create all daily calculations
         if daily_calculations:
             DailyPayrollCalculation.objects.bulk_create(daily_calculations)
 
+    def _build_daily_record(
+        self,
+        employee: Employee,
+        daily_shift: Dict[str, Any],
+        work_log: Optional[WorkLog],
+        employee_type: str,
+    ) -> DailyPayrollCalculation:
+        """
+        Build one DailyPayrollCalculation from a shift result.
+
+        The shift's check-in/check-out and its contribution to the monthly
+        summary are stored in calculation_details for incremental updates.
+        """
+        # Get holiday name if applicable
+        holiday_name = ""
+        if daily_shift.get("is_holiday", False):
+            holiday_record = Holiday.objects.filter(
+                date=daily_shift["work_date"], is_holiday=True
+            ).first()
+            if holiday_record:
+                holiday_name = holiday_record.name
+
+        calculation_details = {}
+        if work_log is not None:
+            calculation_details = {
+                "check_in": work_log.check_in.isoformat(),
+                "check_out": work_log.check_out.isoformat(),
+                "contribution": serialize_values(
+                    shift_contribution(daily_shift, employee_type)
+                ),
+            }
+
+        return DailyPayrollCalculation(
+            employee=employee,
+            work_date=daily_shift["work_date"],
+            worklog_id=daily_shift.get("worklog_id"),
+            # Hours breakdown
+            regular_hours=daily_shift.get("regular_hours", Decimal("0")),
+            overtime_hours_1=daily_shift.get("overtime_125_hours", Decimal("0")),
+            overtime_hours_2=daily_shift.get("overtime_150_hours", Decimal("0")),
+            sabbath_regular_hours=daily_shift.get(
+                "sabbath_regular_hours", Decimal("0")
+            ),
+            sabbath_overtime_hours_1=daily_shift.get(
+                "sabbath_overtime_175_hours", Decimal("0")
+            ),
+            sabbath_overtime_hours_2=daily_shift.get(
+                "sabbath_overtime_200_hours", Decimal("0")
+            ),
+            night_hours=daily_shift.get("night_shift_hours", Decimal("0")),
+            # Payment breakdown
+            base_regular_pay=daily_shift.get("regular_pay", Decimal("0")),
+            bonus_overtime_pay_1=(
+                daily_shift.get("overtime_125_pay", Decimal("0"))
+                - daily_shift.get("overtime_125_hours", Decimal("0"))
+                * (
+                    daily_shift.get("regular_pay", Decimal("0"))
+                    / max(
+                        daily_shift.get("regular_hours", Decimal("1")),
+                        Decimal("1"),
+                    )
+                )
+                if daily_shift.get("regular_hours", Decimal("0")) > 0
+                else daily_shift.get("overtime_125_pay", Decimal("0")) * Decimal("0.2")
+            ),
+            bonus_overtime_pay_2=(
+                daily_shift.get("overtime_150_pay", Decimal("0"))
+                - daily_shift.get("overtime_150_hours", Decimal("0"))
+                * (
+                    daily_shift.get("regular_pay", Decimal("0"))
+                    / max(
+                        daily_shift.get("regular_hours", Decimal("1")),
+                        Decimal("1"),
+                    )
+                )
+                if daily_shift.get("regular_hours", Decimal("0")) > 0
+                else daily_shift.get("overtime_150_pay", Decimal("0"))
+                * Decimal("0.333")
+            ),
+            bonus_sabbath_overtime_pay_1=daily_shift.get(
+                "sabbath_overtime_175_pay", Decimal("0")
+            ),
+            bonus_sabbath_overtime_pay_2=daily_shift.get(
+                "sabbath_overtime_200_pay", Decimal("0")
+            ),
+            # Aggregated payment fields
+            base_pay=daily_shift.get("base_pay", Decimal("0")),
+            bonus_pay=daily_shift.get("bonus_pay", Decimal("0")),
+            total_gross_pay=daily_shift.get("total_gross_pay", Decimal("0")),
+            # Flags
+            is_holiday=daily_shift.get("is_holiday", False),
+            is_sabbath=daily_shift.get("is_sabbath", False),
+            holiday_name=holiday_name,
+            calculated_by_service="PayrollService",
+            calculation_details=calculation_details,
+        )
+
     def _create_compensatory_days(
         self,
         employee: Employee,
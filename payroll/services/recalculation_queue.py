@@ -0,0 +1,246 @@
+"""
+Coalesced payroll recalculation queue.
+
+WorkLog signals used to run a full PayrollService.calculate() inline, so every
+check-out (and every admin edit) paid for a whole-month recompute inside the
+HTTP request. Signals now enqueue (employee_id, year, month) keys instead:
+
+- "async" (default): after the transaction commits the key is marked pending
+  in the cache and a Celery task is scheduled with a debounce countdown.
+  Further enqueues of a pending key are dropped, so a burst of edits (e.g. an
+  admin correcting 30 logs) results in one recompute of the employee-month.
+- "sync": the key is recalculated once when the transaction commits; a
+  rolled back transaction drops it.
+- "deferred": keys are collected in-process until flush() is called (tests).
+
+The mode is selected with PAYROLL_RECALCULATION_MODE, the debounce with
+PAYROLL_RECALCULATION_DEBOUNCE_SECONDS.
+
+Example usage:
+    queue = get_recalculation_queue()
+    queue.enqueue(employee_id, 2025, 7)
+    queue.flush()  # deferred mode: recalculate pending keys now
+"""
+
+import logging
+import threading
+import weakref
+from datetime import date
+from functools import partial
+from typing import Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+RecalculationKey = Tuple[int, int, int]  # (employee_id, year, month)
+
+MODE_ASYNC = "async"
+MODE_SYNC = "sync"
+MODE_DEFERRED = "deferred"
+
+PENDING_KEY_PREFIX = "payroll_recalc:pending"
+
+# A pending marker outlives the debounce so a lost task cannot block the key forever
+PENDING_TTL_SECONDS = 300
+
+SYSTEM_USER_ID = 1  # System user for automatic calculations
+
+
+def make_pending_key(employee_id: int, year: int, month: int) -> str:
+    """Cache key marking an employee-month as scheduled for recalculation"""
+    return f"{PENDING_KEY_PREFIX}:{employee_id}:{year}:{month:02d}"
+
+
+class PayrollRecalculationQueue:
+    """
+    Deduplicating queue of employee-months awaiting payroll recalculation.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._deferred: Set[RecalculationKey] = set()
+        # Key -> its commit hook. Only the connection's commit hooks hold the
+        # hook, so a rollback, which discards them, also drops the key
+        self._sync_scheduled = weakref.WeakValueDictionary()
+
+    @property
+    def mode(self) -> str:
+        """Recalculation mode from PAYROLL_RECALCULATION_MODE"""
+        return getattr(settings, "PAYROLL_RECALCULATION_MODE", MODE_ASYNC)
+
+    @property
+    def debounce_seconds(self) -> int:
+        """Delay before a scheduled recalculation runs"""
+        return getattr(settings, "PAYROLL_RECALCULATION_DEBOUNCE_SECONDS", 5)
+
+    def enqueue(self, employee_id: int, year: int, month: int) -> None:
+        """
+        Request recalculation of an employee-month.
+
+        Args:
+            employee_id: Employee ID
+            year: Payroll year
+            month: Payroll month
+        """
+        key = (employee_id, year, month)
+        mode = self.mode
+
+        if mode == MODE_DEFERRED:
+            with self._lock:
+                self._deferred.add(key)
+        elif mode == MODE_SYNC:
+            with self._lock:
+                if key in self._sync_scheduled:
+                    return
+                callback = self._sync_scheduled[key] = partial(self._run_sync, key)
+            transaction.on_commit(callback)
+        else:
+            transaction.on_commit(lambda: self._schedule(key))
+
+    def enqueue_dates(self, employee_id: int, dates: Iterable[date]) -> None:
+        """
+        Request recalculation of every month touched by the given dates.
+
+        Args:
+            employee_id: Employee ID
+            dates: Affected work dates
+        """
+        for year, month in sorted({(day.year, day.month) for day in dates}):
+            self.enqueue(employee_id, year, month)
+
+    def pending(self) -> List[RecalculationKey]:
+        """Keys collected in deferred mode, in a stable order"""
+        with self._lock:
+            return sorted(self._deferred)
+
+    def flush(self) -> int:
+        """
+        Recalculate all deferred keys synchronously.
+
+        Returns:
+            int: Number of employee-months recalculated
+        """
+        with self._lock:
+            keys = sorted(self._deferred)
+            self._deferred.clear()
+
+        for key in keys:
+            self.recalculate(*key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop deferred keys without recalculating them"""
+        with self._lock:
+            self._deferred.clear()
+            self._sync_scheduled.clear()
+
+    def recalculate(self, employee_id: int, year: int, month: int):
+        """
+        Recalculate and persist payroll for one employee-month.
+
+        Called by the Celery task and by flush(). The pending marker is removed
+        first, so changes made while the calculation runs are enqueued again.
+        Only changed shifts are recalculated when possible (see incremental.py).
+
+        Returns:
+            Dict: mode ("incremental", "unchanged" or "full"), total_salary,
+            total_hours and the number of recalculated shifts
+        """
+        from payroll.models import Salary
+        from payroll.services.contracts import CalculationContext
+        from payroll.services.enums import CalculationStrategy, EmployeeType
+        from payroll.services.incremental import IncrementalPayrollUpdater
+        from payroll.services.payroll_service import PayrollService
+
+        cache.delete(make_pending_key(employee_id, year, month))
+
+        employee_type = (
+            EmployeeType.HOURLY
+            if Salary.objects.filter(
+                employee_id=employee_id, is_active=True, calculation_type="hourly"
+            ).exists()
+            else EmployeeType.MONTHLY
+        )
+
+        context = CalculationContext(
+            employee_id=employee_id,
+            year=year,
+            month=month,
+            user_id=SYSTEM_USER_ID,
+            employee_type=employee_type,
+            force_recalculate=True,
+        )
+        result = IncrementalPayrollUpdater(PayrollService()).recalculate(
+            context, CalculationStrategy.ENHANCED
+        )
+
+        logger.info(
+            f"Recalculated payroll for employee {employee_id} {year}-{month:02d}",
+            extra={
+                "employee_id": employee_id,
+                "year": year,
+                "month": month,
+                "mode": result["mode"],
+                "total_salary": float(result.get("total_salary", 0)),
+                "action": "payroll_recalculation_done",
+            },
+        )
+        return result
+
+    def _run_sync(self, key: RecalculationKey) -> None:
+        """Recalculate a key scheduled in sync mode"""
+        with self._lock:
+            self._sync_scheduled.pop(key, None)
+        try:
+            self.recalculate(*key)
+        except Exception as e:
+            logger.error(f"Payroll recalculation failed for {key}: {e}")
+
+    def _schedule(self, key: RecalculationKey) -> None:
+        """Schedule the Celery task unless the key is already pending"""
+        employee_id, year, month = key
+        pending_key = make_pending_key(employee_id, year, month)
+        if not cache.add(pending_key, True, timeout=PENDING_TTL_SECONDS):
+            logger.debug(
+                f"Payroll recalculation for {key} already pending",
+                extra={
+                    "employee_id": employee_id,
+                    "year": year,
+                    "month": month,
+                    "action": "payroll_recalculation_coalesced",
+                },
+            )
+            return
+
+        try:
+            from payroll.tasks import recalculate_employee_month
+
+            recalculate_employee_month.apply_async(
+                args=[employee_id, year, month], countdown=self.debounce_seconds
+            )
+        except Exception as e:
+            # Broker unavailable - do not lose the recalculation
+            logger.warning(
+                f"Could not schedule payroll recalculation for {key}, running inline: {e}"
+            )
+            cache.delete(pending_key)
+            self._run_sync(key)
+
+
+_queue: Optional[PayrollRecalculationQueue] = None
+
+
+def get_recalculation_queue() -> PayrollRecalculationQueue:
+    """
+    Get the global recalculation queue instance.
+
+    Returns:
+        PayrollRecalculationQueue: Global queue instance
+    """
+    global _queue
+    if _queue is None:
+        _queue = PayrollRecalculationQueue()
+    return _queue
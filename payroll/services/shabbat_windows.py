@@ -0,0 +1,195 @@
+"""
+Month-scoped Shabbat window table for the critical points algorithm.
+
+Resolving Shabbat times per shift costs a cache round-trip (or an API call)
+every time. This module builds the Shabbat intervals for a whole calculation
+period once and answers "which Shabbat window can a shift starting at X
+intersect" with a binary search over the sorted window starts.
+"""
+
+import bisect
+import calendar
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+import pytz
+
+logger = logging.getLogger(__name__)
+
+ISRAEL_TZ = pytz.timezone("Asia/Jerusalem")
+
+
+@dataclass(frozen=True)
+class ShabbatWindow:
+    """Shabbat start/end interval for one week"""
+
+    friday_date: date
+    start: datetime
+    end: datetime
+
+
+def _parse_shabbat_datetime(value) -> datetime:
+    """Parse an ISO string (or datetime) into an aware datetime"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = ISRAEL_TZ.localize(value)
+    return value
+
+
+def _build_window(friday_date: date, times) -> ShabbatWindow:
+    """Build a window from ShabbatTimesData or a ShabbatTimes dict"""
+    if isinstance(times, dict):
+        start, end = times["shabbat_start"], times["shabbat_end"]
+    else:
+        start, end = times.shabbat_start, times.shabbat_end
+    return ShabbatWindow(
+        friday_date=friday_date,
+        start=_parse_shabbat_datetime(start),
+        end=_parse_shabbat_datetime(end),
+    )
+
+
+def get_fridays_for_month(year: int, month: int) -> List[date]:
+    """
+    Get all Fridays of the month plus the Friday before and after it.
+
+    The neighbouring Fridays cover shifts on the first Saturday of the month
+    and shifts at month end that run into the next Shabbat.
+
+    Args:
+        year: Year of the period
+        month: Month of the period
+
+    Returns:
+        List[date]: Sorted Friday dates
+    """
+    first_day = date(year, month, 1)
+    last_day = date(year, month, calendar.monthrange(year, month)[1])
+
+    first_friday = first_day + timedelta(days=(4 - first_day.weekday()) % 7)
+    fridays = []
+    current = first_friday - timedelta(days=7)
+    while current <= last_day + timedelta(days=7):
+        fridays.append(current)
+        current += timedelta(days=7)
+    return fridays
+
+
+class ShabbatWindowTable:
+    """
+    Sorted table of Shabbat intervals with O(log n) lookup by shift start.
+
+    Example usage:
+        table = ShabbatWindowTable.for_month(2025, 7, get_shabbat_times)
+        window = table.window_for(shift_start)
+        if window and window.start < shift_end:
+            ...
+    """
+
+    def __init__(self, windows: Iterable[ShabbatWindow]):
+        """
+        Initialize the table.
+
+        Args:
+            windows: Shabbat windows in any order
+        """
+        self._windows: List[ShabbatWindow] = sorted(windows, key=lambda w: w.start)
+        self._starts: List[datetime] = [window.start for window in self._windows]
+
+    @classmethod
+    def from_shabbat_times(cls, shabbat_times: Dict[date, object]):
+        """
+        Build a table from preloaded Shabbat times keyed by Friday date.
+
+        Accepts ShabbatTimesData objects (bulk loader) or ShabbatTimes dicts.
+
+        Args:
+            shabbat_times: Shabbat times keyed by Friday date
+
+        Returns:
+            ShabbatWindowTable: Table covering the given Fridays
+        """
+        return cls(
+            _build_window(friday_date, times)
+            for friday_date, times in shabbat_times.items()
+        )
+
+    @classmethod
+    def for_month(
+        cls, year: int, month: int, shabbat_times_provider: Callable[[date], dict]
+    ):
+        """
+        Build a table for a calculation month.
+
+        The provider is called once per Friday (see get_fridays_for_month),
+        typically with UnifiedShabbatService.get_shabbat_times.
+
+        Args:
+            year: Year of the period
+            month: Month of the period
+            shabbat_times_provider: Callable returning ShabbatTimes for a Friday
+
+        Returns:
+            ShabbatWindowTable: Table covering the month
+        """
+        windows = []
+        for friday in get_fridays_for_month(year, month):
+            try:
+                windows.append(_build_window(friday, shabbat_times_provider(friday)))
+            except Exception as e:
+                # Missing weeks are resolved per shift by the caller
+                logger.warning(
+                    f"Failed to load Shabbat times for {friday}: {e}",
+                    extra={"friday_date": friday.isoformat(), "error": str(e)},
+                )
+        return cls(windows)
+
+    @property
+    def windows(self) -> List[ShabbatWindow]:
+        """Windows sorted by start"""
+        return list(self._windows)
+
+    def window_for(self, moment: datetime) -> Optional[ShabbatWindow]:
+        """
+        Find the Shabbat window a shift starting at `moment` can intersect.
+
+        This is the window containing `moment` or, if there is none, the next
+        upcoming window.
+
+        Args:
+            moment: Shift start (timezone-aware)
+
+        Returns:
+            ShabbatWindow, or None if the table does not cover `moment`
+        """
+        index = bisect.bisect_right(self._starts, moment)
+
+        if index > 0 and moment < self._windows[index - 1].end:
+            return self._windows[index - 1]
+
+        if index < len(self._windows):
+            window = self._windows[index]
+            previous = self._windows[index - 1] if index > 0 else None
+
+            # The upcoming window is only trusted when the table also holds
+            # the preceding week (or `moment` falls in the window's own week);
+            # otherwise an earlier, uncovered Shabbat could be skipped.
+            follows_previous_week = previous is not None and (
+                window.friday_date - previous.friday_date
+            ) <= timedelta(days=7)
+            week_start = ISRAEL_TZ.localize(
+                datetime.combine(window.friday_date - timedelta(days=5), time.min)
+            )
+            if follows_previous_week or moment >= week_start:
+                return window
+
+        return None
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def __repr__(self):
+        return f"ShabbatWindowTable(windows={len(self._windows)})"
@@ -27,6 +27,10 @@ class AbstractPayrollStrategy(ABC):
     - Context management for calculations
     """
 
+    # True if each shift's pay depends only on the shift itself (no weekly or
+    # monthly thresholds), so single shifts can be recalculated incrementally
+    SHIFTS_ARE_INDEPENDENT = False
+
     def __init__(self, context: CalculationContext):
         """
         Initialize the strategy with calculation context.
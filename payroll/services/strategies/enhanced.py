@@ -12,10 +12,12 @@ This strategy implements comprehensive payroll calculations including:
 
 import calendar
 import logging
-from datetime import date, datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
@@ -37,8 +39,28 @@ from ..contracts import (
     PayrollBreakdown,
     PayrollMetadata,
     PayrollResult,
+    create_fallback_shabbat_times,
 )
 from ..enums import CalculationMode, CalculationStrategy, EmployeeType, PayrollStatus
+from ..fixed_point import (
+    BUCKET_BY_TERRITORY_AND_TIER,
+    SEGMENT_BUCKETS,
+    TERRITORY_HOLIDAY,
+    TERRITORY_SABBATH,
+    TERRITORY_WEEKDAY,
+    FixedPointShift,
+    agorot_rate,
+    agorot_to_decimal,
+    duration_us,
+    fraction_to_decimal,
+    hours_to_us,
+    monthly_agorot_rate,
+    multiplier,
+    overtime_tier,
+    pay_agorot,
+    us_to_hours,
+)
+from ..shabbat_windows import ISRAEL_TZ, ShabbatWindowTable
 from .base import AbstractPayrollStrategy
 
 
@@ -115,6 +137,38 @@ def night_hours(check_in: datetime, check_out: datetime) -> float:
     return total_night_hours
 
 
+@dataclass(frozen=True)
+class PreloadedSalary:
+    """
+    Read-only stand-in for the Salary model built from preloaded context data.
+
+    Exposes only the attributes used by the calculation algorithms.
+    """
+
+    calculation_type: str
+    hourly_rate: Optional[Decimal] = None
+    base_salary: Optional[Decimal] = None
+    currency: str = "ILS"
+
+
+@dataclass(frozen=True)
+class PreloadedWorkLog:
+    """
+    Read-only stand-in for the WorkLog model built from preloaded context data.
+
+    Exposes only the attributes used by the calculation algorithms.
+    """
+
+    id: int
+    check_in: datetime
+    check_out: datetime
+
+    def get_total_hours(self) -> Decimal:
+        """Total hours worked, rounded like WorkLog.get_total_hours()"""
+        hours = (self.check_out - self.check_in).total_seconds() / 3600
+        return round(Decimal(str(hours)), 2)
+
+
 class EnhancedPayrollStrategy(AbstractPayrollStrategy):
     """
     Enhanced payroll calculation strategy with full Israeli labor law compliance.
@@ -135,6 +189,9 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
     MINIMUM_WAGE_ILS = Decimal("5300")
     MONTHLY_WORK_HOURS = Decimal("182")  # Standard month for calculations
 
+    # Only daily norms affect pay; the weekly limits above are validation-only
+    SHIFTS_ARE_INDEPENDENT = True
+
     # Daily hour norms
     REGULAR_DAILY_HOURS = Decimal("8.6")  # Regular day (4 days per week)
     SHORT_DAILY_HOURS = Decimal("7.6")  # Short day (usually Friday)
@@ -187,6 +244,9 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
         "0.00"
     )  # Regular hours premium coefficient (no bonus)
 
+    # Normative hours in fixed-point mode (see apply_normative), microseconds
+    _NORMATIVE_US = {hours_to_us("8.0"): hours_to_us("8.6")}
+
     def __init__(self, context: CalculationContext):
         super().__init__(context)
         self._holidays_cache: Optional[Dict] = None
@@ -202,6 +262,32 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
         self._calculation_errors = []
         self._warnings = []
 
+        # Kernel mode: contexts built by BulkEnhancedPayrollService carry the
+        # salary, work logs, holidays and Shabbat times, so the calculation
+        # runs without touching the ORM, the cache or external APIs.
+        self._use_preloaded_data = (
+            "work_logs" in context and "calculation_type" in context
+        )
+        self._preloaded_shabbat_times = context.get("shabbat_times") or {}
+
+        # Month-scoped Shabbat window table, built once per calculation
+        # (see _get_shabbat_window_table) instead of resolving every shift.
+        self._shabbat_window_table: Optional[ShabbatWindowTable] = context.get(
+            "shabbat_windows"
+        )
+        self._sabbath_windows_by_friday: Dict[date, Tuple[datetime, datetime]] = {}
+
+        # Shift segments precomputed by the bulk service's vectorized engine,
+        # keyed by (check_in, check_out); other shifts use the scalar path.
+        self._precomputed_segments = context.get("shift_segments") or {}
+
+        # Fixed-point mode: integer microseconds and agorot, Decimal only in
+        # the PayrollResult (see payroll/services/fixed_point.py)
+        self._fixed_point = context.get(
+            "fixed_point_arithmetic",
+            getattr(settings, "PAYROLL_FIXED_POINT_ARITHMETIC", False),
+        )
+
     def calculate(self) -> PayrollResult:
         """
         Calculate payroll using enhanced algorithm with full Israeli labor law compliance.
@@ -210,17 +296,30 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
             PayrollResult: Comprehensive payroll calculation result
         """
         try:
-            # Get employee with full related data
-            employee = self._get_employee_with_relations()
-            salary = self._get_salary_info(employee)
+            if self._use_preloaded_data:
+                # Pure calculation from preloaded context data
+                employee = None
+                salary = self._get_preloaded_salary()
+                holidays = self._get_preloaded_holidays()
+                work_logs = self._get_preloaded_work_logs()
+            else:
+                # Get employee with full related data
+                employee = self._get_employee_with_relations()
+                salary = self._get_salary_info(employee)
 
-            # Initialize API services if not in fast mode
-            if not self._fast_mode:
-                self._initialize_api_services()
+                # Initialize API services if not in fast mode
+                if not self._fast_mode:
+                    self._initialize_api_services()
 
-            # Get holidays and work logs for the month
-            holidays = self._get_holidays_enhanced()
-            work_logs = self._get_work_logs_enhanced(employee)
+                # Get holidays and work logs for the month
+                holidays = self._get_holidays_enhanced()
+                work_logs = self._get_work_logs_enhanced(employee)
+
+            # Incremental updates calculate only the changed shifts
+            worklog_ids = self.context.get("worklog_ids")
+            if worklog_ids is not None:
+                worklog_ids = set(worklog_ids)
+                work_logs = [log for log in work_logs if log.id in worklog_ids]
 
             # Validate work logs for legal compliance
             self._validate_legal_compliance(work_logs)
@@ -339,6 +438,122 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
 
         return active_salary
 
+    def _get_preloaded_salary(self) -> PreloadedSalary:
+        """
+        Build salary configuration from preloaded context data.
+
+        Returns:
+            PreloadedSalary: Salary stand-in for the calculation algorithms
+        """
+        return PreloadedSalary(
+            calculation_type=self.context["calculation_type"],
+            hourly_rate=self.context.get("hourly_rate"),
+            base_salary=self.context.get("base_salary"),
+        )
+
+    def _get_preloaded_holidays(self) -> Dict[date, Dict]:
+        """
+        Convert preloaded holidays to the format returned by _get_holidays_enhanced.
+
+        Returns:
+            Dict: Holiday data keyed by date
+        """
+        holidays = {}
+        for holiday_date, holiday in (self.context.get("holidays") or {}).items():
+            if isinstance(holiday, dict):
+                holidays[holiday_date] = holiday
+            else:
+                holidays[holiday_date] = {
+                    "name": holiday.name,
+                    "is_paid": holiday.is_paid,
+                    "source": holiday.source,
+                }
+        return holidays
+
+    def _get_preloaded_work_logs(self) -> List[PreloadedWorkLog]:
+        """
+        Convert preloaded work log dicts into WorkLog stand-ins.
+
+        Returns:
+            List[PreloadedWorkLog]: Completed work logs ordered by check-in
+        """
+        work_logs = [
+            PreloadedWorkLog(
+                id=log["worklog_id"],
+                check_in=log["check_in"],
+                check_out=log["check_out"],
+            )
+            for log in self.context["work_logs"]
+            if log.get("check_out") is not None
+        ]
+        work_logs.sort(key=lambda log: log.check_in)
+        return work_logs
+
+    def _get_shabbat_window_table(self) -> ShabbatWindowTable:
+        """
+        Get the Shabbat window table for the calculation month.
+
+        Uses the table from the context when present, builds it from preloaded
+        Shabbat times in kernel mode, and otherwise loads all Fridays of the
+        month from the Shabbat service once.
+
+        Returns:
+            ShabbatWindowTable: Shabbat intervals covering the month
+        """
+        if self._shabbat_window_table is None:
+            if self._use_preloaded_data or self._preloaded_shabbat_times:
+                self._shabbat_window_table = ShabbatWindowTable.from_shabbat_times(
+                    self._preloaded_shabbat_times
+                )
+            else:
+                from integrations.services.unified_shabbat_service import (
+                    get_shabbat_times,
+                )
+
+                self._shabbat_window_table = ShabbatWindowTable.for_month(
+                    self._year, self._month, get_shabbat_times
+                )
+        return self._shabbat_window_table
+
+    def _get_sabbath_window(self, friday_date: date) -> Tuple[datetime, datetime]:
+        """
+        Get Sabbath start and end for the week of the given Friday.
+
+        Preloaded Shabbat times are used when the context provides them. In
+        kernel mode a missing Friday falls back to the seasonal estimate
+        instead of calling the Shabbat service.
+
+        Args:
+            friday_date: Friday of the week
+
+        Returns:
+            Tuple[datetime, datetime]: Sabbath start and end
+        """
+        if friday_date in self._sabbath_windows_by_friday:
+            return self._sabbath_windows_by_friday[friday_date]
+
+        preloaded = self._preloaded_shabbat_times.get(friday_date)
+        if preloaded is not None:
+            return preloaded.shabbat_start, preloaded.shabbat_end
+
+        if self._use_preloaded_data:
+            shabbat_times = create_fallback_shabbat_times(friday_date.isoformat())
+        else:
+            from integrations.services.unified_shabbat_service import (
+                get_shabbat_times,
+            )
+
+            shabbat_times = get_shabbat_times(friday_date)
+
+        sabbath_start = datetime.fromisoformat(
+            shabbat_times["shabbat_start"].replace("Z", "+00:00")
+        )
+        sabbath_end = datetime.fromisoformat(
+            shabbat_times["shabbat_end"].replace("Z", "+00:00")
+        )
+        self._sabbath_windows_by_friday[friday_date] = (sabbath_start, sabbath_end)
+        return sabbath_start, sabbath_end
+
     def _initialize_api_services(self) -> None:
         """Initialize external API services for precise calculations."""
         try:
@@ -383,7 +598,8 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
         except (AttributeError, KeyError):
             pass
 
-        if cached_holidays:
+        # Months without holidays are cached as {} and are hits too
+        if cached_holidays is not None:
             duration_ms = (timezone.now() - start_time).total_seconds() * 1000
             self._log_performance_metrics(
                 "holidays_cache_hit",
@@ -793,7 +1009,19 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
 
         from django.utils import timezone
 
-        from ..contracts import create_empty_breakdown
+        is_monthly = calculation_type == "monthly"
+
+        precomputed = self._precomputed_segments.get(
+            (shift_start_datetime, shift_end_datetime)
+        )
+        if precomputed is not None:
+            segments = [
+                (hours, *self._get_segment_bucket(bucket))
+                for bucket, hours in precomputed.segments
+            ]
+            return self._build_shift_breakdown(
+                segments, base_hourly_rate, precomputed.night_hours, is_monthly
+            )
 
         # Step 1: Preliminary analysis
         total_shift_duration = shift_end_datetime - shift_start_datetime
@@ -822,32 +1050,12 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
         # This applies to BOTH hourly and monthly employees
         # The threshold determines WHEN overtime kicks in, not HOW MUCH to pay
         applicable_daily_norm = self.NIGHT_NORM if is_night_shift else self.DAY_NORM
-        is_monthly = calculation_type == "monthly"
-
-        # Get Sabbath times from API
-        from integrations.services.unified_shabbat_service import get_shabbat_times
-
-        # Find the Friday for this shift
-        friday_date = shift_start_datetime.date()
-        if friday_date.weekday() > 4:  # Saturday or Sunday, find previous Friday
-            friday_date = friday_date - timedelta(days=friday_date.weekday() - 4)
-        elif friday_date.weekday() < 4:  # Monday-Thursday, find next Friday
-            friday_date = friday_date + timedelta(days=4 - friday_date.weekday())
 
-        # Get precise Sabbath times from API
-        shabbat_times = get_shabbat_times(friday_date)
-        sabbath_start = datetime.fromisoformat(
-            shabbat_times["shabbat_start"].replace("Z", "+00:00")
-        )
-        sabbath_end = datetime.fromisoformat(
-            shabbat_times["shabbat_end"].replace("Z", "+00:00")
+        # Get precise Sabbath times in the shift's timezone
+        sabbath_start, sabbath_end = self._get_shift_sabbath_window(
+            shift_start_datetime
         )
 
-        # CRITICAL: Convert all times to same timezone (UTC) for proper comparison
-        if shift_start_datetime.tzinfo != sabbath_start.tzinfo:
-            sabbath_start = sabbath_start.astimezone(shift_start_datetime.tzinfo)
-            sabbath_end = sabbath_end.astimezone(shift_start_datetime.tzinfo)
-
         # Timezone conversion complete
 
         # Step 2: Determine critical points
@@ -889,10 +1097,8 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
         critical_points = sorted(list(set(critical_points)))
 
         # Step 3: Iterative calculation by segments
-        result = create_empty_breakdown()
-        total_pay = Decimal("0")
+        segments = []
         hours_worked_so_far = Decimal("0")
-        calculation_breakdown = []
 
         # Process segments between critical points
 
@@ -1001,9 +1207,74 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
                     hours_key = "overtime_150_hours"
                     pay_key = "overtime_150_pay"
 
+            segments.append((segment_duration_hours, hours_key, pay_key, final_rate))
+            hours_worked_so_far += segment_duration_hours
+
+        return self._build_shift_breakdown(
+            segments, base_hourly_rate, total_hours_in_night_period, is_monthly
+        )
+
+    def _get_shift_sabbath_window(
+        self, shift_start_datetime: datetime
+    ) -> Tuple[datetime, datetime]:
+        """
+        Get the Sabbath window a shift can intersect, in the shift's timezone.
+
+        Args:
+            shift_start_datetime: Shift start time
+
+        Returns:
+            Tuple[datetime, datetime]: Sabbath start and end
+        """
+        # Binary search in the month's window table
+        window = self._get_shabbat_window_table().window_for(shift_start_datetime)
+        if window is not None:
+            sabbath_start, sabbath_end = window.start, window.end
+        else:
+            # Shift outside the table (e.g. a missing week) - resolve its Friday
+            friday_date = shift_start_datetime.date()
+            if friday_date.weekday() > 4:  # Saturday or Sunday, previous Friday
+                friday_date = friday_date - timedelta(days=friday_date.weekday() - 4)
+            elif friday_date.weekday() < 4:  # Monday-Thursday, next Friday
+                friday_date = friday_date + timedelta(days=4 - friday_date.weekday())
+            sabbath_start, sabbath_end = self._get_sabbath_window(friday_date)
+
+        # CRITICAL: Convert all times to same timezone (UTC) for proper comparison
+        if shift_start_datetime.tzinfo != sabbath_start.tzinfo:
+            sabbath_start = sabbath_start.astimezone(shift_start_datetime.tzinfo)
+            sabbath_end = sabbath_end.astimezone(shift_start_datetime.tzinfo)
+
+        return sabbath_start, sabbath_end
+
+    def _get_segment_bucket(self, bucket: int) -> Tuple[str, str, Decimal]:
+        """Get (hours_key, pay_key, rate) of a precomputed segment bucket"""
+        hours_key, pay_key, rate_attr = SEGMENT_BUCKETS[bucket]
+        return hours_key, pay_key, getattr(self, rate_attr)
+
+    def _build_shift_breakdown(
+        self, segments, base_hourly_rate, night_hours, is_monthly
+    ) -> dict:
+        """
+        Accumulate classified shift segments into a breakdown.
+
+        Shared by the scalar critical points path and precomputed segments.
+
+        Args:
+            segments: (hours, hours_key, pay_key, rate) in time order
+            base_hourly_rate: Base hourly rate
+            night_hours: Hours inside the night period (22:00-06:00)
+            is_monthly: True for monthly employees
+
+        Returns:
+            dict: Shift breakdown (create_empty_breakdown layout)
+        """
+        from ..contracts import create_empty_breakdown
+
+        result = create_empty_breakdown()
+
+        for segment_duration_hours, hours_key, pay_key, final_rate in segments:
             # Calculate segment payment
             segment_pay = segment_duration_hours * base_hourly_rate * final_rate
-            total_pay += segment_pay
 
             # Update result breakdown
             if hours_key in result:
@@ -1011,26 +1282,10 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
             if pay_key in result:
                 result[pay_key] += segment_pay
 
-            # Add to detailed breakdown for debugging
-            calculation_breakdown.append(
-                {
-                    "start": segment_start,
-                    "end": segment_end,
-                    "duration_hours": float(segment_duration_hours),
-                    "hours_key": hours_key,
-                    "pay_key": pay_key,
-                    "multiplier": float(final_rate),
-                    "pay": float(segment_pay),
-                    "hours_worked_before": float(hours_worked_so_far),
-                }
-            )
-
-            hours_worked_so_far += segment_duration_hours
-
         # Track night hours separately for diagnostic purposes
         # This is the total hours that fall within the night period (22:00-06:00)
-        result["night_shift_hours"] = total_hours_in_night_period
-        result["night_hours"] = total_hours_in_night_period  # Alias for compatibility
+        result["night_shift_hours"] = night_hours
+        result["night_hours"] = night_hours  # Alias for compatibility
 
         # Apply normative hours conversion for MONTHLY employees on WEEKDAYS
         # CRITICAL RULES:
@@ -1165,6 +1420,10 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
         """
         # Use the new critical points method
         try:
+            if self._fixed_point:
+                return self._calculate_hourly_employee_fixed_point(
+                    salary, work_logs, holidays
+                )
             return self._calculate_hourly_employee_critical_points(
                 employee, salary, work_logs, holidays
             )
@@ -1211,6 +1470,10 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
         Returns:
             PayrollResult: Monthly employee payroll result
         """
+        if self._fixed_point:
+            return self._calculate_monthly_employee_fixed_point(
+                salary, work_logs, holidays
+            )
         return self._calculate_monthly_employee_critical_points(
             employee, salary, work_logs, holidays
         )
@@ -1628,6 +1891,359 @@ class EnhancedPayrollStrategy(AbstractPayrollStrategy):
 
         return breakdown
 
+    def _segment_shift_fixed_point(
+        self, shift_start_datetime, shift_end_datetime, holidays, is_monthly
+    ) -> FixedPointShift:
+        """
+        Critical points segmentation of a shift in integer microseconds.
+
+        Same segments and buckets as _calculate_shift_critical_points, with
+        integer durations and tier comparisons instead of Decimal hours.
+
+        Args:
+            shift_start_datetime: Shift start time
+            shift_end_datetime: Shift end time
+            holidays: Dict of holidays
+            is_monthly: True for monthly employees (normative hours)
+
+        Returns:
+            FixedPointShift: Microseconds per segment bucket and night time
+        """
+        shift = FixedPointShift(len(SEGMENT_BUCKETS))
+
+        precomputed = self._precomputed_segments.get(
+            (shift_start_datetime, shift_end_datetime)
+        )
+        if precomputed is not None and len(precomputed.durations_us) == len(
+            precomputed.segments
+        ):
+            for (bucket, _hours), us in zip(
+                precomputed.segments, precomputed.durations_us
+            ):
+                shift.add(bucket, us)
+            shift.night_us = precomputed.night_us
+        else:
+            night_hours = self._calculate_night_hours(
+                shift_start_datetime.astimezone(ISRAEL_TZ),
+                shift_end_datetime.astimezone(ISRAEL_TZ),
+                time(22, 0),
+                time(6, 0),
+            )
+            shift.night_us = hours_to_us(night_hours)
+
+            is_night_shift = night_hours > self.NIGHT_DETECTION_MINIMUM
+            norm_us = hours_to_us(self.NIGHT_NORM if is_night_shift else self.DAY_NORM)
+            tier1_us = hours_to_us(self.OVERTIME_TIER1_HOURS)
+
+            sabbath_start, sabbath_end = self._get_shift_sabbath_window(
+                shift_start_datetime
+            )
+            norm_end_time = shift_start_datetime + timedelta(microseconds=norm_us)
+            tier1_end_time = norm_end_time + timedelta(microseconds=tier1_us)
+
+            critical_points = {shift_start_datetime, shift_end_datetime}
+            for point in (sabbath_start, sabbath_end, norm_end_time, tier1_end_time):
+                if shift_start_datetime <= point <= shift_end_datetime:
+                    critical_points.add(point)
+            critical_points = sorted(critical_points)
+
+            worked_us = 0
+            for segment_start, segment_end in zip(critical_points, critical_points[1:]):
+                segment_us = duration_us(segment_start, segment_end)
+                if segment_us <= 0:
+                    continue
+
+                segment_midpoint = segment_start + (segment_end - segment_start) / 2
+                if sabbath_start <= segment_midpoint < sabbath_end:
+                    territory = TERRITORY_SABBATH
+                elif holidays and segment_midpoint.date() in holidays:
+                    territory = TERRITORY_HOLIDAY
+                else:
+                    territory = TERRITORY_WEEKDAY
+
+                tier = overtime_tier(worked_us, norm_us, tier1_us)
+                shift.add(BUCKET_BY_TERRITORY_AND_TIER[territory][tier], segment_us)
+                worked_us += segment_us
+
+        # Normative hours for monthly employees on weekday-only shifts
+        # (same rules as _build_shift_breakdown)
+        bucket_us = shift.bucket_us
+        if (
+            is_monthly
+            and not self._fast_mode
+            and bucket_us[0] > 0
+            and not any(bucket_us[3:])
+        ):
+            bucket_us[0] = self._NORMATIVE_US.get(bucket_us[0], bucket_us[0])
+
+        return shift
+
+    def _build_fixed_point_daily_result(
+        self, log, holidays, shift, bucket_pay, base_pay, bonus_pay
+    ):
+        """
+        Build the DailyPayrollBreakdown of a shift from fixed-point values.
+
+        Args:
+            log: Work log of the shift
+            holidays: Dict of holidays
+            shift: FixedPointShift of the log
+            bucket_pay: Pay per segment bucket in agorot
+            base_pay: Base pay in agorot
+            bonus_pay: Bonus pay in agorot
+
+        Returns:
+            DailyPayrollBreakdown: Shift-level result
+        """
+        from ..contracts import DailyPayrollBreakdown
+
+        work_date = log.check_in.date()
+        daily = DailyPayrollBreakdown(
+            worklog_id=log.id,
+            work_date=work_date,
+            night_shift_hours=us_to_hours(shift.night_us),
+            night_shift_pay=Decimal("0"),
+            base_pay=agorot_to_decimal(base_pay),
+            bonus_pay=agorot_to_decimal(bonus_pay),
+            total_gross_pay=agorot_to_decimal(base_pay + bonus_pay),
+            is_holiday=work_date in holidays,
+            is_sabbath=any(shift.bucket_us[3:6]),
+            is_night_shift=shift.night_us > 0,
+        )
+        for (hours_key, pay_key, _rate), us, pay in zip(
+            SEGMENT_BUCKETS, shift.bucket_us, bucket_pay
+        ):
+            daily[hours_key] = us_to_hours(us)
+            daily[pay_key] = agorot_to_decimal(pay)
+        return daily
+
+    def _calculate_hourly_employee_fixed_point(
+        self, salary, work_logs, holidays: Dict[date, Dict]
+    ) -> PayrollResult:
+        """
+        Calculate payroll for hourly employees in fixed-point arithmetic.
+
+        Time is summed per segment bucket in integer microseconds and each
+        shift's pay is rounded once per bucket to whole agorot; month totals
+        are integer sums of the shift amounts.
+        """
+        hourly_rate = Decimal(str(salary.hourly_rate))
+        rate = agorot_rate(hourly_rate)
+        factors = [multiplier(getattr(self, attr)) for _, _, attr in SEGMENT_BUCKETS]
+
+        total_us = [0] * len(SEGMENT_BUCKETS)
+        total_pay = [0] * len(SEGMENT_BUCKETS)
+        night_us = 0
+        daily_results = []
+
+        for log in work_logs:
+            shift = self._segment_shift_fixed_point(
+                log.check_in, log.check_out, holidays, is_monthly=False
+            )
+            bucket_pay = [
+                pay_agorot(us, rate, factor)
+                for us, factor in zip(shift.bucket_us, factors)
+            ]
+            # Base pay: regular and holiday buckets, bonus pay: the rest
+            base_pay = bucket_pay[0] + bucket_pay[6]
+            bonus_pay = sum(bucket_pay) - base_pay
+            daily_results.append(
+                self._build_fixed_point_daily_result(
+                    log, holidays, shift, bucket_pay, base_pay, bonus_pay
+                )
+            )
+
+            for bucket, (us, pay) in enumerate(zip(shift.bucket_us, bucket_pay)):
+                total_us[bucket] += us
+                total_pay[bucket] += pay
+            night_us += shift.night_us
+
+        hours = [us_to_hours(us) for us in total_us]
+        pay = [agorot_to_decimal(agorot) for agorot in total_pay]
+        total_salary = agorot_to_decimal(sum(total_pay))
+        total_hours = us_to_hours(sum(total_us))
+        night_hours = us_to_hours(night_us)
+
+        breakdown = PayrollBreakdown(
+            regular_hours=float(hours[0]),
+            regular_rate=float(hourly_rate),
+            regular_pay=float(pay[0]),
+            overtime_125_hours=float(hours[1]),
+            overtime_125_rate=float(hourly_rate * self.OVERTIME_RATE_125),
+            overtime_125_pay=float(pay[1]),
+            overtime_150_hours=float(hours[2]),
+            overtime_150_rate=float(hourly_rate * self.OVERTIME_RATE_150),
+            overtime_150_pay=float(pay[2]),
+            sabbath_hours=float(hours[3]),
+            sabbath_rate=float(hourly_rate * self.SABBATH_RATE),
+            sabbath_pay=float(pay[3]),
+            sabbath_overtime_175_hours=float(hours[4]),
+            sabbath_overtime_175_rate=float(
+                hourly_rate * self.SABBATH_OVERTIME_RATE_175
+            ),
+            sabbath_overtime_175_pay=float(pay[4]),
+            sabbath_overtime_200_hours=float(hours[5]),
+            sabbath_overtime_200_rate=float(
+                hourly_rate * self.SABBATH_OVERTIME_RATE_200
+            ),
+            sabbath_overtime_200_pay=float(pay[5]),
+            holiday_hours=float(hours[6]),
+            holiday_rate=float(hourly_rate * self.HOLIDAY_RATE),
+            holiday_pay=float(pay[6]),
+            night_shift_hours=float(night_hours),
+            night_hours=float(night_hours),
+            total_salary=float(total_salary),
+            total_hours=float(total_hours),
+        )
+
+        return PayrollResult(
+            total_salary=total_salary,
+            total_hours=total_hours,
+            regular_hours=hours[0],
+            overtime_hours=us_to_hours(total_us[1] + total_us[2]),
+            shabbat_hours=us_to_hours(total_us[3] + total_us[4] + total_us[5]),
+            holiday_hours=hours[6],
+            night_hours=night_hours,
+            breakdown=breakdown,
+            metadata={
+                "calculation_strategy": "enhanced_critical_points",
+                "employee_type": "hourly",
+                "currency": "ILS",
+                "arithmetic": "fixed_point",
+                "has_cache": False,
+                "warnings": [],
+            },
+            daily_results=daily_results,
+        )
+
+    def _calculate_monthly_employee_fixed_point(
+        self, salary, work_logs, holidays: Dict[date, Dict]
+    ) -> PayrollResult:
+        """
+        Calculate payroll for monthly employees in fixed-point arithmetic.
+
+        Proportional base and premiums are exact rationals of the effective
+        hourly rate (salary / 182), rounded once per shift to whole agorot.
+        """
+        full_monthly_salary = Decimal(str(salary.base_salary or 0))
+        monthly_hours_norm = self.MONTHLY_WORK_HOURS
+        rate = monthly_agorot_rate(full_monthly_salary, monthly_hours_norm)
+        effective_hourly_rate = fraction_to_decimal(rate) / 100
+        bonuses = [
+            multiplier(bonus)
+            for bonus in (
+                self.RATE_REGULAR_PREMIUM,
+                self.OVERTIME_BONUS_125,
+                self.OVERTIME_BONUS_150,
+                self.SPECIAL_DAY_BONUS,
+                self.SABBATH_OVERTIME_BONUS_175,
+                self.SABBATH_OVERTIME_BONUS_200,
+            )
+        ]
+
+        total_us = [0] * len(SEGMENT_BUCKETS)
+        total_pay = [0] * len(SEGMENT_BUCKETS)
+        proportional_base = 0
+        bonus_pay = 0
+        night_us = 0
+        daily_results = []
+
+        for log in work_logs:
+            shift = self._segment_shift_fixed_point(
+                log.check_in, log.check_out, holidays, is_monthly=True
+            )
+            # Like the Decimal path, the monthly breakdown covers the weekday
+            # and Sabbath buckets (holiday overtime is in the Sabbath buckets)
+            # and carries no night hours.
+            shift.bucket_us[6] = 0
+            shift.night_us = 0
+
+            shift_base = pay_agorot(shift.total_us, rate)
+            shift_bonus = sum(
+                pay_agorot(us, rate, bonus)
+                for us, bonus in zip(shift.bucket_us, bonuses)
+            )
+            bucket_pay = [
+                pay_agorot(us, rate, 1 + bonus)
+                for us, bonus in zip(shift.bucket_us, bonuses)
+            ] + [0]
+            daily_results.append(
+                self._build_fixed_point_daily_result(
+                    log, holidays, shift, bucket_pay, shift_base, shift_bonus
+                )
+            )
+
+            for bucket, (us, pay) in enumerate(zip(shift.bucket_us, bucket_pay)):
+                total_us[bucket] += us
+                total_pay[bucket] += pay
+            proportional_base += shift_base
+            bonus_pay += shift_bonus
+            night_us += shift.night_us
+
+        hours = [us_to_hours(us) for us in total_us]
+        pay = [agorot_to_decimal(agorot) for agorot in total_pay]
+        total_hours_us = sum(total_us)
+        total_hours_worked = us_to_hours(total_hours_us)
+        total_salary = agorot_to_decimal(proportional_base + bonus_pay)
+        proportional_base_decimal = agorot_to_decimal(proportional_base)
+        bonus_pay_decimal = agorot_to_decimal(bonus_pay)
+
+        breakdown = PayrollBreakdown(
+            base_monthly_salary=float(full_monthly_salary),
+            work_proportion=float(total_hours_worked / monthly_hours_norm),
+            proportional_base=float(proportional_base_decimal),
+            total_bonuses_monthly=float(bonus_pay_decimal),
+            regular_hours=float(hours[0]),
+            regular_rate=float(effective_hourly_rate),
+            regular_pay=float(pay[0]),
+            overtime_125_hours=float(hours[1]),
+            overtime_125_rate=float(effective_hourly_rate * self.OVERTIME_RATE_125),
+            overtime_125_pay=float(pay[1]),
+            overtime_150_hours=float(hours[2]),
+            overtime_150_rate=float(effective_hourly_rate * self.OVERTIME_RATE_150),
+            overtime_150_pay=float(pay[2]),
+            sabbath_hours=float(hours[3]),
+            sabbath_rate=float(effective_hourly_rate * self.SABBATH_RATE),
+            sabbath_pay=float(pay[3]),
+            sabbath_overtime_175_hours=float(hours[4]),
+            sabbath_overtime_175_rate=float(
+                effective_hourly_rate * self.SABBATH_OVERTIME_RATE_175
+            ),
+            sabbath_overtime_175_pay=float(pay[4]),
+            sabbath_overtime_200_hours=float(hours[5]),
+            sabbath_overtime_200_rate=float(
+                effective_hourly_rate * self.SABBATH_OVERTIME_RATE_200
+            ),
+            sabbath_overtime_200_pay=float(pay[5]),
+            total_salary=float(total_salary),
+            total_hours=float(total_hours_worked),
+        )
+
+        return PayrollResult(
+            total_salary=total_salary,
+            total_hours=total_hours_worked,
+            regular_hours=hours[0],
+            overtime_hours=us_to_hours(total_us[1] + total_us[2]),
+            shabbat_hours=us_to_hours(total_us[3] + total_us[4] + total_us[5]),
+            holiday_hours=Decimal("0"),
+            night_hours=us_to_hours(night_us),
+            breakdown=breakdown,
+            metadata={
+                "calculation_strategy": "enhanced_critical_points_monthly",
+                "employee_type": "monthly",
+                "currency": "ILS",
+                "arithmetic": "fixed_point",
+                "base_monthly_salary": float(full_monthly_salary),
+                "effective_hourly_rate": float(effective_hourly_rate),
+                "monthly_hours_norm": float(monthly_hours_norm),
+                "proportional_base": float(proportional_base_decimal),
+                "bonus_pay": float(bonus_pay_decimal),
+                "has_cache": False,
+                "warnings": [],
+            },
+            daily_results=daily_results,
+        )
+
     def _calculate_night_shift_hours(self, work_log: WorkLog) -> Decimal:
         """
         Calculate night shift hours (22:00-06:00) for a work log.
@@ -0,0 +1,161 @@
+"""
+Payroll cache invalidation signals.
+
+Bumps the generation counters of payroll/services/cache_versions.py when the
+inputs of a payroll calculation change, so cached summaries, daily
+calculations and holidays are never served stale:
+
+- WorkLog save/delete -> employee-month (old and new month of the shift)
+- Salary save/delete -> salary of the employee
+- Holiday save/delete -> holiday-month (old and new month of the date), the
+  process-local calendar caches of integrations/services/calendar_cache.py,
+  and the incremental payroll totals of the month
+  (payroll/services/incremental.py)
+
+Bumps run after the transaction commits.
+
+MonthlyPayrollSummary save/delete also updates the analytics rollups of
+payroll/services/analytics_rollup.py, in the same transaction.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from integrations.models import Holiday
+from integrations.services.calendar_cache import bump_calendar_version
+from worktime.models import WorkLog
+
+from .models import MonthlyPayrollSummary, Salary
+from .services.analytics_rollup import apply_summary_changes, summary_totals
+from .services.cache_versions import (
+    bump_employee_months,
+    bump_holiday_month,
+    bump_salary,
+)
+from .services.incremental import clear_incremental_state
+
+
+def _shift_months(employee_id, check_in, check_out):
+    """Employee-month keys touched by a shift"""
+    keys = set()
+    for moment in (check_in, check_out):
+        if moment is not None:
+            keys.add((employee_id, moment.year, moment.month))
+    return keys
+
+
+@receiver(pre_save, sender=WorkLog)
+def remember_worklog_months(sender, instance, **kwargs):
+    """Remember the months of the stored shift before it is moved"""
+    if not instance.pk:
+        return
+    original = (
+        WorkLog.all_objects.filter(pk=instance.pk)
+        .values_list("employee_id", "check_in", "check_out")
+        .first()
+    )
+    if original:
+        instance._payroll_cache_months = _shift_months(*original)
+
+
+@receiver(post_save, sender=WorkLog)
+@receiver(post_delete, sender=WorkLog)
+def invalidate_worklog_payroll_cache(sender, instance, **kwargs):
+    keys = _shift_months(instance.employee_id, instance.check_in, instance.check_out)
+    keys |= getattr(instance, "_payroll_cache_months", set())
+    transaction.on_commit(lambda: bump_employee_months(keys))
+
+
+@receiver(post_save, sender=Salary)
+@receiver(post_delete, sender=Salary)
+def invalidate_salary_payroll_cache(sender, instance, **kwargs):
+    employee_id = instance.employee_id
+    transaction.on_commit(lambda: bump_salary(employee_id))
+
+
+@receiver(pre_save, sender=Holiday)
+def remember_holiday_month(sender, instance, **kwargs):
+    """Remember the month of the stored holiday before its date is moved"""
+    if not instance.pk:
+        return
+    original_date = (
+        Holiday.objects.filter(pk=instance.pk).values_list("date", flat=True).first()
+    )
+    if original_date:
+        instance._payroll_cache_month = (original_date.year, original_date.month)
+
+
+@receiver(post_save, sender=Holiday)
+@receiver(post_delete, sender=Holiday)
+def invalidate_holiday_payroll_cache(sender, instance, **kwargs):
+    months = {(instance.date.year, instance.date.month)}
+    original_month = getattr(instance, "_payroll_cache_month", None)
+    if original_month:
+        months.add(original_month)
+
+    def bump():
+        for year, month in months:
+            bump_holiday_month(year, month)
+            # Stored totals were calculated with the old calendar
+            clear_incremental_state(year, month)
+        bump_calendar_version()
+
+    transaction.on_commit(bump)
+
+
+@receiver(pre_save, sender=MonthlyPayrollSummary)
+def remember_summary_totals(sender, instance, **kwargs):
+    """Remember the stored totals before a summary is overwritten"""
+    if not instance.pk:
+        return
+    original = (
+        MonthlyPayrollSummary.objects.filter(pk=instance.pk)
+        .values_list("employee_id", "year", "month", "total_gross_pay", "total_hours")
+        .first()
+    )
+    if original:
+        instance._rollup_original = original
+
+
+@receiver(post_save, sender=MonthlyPayrollSummary)
+def update_rollups_on_summary_save(sender, instance, **kwargs):
+    original = getattr(instance, "_rollup_original", None)
+    instance._rollup_original = None
+    roles = {instance.employee_id: instance.employee.role}
+    current = summary_totals(instance.total_gross_pay, instance.total_hours)
+
+    if original and original[:3] != (
+        instance.employee_id,
+        instance.year,
+        instance.month,
+    ):
+        # Summary moved to another employee-month
+        employee_id, year, month = original[:3]
+        apply_summary_changes(
+            year, month, {employee_id: summary_totals(*original[3:])}, {}
+        )
+        original = None
+
+    previous = {instance.employee_id: summary_totals(*original[3:])} if original else {}
+    apply_summary_changes(
+        instance.year,
+        instance.month,
+        previous,
+        {instance.employee_id: current},
+        roles=roles,
+    )
+
+
+@receiver(post_delete, sender=MonthlyPayrollSummary)
+def update_rollups_on_summary_delete(sender, instance, **kwargs):
+    apply_summary_changes(
+        instance.year,
+        instance.month,
+        {
+            instance.employee_id: summary_totals(
+                instance.total_gross_pay, instance.total_hours
+            )
+        },
+        {},
+    )
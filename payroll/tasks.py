@@ -0,0 +1,149 @@
+"""
+Celery tasks for payroll
+"""
+
+import logging
+
+from celery import shared_task
+
+from django.db import OperationalError
+
+from core.idempotency import idempotent_once, idempotent_per_run
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(OperationalError,),
+    retry_backoff=True,
+    retry_backoff_max=60,
+    retry_jitter=True,
+    max_retries=3,
+    name="payroll.tasks.recalculate_employee_month",
+)
+def recalculate_employee_month(self, employee_id, year, month):
+    """
+    Recalculate payroll for one employee-month.
+
+    Scheduled by PayrollRecalculationQueue with a debounce countdown, so a
+    burst of WorkLog changes results in a single recalculation.
+    """
+    from payroll.services.recalculation_queue import get_recalculation_queue
+
+    result = get_recalculation_queue().recalculate(employee_id, year, month)
+    return {
+        "employee_id": employee_id,
+        "year": year,
+        "month": month,
+        "mode": result["mode"],
+        "total_salary": float(result.get("total_salary", 0)),
+        "total_hours": float(result.get("total_hours", 0)),
+    }
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(OperationalError,),
+    retry_backoff=True,
+    retry_backoff_max=120,
+    retry_jitter=True,
+    max_retries=3,
+    name="payroll.tasks.calculate_payroll_shard",
+)
+@idempotent_per_run("run_id", "shard_index", ttl_hours=12, side_effect_free=True)
+def calculate_payroll_shard(
+    self, employee_ids, year, month, strategy, run_id, shard_index
+):
+    """
+    Calculate one shard of a distributed bulk payroll run (fan-out).
+
+    Idempotent per (run_id, shard_index): a redelivered shard returns its
+    payload from the result backend, or recalculates it (shards persist
+    nothing) if the payload is gone.
+    """
+    from payroll.services.bulk.distributed import calculate_shard
+    from payroll.services.enums import CalculationStrategy
+
+    return calculate_shard(employee_ids, year, month, CalculationStrategy(strategy))
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(OperationalError,),
+    retry_backoff=True,
+    retry_backoff_max=120,
+    retry_jitter=True,
+    max_retries=3,
+    name="payroll.tasks.finalize_bulk_payroll",
+)
+@idempotent_per_run("run_id", ttl_hours=12)
+def finalize_bulk_payroll(
+    self, shard_payloads, year, month, save_to_db, started_at, run_id
+):
+    """
+    Merge shard results and persist them once (fan-in chord callback).
+
+    Idempotent per run, so a redelivered callback does not persist twice.
+    """
+    from datetime import datetime
+
+    from payroll.services.bulk.distributed import (
+        merge_shard_payloads,
+        persist_merged_results,
+        summarize_result,
+    )
+
+    result = merge_shard_payloads(shard_payloads, datetime.fromisoformat(started_at))
+    saved_records = 0
+    if save_to_db:
+        saved_records = persist_merged_results(
+            result.get_successful_results(), year, month
+        )
+
+    summary = summarize_result(result)
+    summary["saved_records"] = saved_records
+    summary["shard_count"] = len(shard_payloads)
+
+    logger.info(
+        f"Distributed bulk payroll {run_id} completed: {result.successful_count} "
+        f"successful, {result.failed_count} failed in {len(shard_payloads)} shards",
+        extra={
+            "run_id": run_id,
+            "successful": result.successful_count,
+            "failed": result.failed_count,
+            "saved_records": saved_records,
+            "action": "distributed_bulk_complete",
+        },
+    )
+    return summary
+
+
+@shared_task(
+    bind=True,
+    name="payroll.tasks.run_bulk_payroll_job",
+)
+@idempotent_once(ttl_hours=24)
+def run_bulk_payroll_job(self, job_id):
+    """
+    Run a bulk payroll job created by the bulk calculation API.
+
+    Progress is published to the job's cache entry while the job runs.
+    Idempotent per job, so a redelivered message does not calculate twice.
+    """
+    from payroll.services.bulk.jobs import run_job
+
+    job = run_job(job_id)
+    return {"job_id": job_id, "status": job["status"] if job else None}
+
+
+@shared_task(name="payroll.tasks.finish_payroll_backfill")
+def finish_payroll_backfill(job_id, year, month):
+    """
+    Release the month's backfill lock once its job ends and queue the
+    employees deferred while it ran. Linked to every payroll list backfill job.
+    """
+    from payroll.services.bulk.backfill import finish_backfill
+
+    follow_up = finish_backfill(job_id, year, month)
+    return {"job_id": job_id, "follow_up_job_id": follow_up and follow_up["job_id"]}
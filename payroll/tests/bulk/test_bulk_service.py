@@ -14,6 +14,7 @@ from django.test import TestCase
 from payroll.models import Salary
 from payroll.services.bulk.bulk_service import BulkEnhancedPayrollService
 from payroll.services.bulk.types import BulkCalculationResult
+from payroll.services.cache_versions import bump_employee_month, get_monthly_versions
 from payroll.services.enums import CalculationStrategy
 from users.models import Employee
 from worktime.models import WorkLog
@@ -231,6 +232,57 @@ class BulkEnhancedPayrollServiceTestCase(TestCase):
 
         self.assertEqual(deleted_count, 10)
 
+    def test_results_are_cached_under_versions_read_before_loading(self):
+        """A WorkLog change during the data load retires the cached result."""
+        service = BulkEnhancedPayrollService(
+            use_cache=True, use_parallel=False, show_progress=False
+        )
+        service.cache_manager.cache_available = True
+        service.cache_manager.redis_client = MagicMock()
+        service.cache_manager.redis_client.mget.return_value = [None, None]
+        pipeline = service.cache_manager.redis_client.pipeline.return_value
+        employee_ids = [self.employee1.id, self.employee2.id]
+        versions = get_monthly_versions(employee_ids, 2025, 10)
+
+        load_all_data = service.data_loader.load_all_data
+
+        def load_during_change(*args, **kwargs):
+            bulk_data = load_all_data(*args, **kwargs)
+            bump_employee_month(self.employee1.id, 2025, 10)
+            return bulk_data
+
+        with patch.object(
+            service.data_loader, "load_all_data", side_effect=load_during_change
+        ):
+            service.calculate_bulk(employee_ids, 2025, 10, save_to_db=False)
+
+        cached_keys = {call.args[0] for call in pipeline.setex.call_args_list}
+        self.assertEqual(
+            cached_keys,
+            {
+                f"monthly_summary:{employee_id}:2025:10:{versions[employee_id]}"
+                for employee_id in employee_ids
+            },
+        )
+        self.assertNotEqual(
+            get_monthly_versions([self.employee1.id], 2025, 10)[self.employee1.id],
+            versions[self.employee1.id],
+        )
+
+    def test_warm_up_workers(self):
+        """Test that the worker pool is only warmed up for parallel runs."""
+        with patch(
+            "payroll.services.bulk.bulk_service.AdaptiveExecutor.warm_up",
+            return_value=3,
+        ) as warm_up:
+            sequential = BulkEnhancedPayrollService(use_parallel=False)
+            parallel = BulkEnhancedPayrollService(use_parallel=True)
+
+            self.assertEqual(sequential.warm_up_workers(), 0)
+            self.assertEqual(parallel.warm_up_workers(timeout=5), 3)
+
+        warm_up.assert_called_once_with(5)
+
     def test_invalidate_cache_without_cache_manager(self):
         """Test cache invalidation when cache is disabled."""
         service = BulkEnhancedPayrollService(use_cache=False)
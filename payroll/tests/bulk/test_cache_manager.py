@@ -9,7 +9,9 @@ from unittest.mock import MagicMock, call, patch
 from django.test import TestCase
 
 from payroll.services.bulk.cache_manager import BulkCacheManager
+from payroll.services.bulk.result_codec import CachedPayrollResult
 from payroll.services.bulk.types import CacheStats
+from payroll.services.cache_versions import bump_employee_month, get_monthly_versions
 
 
 class BulkCacheManagerTestCase(TestCase):
@@ -27,17 +29,6 @@ class BulkCacheManagerTestCase(TestCase):
         key2 = self.cache_manager._make_key("daily_calc", 5, "2025-10-09")
         self.assertEqual(key2, "daily_calc:5:2025-10-09")
 
-    def test_serialize_decimal(self):
-        """Test Decimal serialization."""
-        result = self.cache_manager._serialize_decimal(Decimal("123.45"))
-        self.assertEqual(result, 123.45)
-        self.assertIsInstance(result, float)
-
-    def test_serialize_decimal_raises_for_non_decimal(self):
-        """Test that non-Decimal objects raise TypeError."""
-        with self.assertRaises(TypeError):
-            self.cache_manager._serialize_decimal(object())
-
     @patch("payroll.services.bulk.cache_manager.redis.Redis")
     def test_get_many_monthly_summaries_cache_available(self, mock_redis_class):
         """Test bulk get with cache available."""
@@ -112,6 +103,53 @@ class BulkCacheManagerTestCase(TestCase):
         stats = cache_manager.get_cache_stats()
         self.assertEqual(stats.sets, 2)
 
+    @patch("payroll.services.bulk.cache_manager.redis.Redis")
+    def test_set_then_get_uses_binary_codec(self, mock_redis_class):
+        """Test that cached results are stored compactly and decoded lazily."""
+        mock_pipeline = MagicMock()
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value = mock_pipeline
+
+        cache_manager = BulkCacheManager()
+        cache_manager.redis_client = mock_redis
+        cache_manager.cache_available = True
+
+        cache_manager.set_many_monthly_summaries(
+            {1: {"total_salary": Decimal("5000.00"), "total_hours": Decimal("8")}},
+            2025,
+            10,
+        )
+        key, ttl, payload = mock_pipeline.setex.call_args[0]
+        self.assertIsInstance(payload, bytes)
+
+        mock_redis.mget.return_value = [payload]
+        results = cache_manager.get_many_monthly_summaries([1], 2025, 10)
+
+        self.assertEqual(mock_redis.mget.call_args[0][0], [key])
+        self.assertIsInstance(results[1], CachedPayrollResult)
+        self.assertEqual(results[1]["total_salary"], Decimal("5000.00"))
+
+    @patch("payroll.services.bulk.cache_manager.redis.Redis")
+    def test_set_uses_version_snapshot(self, mock_redis_class):
+        """Test that results are written under the versions of their inputs."""
+        mock_pipeline = MagicMock()
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value = mock_pipeline
+
+        cache_manager = BulkCacheManager()
+        cache_manager.redis_client = mock_redis
+        cache_manager.cache_available = True
+
+        versions = cache_manager.snapshot_versions([1], 2025, 10)
+        bump_employee_month(1, 2025, 10)
+        cache_manager.set_many_monthly_summaries(
+            {1: {"total_salary": Decimal("5000.00")}}, 2025, 10, versions=versions
+        )
+
+        key = mock_pipeline.setex.call_args[0][0]
+        self.assertEqual(key, f"monthly_summary:1:2025:10:{versions[1]}")
+        self.assertNotEqual(get_monthly_versions([1], 2025, 10), versions)
+
     def test_get_many_cache_unavailable(self):
         """Test bulk get when cache is unavailable."""
         cache_manager = BulkCacheManager()
@@ -135,14 +173,9 @@ class BulkCacheManagerTestCase(TestCase):
 
     @patch("payroll.services.bulk.cache_manager.redis.Redis")
     def test_invalidate_employees(self, mock_redis_class):
-        """Test bulk invalidation."""
+        """Test bulk invalidation bumps generations instead of deleting keys."""
         # Mock Redis client
         mock_redis = MagicMock()
-        mock_redis.keys.return_value = [
-            "daily_calc:1:2025-10-09",
-            "daily_calc:1:2025-10-10",
-        ]
-        mock_redis.delete.return_value = 4  # 2 monthly + 2 daily
         mock_redis.ping.return_value = True
 
         # Inject mock
@@ -150,12 +183,20 @@ class BulkCacheManagerTestCase(TestCase):
         cache_manager.redis_client = mock_redis
         cache_manager.cache_available = True
 
+        versions_before = get_monthly_versions([1, 2, 3], 2025, 10)
+
         # Test invalidation
-        deleted_count = cache_manager.invalidate_employees([1, 2], 2025, 10)
+        invalidated = cache_manager.invalidate_employees([1, 2], 2025, 10)
+
+        versions_after = get_monthly_versions([1, 2, 3], 2025, 10)
+        self.assertEqual(invalidated, 2)
+        self.assertNotEqual(versions_before[1], versions_after[1])
+        self.assertNotEqual(versions_before[2], versions_after[2])
+        self.assertEqual(versions_before[3], versions_after[3])
 
-        # Verify keys were deleted
-        self.assertGreater(deleted_count, 0)
-        mock_redis.delete.assert_called()
+        # No key scans or deletes
+        mock_redis.keys.assert_not_called()
+        mock_redis.delete.assert_not_called()
 
     @patch("payroll.services.bulk.cache_manager.redis.Redis")
     def test_warm_up_cache(self, mock_redis_class):
@@ -0,0 +1,162 @@
+"""
+Tests for distributed (Celery fan-out/fan-in) bulk payroll helpers.
+"""
+
+import io
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from payroll.services.bulk.distributed import (
+    DistributedBulkPayrollService,
+    decode_value,
+    encode_value,
+    merge_shard_payloads,
+    persist_merged_results,
+    shard_employee_ids,
+)
+from payroll.services.bulk.types import BulkSaveResult, ProcessingStatus
+from users.models import Employee
+
+
+def _payload(employee_ids, failed=(), cached=0):
+    results = {
+        employee_id: {
+            "total_salary": Decimal("1234.565"),
+            "daily_results": [{"work_date": date(2025, 10, 9)}],
+        }
+        for employee_id in employee_ids
+        if employee_id not in failed
+    }
+    return {
+        "employee_ids": list(employee_ids),
+        "results": encode_value(results),
+        "errors": [
+            {
+                "employee_id": employee_id,
+                "error_type": "ValueError",
+                "error_message": "bad salary",
+            }
+            for employee_id in failed
+        ],
+        "cached_count": cached,
+        "db_queries_count": 4,
+        "duration_seconds": 1.5,
+    }
+
+
+class DistributedBulkPayrollTest(SimpleTestCase):
+    def test_encoding_roundtrip_is_exact(self):
+        value = {
+            "total_salary": Decimal("1234.5650"),
+            "work_date": date(2025, 10, 9),
+            "calculated_at": datetime(2025, 10, 9, 12, 30),
+            "daily_results": [{"hours": Decimal("8.6")}],
+            "metadata": {"status": "success"},
+        }
+
+        decoded = decode_value(encode_value(value))
+
+        self.assertEqual(decoded, value)
+        self.assertEqual(
+            decoded["total_salary"].as_tuple(), Decimal("1234.5650").as_tuple()
+        )
+
+    def test_employee_ids_are_sharded(self):
+        shards = shard_employee_ids(list(range(10, 0, -1)) + [3], 4)
+
+        self.assertEqual(shards, [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]])
+
+    def test_shard_payloads_are_merged(self):
+        start_time = datetime.now() - timedelta(seconds=5)
+
+        result = merge_shard_payloads(
+            [_payload([1, 2, 3], cached=1), _payload([4, 5], failed=[5])],
+            start_time,
+        )
+
+        self.assertEqual(result.total_count, 5)
+        self.assertEqual(result.successful_count, 4)
+        self.assertEqual(result.failed_count, 1)
+        self.assertEqual(result.cached_count, 1)
+        self.assertEqual(result.db_queries_count, 8)
+        self.assertEqual(sorted(result.results), [1, 2, 3, 4])
+        self.assertEqual(result.results[4]["total_salary"], Decimal("1234.565"))
+        self.assertEqual(
+            result.results[1]["daily_results"][0]["work_date"], date(2025, 10, 9)
+        )
+        self.assertEqual(result.errors[5].error_type, "ValueError")
+        self.assertEqual(result.status, ProcessingStatus.COMPLETED)
+
+    def test_empty_run_does_not_dispatch(self):
+        service = DistributedBulkPayrollService(shard_size=100)
+
+        with patch.object(service, "dispatch") as dispatch:
+            summary = service.calculate_bulk([], 2025, 10)
+
+        dispatch.assert_not_called()
+        self.assertEqual(summary["total_employees"], 0)
+
+
+class DistributedPersistenceTest(TestCase):
+    def test_merged_results_are_persisted_per_shard(self):
+        results = {employee_id: {"total_salary": 1} for employee_id in range(1, 6)}
+        saved_shards = []
+
+        def save_all(shard_results, contexts, bulk_data):
+            saved_shards.append(sorted(shard_results))
+            return BulkSaveResult(monthly_summaries_created=len(shard_results))
+
+        persister = Mock()
+        persister.save_all.side_effect = save_all
+        with (
+            patch(
+                "payroll.services.bulk.bulk_service.get_bulk_persister",
+                return_value=persister,
+            ),
+            patch(
+                "payroll.services.bulk.data_loader.BulkDataLoader.load_all_data"
+            ) as load_all_data,
+        ):
+            saved = persist_merged_results(results, 2025, 10, shard_size=2)
+
+        self.assertEqual(saved, 5)
+        self.assertEqual(saved_shards, [[1, 2], [3, 4], [5]])
+        for call in load_all_data.call_args_list:
+            self.assertFalse(call.kwargs["include_shabbat_times"])
+
+
+class DistributedCommandTest(TestCase):
+    def setUp(self):
+        Employee.objects.create(
+            first_name="Shard",
+            last_name="Worker",
+            email="shard@example.com",
+            is_active=True,
+        )
+
+    def test_duplicate_run_marker_is_reported(self):
+        marker = {
+            "task_name": "payroll.tasks.finalize_bulk_payroll",
+            "task_id": "abc",
+            "completed_at": "2025-10-31T12:00:00+00:00",
+            "duplicate": True,
+        }
+        out = io.StringIO()
+
+        with patch.object(
+            DistributedBulkPayrollService, "calculate_bulk", return_value=marker
+        ):
+            call_command(
+                "bulk_calculate_payroll",
+                "--year=2025",
+                "--month=10",
+                "--distributed",
+                stdout=out,
+            )
+
+        self.assertIn("already finalized at 2025-10-31T12:00:00+00:00", out.getvalue())
+        self.assertNotIn("Calculation Complete", out.getvalue())
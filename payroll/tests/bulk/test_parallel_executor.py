@@ -0,0 +1,197 @@
+"""
+Tests for ParallelExecutor and the warm worker pool.
+
+Thread pools are used so the tests do not fork the test process; process
+pools share the same code path apart from the worker initializer.
+"""
+
+from datetime import date
+from unittest.mock import Mock, patch
+
+from celery.concurrency.prefork import TaskPool as PreforkTaskPool
+from celery.concurrency.solo import TaskPool as SoloTaskPool
+
+from django.test import SimpleTestCase
+
+from payroll.services.bulk import parallel_executor
+from payroll.services.bulk.parallel_executor import (
+    AdaptiveExecutor,
+    ParallelExecutor,
+    _initialize_worker,
+    _warm_up_on_worker_ready,
+    get_worker_pool,
+    get_worker_pool_statistics,
+    shutdown_worker_pools,
+)
+from payroll.services.enums import CalculationStrategy
+
+WORKER = "payroll.services.bulk.parallel_executor._calculate_payroll_worker"
+
+
+def _fake_worker(context, strategy):
+    if context["employee_id"] == 13:
+        raise ValueError("bad salary")
+    return {"employee_id": context["employee_id"], "strategy": strategy.value}
+
+
+class ParallelExecutorTest(SimpleTestCase):
+    def setUp(self):
+        shutdown_worker_pools()
+
+    def tearDown(self):
+        shutdown_worker_pools()
+
+    def _contexts(self, count):
+        return [{"employee_id": employee_id} for employee_id in range(1, count + 1)]
+
+    def test_results_and_errors_are_returned_per_employee(self):
+        executor = ParallelExecutor(max_workers=2, use_processes=False, chunk_size=5)
+        progress = []
+
+        with patch(WORKER, side_effect=_fake_worker):
+            results = executor.map_calculations(
+                self._contexts(20),
+                CalculationStrategy.ENHANCED,
+                progress_callback=lambda done, total, status: progress.append(
+                    (done, total, status)
+                ),
+            )
+
+        self.assertEqual(len(results), 20)
+        self.assertIsInstance(results[13], ValueError)
+        self.assertEqual(results[12]["employee_id"], 12)
+        self.assertEqual(len(progress), 20)
+        self.assertEqual(progress[-1][:2], (20, 20))
+        self.assertEqual(sum(1 for p in progress if p[2] == "error"), 1)
+
+    def test_contexts_are_submitted_in_chunks(self):
+        executor = ParallelExecutor(max_workers=2, use_processes=False)
+
+        chunks = executor._split_chunks(self._contexts(100))
+
+        # max_workers * CHUNKS_PER_WORKER chunks
+        self.assertEqual(len(chunks), 8)
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 100)
+
+    def test_pool_is_reused_across_runs(self):
+        with patch(WORKER, side_effect=_fake_worker):
+            for _ in range(3):
+                ParallelExecutor(max_workers=2, use_processes=False).map_calculations(
+                    self._contexts(13), CalculationStrategy.ENHANCED
+                )
+
+        stats = get_worker_pool(2, use_processes=False).get_statistics()
+        self.assertTrue(stats["running"])
+        self.assertEqual(stats["starts"], 1)
+        self.assertEqual(stats["runs"], 3)
+        self.assertEqual(stats["tasks_completed"], 36)
+        self.assertEqual(stats["tasks_failed"], 3)
+
+    def test_statistics_expose_pool_health(self):
+        executor = ParallelExecutor(max_workers=2, use_processes=False)
+        with patch(WORKER, side_effect=_fake_worker):
+            executor.map_calculations(self._contexts(4), CalculationStrategy.ENHANCED)
+
+        stats = executor.get_statistics()
+        self.assertTrue(stats["persistent"])
+        self.assertEqual(stats["pool"]["max_workers"], 2)
+        self.assertEqual(stats["pool"]["runs"], 1)
+        self.assertEqual(len(get_worker_pool_statistics()), 1)
+
+    def test_non_persistent_executor_stops_its_pool(self):
+        executor = ParallelExecutor(
+            max_workers=2, use_processes=False, persistent=False
+        )
+        with patch(WORKER, side_effect=_fake_worker):
+            results = executor.map_calculations(
+                self._contexts(4), CalculationStrategy.ENHANCED
+            )
+
+        self.assertEqual(len(results), 4)
+        self.assertIsNone(executor._executor)
+        self.assertEqual(get_worker_pool_statistics(), [])
+
+    def test_restart_replaces_workers(self):
+        pool = get_worker_pool(2, use_processes=False)
+        pool.warm_up()
+
+        pool.restart(reason="test")
+
+        stats = pool.get_statistics()
+        self.assertFalse(stats["running"])
+        self.assertEqual(stats["restarts"], 1)
+        self.assertEqual(pool.warm_up(), 1)  # all threads share one pid
+        self.assertEqual(pool.get_statistics()["starts"], 2)
+
+    def test_daemonic_process_falls_back_to_threads(self):
+        executor = ParallelExecutor(max_workers=2, use_processes=True)
+
+        with (
+            patch(
+                "payroll.services.bulk.parallel_executor.processes_available",
+                return_value=False,
+            ),
+            patch(WORKER, side_effect=_fake_worker),
+        ):
+            results = executor.map_calculations(
+                self._contexts(12), CalculationStrategy.ENHANCED
+            )
+
+        self.assertEqual(len(results), 12)
+        self.assertEqual(results[12]["employee_id"], 12)
+        self.assertFalse(executor.use_processes)
+        self.assertEqual(
+            get_worker_pool(2, use_processes=True).get_statistics()["starts"], 0
+        )
+
+
+class WorkerStartupTest(SimpleTestCase):
+    def tearDown(self):
+        shutdown_worker_pools()
+
+    @patch("payroll.services.bulk.parallel_executor.date")
+    @patch(
+        "integrations.services.unified_shabbat_service.unified_shabbat_service"
+        ".preload_sunset_table"
+    )
+    @patch("payroll.enhanced_redis_cache.enhanced_payroll_cache.get_holidays")
+    def test_worker_preloads_calendar_caches(
+        self, get_holidays, preload_sunset_table, today
+    ):
+        today.today.return_value = date(2026, 1, 15)
+
+        _initialize_worker()
+
+        self.assertEqual(
+            [call.args for call in get_holidays.call_args_list],
+            [(2025, 12), (2026, 1)],
+        )
+        preload_sunset_table.assert_called_once_with(2025, 2026)
+        self.assertIsNotNone(parallel_executor._worker_factory)
+
+    @patch(
+        "payroll.enhanced_redis_cache.enhanced_payroll_cache.get_holidays",
+        side_effect=ConnectionError("redis down"),
+    )
+    def test_failed_preload_does_not_break_worker(self, get_holidays):
+        with self.assertLogs("payroll.services.bulk.parallel_executor", "WARNING"):
+            _initialize_worker()
+
+        self.assertIsNotNone(parallel_executor._worker_factory)
+
+    def test_adaptive_executor_warms_up_pool_of_large_batches(self):
+        executor = AdaptiveExecutor(max_workers=1, prefer_processes=False)
+
+        started = executor.warm_up()
+
+        pool = get_worker_pool(executor._get_optimal_worker_count(), False)
+        self.assertTrue(pool.is_running)
+        self.assertGreaterEqual(started, 1)
+
+    def test_celery_worker_ready_warms_up_solo_pool_only(self):
+        with patch.object(AdaptiveExecutor, "warm_up", return_value=3) as warm_up:
+            _warm_up_on_worker_ready(sender=Mock(pool=Mock(spec=PreforkTaskPool)))
+            warm_up.assert_not_called()
+
+            _warm_up_on_worker_ready(sender=Mock(pool=Mock(spec=SoloTaskPool)))
+            warm_up.assert_called_once_with()
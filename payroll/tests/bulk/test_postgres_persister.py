@@ -0,0 +1,145 @@
+"""
+Tests for the PostgreSQL COPY/upsert bulk persister.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from unittest import skipUnless
+from unittest.mock import MagicMock, patch
+
+import pytz
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from payroll.models import DailyPayrollCalculation, MonthlyPayrollSummary
+from payroll.services.bulk.persister import BulkPersister
+from payroll.services.bulk.postgres_persister import (
+    COPY_NULL,
+    PostgresBulkPersister,
+    copy_value,
+    get_bulk_persister,
+)
+from payroll.services.bulk.types import BulkLoadedData, WorkLogData
+from users.models import Employee
+
+CONNECTION = "payroll.services.bulk.postgres_persister.connection"
+
+
+class PersisterSelectionTest(SimpleTestCase):
+    def test_postgres_uses_copy_persister(self):
+        with patch(CONNECTION, MagicMock(vendor="postgresql")):
+            self.assertIsInstance(get_bulk_persister(), PostgresBulkPersister)
+
+    @override_settings(PAYROLL_BULK_USE_COPY=False)
+    def test_copy_can_be_disabled(self):
+        with patch(CONNECTION, MagicMock(vendor="postgresql")):
+            persister = get_bulk_persister(batch_size=10)
+
+        self.assertNotIsInstance(persister, PostgresBulkPersister)
+        self.assertEqual(persister.batch_size, 10)
+
+    def test_other_databases_use_orm_persister(self):
+        with patch(CONNECTION, MagicMock(vendor="sqlite")):
+            self.assertIs(type(get_bulk_persister()), BulkPersister)
+
+    def test_copy_values_keep_null_and_empty_string_apart(self):
+        calculation = DailyPayrollCalculation(
+            employee_id=1, work_date=date(2025, 10, 9), holiday_name=None
+        )
+        field = DailyPayrollCalculation._meta.get_field
+
+        self.assertEqual(copy_value(field("holiday_name"), calculation), COPY_NULL)
+        calculation.holiday_name = ""
+        self.assertEqual(copy_value(field("holiday_name"), calculation), "")
+        self.assertEqual(copy_value(field("is_holiday"), calculation), "f")
+        self.assertEqual(copy_value(field("calculation_details"), calculation), "{}")
+        self.assertEqual(copy_value(field("work_date"), calculation), "2025-10-09")
+
+
+@skipUnless(connection.vendor == "postgresql", "COPY requires PostgreSQL")
+class PostgresBulkPersisterTest(TestCase):
+    def setUp(self):
+        tz = pytz.timezone("Asia/Jerusalem")
+        self.employees = []
+        work_logs = {}
+        for i in range(3):
+            user = User.objects.create_user(
+                username=f"copyuser{i}", email=f"copy{i}@example.com"
+            )
+            employee = Employee.objects.create(
+                user=user,
+                first_name=f"Copy{i}",
+                last_name="Employee",
+                email=f"copy{i}@example.com",
+                is_active=True,
+            )
+            self.employees.append(employee)
+            work_logs[employee.id] = [
+                WorkLogData(
+                    worklog_id=None,
+                    employee_id=employee.id,
+                    check_in=datetime(2025, 10, 9, 9, 0, tzinfo=tz),
+                    check_out=datetime(2025, 10, 9, 17, 0, tzinfo=tz),
+                    work_date=date(2025, 10, 9),
+                )
+            ]
+
+        self.bulk_data = BulkLoadedData(
+            employees={},
+            work_logs=work_logs,
+            holidays={},
+            shabbat_times={},
+            year=2025,
+            month=10,
+        )
+        self.contexts = {
+            employee.id: {"employee_id": employee.id, "year": 2025, "month": 10}
+            for employee in self.employees
+        }
+
+    def _results(self, salary):
+        return {
+            employee.id: {
+                "total_salary": Decimal(salary),
+                "total_hours": Decimal("8"),
+                "regular_hours": Decimal("8"),
+                "overtime_hours": Decimal("0"),
+                "holiday_hours": Decimal("0"),
+                "shabbat_hours": Decimal("0"),
+                "breakdown": {"regular_pay": salary},
+                "metadata": {"work_log_count": 1},
+            }
+            for employee in self.employees
+        }
+
+    def test_summaries_are_upserted(self):
+        MonthlyPayrollSummary.objects.create(
+            employee=self.employees[0], year=2025, month=10, total_gross_pay=1
+        )
+        persister = PostgresBulkPersister()
+
+        save_result = persister.save_all(
+            self._results("400.00"), self.contexts, self.bulk_data
+        )
+
+        self.assertEqual(save_result.errors, [])
+        self.assertEqual(save_result.monthly_summaries_created, 2)
+        self.assertEqual(save_result.monthly_summaries_updated, 1)
+        self.assertEqual(save_result.daily_calculations_created, 3)
+
+        save_result = persister.save_all(
+            self._results("500.00"), self.contexts, self.bulk_data
+        )
+
+        self.assertEqual(save_result.monthly_summaries_updated, 3)
+        summaries = MonthlyPayrollSummary.objects.filter(year=2025, month=10)
+        self.assertEqual(summaries.count(), 3)
+        self.assertEqual(
+            {summary.total_gross_pay for summary in summaries}, {Decimal("500.00")}
+        )
+        self.assertEqual(
+            DailyPayrollCalculation.objects.filter(employee__in=self.employees).count(),
+            3,
+        )
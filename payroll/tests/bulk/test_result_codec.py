@@ -0,0 +1,87 @@
+"""
+Tests for the compact binary PayrollResult cache codec.
+"""
+
+import json
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from payroll.services.bulk.result_codec import (
+    CachedPayrollResult,
+    ResultCodecError,
+    decode_result,
+    encode_result,
+)
+
+
+def _result():
+    return {
+        "total_salary": Decimal("9350.00"),
+        "total_hours": Decimal("187.5"),
+        "regular_hours": Decimal("176"),
+        "overtime_hours": Decimal("11.5"),
+        "holiday_hours": Decimal("0"),
+        "shabbat_hours": Decimal("-0.25"),
+        "night_hours": Decimal("0"),
+        "breakdown": {"regular_pay": Decimal("8800.00")},
+        "metadata": {"status": "calculated", "work_log_count": 22},
+        "daily_results": [
+            {"date": f"2025-10-{day:02d}", "hours": Decimal("8.5")}
+            for day in range(1, 23)
+        ],
+        "worked_days": 22,
+    }
+
+
+class ResultCodecTest(SimpleTestCase):
+    def test_numbers_round_trip_exactly(self):
+        cached = decode_result(encode_result(_result()))
+
+        self.assertIsInstance(cached, CachedPayrollResult)
+        self.assertEqual(cached["total_salary"], Decimal("9350.00"))
+        self.assertEqual(str(cached["total_salary"]), "9350.00")
+        self.assertEqual(cached["shabbat_hours"], Decimal("-0.25"))
+        self.assertEqual(cached["worked_days"], 22)
+        self.assertEqual(set(cached), set(_result()))
+
+    def test_payload_is_smaller_than_json(self):
+        result = _result()
+        legacy = json.dumps(result, default=float)
+
+        self.assertLess(len(encode_result(result)), len(legacy) / 2)
+        self.assertLess(
+            len(encode_result(result)), len(encode_result(result, compress=False))
+        )
+
+    def test_daily_results_are_decoded_only_when_read(self):
+        cached = decode_result(encode_result(_result()))
+
+        with patch("payroll.services.bulk.result_codec.zlib.decompress") as inflate:
+            cached["total_salary"]
+            cached.get("metadata")
+            self.assertIn("daily_results", cached)
+        inflate.assert_not_called()
+
+        self.assertEqual(len(cached["daily_results"]), 22)
+        self.assertEqual(cached.to_dict()["breakdown"], {"regular_pay": 8800.0})
+
+    def test_missing_and_oversized_fields(self):
+        cached = decode_result(
+            encode_result({"total_salary": Decimal("1E+200"), "total_hours": 8})
+        )
+
+        self.assertEqual(cached["total_hours"], Decimal("8"))
+        self.assertEqual(cached["total_salary"], 1e200)
+        self.assertNotIn("breakdown", cached)
+        self.assertEqual(cached.get("breakdown", {}), {})
+
+    def test_legacy_json_and_garbage(self):
+        self.assertEqual(
+            decode_result(json.dumps({"total_salary": 5000})), {"total_salary": 5000}
+        )
+        with self.assertRaises(ResultCodecError):
+            decode_result(b"not a payload")
+        with self.assertRaises(ResultCodecError):
+            decode_result(encode_result(_result())[:-3])
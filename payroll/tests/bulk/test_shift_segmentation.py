@@ -0,0 +1,173 @@
+"""
+Differential tests for the vectorized shift segmentation engine.
+
+Every shift is calculated twice - with the scalar critical points path of
+EnhancedPayrollStrategy and from the engine's precomputed segments - and the
+breakdowns must be identical.
+"""
+
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+
+import numpy as np
+
+from django.test import SimpleTestCase
+
+from integrations.services.unified_shabbat_service import UnifiedShabbatService
+from payroll.services.bulk.shift_segmentation import (
+    ShiftSegmentationEngine,
+    lookup_sabbath_windows,
+    to_epoch_us,
+)
+from payroll.services.shabbat_windows import ShabbatWindowTable
+from payroll.services.strategies.enhanced import EnhancedPayrollStrategy
+from payroll.tests.helpers import SHIFT_HOLIDAYS, random_shifts
+
+
+class ShiftSegmentationDifferentialTest(SimpleTestCase):
+    """Engine segments must reproduce the scalar breakdown exactly"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        service = UnifiedShabbatService(source="astronomical", api_cross_check=False)
+        cls.shabbat_windows = ShabbatWindowTable.for_month(
+            2025, 7, lambda friday: service.get_shabbat_times(friday, use_cache=False)
+        )
+
+    def _strategy(self, calculation_type="hourly", shift_segments=None):
+        context = {
+            "employee_id": 1,
+            "user_id": 1,
+            "year": 2025,
+            "month": 7,
+            "calculation_type": calculation_type,
+            "work_logs": [],
+            "holidays": SHIFT_HOLIDAYS,
+            "shabbat_times": {},
+            "shabbat_windows": self.shabbat_windows,
+        }
+        if shift_segments is not None:
+            context["shift_segments"] = shift_segments
+        return EnhancedPayrollStrategy(context)
+
+    def _assert_identical(self, shifts, calculation_type, rate):
+        engine = ShiftSegmentationEngine.for_strategy(
+            EnhancedPayrollStrategy, holidays=SHIFT_HOLIDAYS.keys()
+        )
+        segments = engine.segment_shifts(shifts, self.shabbat_windows)
+        self.assertEqual(len(segments), len(set(shifts)))
+
+        scalar = self._strategy(calculation_type)
+        batch = self._strategy(calculation_type, shift_segments=segments)
+
+        for start, end in shifts:
+            expected = scalar._calculate_shift_critical_points(
+                start, end, rate, SHIFT_HOLIDAYS, calculation_type
+            )
+            actual = batch._calculate_shift_critical_points(
+                start, end, rate, SHIFT_HOLIDAYS, calculation_type
+            )
+            self.assertEqual(actual, expected, f"{start} - {end}")
+
+    def test_hourly_shifts_match_scalar_path(self):
+        self._assert_identical(random_shifts(400), "hourly", Decimal("57.50"))
+
+    def test_monthly_shifts_match_scalar_path(self):
+        effective_rate = Decimal("25000") / Decimal("182")
+        self._assert_identical(random_shifts(400, seed=7), "monthly", effective_rate)
+
+    def test_edge_shifts_match_scalar_path(self):
+        utc = dt_timezone.utc
+        shifts = [
+            # Exactly 8 hours (monthly normalization), night shift, midnight cross
+            (
+                datetime(2025, 7, 1, 6, 0, tzinfo=utc),
+                datetime(2025, 7, 1, 14, 0, tzinfo=utc),
+            ),
+            (
+                datetime(2025, 7, 2, 18, 0, tzinfo=utc),
+                datetime(2025, 7, 3, 4, 0, tzinfo=utc),
+            ),
+            (
+                datetime(2025, 7, 2, 20, 30, tzinfo=utc),
+                datetime(2025, 7, 3, 0, 0, tzinfo=utc),
+            ),
+            # Starts inside Sabbath, ends after it
+            (
+                datetime(2025, 7, 5, 12, 0, tzinfo=utc),
+                datetime(2025, 7, 5, 23, 0, tzinfo=utc),
+            ),
+            # Whole Friday into Saturday, long overtime
+            (
+                datetime(2025, 7, 11, 5, 0, tzinfo=utc),
+                datetime(2025, 7, 11, 21, 0, tzinfo=utc),
+            ),
+            # Holiday eve crossing into holiday
+            (
+                datetime(2025, 7, 9, 19, 0, tzinfo=utc),
+                datetime(2025, 7, 10, 5, 0, tzinfo=utc),
+            ),
+        ]
+        for calculation_type in ("hourly", "monthly"):
+            self._assert_identical(shifts, calculation_type, Decimal("100"))
+
+    def test_bucket_hours_sum_to_shift_duration(self):
+        shifts = random_shifts(200, seed=3)
+        engine = ShiftSegmentationEngine.for_strategy(
+            EnhancedPayrollStrategy, holidays=SHIFT_HOLIDAYS.keys()
+        )
+        starts = np.array([to_epoch_us(s) for s, _ in shifts], dtype=np.int64)
+        ends = np.array([to_epoch_us(e) for _, e in shifts], dtype=np.int64)
+        offsets = np.full(len(shifts), 3 * 3600 * 10**6, dtype=np.int64)
+        sabbath_starts, sabbath_ends, _ = lookup_sabbath_windows(
+            self.shabbat_windows, starts
+        )
+
+        arrays = engine.segment_arrays(
+            starts, ends, offsets, offsets, sabbath_starts, sabbath_ends
+        )
+
+        np.testing.assert_allclose(
+            arrays.bucket_hours.sum(axis=1), (ends - starts) / 3.6e9
+        )
+
+    def test_non_utc_shifts_are_left_to_scalar_path(self):
+        engine = ShiftSegmentationEngine()
+        start = datetime(2025, 7, 1, 8, 0, tzinfo=dt_timezone(timedelta(hours=3)))
+
+        segments = engine.segment_shifts(
+            [(start, start + timedelta(hours=8))], self.shabbat_windows
+        )
+
+        self.assertEqual(segments, {})
+
+
+class SabbathWindowLookupTest(SimpleTestCase):
+    """Vectorized lookup must agree with ShabbatWindowTable.window_for"""
+
+    def test_lookup_matches_window_for(self):
+        service = UnifiedShabbatService(source="astronomical", api_cross_check=False)
+
+        def provider(friday):
+            if friday == date(2025, 7, 18):
+                raise ValueError("missing week")
+            return service.get_shabbat_times(friday, use_cache=False)
+
+        table = ShabbatWindowTable.for_month(2025, 7, provider)
+        moments = [
+            datetime(2025, 6, 15, tzinfo=dt_timezone.utc) + timedelta(hours=h)
+            for h in range(0, 60 * 24, 5)
+        ]
+
+        starts, ends, found = lookup_sabbath_windows(
+            table, np.array([to_epoch_us(m) for m in moments], dtype=np.int64)
+        )
+
+        for i, moment in enumerate(moments):
+            window = table.window_for(moment)
+            self.assertEqual(bool(found[i]), window is not None, moment)
+            if window is not None:
+                self.assertEqual(starts[i], to_epoch_us(window.start))
+                self.assertEqual(ends[i], to_epoch_us(window.end))
@@ -0,0 +1,122 @@
+"""
+Tests for the streaming (chunked, resumable) bulk payroll service.
+"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from payroll.services.bulk.streaming import (
+    StreamingBulkPayrollService,
+    StreamingCheckpoint,
+    chunk_employee_ids,
+)
+from payroll.services.bulk.types import BulkChunkResult, ProcessingStatus
+from payroll.services.enums import CalculationStrategy
+
+
+def _fake_process_chunk(
+    chunk_index, chunk_ids, year, month, strategy, save_to_db, progress
+):
+    for employee_id in chunk_ids:
+        progress.update(employee_id, status="success")
+    return BulkChunkResult(
+        chunk_index=chunk_index,
+        employee_ids=chunk_ids,
+        results={
+            employee_id: {"employee_id": employee_id} for employee_id in chunk_ids
+        },
+        saved_records=len(chunk_ids),
+    )
+
+
+class StreamingBulkPayrollServiceTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.service = StreamingBulkPayrollService(
+            chunk_size=3, use_cache=False, use_parallel=False, show_progress=False
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_employee_ids_are_chunked_in_stable_order(self):
+        self.assertEqual(
+            chunk_employee_ids([7, 1, 5, 3, 1, 2, 6], 3), [[1, 2, 3], [5, 6, 7]]
+        )
+
+    def test_chunks_are_streamed_without_keeping_results(self):
+        with patch.object(
+            self.service, "_process_chunk", side_effect=_fake_process_chunk
+        ) as process_chunk:
+            chunks = list(self.service.iter_chunks(list(range(1, 8)), 2025, 10))
+            result = self.service.calculate_bulk(list(range(1, 8)), 2025, 10)
+
+        self.assertEqual([chunk.employee_ids for chunk in chunks][-1], [7])
+        self.assertEqual(process_chunk.call_count, 6)
+        self.assertEqual(result.total_count, 7)
+        self.assertEqual(result.successful_count, 7)
+        self.assertEqual(result.results, {})
+
+    def test_interrupted_run_resumes_after_committed_chunks(self):
+        employee_ids = list(range(1, 10))
+
+        def fail_on_third_chunk(chunk_index, *args):
+            if chunk_index == 2:
+                raise RuntimeError("Chunk 2 could not be saved: connection lost")
+            return _fake_process_chunk(chunk_index, *args)
+
+        with patch.object(
+            self.service, "_process_chunk", side_effect=fail_on_third_chunk
+        ):
+            failed = self.service.calculate_bulk(employee_ids, 2025, 10, run_id="oct")
+
+        self.assertEqual(failed.status, ProcessingStatus.FAILED)
+        self.assertEqual(failed.successful_count, 6)
+
+        with patch.object(
+            self.service, "_process_chunk", side_effect=_fake_process_chunk
+        ) as process_chunk:
+            resumed = self.service.calculate_bulk(
+                employee_ids, 2025, 10, run_id="oct", keep_results=True
+            )
+
+        process_chunk.assert_called_once()
+        self.assertEqual(process_chunk.call_args[0][0], 2)
+        self.assertEqual(resumed.status, ProcessingStatus.COMPLETED)
+        self.assertEqual(sorted(resumed.results), [7, 8, 9])
+
+    def test_checkpoint_is_bound_to_run_parameters(self):
+        chunks = chunk_employee_ids(list(range(1, 10)), 3)
+        checkpoint = StreamingCheckpoint(
+            "oct", 2025, 10, CalculationStrategy.ENHANCED, chunks
+        )
+        checkpoint.mark_completed(0)
+
+        other_month = StreamingCheckpoint(
+            "oct", 2025, 11, CalculationStrategy.ENHANCED, chunks
+        )
+
+        self.assertEqual(checkpoint.completed_chunks(), {0})
+        self.assertEqual(other_month.completed_chunks(), set())
+
+    def test_unreadable_checkpoint_starts_over(self):
+        chunks = chunk_employee_ids(list(range(1, 10)), 3)
+        checkpoint = StreamingCheckpoint(
+            "oct", 2025, 10, CalculationStrategy.ENHANCED, chunks
+        )
+        checkpoint.mark_completed(0)
+
+        with patch(
+            "payroll.services.bulk.streaming.cache.get",
+            side_effect=ConnectionError("redis down"),
+        ):
+            self.assertEqual(checkpoint.completed_chunks(), set())
+        with patch(
+            "payroll.services.bulk.streaming.cache.set",
+            side_effect=ConnectionError("redis down"),
+        ):
+            checkpoint.mark_completed(1)
+
+        self.assertEqual(checkpoint.completed_chunks(), {0})
@@ -5,7 +5,9 @@ Provides common utilities, mixins, and re-exports from conftest.py
 to support migration from pytest fixtures to unittest setUp patterns.
 """
 
-from datetime import datetime, timedelta
+import random
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
 from decimal import Decimal
 from typing import Any, Dict, Optional
 
@@ -115,6 +117,30 @@ class PayrollTestMixin:
             self.assertIsInstance(breakdown, dict, "Breakdown should be dictionary")
 
 
+# Holidays of the random July 2025 shifts (shift segmentation and fixed point tests)
+SHIFT_HOLIDAYS = {
+    date(2025, 7, 10): {"name": "Test Holiday", "is_paid": True, "source": "test"},
+    date(2025, 7, 22): {"name": "Other Holiday", "is_paid": True, "source": "test"},
+}
+
+
+def random_shifts(count, seed=20250701):
+    """Deterministic mix of July 2025 day, evening, night, Sabbath and long shifts"""
+    rng = random.Random(seed)
+    month_start = datetime(2025, 7, 1, tzinfo=dt_timezone.utc)
+    shifts = []
+    for _ in range(count):
+        start = month_start + timedelta(
+            days=rng.randrange(0, 31),
+            hours=rng.randrange(0, 24),
+            minutes=rng.choice([0, 0, 15, 30, 45, rng.randrange(60)]),
+            seconds=rng.choice([0, 0, 0, rng.randrange(60)]),
+        )
+        hours = rng.choice([4, 6, 8, 8.6, 9, 10, 10.6, 11, 12, 14, 16])
+        shifts.append((start, start + timedelta(hours=hours)))
+    return shifts
+
+
 def create_test_context(employee, year: int, month: int, **kwargs):
     """
     Factory function to create CalculationContext for tests.
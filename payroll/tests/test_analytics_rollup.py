@@ -0,0 +1,203 @@
+"""
+Tests for the incrementally maintained payroll analytics rollups.
+"""
+
+from decimal import Decimal
+from importlib import import_module
+from io import StringIO
+from unittest.mock import patch
+
+from rest_framework.test import APIClient
+
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from payroll.models import MonthlyPayrollRollup, MonthlyPayrollSummary
+from payroll.services.analytics_rollup import (
+    apply_summary_changes,
+    get_year_rollups,
+    load_summary_totals,
+    rebuild_rollups,
+    summary_totals,
+)
+from users.models import Employee
+
+
+class AnalyticsRollupTest(TestCase):
+    def setUp(self):
+        self.admin_user = User.objects.create_user(
+            username="rollup_admin", email="rollup_admin@test.com"
+        )
+        self.admin = Employee.objects.create(
+            user=self.admin_user,
+            first_name="Admin",
+            last_name="User",
+            email="rollup_admin@test.com",
+            role="admin",
+        )
+        self.employee = Employee.objects.create(
+            first_name="Regular",
+            last_name="Employee",
+            email="rollup_employee@test.com",
+            role="employee",
+        )
+
+    def _rollup(self, role=""):
+        return MonthlyPayrollRollup.objects.get(year=2025, month=10, role=role)
+
+    def _snapshot(self):
+        return sorted(
+            MonthlyPayrollRollup.objects.values_list(
+                "year",
+                "month",
+                "role",
+                "employee_count",
+                "total_gross_pay_sum",
+                "total_hours_sum",
+            )
+        )
+
+    def test_summary_saves_and_deletes_update_rollups(self):
+        summary = MonthlyPayrollSummary.objects.create(
+            employee=self.admin,
+            year=2025,
+            month=10,
+            total_gross_pay=Decimal("9000.00"),
+            total_hours=Decimal("180.00"),
+        )
+        MonthlyPayrollSummary.objects.create(
+            employee=self.employee,
+            year=2025,
+            month=10,
+            total_gross_pay=Decimal("5000.00"),
+            total_hours=Decimal("160.00"),
+        )
+
+        rollup = self._rollup()
+        self.assertEqual(rollup.employee_count, 2)
+        self.assertEqual(rollup.total_gross_pay_sum, Decimal("14000.00"))
+        self.assertEqual(rollup.avg_hours, Decimal("170.00"))
+        self.assertEqual(self._rollup("employee").employee_count, 1)
+
+        summary.total_gross_pay = Decimal("10000.00")
+        summary.save()
+        self.assertEqual(self._rollup().total_gross_pay_sum, Decimal("15000.00"))
+        self.assertEqual(self._rollup("admin").total_gross_pay_sum, Decimal("10000.00"))
+
+        summary.delete()
+        rollup = self._rollup()
+        self.assertEqual(rollup.employee_count, 1)
+        self.assertEqual(rollup.total_gross_pay_sum, Decimal("5000.00"))
+        self.assertEqual(self._rollup("admin").employee_count, 0)
+
+    def test_bulk_changes_match_rebuild(self):
+        MonthlyPayrollSummary.objects.create(
+            employee=self.admin, year=2025, month=10, total_gross_pay=Decimal("100")
+        )
+        previous = load_summary_totals([self.admin.id, self.employee.id], 2025, 10)
+
+        # Writes that bypass model signals, as BulkPersister does
+        MonthlyPayrollSummary.objects.filter(employee=self.admin).update(
+            total_gross_pay=Decimal("300.00"), total_hours=Decimal("10.00")
+        )
+        MonthlyPayrollSummary.objects.bulk_create(
+            [
+                MonthlyPayrollSummary(
+                    employee=self.employee,
+                    year=2025,
+                    month=10,
+                    total_gross_pay=Decimal("200.00"),
+                    total_hours=Decimal("8.00"),
+                )
+            ]
+        )
+        apply_summary_changes(
+            2025,
+            10,
+            previous,
+            {
+                self.admin.id: summary_totals("300.00", "10"),
+                self.employee.id: summary_totals("200.00", "8"),
+            },
+        )
+        incremental = self._snapshot()
+
+        self.assertEqual(rebuild_rollups(), 3)
+        self.assertEqual(self._snapshot(), incremental)
+        self.assertEqual(self._rollup().total_gross_pay_sum, Decimal("500.00"))
+
+    def test_rollup_rows_are_locked_in_role_order(self):
+        get_or_create = MonthlyPayrollRollup.objects.get_or_create
+        with patch.object(
+            MonthlyPayrollRollup.objects, "get_or_create", wraps=get_or_create
+        ) as locked:
+            apply_summary_changes(
+                2025,
+                10,
+                {},
+                {
+                    self.employee.id: summary_totals("200.00", "8"),
+                    self.admin.id: summary_totals("300.00", "10"),
+                },
+                # The first changed employee has the role that sorts last
+                roles={self.admin.id: "employee", self.employee.id: "admin"},
+            )
+
+        self.assertEqual(
+            [call.kwargs["role"] for call in locked.call_args_list],
+            ["", "admin", "employee"],
+        )
+
+    def test_migration_builds_rollups_of_existing_summaries(self):
+        MonthlyPayrollSummary.objects.create(
+            employee=self.employee, year=2025, month=10, total_gross_pay=Decimal("50")
+        )
+        MonthlyPayrollRollup.objects.all().delete()
+        migration = import_module("payroll.migrations.0021_monthlypayrollrollup")
+
+        migration.build_rollups(apps, None)
+
+        self.assertEqual(self._rollup().employee_count, 1)
+        self.assertEqual(self._rollup("employee").total_gross_pay_sum, Decimal("50"))
+
+    def test_rebuild_command_fixes_drift(self):
+        MonthlyPayrollSummary.objects.create(
+            employee=self.employee, year=2025, month=10, total_gross_pay=Decimal("50")
+        )
+        MonthlyPayrollRollup.objects.all().update(employee_count=7)
+
+        call_command("rebuild_payroll_rollups", "--year", "2025", stdout=StringIO())
+
+        self.assertEqual(self._rollup().employee_count, 1)
+
+    def test_analytics_reads_rollups(self):
+        MonthlyPayrollSummary.objects.create(
+            employee=self.employee,
+            year=2025,
+            month=10,
+            total_gross_pay=Decimal("8000.00"),
+            total_hours=Decimal("160.00"),
+        )
+        client = APIClient()
+        client.force_authenticate(user=self.admin_user)
+
+        with self.assertNumQueries(1):
+            rollups = get_year_rollups(2025)
+        self.assertEqual([rollup.month for rollup in rollups], [10])
+
+        response = client.get(reverse("payroll-analytics"), {"year": 2025})
+
+        self.assertEqual(response.status_code, 200)
+        stats = response.data["monthly_statistics"]
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0]["month"], 10)
+        self.assertEqual(stats[0]["total_employees"], 1)
+        self.assertEqual(stats[0]["avg_gross_pay"], Decimal("8000.00"))
+
+        response = client.get(
+            reverse("payroll-analytics"), {"year": 2025, "role": "admin"}
+        )
+        self.assertEqual(response.data["monthly_statistics"], [])
@@ -0,0 +1,94 @@
+"""
+Tests for the payroll benchmark suite (workload generator and baseline checks).
+"""
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from payroll.benchmarks import (
+    ScenarioResult,
+    WorkloadSpec,
+    compare_to_baseline,
+    generate_workload,
+    run_benchmarks,
+)
+from payroll.benchmarks.workload import SHIFT_HOURS
+from users.models import Employee
+
+
+class PayrollBenchmarkTest(TestCase):
+    def test_workload_is_deterministic(self):
+        spec = WorkloadSpec(employees=20, seed=7)
+
+        first = generate_workload(spec)
+        second = generate_workload(spec)
+        other = generate_workload(WorkloadSpec(employees=20, seed=8))
+
+        def shifts(workload):
+            return [
+                (log.employee_id, log.check_in, log.check_out)
+                for logs in workload.bulk_data.work_logs.values()
+                for log in logs
+            ]
+
+        self.assertEqual(shifts(first), shifts(second))
+        self.assertNotEqual(shifts(first), shifts(other))
+        self.assertEqual(set(first.shift_counts), set(SHIFT_HOURS))
+        self.assertEqual(
+            {e.calculation_type for e in first.bulk_data.employees.values()},
+            {"hourly", "monthly"},
+        )
+
+    def test_memory_and_database_scenarios(self):
+        workload = generate_workload(WorkloadSpec(employees=3))
+
+        results = run_benchmarks(
+            workload, ["bulk_sequential", "strategy_memory"], repeat=1
+        )
+
+        self.assertEqual(
+            [result.name for result in results], ["strategy_memory", "bulk_sequential"]
+        )
+        self.assertEqual(results[0].queries, 0)
+        self.assertGreater(results[1].queries, 0)
+        # Database scenarios roll their rows back
+        self.assertFalse(Employee.objects.filter(last_name="Employee").exists())
+
+    def test_compare_to_baseline(self):
+        baseline = {
+            "scenarios": {
+                "bulk_sequential": {"ms_per_employee": 2.0, "queries_per_employee": 0.1}
+            }
+        }
+
+        def result(seconds, queries):
+            return ScenarioResult("bulk_sequential", 100, seconds, queries)
+
+        self.assertEqual(compare_to_baseline([result(0.22, 10)], baseline), [])
+        regressions = compare_to_baseline([result(0.3, 20)], baseline)
+        self.assertEqual(len(regressions), 2)
+        self.assertIn("queries/employee", regressions[0])
+        self.assertIn("ms/employee", regressions[1])
+
+    def test_command_writes_and_checks_baseline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "baseline.json"
+            args = ["--employees", "2", "--scenarios", "strategy_memory"]
+            args += ["--repeat", "1", "--baseline", str(path)]
+
+            call_command(
+                "benchmark_payroll", *args, "--write-baseline", stdout=StringIO()
+            )
+            baseline = json.loads(path.read_text())
+            self.assertIn("strategy_memory", baseline["scenarios"])
+
+            baseline["scenarios"]["strategy_memory"]["queries_per_employee"] = -1
+            path.write_text(json.dumps(baseline))
+            with self.assertRaises(CommandError):
+                call_command("benchmark_payroll", *args, stdout=StringIO())
@@ -2,6 +2,7 @@
 Integration tests for Bulk Payroll API endpoints.
 """
 
+import multiprocessing
 from datetime import date, datetime
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
@@ -156,6 +157,7 @@ class BulkPayrollAPITestCase(TestCase):
                     "year": 2025,
                     "month": 10,
                     "employee_ids": [self.test_employees[0].id],
+                    "wait": True,
                 },
                 format="json",
             )
@@ -174,7 +176,9 @@ class BulkPayrollAPITestCase(TestCase):
         ) as mock_calc:
             mock_calc.return_value = {}
 
-            response = self.client.post(url, {"year": 2025, "month": 10}, format="json")
+            response = self.client.post(
+                url, {"year": 2025, "month": 10, "wait": True}, format="json"
+            )
 
             self.assertEqual(response.status_code, status.HTTP_200_OK)
 
@@ -277,7 +281,12 @@ class BulkPayrollAPITestCase(TestCase):
 
             response = self.client.post(
                 url,
-                {"year": 2025, "month": 10, "employee_ids": employee_ids},
+                {
+                    "year": 2025,
+                    "month": 10,
+                    "employee_ids": employee_ids,
+                    "wait": True,
+                },
                 format="json",
             )
 
@@ -302,6 +311,7 @@ class BulkPayrollAPITestCase(TestCase):
                     "year": 2025,
                     "month": 10,
                     # No employee_ids - should process all active employees
+                    "wait": True,
                 },
                 format="json",
             )
@@ -324,7 +334,12 @@ class BulkPayrollAPITestCase(TestCase):
 
             response = self.client.post(
                 url,
-                {"year": 2025, "month": 10, "strategy": "critical_points"},
+                {
+                    "year": 2025,
+                    "month": 10,
+                    "strategy": "critical_points",
+                    "wait": True,
+                },
                 format="json",
             )
 
@@ -368,6 +383,7 @@ class BulkPayrollAPITestCase(TestCase):
                     "use_parallel": False,
                     "use_cache": False,
                     "save_to_db": False,
+                    "wait": True,
                 },
                 format="json",
             )
@@ -406,7 +422,12 @@ class BulkPayrollAPITestCase(TestCase):
 
             response = self.client.post(
                 url,
-                {"year": 2025, "month": 10, "employee_ids": [employee_id]},
+                {
+                    "year": 2025,
+                    "month": 10,
+                    "employee_ids": [employee_id],
+                    "wait": True,
+                },
                 format="json",
             )
 
@@ -470,7 +491,12 @@ class BulkPayrollAPITestCase(TestCase):
 
             response = self.client.post(
                 url,
-                {"year": 2025, "month": 10, "employee_ids": employee_ids},
+                {
+                    "year": 2025,
+                    "month": 10,
+                    "employee_ids": employee_ids,
+                    "wait": True,
+                },
                 format="json",
             )
 
@@ -532,10 +558,208 @@ class BulkPayrollAPITestCase(TestCase):
         ) as mock_calc:
             mock_calc.side_effect = Exception("Service error")
 
-            response = self.client.post(url, {"year": 2025, "month": 10}, format="json")
+            response = self.client.post(
+                url, {"year": 2025, "month": 10, "wait": True}, format="json"
+            )
 
             self.assertEqual(
                 response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
             )
             self.assertEqual(response.data["status"], "error")
             self.assertIn("error", response.data)
+
+    def test_bulk_calculate_starts_background_job(self):
+        """Test that bulk calculation returns a job id without calculating."""
+        url = reverse("bulk-calculate-payroll")
+        employee_ids = [emp.id for emp in self.test_employees[:2]]
+
+        self.client.force_authenticate(user=self.admin_user)
+
+        with (
+            patch("payroll.tasks.run_bulk_payroll_job.apply_async") as mock_apply,
+            patch(
+                "payroll.services.payroll_service.PayrollService.calculate_bulk_optimized"
+            ) as mock_calc,
+        ):
+            response = self.client.post(
+                url,
+                {"year": 2025, "month": 10, "employee_ids": employee_ids},
+                format="json",
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            self.assertEqual(response.data["status"], "accepted")
+            job_id = response.data["job_id"]
+            mock_apply.assert_called_once_with(args=[job_id])
+            mock_calc.assert_not_called()
+
+        status_response = self.client.get(response.data["status_url"])
+
+        self.assertEqual(status_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(status_response.data["status"], "pending")
+        self.assertEqual(
+            status_response.data["parameters"]["employee_ids"], employee_ids
+        )
+
+    def test_bulk_calculate_job_queue_unavailable(self):
+        """Test that a broker failure marks the job failed."""
+        url = reverse("bulk-calculate-payroll")
+
+        self.client.force_authenticate(user=self.admin_user)
+
+        with patch(
+            "payroll.tasks.run_bulk_payroll_job.apply_async",
+            side_effect=ConnectionError("broker down"),
+        ):
+            response = self.client.post(url, {"year": 2025, "month": 10}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        job = self.client.get(
+            reverse("bulk-calculation-status"), {"job_id": response.data["job_id"]}
+        ).data
+        self.assertEqual(job["status"], "failed")
+
+    def test_bulk_calculate_job_store_unavailable(self):
+        """Test that a cache outage is reported instead of queueing a job."""
+        url = reverse("bulk-calculate-payroll")
+
+        self.client.force_authenticate(user=self.admin_user)
+
+        with (
+            patch(
+                "payroll.services.bulk.jobs.cache.set",
+                side_effect=ConnectionError("redis down"),
+            ),
+            patch("payroll.tasks.run_bulk_payroll_job.apply_async") as mock_apply,
+        ):
+            response = self.client.post(url, {"year": 2025, "month": 10}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        mock_apply.assert_not_called()
+
+    def test_bulk_job_progress_errors_do_not_fail_job(self):
+        """Test that a progress snapshot that cannot be stored is dropped."""
+        from payroll.services.bulk.jobs import BulkPayrollJobStore
+
+        store = BulkPayrollJobStore()
+        job = store.create_job(self.admin_user.id, [1], 2025, 10, "enhanced")
+
+        with patch(
+            "payroll.services.bulk.jobs.cache.set",
+            side_effect=ConnectionError("redis down"),
+        ):
+            store.progress_publisher(job["job_id"])({"completed": 1})
+
+        self.assertIsNone(store.get_job(job["job_id"])["progress"])
+
+    def test_bulk_job_reports_progress_and_summary(self):
+        """Test that a finished job exposes its progress and summary."""
+        from payroll.services.bulk.jobs import BulkPayrollJobStore, run_job
+
+        store = BulkPayrollJobStore()
+        employee_id = self.test_employees[0].id
+        job = store.create_job(
+            self.admin_user.id, [employee_id], 2025, 10, "enhanced", save_to_db=False
+        )
+
+        def fake_calculate_bulk(**kwargs):
+            kwargs["progress_publisher"]({"phase": "completed", "completed": 1})
+            return BulkCalculationResult(
+                results={
+                    employee_id: {
+                        "total_salary": Decimal("400.00"),
+                        "total_hours": Decimal("8.0"),
+                        "regular_hours": Decimal("8.0"),
+                        "overtime_hours": Decimal("0.0"),
+                        "holiday_hours": Decimal("0.0"),
+                        "shabbat_hours": Decimal("0.0"),
+                        "worked_days": 1,
+                        "metadata": {"status": "success"},
+                    }
+                },
+                errors={},
+                total_count=1,
+                successful_count=1,
+                failed_count=0,
+                cached_count=0,
+                calculated_count=1,
+                duration_seconds=0.5,
+                start_time=datetime.now(),
+                end_time=datetime.now(),
+                cache_hit_rate=0.0,
+            )
+
+        with patch(
+            "payroll.services.bulk.bulk_service.BulkEnhancedPayrollService.calculate_bulk",
+            side_effect=fake_calculate_bulk,
+        ):
+            run_job(job["job_id"], store)
+
+        self.client.force_authenticate(user=self.accountant_user)
+        response = self.client.get(
+            reverse("bulk-calculation-status"), {"job_id": job["job_id"]}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "completed")
+        self.assertEqual(response.data["progress"]["completed"], 1)
+        self.assertEqual(response.data["summary"]["successful"], 1)
+        self.assertEqual(
+            response.data["summary"]["results"][str(employee_id)]["total_salary"],
+            400.0,
+        )
+
+    def test_bulk_job_runs_in_daemonic_worker(self):
+        """Test that a job runs in a Celery prefork (daemonic) worker process."""
+        from payroll.services.bulk.jobs import BulkPayrollJobStore, run_job
+
+        employee_ids = [employee.id for employee in self.test_employees]
+        for i in range(5, 10):
+            employee = Employee.objects.create(
+                first_name=f"Test{i}",
+                last_name="Employee",
+                email=f"test{i}@example.com",
+                employment_type="full_time",
+                is_active=True,
+            )
+            Salary.objects.create(
+                employee=employee,
+                calculation_type="hourly",
+                hourly_rate=Decimal("50.00"),
+                is_active=True,
+            )
+            employee_ids.append(employee.id)
+
+        store = BulkPayrollJobStore()
+        job = store.create_job(
+            self.admin_user.id, employee_ids, 2025, 10, "enhanced", save_to_db=False
+        )
+
+        # A forked daemonic child, like a billiard pool worker, which may
+        # not start processes of its own
+        context = multiprocessing.get_context("fork")
+        receiver, sender = context.Pipe(duplex=False)
+
+        def worker():
+            sender.send(run_job(job["job_id"], store))
+
+        process = context.Process(target=worker, daemon=True)
+        process.start()
+        finished = receiver.poll(120) and receiver.recv()
+        process.join(5)
+
+        self.assertTrue(finished)
+        self.assertEqual(finished["status"], "completed")
+        self.assertEqual(finished["summary"]["successful"], 10)
+        self.assertEqual(finished["summary"]["failed"], 0)
+
+    def test_bulk_job_status_unknown_job(self):
+        """Test that an unknown job id returns 404."""
+        self.client.force_authenticate(user=self.admin_user)
+
+        response = self.client.get(
+            reverse("bulk-calculation-status"), {"job_id": "missing"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
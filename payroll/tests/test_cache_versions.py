@@ -0,0 +1,137 @@
+"""
+Tests for generation-versioned payroll cache keys.
+
+Saving or deleting a WorkLog, Salary or Holiday must bump the matching
+generation after commit, which changes the version baked into cache keys.
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from integrations.models import Holiday
+from payroll.models import Salary
+from payroll.services.cache_versions import (
+    get_holiday_version,
+    get_monthly_version,
+    make_employee_month_key,
+    make_holiday_month_key,
+    make_salary_key,
+)
+from payroll.tests.base import MockedShabbatTestBase
+from users.models import Employee
+from worktime.models import WorkLog
+
+
+class CacheVersionSignalsTest(MockedShabbatTestBase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.employee = Employee.objects.create(
+            first_name="Version",
+            last_name="Test",
+            email="version.test@test.com",
+            employment_type="hourly",
+            role="employee",
+        )
+
+    def tearDown(self):
+        cache.clear()
+        super().tearDown()
+
+    def _create_log(self, month=7):
+        check_in = self.make_israel_aware(datetime(2025, month, 10, 9, 0))
+        with self.captureOnCommitCallbacks(execute=True):
+            return WorkLog.objects.create(
+                employee=self.employee,
+                check_in=check_in,
+                check_out=check_in + timedelta(hours=8),
+            )
+
+    def test_worklog_change_bumps_only_its_month(self):
+        july = get_monthly_version(self.employee.id, 2025, 7)
+        june = get_monthly_version(self.employee.id, 2025, 6)
+
+        self._create_log()
+
+        self.assertNotEqual(get_monthly_version(self.employee.id, 2025, 7), july)
+        self.assertEqual(get_monthly_version(self.employee.id, 2025, 6), june)
+
+    def test_moving_worklog_bumps_old_and_new_month(self):
+        log = self._create_log()
+        july = get_monthly_version(self.employee.id, 2025, 7)
+        august = get_monthly_version(self.employee.id, 2025, 8)
+
+        log.check_in = self.make_israel_aware(datetime(2025, 8, 1, 9, 0))
+        log.check_out = log.check_in + timedelta(hours=8)
+        with self.captureOnCommitCallbacks(execute=True):
+            log.save()
+
+        self.assertNotEqual(get_monthly_version(self.employee.id, 2025, 7), july)
+        self.assertNotEqual(get_monthly_version(self.employee.id, 2025, 8), august)
+
+    def test_salary_change_bumps_every_month(self):
+        version = get_monthly_version(self.employee.id, 2025, 7)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Salary.objects.create(
+                employee=self.employee,
+                calculation_type="hourly",
+                hourly_rate=Decimal("50.00"),
+                currency="ILS",
+                is_active=True,
+            )
+
+        self.assertNotEqual(get_monthly_version(self.employee.id, 2025, 7), version)
+
+    def test_holiday_change_bumps_holiday_month(self):
+        holidays = get_holiday_version(2025, 10)
+        payroll = get_monthly_version(self.employee.id, 2025, 10)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Holiday.objects.create(date=date(2025, 10, 7), name="Sukkot")
+
+        self.assertNotEqual(get_holiday_version(2025, 10), holidays)
+        self.assertNotEqual(get_monthly_version(self.employee.id, 2025, 10), payroll)
+
+    def test_bump_waits_for_commit(self):
+        version = get_monthly_version(self.employee.id, 2025, 7)
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            WorkLog.objects.create(
+                employee=self.employee,
+                check_in=self.make_israel_aware(datetime(2025, 7, 10, 9, 0)),
+                check_out=self.make_israel_aware(datetime(2025, 7, 10, 17, 0)),
+            )
+
+        self.assertEqual(get_monthly_version(self.employee.id, 2025, 7), version)
+        self.assertTrue(callbacks)
+
+    def test_unreachable_cache_never_serves_cached_versions(self):
+        cache.set_many(
+            {
+                make_employee_month_key(self.employee.id, 2025, 7): 1,
+                make_salary_key(self.employee.id): 1,
+                make_holiday_month_key(2025, 7): 1,
+            },
+            timeout=None,
+        )
+        version = get_monthly_version(self.employee.id, 2025, 7)
+        self.assertEqual(version, "v1.1.1")
+
+        with (
+            patch(
+                "payroll.services.cache_versions.cache.get_many",
+                side_effect=ConnectionError("down"),
+            ),
+            patch(
+                "payroll.services.cache_versions.cache.add",
+                side_effect=ConnectionError("down"),
+            ),
+        ):
+            unavailable = get_monthly_version(self.employee.id, 2025, 7)
+
+        self.assertNotEqual(unavailable, version)
+        self.assertEqual(get_monthly_version(self.employee.id, 2025, 7), version)
@@ -0,0 +1,142 @@
+"""
+Tests for the preloaded-context (kernel) mode of EnhancedPayrollStrategy.
+
+Contexts built by BulkEnhancedPayrollService carry work logs, holidays and
+Shabbat times. The strategy must calculate from that data only - no ORM,
+cache or Shabbat API access - and produce the same result as the DB path.
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from payroll.models import Salary
+from payroll.services.bulk.bulk_service import BulkEnhancedPayrollService
+from payroll.services.strategies.enhanced import (
+    EnhancedPayrollStrategy,
+    PreloadedWorkLog,
+)
+from payroll.tests.base import MockedShabbatTestBase
+from payroll.tests.helpers import make_context
+from users.models import Employee
+from worktime.models import WorkLog
+
+
+class EnhancedPreloadedContextTest(MockedShabbatTestBase):
+    """Kernel mode must match the DB path without touching the database"""
+
+    def setUp(self):
+        super().setUp()
+
+        self.hourly_employee = Employee.objects.create(
+            first_name="Hourly",
+            last_name="Kernel",
+            email="hourly.kernel@test.com",
+            employment_type="hourly",
+            role="employee",
+        )
+        Salary.objects.create(
+            employee=self.hourly_employee,
+            calculation_type="hourly",
+            hourly_rate=Decimal("100.00"),
+            currency="ILS",
+            is_active=True,
+        )
+
+        self.monthly_employee = Employee.objects.create(
+            first_name="Monthly",
+            last_name="Kernel",
+            email="monthly.kernel@test.com",
+            employment_type="full_time",
+            role="employee",
+        )
+        Salary.objects.create(
+            employee=self.monthly_employee,
+            calculation_type="monthly",
+            base_salary=Decimal("25000.00"),
+            currency="ILS",
+            is_active=True,
+        )
+
+        for employee in (self.hourly_employee, self.monthly_employee):
+            # Weekday with overtime, Friday into Sabbath, Saturday daytime
+            self._create_log(employee, datetime(2025, 7, 1, 8, 0), 11)
+            self._create_log(employee, datetime(2025, 7, 4, 12, 0), 9)
+            self._create_log(employee, datetime(2025, 7, 5, 9, 0), 8)
+
+        # Holidays come from HolidayUtilityService on the DB path only
+        self.holiday_patcher = patch(
+            "integrations.services.holiday_utility_service.HolidayUtilityService.get_holidays_in_range",
+            return_value=[],
+        )
+        self.holiday_patcher.start()
+
+    def tearDown(self):
+        self.holiday_patcher.stop()
+        super().tearDown()
+
+    def _create_log(self, employee, start, hours):
+        check_in = self.make_israel_aware(start)
+        WorkLog.objects.create(
+            employee=employee,
+            check_in=check_in,
+            check_out=check_in + timedelta(hours=hours),
+        )
+
+    def _build_preloaded_context(self, employee):
+        service = BulkEnhancedPayrollService(use_cache=False, use_parallel=False)
+        with patch(
+            "payroll.services.bulk.data_loader.get_shabbat_times",
+            side_effect=self._default_shabbat_times,
+        ):
+            bulk_data = service.data_loader.load_all_data([employee.id], 2025, 7)
+        return service._build_contexts([employee.id], bulk_data, 2025, 7)[employee.id]
+
+    def _assert_same_result(self, employee):
+        preloaded_context = self._build_preloaded_context(employee)
+        db_result = EnhancedPayrollStrategy(make_context(employee, 2025, 7)).calculate()
+
+        self.mock_get_shabbat_times.reset_mock()
+        with self.assertNumQueries(0):
+            kernel_result = EnhancedPayrollStrategy(preloaded_context).calculate()
+        self.mock_get_shabbat_times.assert_not_called()
+
+        for field in (
+            "total_salary",
+            "total_hours",
+            "regular_hours",
+            "overtime_hours",
+            "shabbat_hours",
+            "holiday_hours",
+        ):
+            self.assertEqual(kernel_result[field], db_result[field], field)
+        self.assertEqual(
+            len(kernel_result["daily_results"]), len(db_result["daily_results"])
+        )
+        self.assertEqual(kernel_result["metadata"]["work_log_count"], 3)
+
+    def test_hourly_preloaded_matches_db_path(self):
+        self._assert_same_result(self.hourly_employee)
+
+    def test_monthly_preloaded_matches_db_path(self):
+        self._assert_same_result(self.monthly_employee)
+
+    def test_missing_friday_uses_fallback_without_api(self):
+        context = self._build_preloaded_context(self.hourly_employee)
+        context["shabbat_times"] = {}
+        self.mock_get_shabbat_times.reset_mock()
+
+        strategy = EnhancedPayrollStrategy(context)
+        sabbath_start, sabbath_end = strategy._get_sabbath_window(date(2025, 7, 4))
+
+        self.mock_get_shabbat_times.assert_not_called()
+        self.assertEqual(sabbath_start.date(), date(2025, 7, 4))
+        self.assertEqual(sabbath_end.date(), date(2025, 7, 5))
+
+    def test_preloaded_work_log_total_hours(self):
+        check_in = self.make_israel_aware(datetime(2025, 7, 1, 8, 0))
+        log = PreloadedWorkLog(
+            id=1, check_in=check_in, check_out=check_in + timedelta(hours=8.5)
+        )
+
+        self.assertEqual(log.get_total_hours(), Decimal("8.50"))
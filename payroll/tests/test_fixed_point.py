@@ -0,0 +1,203 @@
+"""
+Tests for the fixed-point arithmetic mode of EnhancedPayrollStrategy.
+
+Fixed-point results must match the Decimal path up to agorot rounding, be
+internally consistent (shift amounts add up to the totals) and be exactly
+reproducible.
+"""
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from fractions import Fraction
+
+from django.test import SimpleTestCase
+
+from integrations.services.unified_shabbat_service import UnifiedShabbatService
+from payroll.services.bulk.shift_segmentation import ShiftSegmentationEngine
+from payroll.services.fixed_point import (
+    SEGMENT_BUCKETS,
+    US_PER_HOUR,
+    agorot_rate,
+    agorot_to_decimal,
+    hours_to_us,
+    overtime_tier,
+    pay_agorot,
+    round_half_up,
+    us_to_hours,
+)
+from payroll.services.shabbat_windows import ShabbatWindowTable
+from payroll.services.strategies.enhanced import EnhancedPayrollStrategy
+from payroll.tests.helpers import SHIFT_HOLIDAYS, random_shifts
+
+UTC = dt_timezone.utc
+
+
+class FixedPointArithmeticTest(SimpleTestCase):
+    """Integer time/money primitives"""
+
+    def test_pay_is_rounded_once_to_agorot(self):
+        rate = agorot_rate(Decimal("45.50"))
+        self.assertEqual(rate, 4550)
+        # 8.6h * 45.50 * 1.25 = 489.125 -> 489.13
+        self.assertEqual(pay_agorot(hours_to_us("8.6"), rate, Fraction(5, 4)), 48913)
+        self.assertEqual(pay_agorot(0, rate), 0)
+
+    def test_round_half_up(self):
+        self.assertEqual(round_half_up(Fraction(5, 2)), 3)
+        self.assertEqual(round_half_up(Fraction(7, 3)), 2)
+        self.assertEqual(round_half_up(Fraction(0)), 0)
+
+    def test_decimal_boundary(self):
+        self.assertEqual(us_to_hours(8 * US_PER_HOUR), Decimal("8.0"))
+        self.assertEqual(us_to_hours(hours_to_us("8.6")), Decimal("8.6"))
+        self.assertEqual(agorot_to_decimal(48913), Decimal("489.13"))
+
+    def test_overtime_tier_boundaries(self):
+        norm, tier1 = hours_to_us("8.6"), hours_to_us("2.0")
+        self.assertEqual(overtime_tier(0, norm, tier1), 0)
+        self.assertEqual(overtime_tier(norm, norm, tier1), 1)
+        self.assertEqual(overtime_tier(norm + tier1, norm, tier1), 2)
+
+
+class FixedPointStrategyTest(SimpleTestCase):
+    """Fixed-point mode against the Decimal path"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        service = UnifiedShabbatService(source="astronomical", api_cross_check=False)
+        cls.shabbat_windows = ShabbatWindowTable.for_month(
+            2025, 7, lambda friday: service.get_shabbat_times(friday, use_cache=False)
+        )
+
+    def _strategy(self, shifts=(), calculation_type="hourly", **extra):
+        context = {
+            "employee_id": 1,
+            "user_id": 1,
+            "year": 2025,
+            "month": 7,
+            "calculation_type": calculation_type,
+            "hourly_rate": Decimal("57.50"),
+            "base_salary": Decimal("25000"),
+            "work_logs": [
+                {"worklog_id": i, "check_in": start, "check_out": end}
+                for i, (start, end) in enumerate(shifts, start=1)
+            ],
+            "holidays": SHIFT_HOLIDAYS,
+            "shabbat_times": {},
+            "shabbat_windows": self.shabbat_windows,
+        }
+        context.update(extra)
+        return EnhancedPayrollStrategy(context)
+
+    def _month_shifts(self, seed):
+        # One shift per day so that work logs look like a real month
+        shifts = {}
+        for start, end in random_shifts(120, seed=seed):
+            shifts.setdefault(start.date(), (start, end))
+        return sorted(shifts.values())
+
+    def test_segments_match_decimal_path(self):
+        strategy = self._strategy()
+        for calculation_type in ("hourly", "monthly"):
+            for start, end in random_shifts(300):
+                expected = strategy._calculate_shift_critical_points(
+                    start, end, Decimal("57.50"), SHIFT_HOLIDAYS, calculation_type
+                )
+                shift = strategy._segment_shift_fixed_point(
+                    start, end, SHIFT_HOLIDAYS, calculation_type == "monthly"
+                )
+                for (hours_key, _pay_key, _rate), us in zip(
+                    SEGMENT_BUCKETS, shift.bucket_us
+                ):
+                    self.assertAlmostEqual(
+                        us_to_hours(us),
+                        expected[hours_key],
+                        delta=Decimal("0.000001"),
+                        msg=f"{hours_key} {start} - {end}",
+                    )
+                self.assertAlmostEqual(
+                    us_to_hours(shift.night_us),
+                    expected["night_hours"],
+                    delta=Decimal("0.000001"),
+                )
+
+    def test_precomputed_segments_match_scalar_fixed_point(self):
+        shifts = random_shifts(300, seed=11)
+        engine = ShiftSegmentationEngine.for_strategy(
+            EnhancedPayrollStrategy, holidays=SHIFT_HOLIDAYS.keys()
+        )
+        segments = engine.segment_shifts(shifts, self.shabbat_windows)
+
+        scalar = self._strategy()
+        batch = self._strategy(shift_segments=segments)
+        for start, end in shifts:
+            expected = scalar._segment_shift_fixed_point(
+                start, end, SHIFT_HOLIDAYS, False
+            )
+            actual = batch._segment_shift_fixed_point(start, end, SHIFT_HOLIDAYS, False)
+            self.assertEqual(actual.bucket_us, expected.bucket_us, f"{start}")
+            self.assertEqual(actual.night_us, expected.night_us, f"{start}")
+
+    def _assert_matches_decimal_path(self, calculation_type, seed):
+        shifts = self._month_shifts(seed)
+        decimal_result = self._strategy(shifts, calculation_type).calculate()
+        fixed_result = self._strategy(
+            shifts, calculation_type, fixed_point_arithmetic=True
+        ).calculate()
+
+        self.assertEqual(fixed_result["metadata"]["arithmetic"], "fixed_point")
+        for field in (
+            "total_hours",
+            "regular_hours",
+            "overtime_hours",
+            "shabbat_hours",
+            "holiday_hours",
+            "night_hours",
+        ):
+            self.assertAlmostEqual(
+                fixed_result[field],
+                Decimal(str(decimal_result[field])),
+                delta=Decimal("0.0001"),
+                msg=field,
+            )
+        # One rounding to agorot per shift and bucket
+        self.assertAlmostEqual(
+            fixed_result["total_salary"],
+            decimal_result["total_salary"],
+            delta=Decimal("0.01") * len(shifts) * len(SEGMENT_BUCKETS),
+        )
+        self.assertEqual(
+            sum(day["total_gross_pay"] for day in fixed_result["daily_results"]),
+            fixed_result["total_salary"],
+        )
+        return shifts, fixed_result
+
+    def test_hourly_result_matches_decimal_path(self):
+        self._assert_matches_decimal_path("hourly", seed=3)
+
+    def test_monthly_result_matches_decimal_path(self):
+        self._assert_matches_decimal_path("monthly", seed=5)
+
+    def test_results_are_reproducible(self):
+        shifts, first = self._assert_matches_decimal_path("hourly", seed=9)
+        second = self._strategy(shifts, fixed_point_arithmetic=True).calculate()
+
+        self.assertEqual(first["total_salary"], second["total_salary"])
+        self.assertEqual(
+            first["total_salary"].as_tuple(), second["total_salary"].as_tuple()
+        )
+        self.assertEqual(first["daily_results"], second["daily_results"])
+
+    def test_monthly_normative_hours(self):
+        start = datetime(2025, 7, 1, 6, 0, tzinfo=UTC)  # Tuesday, 09:00 local
+        result = self._strategy(
+            [(start, start + timedelta(hours=8))],
+            "monthly",
+            fixed_point_arithmetic=True,
+        ).calculate()
+
+        self.assertEqual(result["regular_hours"], Decimal("8.6"))
+        # 8.6 / 182 * 25000 = 1181.318...
+        self.assertEqual(result["total_salary"], Decimal("1181.32"))
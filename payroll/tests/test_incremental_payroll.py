@@ -0,0 +1,163 @@
+"""
+Tests for incremental (delta) payroll updates.
+
+Editing one WorkLog must recalculate only the affected shift, keep the other
+daily records, and leave MonthlyPayrollSummary equal to a full recalculation.
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from django.test import override_settings
+
+from integrations.models import Holiday
+from payroll.models import DailyPayrollCalculation, MonthlyPayrollSummary, Salary
+from payroll.services.incremental import SUMMARY_FIELDS
+from payroll.services.recalculation_queue import get_recalculation_queue
+from payroll.tests.base import MockedShabbatTestBase
+from users.models import Employee
+from worktime.models import WorkLog
+
+
+@override_settings(PAYROLL_RECALCULATION_MODE="deferred")
+class IncrementalPayrollTest(MockedShabbatTestBase):
+    def setUp(self):
+        super().setUp()
+        self.queue = get_recalculation_queue()
+        self.queue.clear()
+        self.employee = Employee.objects.create(
+            first_name="Delta",
+            last_name="Test",
+            email="delta.test@test.com",
+            employment_type="hourly",
+            role="employee",
+        )
+        self.salary = Salary.objects.create(
+            employee=self.employee,
+            calculation_type="hourly",
+            hourly_rate=Decimal("50.00"),
+            currency="ILS",
+            is_active=True,
+        )
+        # Sunday-Thursday shifts, 6-10 July 2025
+        self.logs = []
+        for day in range(6, 11):
+            check_in = self.make_israel_aware(datetime(2025, 7, day, 9, 0))
+            self.logs.append(
+                WorkLog.objects.create(
+                    employee=self.employee,
+                    check_in=check_in,
+                    check_out=check_in + timedelta(hours=8),
+                )
+            )
+        self.queue.flush()
+
+    def tearDown(self):
+        self.queue.clear()
+        super().tearDown()
+
+    def _recalculate(self):
+        self.queue.clear()
+        return self.queue.recalculate(self.employee.id, 2025, 7)
+
+    def _summary(self):
+        summary = MonthlyPayrollSummary.objects.get(
+            employee=self.employee, year=2025, month=7
+        )
+        return {
+            field: getattr(summary, field)
+            for field in SUMMARY_FIELDS + ("worked_days",)
+        }
+
+    def _assert_matches_full_recalculation(self):
+        incremental = self._summary()
+        MonthlyPayrollSummary.objects.filter(employee=self.employee).update(
+            calculation_details={}
+        )
+        self.assertEqual(self._recalculate()["mode"], "full")
+        self.assertEqual(incremental, self._summary())
+
+    def test_full_calculation_stores_shift_contributions(self):
+        summary = MonthlyPayrollSummary.objects.get(employee=self.employee)
+        totals = summary.calculation_details["incremental"]["totals"]
+        self.assertEqual(Decimal(totals["total_hours"]), Decimal("40"))
+
+        for record in DailyPayrollCalculation.objects.filter(employee=self.employee):
+            self.assertIn("contribution", record.calculation_details)
+            self.assertEqual(
+                record.calculation_details["check_in"],
+                record.worklog.check_in.isoformat(),
+            )
+
+    def test_unchanged_month_is_not_recalculated(self):
+        self.assertEqual(self._recalculate()["mode"], "unchanged")
+
+    def test_edit_recalculates_only_changed_shift(self):
+        untouched = set(
+            DailyPayrollCalculation.objects.exclude(worklog=self.logs[0]).values_list(
+                "id", flat=True
+            )
+        )
+
+        log = self.logs[0]
+        log.check_out = log.check_in + timedelta(hours=11)
+        log.save()
+        outcome = self._recalculate()
+
+        self.assertEqual(outcome["mode"], "incremental")
+        self.assertEqual(outcome["changed_shifts"], 1)
+        self.assertEqual(outcome["total_hours"], Decimal("43"))
+        self.assertTrue(
+            untouched.issubset(
+                DailyPayrollCalculation.objects.values_list("id", flat=True)
+            )
+        )
+        self.assertEqual(
+            DailyPayrollCalculation.objects.filter(employee=self.employee).count(), 5
+        )
+        self._assert_matches_full_recalculation()
+
+    def test_new_shift_is_added_incrementally(self):
+        check_in = self.make_israel_aware(datetime(2025, 7, 13, 22, 0))
+        WorkLog.objects.create(
+            employee=self.employee,
+            check_in=check_in,
+            check_out=check_in + timedelta(hours=9),
+        )
+        outcome = self._recalculate()
+
+        self.assertEqual(outcome["mode"], "incremental")
+        self.assertEqual(self._summary()["worked_days"], 6)
+        self._assert_matches_full_recalculation()
+
+    def test_soft_deleted_shift_falls_back_to_full(self):
+        # The signal drops the shift's record immediately, so the stored
+        # totals no longer match the records
+        self.logs[1].soft_delete()
+
+        self.assertEqual(self._recalculate()["mode"], "full")
+        self.assertEqual(self._summary()["total_hours"], Decimal("32"))
+        self.assertEqual(self._recalculate()["mode"], "unchanged")
+
+    def test_salary_change_falls_back_to_full(self):
+        self.salary.hourly_rate = Decimal("60.00")
+        self.salary.save()
+
+        self.assertEqual(self._recalculate()["mode"], "full")
+        self.assertEqual(self._summary()["total_gross_pay"], Decimal("2400.00"))
+
+    def test_holiday_change_falls_back_to_full(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            holiday = Holiday.objects.create(date=date(2025, 7, 8), name="Test")
+
+        summary = MonthlyPayrollSummary.objects.get(employee=self.employee)
+        self.assertNotIn("incremental", summary.calculation_details)
+        self.assertEqual(self._recalculate()["mode"], "full")
+
+        # Moving the holiday to another month clears both months
+        with self.captureOnCommitCallbacks(execute=True):
+            holiday.date = date(2025, 8, 8)
+            holiday.save()
+
+        summary.refresh_from_db()
+        self.assertNotIn("incremental", summary.calculation_details)
@@ -0,0 +1,136 @@
+"""
+Tests for the streaming payroll export (endpoint and management command).
+"""
+
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal
+
+from rest_framework.test import APIClient
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from payroll.models import DailyPayrollCalculation, MonthlyPayrollSummary
+from users.models import Employee
+
+
+class PayrollExportTest(TestCase):
+    def setUp(self):
+        self.admin_user = User.objects.create_user(
+            username="export_admin", email="export_admin@test.com"
+        )
+        self.admin = Employee.objects.create(
+            user=self.admin_user,
+            first_name="Admin",
+            last_name="User",
+            email="export_admin@test.com",
+            role="admin",
+        )
+        self.employee_user = User.objects.create_user(
+            username="export_employee", email="export_employee@test.com"
+        )
+        self.employees = [
+            Employee.objects.create(
+                user=self.employee_user if i == 0 else None,
+                first_name=f"Worker{i}",
+                last_name="Employee",
+                email=f"export_worker{i}@test.com",
+                role="employee",
+            )
+            for i in range(5)
+        ]
+        for i, employee in enumerate(self.employees):
+            MonthlyPayrollSummary.objects.create(
+                employee=employee,
+                year=2025,
+                month=10,
+                total_gross_pay=Decimal(f"{1000 + i}.50"),
+                total_hours=Decimal("160.00"),
+            )
+            DailyPayrollCalculation.objects.create(
+                employee=employee,
+                work_date=date(2025, 10, 9),
+                regular_hours=Decimal("8.00"),
+                total_gross_pay=Decimal("400.00"),
+            )
+        # Other month - never exported
+        MonthlyPayrollSummary.objects.create(
+            employee=self.admin, year=2025, month=9, total_gross_pay=Decimal("1")
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin_user)
+        self.url = reverse("payroll-export")
+
+    def _get(self, **params):
+        response = self.client.get(self.url, {"year": 2025, "month": 10, **params})
+        content = b"".join(response.streaming_content).decode()
+        return response, content
+
+    def test_csv_export_streams_all_summaries(self):
+        response, content = self._get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual(
+            [int(row["employee_id"]) for row in rows],
+            [employee.id for employee in self.employees],
+        )
+        self.assertEqual(rows[0]["total_gross_pay"], "1000.50")
+
+    def test_ndjson_keyset_pages_cover_every_row_once(self):
+        seen, after = [], 0
+        while True:
+            response, content = self._get(
+                dataset="daily", output="ndjson", limit=2, after=after
+            )
+            seen += [json.loads(line) for line in content.splitlines()]
+            if "X-Next-Cursor" not in response:
+                break
+            after = response["X-Next-Cursor"]
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len({row["id"] for row in seen}), 5)
+        self.assertEqual(seen[0]["work_date"], "2025-10-09")
+        self.assertEqual(seen[0]["total_gross_pay"], "400.00")
+
+    def test_employee_exports_only_own_rows(self):
+        self.client.force_authenticate(user=self.employee_user)
+
+        _, content = self._get(output="ndjson", employee_id=self.admin.id)
+
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual([row["employee_id"] for row in rows], [self.employees[0].id])
+
+    def test_invalid_parameters(self):
+        response = self.client.get(self.url, {"output": "xml"})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get(self.url, {"year": 2025, "month": 13})
+        self.assertEqual(response.status_code, 400)
+
+    def test_management_command(self):
+        stdout = io.StringIO()
+
+        call_command(
+            "export_payroll",
+            "--year",
+            "2025",
+            "--month",
+            "10",
+            "--format",
+            "ndjson",
+            "--chunk-size",
+            "2",
+            stdout=stdout,
+        )
+
+        rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual({row["month"] for row in rows}, {10})
@@ -0,0 +1,209 @@
+"""
+Tests for payroll_list serving stored summaries and backfilling the gaps in
+the background.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytz
+from rest_framework.test import APIClient
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+
+from payroll.models import MonthlyPayrollSummary, Salary
+from payroll.services.bulk.backfill import (
+    enqueue_backfill,
+    find_stale_employee_ids,
+    finish_backfill,
+    make_backfill_key,
+)
+from payroll.services.bulk.jobs import JOB_FAILED, BulkPayrollJobStore
+from payroll.services.bulk.persister import BulkPersister
+from payroll.views.payroll_list_views import _schedule_backfill
+from users.models import Employee
+from worktime.models import WorkLog
+
+LIST_URL = "/api/v1/payroll/?year=2025&month=10"
+
+
+class PayrollListBackfillTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+        self.admin_user = User.objects.create_user(
+            username="backfill_admin", email="admin@test.com", password="pass123"
+        )
+        self.admin = Employee.objects.create(
+            user=self.admin_user,
+            first_name="Admin",
+            last_name="User",
+            email="admin@test.com",
+            employment_type="full_time",
+            role="admin",
+        )
+        self.worker = Employee.objects.create(
+            first_name="Hourly",
+            last_name="Worker",
+            email="worker@test.com",
+            employment_type="hourly",
+            role="employee",
+        )
+        for employee in (self.admin, self.worker):
+            Salary.objects.create(
+                employee=employee,
+                calculation_type="hourly",
+                hourly_rate=Decimal("50.00"),
+                currency="ILS",
+                is_active=True,
+            )
+
+        self.summary = MonthlyPayrollSummary.objects.create(
+            employee=self.admin,
+            year=2025,
+            month=10,
+            total_gross_pay=Decimal("8000.00"),
+            total_hours=Decimal("160.0"),
+            worked_days=20,
+        )
+        self.client.force_authenticate(user=self.admin_user)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _statuses(self, response):
+        return {row["id"]: row["status"] for row in response.json()}
+
+    @patch("payroll.tasks.run_bulk_payroll_job.apply_async")
+    @patch("payroll.services.payroll_service.PayrollService.calculate")
+    def test_missing_summaries_are_queued_not_calculated(
+        self, mock_calculate, mock_apply_async
+    ):
+        response = self.client.get(LIST_URL)
+
+        self.assertEqual(response.status_code, 200)
+        mock_calculate.assert_not_called()
+        self.assertEqual(
+            self._statuses(response),
+            {self.admin.id: "calculated", self.worker.id: "pending"},
+        )
+
+        job_id = response["X-Payroll-Backfill-Job"]
+        mock_apply_async.assert_called_once()
+        self.assertEqual(mock_apply_async.call_args.kwargs["args"], [job_id])
+        finish = mock_apply_async.call_args.kwargs["link"]
+        self.assertEqual(finish.task, "payroll.tasks.finish_payroll_backfill")
+        self.assertEqual(list(finish.args), [job_id, 2025, 10])
+        self.assertEqual(mock_apply_async.call_args.kwargs["link_error"], finish)
+        job = BulkPayrollJobStore().get_job(job_id)
+        self.assertEqual(job["parameters"]["employee_ids"], [self.worker.id])
+        self.assertTrue(job["parameters"]["save_to_db"])
+
+        # Re-fetching while the job is pending reuses it
+        response = self.client.get(LIST_URL)
+        self.assertEqual(response["X-Payroll-Backfill-Job"], job_id)
+        mock_apply_async.assert_called_once()
+
+    @patch("payroll.tasks.run_bulk_payroll_job.apply_async")
+    def test_summary_older_than_work_log_is_stale(self, mock_apply_async):
+        MonthlyPayrollSummary.objects.create(
+            employee=self.worker, year=2025, month=10, total_gross_pay=Decimal("0")
+        )
+        tz = pytz.timezone("Asia/Jerusalem")
+        work_log = WorkLog.objects.create(
+            employee=self.worker,
+            check_in=tz.localize(datetime(2025, 10, 9, 9, 0)),
+            check_out=tz.localize(datetime(2025, 10, 9, 17, 0)),
+        )
+        WorkLog.all_objects.filter(pk=work_log.pk).update(
+            updated_at=self.summary.last_updated + timedelta(hours=1)
+        )
+
+        response = self.client.get(LIST_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._statuses(response)[self.worker.id], "stale")
+        job_id = mock_apply_async.call_args.kwargs["args"][0]
+        job = BulkPayrollJobStore().get_job(job_id)
+        self.assertIn(self.worker.id, job["parameters"]["employee_ids"])
+        self.assertNotIn(self.admin.id, job["parameters"]["employee_ids"])
+
+    def test_backfilled_summary_is_no_longer_stale(self):
+        tz = pytz.timezone("Asia/Jerusalem")
+        work_log = WorkLog.objects.create(
+            employee=self.admin,
+            check_in=tz.localize(datetime(2025, 10, 9, 9, 0)),
+            check_out=tz.localize(datetime(2025, 10, 9, 17, 0)),
+        )
+        MonthlyPayrollSummary.objects.filter(pk=self.summary.pk).update(
+            last_updated=work_log.updated_at - timedelta(hours=1)
+        )
+        self.assertEqual(
+            find_stale_employee_ids([self.admin.id], 2025, 10), {self.admin.id}
+        )
+
+        # The backfill rewrites the existing summary with bulk_update
+        with self.assertLogs("payroll.services.bulk.persister", "INFO"):
+            BulkPersister()._save_monthly_summaries(
+                {self.admin.id: {"total_salary": Decimal("400.00")}},
+                {
+                    self.admin.id: {
+                        "employee_id": self.admin.id,
+                        "year": 2025,
+                        "month": 10,
+                    }
+                },
+            )
+
+        self.assertEqual(find_stale_employee_ids([self.admin.id], 2025, 10), set())
+
+    @patch("payroll.tasks.run_bulk_payroll_job.apply_async")
+    def test_queue_failure_marks_job_failed_and_releases_lock(self, mock_apply_async):
+        mock_apply_async.side_effect = ConnectionError("broker down")
+
+        job = enqueue_backfill(self.admin_user.id, [self.worker.id], 2025, 10)
+
+        self.assertEqual(job["status"], JOB_FAILED)
+        self.assertIsNone(cache.get(make_backfill_key(2025, 10)))
+
+    @patch("payroll.tasks.run_bulk_payroll_job.apply_async")
+    def test_employees_outside_active_job_are_queued_after_it(self, mock_apply_async):
+        first = enqueue_backfill(self.admin_user.id, [self.worker.id], 2025, 10)
+
+        # A caller needing other employees gets the active job for now
+        joined = enqueue_backfill(
+            self.admin_user.id, [self.worker.id, self.admin.id], 2025, 10
+        )
+        self.assertEqual(joined["job_id"], first["job_id"])
+        mock_apply_async.assert_called_once()
+
+        follow_up = finish_backfill(first["job_id"], 2025, 10)
+
+        self.assertNotEqual(follow_up["job_id"], first["job_id"])
+        self.assertEqual(follow_up["parameters"]["employee_ids"], [self.admin.id])
+        self.assertEqual(cache.get(make_backfill_key(2025, 10)), follow_up["job_id"])
+        self.assertEqual(mock_apply_async.call_count, 2)
+
+        # Nothing was deferred behind the follow-up
+        self.assertIsNone(finish_backfill(follow_up["job_id"], 2025, 10))
+        self.assertIsNone(cache.get(make_backfill_key(2025, 10)))
+
+    @patch("payroll.tasks.run_bulk_payroll_job.apply_async")
+    def test_status_url_only_reported_to_status_pollers(self, mock_apply_async):
+        employees = Employee.objects.filter(pk=self.worker.pk)
+        current_date = datetime(2025, 10, 1).date()
+
+        info = _schedule_backfill(self.admin_user.id, employees, [], current_date)[
+            "info"
+        ]
+        self.assertIsNotNone(info["job_id"])
+        self.assertIsNone(info["status_url"])
+
+        info = _schedule_backfill(
+            self.admin_user.id, employees, [], current_date, can_poll_status=True
+        )["info"]
+        self.assertTrue(info["status_url"].endswith(f"?job_id={info['job_id']}"))
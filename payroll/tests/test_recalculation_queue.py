@@ -0,0 +1,191 @@
+"""
+Tests for the coalesced payroll recalculation queue.
+
+WorkLog signals must enqueue employee-months instead of recalculating inline,
+and bursts of changes must result in one recalculation per employee-month.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import override_settings
+
+from payroll.models import Salary
+from payroll.services.recalculation_queue import (
+    PayrollRecalculationQueue,
+    get_recalculation_queue,
+    make_pending_key,
+)
+from payroll.tests.base import MockedShabbatTestBase
+from users.models import Employee
+from worktime.models import WorkLog
+
+RECALCULATE = (
+    "payroll.services.recalculation_queue.PayrollRecalculationQueue.recalculate"
+)
+
+
+class RecalculationQueueTestBase(MockedShabbatTestBase):
+    def setUp(self):
+        super().setUp()
+        get_recalculation_queue().clear()
+        self.employee = Employee.objects.create(
+            first_name="Queue",
+            last_name="Test",
+            email="queue.test@test.com",
+            employment_type="hourly",
+            role="employee",
+        )
+        Salary.objects.create(
+            employee=self.employee,
+            calculation_type="hourly",
+            hourly_rate=Decimal("50.00"),
+            currency="ILS",
+            is_active=True,
+        )
+
+    def tearDown(self):
+        get_recalculation_queue().clear()
+        super().tearDown()
+
+    def _create_logs(self, count, month=7):
+        logs = []
+        for day in range(1, count + 1):
+            check_in = self.make_israel_aware(datetime(2025, month, day, 9, 0))
+            logs.append(
+                WorkLog.objects.create(
+                    employee=self.employee,
+                    check_in=check_in,
+                    check_out=check_in + timedelta(hours=8),
+                )
+            )
+        return logs
+
+
+@override_settings(PAYROLL_RECALCULATION_MODE="deferred")
+class DeferredRecalculationTest(RecalculationQueueTestBase):
+    """Deferred mode collects keys until flush()"""
+
+    def test_checkouts_do_not_recalculate_inline(self):
+        with patch(RECALCULATE) as recalculate:
+            self._create_logs(5)
+        recalculate.assert_not_called()
+
+        self.assertEqual(
+            get_recalculation_queue().pending(), [(self.employee.id, 2025, 7)]
+        )
+
+    def test_burst_of_edits_is_recalculated_once(self):
+        logs = self._create_logs(10)
+        for log in logs:
+            log.check_out = log.check_out + timedelta(hours=1)
+            log.save()
+
+        with patch(RECALCULATE) as recalculate:
+            flushed = get_recalculation_queue().flush()
+
+        self.assertEqual(flushed, 1)
+        recalculate.assert_called_once_with(self.employee.id, 2025, 7)
+        self.assertEqual(get_recalculation_queue().pending(), [])
+
+    def test_edit_moving_log_across_months_enqueues_both(self):
+        log = self._create_logs(1)[0]
+        get_recalculation_queue().clear()
+
+        log.check_in = self.make_israel_aware(datetime(2025, 8, 1, 9, 0))
+        log.check_out = log.check_in + timedelta(hours=8)
+        log.save()
+
+        self.assertEqual(
+            get_recalculation_queue().pending(),
+            [(self.employee.id, 2025, 7), (self.employee.id, 2025, 8)],
+        )
+
+    def test_flush_persists_monthly_summary(self):
+        from payroll.models import MonthlyPayrollSummary
+
+        self._create_logs(3)
+        get_recalculation_queue().flush()
+
+        summary = MonthlyPayrollSummary.objects.get(
+            employee=self.employee, year=2025, month=7
+        )
+        self.assertEqual(summary.total_hours, Decimal("24.00"))
+
+
+@override_settings(
+    PAYROLL_RECALCULATION_MODE="async", PAYROLL_RECALCULATION_DEBOUNCE_SECONDS=7
+)
+class AsyncRecalculationTest(RecalculationQueueTestBase):
+    """Async mode schedules one debounced Celery task per pending key"""
+
+    def test_burst_schedules_single_task(self):
+        with (
+            patch(
+                "payroll.tasks.recalculate_employee_month.apply_async"
+            ) as apply_async,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self._create_logs(10)
+
+        apply_async.assert_called_once_with(
+            args=[self.employee.id, 2025, 7], countdown=7
+        )
+        self.assertTrue(cache.get(make_pending_key(self.employee.id, 2025, 7)))
+
+    def test_recalculation_clears_pending_key(self):
+        queue = PayrollRecalculationQueue()
+        pending_key = make_pending_key(self.employee.id, 2025, 7)
+        cache.set(pending_key, True)
+
+        with patch("payroll.services.payroll_service.PayrollService.calculate") as calc:
+            calc.return_value = {"total_salary": Decimal("0")}
+            queue.recalculate(self.employee.id, 2025, 7)
+
+        self.assertIsNone(cache.get(pending_key))
+
+    def test_unavailable_broker_runs_inline(self):
+        with (
+            patch(
+                "payroll.tasks.recalculate_employee_month.apply_async",
+                side_effect=ConnectionError("broker down"),
+            ),
+            patch(RECALCULATE) as recalculate,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self._create_logs(1)
+
+        recalculate.assert_called_once_with(self.employee.id, 2025, 7)
+        self.assertIsNone(cache.get(make_pending_key(self.employee.id, 2025, 7)))
+
+
+@override_settings(PAYROLL_RECALCULATION_MODE="sync")
+class SyncRecalculationTest(RecalculationQueueTestBase):
+    """Sync mode recalculates each key once when the transaction commits"""
+
+    def test_burst_recalculates_once_on_commit(self):
+        with (
+            patch(RECALCULATE) as recalculate,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self._create_logs(5)
+
+        recalculate.assert_called_once_with(self.employee.id, 2025, 7)
+
+    def test_rolled_back_enqueue_does_not_block_key(self):
+        queue = get_recalculation_queue()
+        with patch(RECALCULATE) as recalculate:
+            try:
+                with transaction.atomic():
+                    queue.enqueue(self.employee.id, 2025, 7)
+                    raise RuntimeError("rollback")
+            except RuntimeError:
+                pass
+
+            with self.captureOnCommitCallbacks(execute=True):
+                queue.enqueue(self.employee.id, 2025, 7)
+
+        recalculate.assert_called_once_with(self.employee.id, 2025, 7)
@@ -15,6 +15,7 @@ from integrations.models import Holiday
 from payroll.models import CompensatoryDay, MonthlyPayrollSummary, Salary
 from payroll.services.enums import CalculationStrategy
 from payroll.services.payroll_service import PayrollService
+from payroll.services.recalculation_queue import get_recalculation_queue
 from payroll.tests.base import MockedShabbatTestBase
 from payroll.tests.helpers import (
     ISRAELI_DAILY_NORM_HOURS,
@@ -444,6 +445,8 @@ class SabbathCalculationTest(PayrollTestMixin, MockedShabbatTestBase):
         WorkLog.objects.create(
             employee=self.hourly_employee, check_in=check_in, check_out=check_out
         )
+        # The save only queues the recalculation; run it
+        get_recalculation_queue().flush()
         # Test with API (fast_mode=False)
         context = make_context(self.hourly_employee, 2025, 7, fast_mode=False)
         # Test individual worklog calculation first
@@ -0,0 +1,145 @@
+"""
+Tests for the month-scoped Shabbat window table.
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytz
+
+from django.test import SimpleTestCase
+
+from payroll.models import Salary
+from payroll.services.shabbat_windows import (
+    ShabbatWindowTable,
+    get_fridays_for_month,
+)
+from payroll.services.strategies.enhanced import EnhancedPayrollStrategy
+from payroll.tests.base import MockedShabbatTestBase
+from payroll.tests.helpers import make_context
+from users.models import Employee
+from worktime.models import WorkLog
+
+ISRAEL_TZ = pytz.timezone("Asia/Jerusalem")
+
+
+def _shabbat_times(friday_date):
+    start = ISRAEL_TZ.localize(datetime.combine(friday_date, datetime.min.time()))
+    return {
+        "shabbat_start": (start + timedelta(hours=19)).isoformat(),
+        "shabbat_end": (start + timedelta(days=1, hours=20)).isoformat(),
+    }
+
+
+class ShabbatWindowTableTest(SimpleTestCase):
+    """Lookup semantics of ShabbatWindowTable.window_for"""
+
+    def setUp(self):
+        self.table = ShabbatWindowTable.for_month(2025, 7, _shabbat_times)
+
+    def _at(self, day, hour=0, minute=0):
+        return ISRAEL_TZ.localize(datetime(2025, 7, day, hour, minute))
+
+    def test_fridays_for_month_include_neighbours(self):
+        self.assertEqual(
+            get_fridays_for_month(2025, 7),
+            [
+                date(2025, 6, 27),
+                date(2025, 7, 4),
+                date(2025, 7, 11),
+                date(2025, 7, 18),
+                date(2025, 7, 25),
+                date(2025, 8, 1),
+            ],
+        )
+        self.assertEqual(len(self.table), 6)
+
+    def test_moment_inside_window(self):
+        window = self.table.window_for(self._at(5, 10))
+        self.assertEqual(window.friday_date, date(2025, 7, 4))
+
+    def test_moment_before_window_returns_upcoming(self):
+        self.assertEqual(
+            self.table.window_for(self._at(2, 8)).friday_date, date(2025, 7, 4)
+        )
+        self.assertEqual(
+            self.table.window_for(self._at(4, 18, 59)).friday_date, date(2025, 7, 4)
+        )
+
+    def test_moment_after_window_end_returns_next_week(self):
+        window = self.table.window_for(self._at(5, 20, 0))
+        self.assertEqual(window.friday_date, date(2025, 7, 11))
+
+    def test_moment_outside_table_returns_none(self):
+        # Saturday before the first covered Friday - that Shabbat is unknown
+        self.assertIsNone(
+            self.table.window_for(ISRAEL_TZ.localize(datetime(2025, 6, 21, 10)))
+        )
+        # After the last covered Shabbat
+        self.assertIsNone(
+            self.table.window_for(ISRAEL_TZ.localize(datetime(2025, 8, 3, 10)))
+        )
+
+    def test_missing_week_is_not_skipped(self):
+        def provider(friday_date):
+            if friday_date == date(2025, 7, 11):
+                raise ValueError("API unavailable")
+            return _shabbat_times(friday_date)
+
+        table = ShabbatWindowTable.for_month(2025, 7, provider)
+
+        self.assertEqual(len(table), 5)
+        self.assertIsNone(table.window_for(self._at(9, 8)))
+        self.assertEqual(
+            table.window_for(self._at(14, 8)).friday_date, date(2025, 7, 18)
+        )
+
+    def test_from_shabbat_times_accepts_dicts(self):
+        table = ShabbatWindowTable.from_shabbat_times(
+            {date(2025, 7, 4): _shabbat_times(date(2025, 7, 4))}
+        )
+        window = table.window_for(self._at(4, 20))
+        self.assertEqual(window.start, self._at(4, 19))
+        self.assertEqual(window.end, self._at(5, 20))
+
+
+class EnhancedStrategyShabbatWindowsTest(MockedShabbatTestBase):
+    """The strategy resolves Shabbat times once per month, not per shift"""
+
+    def setUp(self):
+        super().setUp()
+        self.employee = Employee.objects.create(
+            first_name="Window",
+            last_name="Table",
+            email="window.table@test.com",
+            employment_type="hourly",
+            role="employee",
+        )
+        Salary.objects.create(
+            employee=self.employee,
+            calculation_type="hourly",
+            hourly_rate=Decimal("100.00"),
+            currency="ILS",
+            is_active=True,
+        )
+        for day in range(1, 29):
+            check_in = self.make_israel_aware(datetime(2025, 7, day, 9, 0))
+            WorkLog.objects.create(
+                employee=self.employee,
+                check_in=check_in,
+                check_out=check_in + timedelta(hours=9),
+            )
+
+    def test_shabbat_times_loaded_once_per_friday(self):
+        self.mock_get_shabbat_times.reset_mock()
+
+        result = EnhancedPayrollStrategy(
+            make_context(self.employee, 2025, 7)
+        ).calculate()
+
+        self.assertEqual(
+            self.mock_get_shabbat_times.call_count,
+            len(get_fridays_for_month(2025, 7)),
+        )
+        # 4 Saturdays fully inside Shabbat + 4 Fridays from 17:30 to 18:00
+        self.assertEqual(result["shabbat_hours"], Decimal("38.0"))
@@ -12,6 +12,7 @@ from .views import (
     enhanced_earnings,
     monthly_payroll_summary,
     payroll_analytics,
+    payroll_export,
     payroll_list,
     recalculate_payroll,
 )
@@ -39,6 +40,7 @@ urlpatterns = [
     path("monthly-summary/", monthly_payroll_summary, name="monthly-payroll-summary"),
     path("recalculate/", recalculate_payroll, name="recalculate-payroll"),
     path("analytics/", payroll_analytics, name="payroll-analytics"),
+    path("export/", payroll_export, name="payroll-export"),
     # Bulk payroll calculation endpoints
     path(
         "bulk/calculate/",
@@ -6,6 +6,7 @@ All views are now split into separate modules by functionality:
 - earnings_views.py - Earnings calculations
 - calculation_views.py - Recalculation operations
 - analytics_views.py - Analytics and summaries
+- export_views.py - Streaming CSV / NDJSON exports
 """
 
 import logging
@@ -40,6 +41,9 @@ from .earnings_views import (
     enhanced_earnings,
 )
 
+# Import streaming export views
+from .export_views import payroll_export
+
 # Import helper functions
 from .helpers import check_admin_or_accountant_role, get_user_employee_profile
 
@@ -63,6 +67,8 @@ __all__ = [
     # Analytics views
     "payroll_analytics",
     "monthly_payroll_summary",
+    # Export views
+    "payroll_export",
     # Models for test compatibility
     "MonthlyPayrollSummary",
     "DailyPayrollCalculation",
@@ -14,13 +14,11 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from django.db.models import Avg, Count, DecimalField, Sum
-from django.db.models.functions import Coalesce
-
 # Import from parent module to make test mocking work correctly
 from payroll import views as payroll_views
 
 from ..models import MonthlyPayrollSummary
+from ..services.analytics_rollup import ALL_ROLES, get_year_rollups
 
 logger = logging.getLogger(__name__)
 
@@ -49,28 +47,20 @@ def payroll_analytics(request):
                 {"error": "Invalid year"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Get aggregated data
-        monthly_stats = (
-            MonthlyPayrollSummary.objects.filter(year=year)
-            .values("month")
-            .annotate(
-                total_employees=Count("employee", distinct=True),
-                total_gross_pay_sum=Coalesce(
-                    Sum("total_gross_pay"), 0, output_field=DecimalField()
-                ),
-                avg_gross_pay=Coalesce(
-                    Avg("total_gross_pay"), 0, output_field=DecimalField()
-                ),
-                total_hours_sum=Coalesce(
-                    Sum("total_hours"), 0, output_field=DecimalField()
-                ),
-                avg_hours=Coalesce(Avg("total_hours"), 0, output_field=DecimalField()),
-            )
-            .order_by("month")
-        )
-
-        # Convert queryset to list
-        stats_list = list(monthly_stats)
+        # Per-month totals are maintained incrementally when summaries are
+        # written (payroll/services/analytics_rollup.py)
+        role = request.GET.get("role", ALL_ROLES).strip()
+        stats_list = [
+            {
+                "month": rollup.month,
+                "total_employees": rollup.employee_count,
+                "total_gross_pay_sum": rollup.total_gross_pay_sum,
+                "avg_gross_pay": rollup.avg_gross_pay,
+                "total_hours_sum": rollup.total_hours_sum,
+                "avg_hours": rollup.avg_hours,
+            }
+            for rollup in get_year_rollups(year, role)
+        ]
 
         # If no data exists, provide default structure with required keys
         if not stats_list:
@@ -0,0 +1,131 @@
+"""
+Streaming export views for payroll module.
+
+Contains endpoints for:
+- Month export of payroll summaries or daily calculations (CSV / NDJSON)
+"""
+
+import logging
+from datetime import date
+
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from django.http import StreamingHttpResponse
+
+# Import from parent module to make test mocking work correctly
+from payroll import views as payroll_views
+
+from ..services.export import (
+    COLUMNS,
+    CONTENT_TYPES,
+    DATASET_SUMMARIES,
+    FORMAT_CSV,
+    encode_rows,
+    get_page_bounds,
+    get_queryset,
+    iter_rows,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def payroll_export(request):
+    """
+    Stream a month of payroll as CSV or NDJSON.
+
+    Query parameters:
+        year, month: Period (defaults to the current month)
+        dataset: "summaries" (MonthlyPayrollSummary, default) or "daily"
+            (DailyPayrollCalculation)
+        output: "csv" (default) or "ndjson"
+        employee_id: Only this employee (admins and accountants)
+        after, limit: Keyset pagination - at most `limit` rows with an id
+            greater than `after`; the X-Next-Cursor header holds the `after`
+            of the next page while more rows follow
+
+    Regular employees only export their own rows.
+    """
+    employee_profile = payroll_views.get_user_employee_profile(request.user)
+    if not employee_profile:
+        return Response(
+            {"error": "User does not have an employee profile"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    today = date.today()
+    dataset = request.GET.get("dataset", DATASET_SUMMARIES)
+    output_format = request.GET.get("output", FORMAT_CSV)
+    if dataset not in COLUMNS:
+        return Response(
+            {"error": f"dataset must be one of: {', '.join(COLUMNS)}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    if output_format not in CONTENT_TYPES:
+        return Response(
+            {"error": f"output must be one of: {', '.join(CONTENT_TYPES)}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    try:
+        year = int(request.GET.get("year", today.year))
+        month = int(request.GET.get("month", today.month))
+        date(year, month, 1)
+        after_id = int(request.GET.get("after", 0))
+        limit = request.GET.get("limit")
+        limit = int(limit) if limit else None
+        employee_id = request.GET.get("employee_id")
+        employee_id = int(employee_id) if employee_id else None
+    except (ValueError, TypeError):
+        return Response(
+            {"error": "Invalid year, month, after, limit or employee_id"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    if limit is not None and limit < 1:
+        return Response(
+            {"error": "limit must be positive"}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    if employee_profile.role not in ["accountant", "admin"]:
+        employee_id = employee_profile.id
+
+    last_id, has_more = None, False
+    if limit is not None:
+        last_id, has_more = get_page_bounds(
+            get_queryset(dataset, year, month, employee_id), after_id, limit
+        )
+
+    rows = iter_rows(
+        dataset,
+        year,
+        month,
+        employee_id=employee_id,
+        after_id=after_id,
+        last_id=last_id,
+    )
+    response = StreamingHttpResponse(
+        encode_rows(rows, dataset, output_format),
+        content_type=CONTENT_TYPES[output_format],
+    )
+    filename = f"payroll_{dataset}_{year}-{month:02d}.{output_format}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    if has_more:
+        response["X-Next-Cursor"] = str(last_id)
+
+    logger.info(
+        "Payroll export started",
+        extra={
+            "dataset": dataset,
+            "format": output_format,
+            "year": year,
+            "month": month,
+            "after_id": after_id,
+            "limit": limit,
+            "action": "payroll_export_start",
+        },
+    )
+    return response
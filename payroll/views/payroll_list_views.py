@@ -2,7 +2,6 @@
 Payroll list views for displaying employee payroll data with pagination and filtering.
 """
 
-import calendar
 import logging
 from datetime import date
 
@@ -13,6 +12,7 @@ from rest_framework.response import Response
 
 from django.db import DatabaseError, OperationalError
 from django.db.models import Prefetch, Q
+from django.urls import reverse
 
 # Import from parent module to make test mocking work correctly
 # (tests patch payroll.views.get_user_employee_profile and payroll.views.logger)
@@ -21,6 +21,7 @@ from users.models import Employee
 from worktime.models import WorkLog
 
 from ..models import MonthlyPayrollSummary
+from ..services.bulk.backfill import enqueue_backfill, find_stale_employee_ids
 from ..services.contracts import CalculationContext
 from ..services.enums import CalculationStrategy, EmployeeType
 from ..services.payroll_service import PayrollService
@@ -161,16 +162,10 @@ def payroll_list(request):
         else:
             current_date = date.today()
 
-        payroll_data = []
-
-        # Get all work logs for the month in a single query
-        start_date = date(current_date.year, current_date.month, 1)
-        _, last_day = calendar.monthrange(current_date.year, current_date.month)
-        end_date = date(current_date.year, current_date.month, last_day)
-
-        # Try to get pre-calculated data from DB first, then calculate
-
-        # Get pre-calculated data from database
+        # Always answer from stored summaries; missing and stale employee-months
+        # are recalculated by one background bulk job (see
+        # payroll/services/bulk/backfill.py) instead of inline, so the list
+        # latency does not grow with the number of employees.
         try:
             existing_summaries = (
                 MonthlyPayrollSummary.objects.filter(
@@ -199,34 +194,51 @@ def payroll_list(request):
 
         # Create dictionary for fast access
         summary_dict = {summary.employee_id: summary for summary in existing_summaries}
-
-        # If we have ready data for all employees - use it
-        # Count employees without converting to list yet
-        employees_count = (
-            employees.count() if hasattr(employees, "count") else len(employees)
+        page_employees = list(employees)
+
+        backfill = _schedule_backfill(
+            request.user.id,
+            employees_queryset,
+            [employee.id for employee in page_employees if employee.id in summary_dict],
+            current_date,
+            can_poll_status=user_role in ["admin", "accountant"],
         )
-        if len(summary_dict) == employees_count:
-            payroll_views.logger.info("Using cached payroll data for all employees")
-            payroll_data = []
-            for summary in existing_summaries:
-                employee = summary.employee
-                salary_info = (
-                    employee.salary_info if hasattr(employee, "salary_info") else None
-                )
 
-                payroll_data.append(
+        period = f"{current_date.year}-{current_date.month:02d}"
+        payroll_data = []
+        for employee in page_employees:
+            summary = summary_dict.get(employee.id)
+            salary_info = (
+                employee.salary_info if hasattr(employee, "salary_info") else None
+            )
+            row = {
+                "id": employee.id,
+                "employee": {
+                    "id": employee.id,
+                    "name": employee.get_full_name(),
+                    "email": employee.email,
+                    "role": employee.role,
+                },
+                "calculation_type": (
+                    salary_info.calculation_type if salary_info else "unknown"
+                ),
+                "currency": salary_info.currency if salary_info else "ILS",
+                "period": period,
+            }
+            if summary is None:
+                # Not calculated yet - filled in by the backfill job
+                row.update(
+                    {
+                        "total_salary": 0,
+                        "total_hours": 0,
+                        "worked_days": 0,
+                        "work_sessions": 0,
+                        "status": "pending",
+                    }
+                )
+            else:
+                row.update(
                     {
-                        "id": employee.id,
-                        "employee": {
-                            "id": employee.id,
-                            "name": employee.get_full_name(),
-                            "email": employee.email,
-                            "role": employee.role,
-                        },
-                        "calculation_type": (
-                            salary_info.calculation_type if salary_info else "unknown"
-                        ),
-                        "currency": salary_info.currency if salary_info else "ILS",
                         "total_salary": float(summary.total_gross_pay),
                         "total_hours": float(summary.total_hours),
                         "worked_days": summary.worked_days,
@@ -235,127 +247,14 @@ def payroll_list(request):
                             if summary.calculation_details
                             else 0
                         ),
-                        "period": f"{current_date.year}-{current_date.month:02d}",
-                        "status": "calculated",
+                        "status": (
+                            "stale"
+                            if employee.id in backfill["stale_ids"]
+                            else "calculated"
+                        ),
                     }
                 )
-        else:
-            # Use new PayrollService to calculate and save to DB
-            payroll_views.logger.info(
-                f"Calculating payroll with new PayrollService for {current_date.year}-{current_date.month:02d}"
-            )
-
-            payroll_data = []
-            calculations_performed = 0
-            errors_encountered = 0
-
-            try:
-                payroll_service = PayrollService(
-                    enable_fallback=True, enable_caching=True
-                )
-
-                for employee in employees:
-                    try:
-                        # Create calculation context
-                        context = CalculationContext(
-                            employee_id=employee.id,
-                            year=current_date.year,
-                            month=current_date.month,
-                            user_id=request.user.id,
-                            force_recalculate=False,  # Use cache if available
-                            fast_mode=False,  # Full calculation with DB save
-                            include_breakdown=True,
-                            include_daily_details=False,
-                        )
-
-                        # Calculate using the new service
-                        result = payroll_service.calculate(context)
-                        calculations_performed += 1
-
-                        # Convert result to API format (result is a dict, not PayrollResult object)
-                        payroll_data.append(
-                            {
-                                "id": employee.id,
-                                "employee": {
-                                    "id": employee.id,
-                                    "name": employee.get_full_name(),
-                                    "email": employee.email,
-                                    "role": employee.role,
-                                },
-                                "calculation_type": result["metadata"].get(
-                                    "employee_type", "unknown"
-                                ),
-                                "currency": result["metadata"].get("currency", "ILS"),
-                                "total_salary": float(result["total_salary"]),
-                                "total_hours": float(result["total_hours"]),
-                                "worked_days": result["breakdown"].get(
-                                    "worked_days", 0
-                                ),
-                                "work_sessions": result["breakdown"].get(
-                                    "work_sessions_count", 0
-                                ),
-                                "period": f"{current_date.year}-{current_date.month:02d}",
-                                "status": "calculated_and_saved",
-                                "calculation_method": "new_payroll_service",
-                                "regular_hours": float(result["regular_hours"]),
-                                "overtime_hours": float(result["overtime_hours"]),
-                                "holiday_hours": float(result["holiday_hours"]),
-                                "sabbath_hours": float(result["shabbat_hours"]),
-                            }
-                        )
-
-                    except Exception as employee_error:
-                        errors_encountered += 1
-                        logger.error(
-                            f"Error calculating payroll for employee {employee.id}",
-                            extra={
-                                "employee_id": employee.id,
-                                "error": str(employee_error),
-                            },
-                        )
-                        # Add error result for this employee
-                        payroll_data.append(
-                            {
-                                "id": employee.id,
-                                "employee": {
-                                    "id": employee.id,
-                                    "name": employee.get_full_name(),
-                                    "email": employee.email,
-                                    "role": employee.role,
-                                },
-                                "calculation_type": "unknown",
-                                "currency": "ILS",
-                                "total_salary": 0,
-                                "total_hours": 0,
-                                "worked_days": 0,
-                                "work_sessions": 0,
-                                "period": f"{current_date.year}-{current_date.month:02d}",
-                                "status": "error",
-                                "error_message": str(employee_error),
-                                "calculation_method": "new_payroll_service_error",
-                            }
-                        )
-
-                payroll_views.logger.info(
-                    "New PayrollService calculation completed",
-                    extra={
-                        "user_hash": hash_user_id(request.user.id),
-                        "calculations_performed": calculations_performed,
-                        "errors_encountered": errors_encountered,
-                        "total_employees": len(payroll_data),
-                        "year": current_date.year,
-                        "month": current_date.month,
-                    },
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"New PayrollService failed, falling back to legacy calculation: {e}"
-                )
-                # Fallback to legacy logic
-                payroll_data = _legacy_payroll_calculation(
-                    employees, current_date, start_date, end_date
-                )
+            payroll_data.append(row)
 
         # Calculate pagination metadata
         has_next = offset + limit < total_count
@@ -374,6 +273,7 @@ def payroll_list(request):
                 "next_page": page + 1 if has_next else None,
                 "previous_page": page - 1 if has_previous else None,
             },
+            "backfill": backfill["info"],
         }
 
         payroll_views.logger.info(
@@ -382,14 +282,19 @@ def payroll_list(request):
                 "user_hash": hash_user_id(request.user.id),
                 "records_count": len(payroll_data),
                 "total_count": total_count,
+                "backfill_status": backfill["info"]["status"],
                 "page": page,
                 "limit": limit,
             },
         )
         path = getattr(request, "path", "") or ""
         if path.startswith("/api/v1/payroll/"):
-            # Compatibility with old clients/tests
-            return Response(payroll_data, status=200)
+            # Compatibility with old clients/tests - backfill state in headers
+            response = Response(payroll_data, status=200)
+            response["X-Payroll-Backfill-Status"] = backfill["info"]["status"]
+            if backfill["info"]["job_id"]:
+                response["X-Payroll-Backfill-Job"] = backfill["info"]["job_id"]
+            return response
         # New format (v2+)
         return Response(paginated_response)
 
@@ -413,6 +318,62 @@ def payroll_list(request):
         )
 
 
+def _schedule_backfill(
+    user_id, employees_queryset, summarized_ids, current_date, can_poll_status=False
+):
+    """
+    Queue one bulk job recalculating the missing and stale summaries of the month.
+
+    Missing summaries are looked up for the whole filtered list, stale ones for
+    the summaries shown on the page. Failures here never fail the list request.
+    The job's "status_url" is only reported to callers allowed to poll it.
+
+    Returns:
+        Dict: "stale_ids" of the page and the "info" reported to the client
+    """
+    year, month = current_date.year, current_date.month
+    info = {
+        "status": "up_to_date",
+        "missing": 0,
+        "stale": 0,
+        "job_id": None,
+        "status_url": None,
+    }
+    stale_ids = set()
+
+    try:
+        employee_ids = set(employees_queryset.values_list("id", flat=True))
+        calculated_ids = set(
+            employees_queryset.filter(
+                monthly_payroll_summaries__year=year,
+                monthly_payroll_summaries__month=month,
+            ).values_list("id", flat=True)
+        )
+        missing_ids = employee_ids - calculated_ids
+        stale_ids = find_stale_employee_ids(summarized_ids, year, month)
+        info.update(missing=len(missing_ids), stale=len(stale_ids))
+        if not missing_ids and not stale_ids:
+            return {"stale_ids": stale_ids, "info": info}
+
+        job = enqueue_backfill(user_id, sorted(missing_ids | stale_ids), year, month)
+    except Exception as e:
+        from core.logging_utils import err_tag
+
+        logger.warning(f"Could not schedule payroll backfill: {err_tag(e)}")
+        info["status"] = "unavailable"
+        return {"stale_ids": stale_ids, "info": info}
+
+    if job is None:
+        # Another request is queueing this month's backfill right now
+        info["status"] = "pending"
+    else:
+        info.update(status=job["status"], job_id=job["job_id"])
+        if can_poll_status:
+            status_url = reverse("bulk-calculation-status")
+            info["status_url"] = f"{status_url}?job_id={job['job_id']}"
+    return {"stale_ids": stale_ids, "info": info}
+
+
 def _legacy_payroll_calculation(employees, current_date, start_date, end_date):
     """
     Legacy fallback calculation (original logic)
@@ -20,6 +20,7 @@ try:
     from biometrics.services.face_processor import face_processor
 except ImportError:
     face_processor = None
+from biometrics.services.face_processing_pool import FaceProcessingUnavailable
 from biometrics.services.mongodb_repository import mongo_biometric_repository
 from biometrics.services.mongodb_service import get_mongodb_service
 
@@ -467,6 +468,19 @@ def biometric_verification(request):
             }
         )
 
+    except FaceProcessingUnavailable as e:
+        return Response(
+            {
+                "error": True,
+                "code": "BIOMETRIC_SERVICE_BUSY",
+                "message": str(e.detail),
+                "details": None,
+                "error_id": "bio_007",
+                "timestamp": timezone.now().isoformat(),
+            },
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(e.wait)},
+        )
     except Exception as e:
         logger.exception("Biometric verification error")
         return Response(
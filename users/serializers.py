@@ -56,6 +56,12 @@ class EmployeeSerializer(serializers.ModelSerializer):
     def get_has_biometric(self, obj):
         """Check if employee has biometric profile - optimized for prefetch_related"""
         try:
+            # A prefetched profile is cached as None when the employee has
+            # none; hasattr() below would miss that and query per employee
+            descriptor = getattr(type(obj), "biometric_profile", None)
+            if hasattr(descriptor, "is_cached") and descriptor.is_cached(obj):
+                return getattr(obj, "biometric_profile", None) is not None
+
             # Check if biometric_profile is prefetched and available
             if (
                 hasattr(obj, "_prefetched_objects_cache")
@@ -1,5 +1,8 @@
 """
 Simple signals for work time notifications and payroll recalculation
+
+Payroll is not recalculated inline: the signals enqueue employee-months on
+the payroll recalculation queue (payroll/services/recalculation_queue.py).
 """
 
 import logging
@@ -45,41 +48,21 @@ def send_work_notifications(sender, instance, created, **kwargs):
         # Send simple notifications
         instance.send_simple_notifications()
 
-        # If this is a check-out, trigger payroll calculation
+        # If this is a check-out, queue payroll recalculation for the month
         if instance.check_out:
             try:
-                from payroll.services.contracts import CalculationContext
-                from payroll.services.enums import CalculationStrategy, EmployeeType
-                from payroll.services.payroll_service import PayrollService
-
-                # Calculate payroll for this work session
-                year = instance.check_in.year
-                month = instance.check_in.month
-
-                # Determine employee type
-                employee_type = (
-                    EmployeeType.HOURLY
-                    if instance.employee.salaries.filter(
-                        is_active=True, calculation_type="hourly"
-                    ).exists()
-                    else EmployeeType.MONTHLY
+                from payroll.services.recalculation_queue import (
+                    get_recalculation_queue,
                 )
 
-                service = PayrollService()
-                context = CalculationContext(
-                    employee_id=instance.employee.id,
-                    year=year,
-                    month=month,
-                    user_id=1,  # System user for automatic calculations
-                    employee_type=employee_type,
-                    force_recalculate=True,
+                get_recalculation_queue().enqueue(
+                    instance.employee_id,
+                    instance.check_in.year,
+                    instance.check_in.month,
                 )
-                result = service.calculate(context, CalculationStrategy.ENHANCED)
-
-                # Monthly summary is handled automatically by PayrollService
 
                 logger.debug(
-                    f"Payroll and monthly summary calculated for WorkLog {instance.id} via notification signal"
+                    f"Payroll recalculation queued for WorkLog {instance.id} via notification signal"
                 )
 
             except ImportError:
@@ -87,7 +70,7 @@ def send_work_notifications(sender, instance, created, **kwargs):
             except Exception as e:
                 # Log the error but don't fail the check-out
                 logger.error(
-                    f"Failed to calculate payroll for WorkLog {instance.id}: {e}"
+                    f"Failed to queue payroll recalculation for WorkLog {instance.id}: {e}"
                 )
 
 
@@ -184,9 +167,7 @@ def handle_payroll_recalculation(sender, instance, created, **kwargs):
 
         try:
             from payroll.models import DailyPayrollCalculation
-            from payroll.services.contracts import CalculationContext
-            from payroll.services.enums import CalculationStrategy, EmployeeType
-            from payroll.services.payroll_service import PayrollService
+            from payroll.services.recalculation_queue import get_recalculation_queue
 
             # Determine affected dates
             affected_dates = set()
@@ -199,11 +180,6 @@ def handle_payroll_recalculation(sender, instance, created, **kwargs):
             # Always include current date
             affected_dates.add(instance.check_in.date())
 
-            # Get employee and year/month for service
-            employee = instance.employee
-            year = instance.check_in.year
-            month = instance.check_in.month
-
             operation_type = (
                 "soft delete"
                 if hasattr(instance, "_was_soft_deleted")
@@ -215,28 +191,8 @@ def handle_payroll_recalculation(sender, instance, created, **kwargs):
             )
 
             logger.info(
-                f"Recalculating payroll for employee {employee.get_full_name()} "
-                f"for {year}-{month:02d} due to WorkLog {instance.id} {operation_type}"
-            )
-
-            # Determine employee type
-            employee_type = (
-                EmployeeType.HOURLY
-                if employee.salaries.filter(
-                    is_active=True, calculation_type="hourly"
-                ).exists()
-                else EmployeeType.MONTHLY
-            )
-
-            # Initialize new payroll service
-            service = PayrollService()
-            context = CalculationContext(
-                employee_id=employee.id,
-                year=year,
-                month=month,
-                user_id=1,  # System user for automatic calculations
-                employee_type=employee_type,
-                force_recalculate=True,
+                f"Queueing payroll recalculation for employee {instance.employee_id} "
+                f"for dates {sorted(affected_dates)} due to WorkLog {instance.id} {operation_type}"
             )
 
             # Handle specific WorkLog soft delete - remove its calculation immediately
@@ -254,53 +210,11 @@ def handle_payroll_recalculation(sender, instance, created, **kwargs):
                         f"Could not delete payroll calculation for WorkLog {instance.id}: {e}"
                     )
 
-            # For each affected date, recalculate or clean up
-            for affected_date in affected_dates:
-                # Get all active worklogs for this date in one query
-                date_worklogs = list(
-                    WorkLog.objects.filter(
-                        employee=employee,
-                        check_in__date=affected_date,
-                        is_deleted=False,
-                    )
-                )
-
-                if date_worklogs:
-                    # Recalculate payroll for this specific date
-                    logger.info(
-                        f"Recalculating payroll for {affected_date} - has {len(date_worklogs)} active WorkLogs"
-                    )
-
-                    # Recalculate payroll for the full period using new service
-                    # (The new PayrollService handles all work logs for the period automatically)
-                    service.calculate(context, CalculationStrategy.ENHANCED)
-
-                else:
-                    # No active WorkLogs for this date - remove all payroll calculations for this date
-                    logger.info(
-                        f"No active WorkLogs for {affected_date} - removing payroll calculations"
-                    )
-
-                    # Delete all calculations for this employee and date (shift-based)
-                    deleted_count, _ = DailyPayrollCalculation.objects.filter(
-                        employee=employee, work_date=affected_date
-                    ).delete()
-
-                    if deleted_count > 0:
-                        logger.info(
-                            f"Deleted {deleted_count} orphaned payroll calculation(s) for {affected_date}"
-                        )
-                    else:
-                        logger.info(
-                            f"No payroll calculations found for {affected_date} - nothing to clean up"
-                        )
-
-            # Only recalculate monthly summary if we processed any dates
-            if affected_dates:
-                result = service.calculate(context, CalculationStrategy.ENHANCED)
-                logger.info(
-                    f"Payroll recalculation completed: total {result.get('total_salary', 0)} ILS for {result.get('total_hours', 0)}h"
-                )
+            # One recalculation per affected month; it rebuilds the month's
+            # daily records, which also removes calculations of emptied dates
+            get_recalculation_queue().enqueue_dates(
+                instance.employee_id, affected_dates
+            )
 
             # Clean up flags
             for flag in [
@@ -15,6 +15,7 @@ from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
 
+from core.query_budget import profile_queries
 from payroll.models import Salary
 from tests.base import BaseAPITestCase, UnauthenticatedAPITestCase
 from users.models import Employee
@@ -121,6 +122,18 @@ class WorkLogAPITest(BaseAPITestCase):
             self.assertIsInstance(response.data, list)
             self.assertGreater(len(response.data), 0)
 
+    def test_list_worklogs_query_count_does_not_grow_with_page(self):
+        """Listing work logs has no per-row (N+1) queries"""
+        url = reverse("worklog-list")
+
+        with profile_queries() as small_page:
+            self.client.get(url, {"page_size": 2})
+        with profile_queries() as large_page:
+            response = self.client.get(url, {"page_size": 12})
+
+        self.assertEqual(len(response.data["results"]), 12)
+        self.assertEqual(large_page.count, small_page.count, large_page.to_dict())
+
     def test_create_worklog_check_in(self):
         """Test creating a work log (check-in)"""
         url = reverse("worklog-list")